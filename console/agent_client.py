@@ -0,0 +1,233 @@
+# SVCMON 콘솔 에이전트 모드 (수집 API 클라이언트)
+# DB에 직접 연결할 수 없는 망(KT망/LG망/해외망 등) 안의 폴러가 웹앱 수집 API(/monitoring/api/ingest/)로
+# 체크 결과를 NDJSON(gzip) 배치로 보내고, 응답으로 담당 엔드포인트와 설정 리비전을 받습니다.
+import gzip
+import json
+import logging
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import pytz
+
+from scheduler import next_due
+
+logger = logging.getLogger('SVCMON')
+
+KST = pytz.timezone('Asia/Seoul')
+
+
+def _to_db_time(value) -> Optional[str]:
+    """DB 기준(한국 시간, 시간대 없음) ISO 문자열"""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(KST).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _from_db_time(value) -> Optional[datetime]:
+    """응답의 ISO 문자열 → 한국 시간 기준 시간대 없는 datetime (usp_get_poll_targets 행과 같은 형식)"""
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(KST).replace(tzinfo=None)
+    return parsed
+
+
+class AgentClient:
+    """
+    수집 API 클라이언트 (에이전트 모드에서 DatabaseManager 대신 사용)
+
+    MonitoringService가 호출하는 저장프로시저를 같은 이름으로 받아 처리합니다.
+    - usp_record_check, usp_mark_suppressed: 버퍼에 모았다가 batch_size건마다 또는 flush()로 전송
+    - usp_next_poll_batch, usp_get_poll_targets: 마지막 응답으로 받은 담당 엔드포인트에서 계산
+    전송이 실패하면 결과를 버퍼에 남겨 다음 전송 때 다시 보냅니다. (max_buffer 초과분은 오래된 것부터 버림)
+    체크 결과마다 trace_id를 붙여 두므로 서버가 이미 기록한 결과를 다시 보내도 중복 기록되지 않습니다.
+    """
+
+    def __init__(self, url: str, token: str, batch_size: int = 500, flush_sec: float = 5, timeout: int = 30,
+                 max_buffer: int = 50000, ca_file: str = ''):
+        self.url = url
+        self.token = token
+        self.batch_size = batch_size
+        self.flush_sec = flush_sec
+        self.timeout = timeout
+        self.max_buffer = max_buffer
+        self._ssl_context = ssl.create_default_context(cafile=ca_file or None) if url.startswith('https') else None
+
+        # 마지막 응답 기준 에이전트 정보
+        self.config_revision = 0
+        self.network_group_id: Optional[int] = None
+        self.network_group_name: Optional[str] = None
+        self.targets: Dict[int, Dict] = {}
+        self._targets_revision: Optional[int] = None
+
+        self._buffer: List[Dict] = []
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._sent_at = 0.0
+
+    def execute_sp(self, sp_name: str, params: Dict = None) -> List[Dict]:
+        """DatabaseManager.execute_sp 대응 (지원하지 않는 저장프로시저는 DatabaseManager와 같이 오류 기록 후 빈 리스트)"""
+        params = params or {}
+        if sp_name == 'usp_record_check':
+            self._append({
+                'endpoint_id': params['endpoint_id'],
+                'status_code': params['status_code'],
+                'latency_ms': params['latency_ms'],
+                'headers': params['headers'],
+                'error': params['error'],
+                'checked_at': _to_db_time(params['checked_at']),
+                'trace_id': str(uuid.uuid4()),
+            })
+            return []
+        if sp_name == 'usp_next_poll_batch':
+            return self._next_batch(params['now'], params['limit'])
+        if sp_name == 'usp_get_poll_targets':
+            self.flush()
+            with self._lock:
+                return [dict(row) for row in self.targets.values()]
+        logger.error(f"에이전트 모드에서 지원하지 않는 저장프로시저입니다: {sp_name}")
+        return []
+
+    def execute_sp_non_query(self, sp_name: str, params: Dict = None) -> bool:
+        """DatabaseManager.execute_sp_non_query 대응 (체크 생략 기록만 지원)"""
+        if sp_name == 'usp_mark_suppressed':
+            self._append({
+                'type': 'suppressed',
+                'endpoint_ids': [int(endpoint_id) for endpoint_id in params['endpoint_ids'].split(',')],
+                'reason': params['reason'],
+                'suppressed_at': _to_db_time(params['suppressed_at']),
+            })
+            return True
+        logger.error(f"에이전트 모드에서 지원하지 않는 저장프로시저입니다: {sp_name}")
+        return False
+
+    def execute_query(self, query: str, params: List = None) -> List[Dict]:
+        """에이전트 모드에서는 직접 쿼리를 실행할 수 없음 (DatabaseManager와 같이 오류 시 빈 리스트)"""
+        logger.error("에이전트 모드에서는 DB 쿼리를 직접 실행할 수 없습니다.")
+        return []
+
+    def _append(self, row: Dict):
+        """버퍼에 추가 (batch_size건이 모이면 호출한 스레드에서 바로 전송)"""
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def _next_batch(self, now: datetime, limit: int) -> List[Dict]:
+        """
+        due 엔드포인트를 다음 체크 시각 순으로 limit개
+
+        가져간 엔드포인트는 usp_next_poll_batch와 같이 (지금 + 주기/2) 이후 첫 위상 시각으로 미룸
+        """
+        now = now.astimezone(KST).replace(tzinfo=None) if now.tzinfo is not None else now
+        now_sec = KST.localize(now).timestamp()
+        with self._lock:
+            due = sorted(
+                (row for row in self.targets.values() if row['next_check_due'] <= now),
+                key=lambda row: row['next_check_due']
+            )[:limit]
+            batch = [dict(row) for row in due]
+            for row in due:
+                row['last_checked_at'] = now
+                due_sec = next_due(row['endpoint_id'], row['poll_interval_sec'], now_sec)
+                row['next_check_due'] = now + timedelta(seconds=due_sec - now_sec)
+        return batch
+
+    def flush_due(self) -> bool:
+        """flush_sec이 지났는지 (빈 버퍼도 주기적으로 보내 담당 엔드포인트/설정 리비전 갱신)"""
+        return time.monotonic() - self._sent_at >= self.flush_sec and not self._send_lock.locked()
+
+    def flush(self, drain: bool = False) -> bool:
+        """
+        버퍼 전송 (batch_size건씩), 반환값: 성공 여부
+
+        drain이 아니면 batch_size보다 적게 남은 결과는 다음 전송으로 미룹니다.
+        """
+        with self._send_lock:
+            while True:
+                with self._lock:
+                    batch = self._buffer[:self.batch_size]
+                    del self._buffer[:len(batch)]
+                self._sent_at = time.monotonic()
+                try:
+                    data = self._post(batch)
+                except urllib.error.HTTPError as e:
+                    if e.code == 400:
+                        # 형식 오류 배치는 다시 보내도 실패하므로 버림
+                        logger.error(f"수집 API가 배치를 거부했습니다 ({len(batch)}건 버림): {e.read()[:500]!r}")
+                        return False
+                    self._requeue(batch)
+                    logger.error(f"수집 API 전송 오류 (HTTP {e.code}, 대기 {len(self._buffer)}건)")
+                    return False
+                except (OSError, ValueError) as e:
+                    self._requeue(batch)
+                    logger.error(f"수집 API 전송 오류 (대기 {len(self._buffer)}건): {e}")
+                    return False
+
+                self._apply(data)
+                with self._lock:
+                    remaining = len(self._buffer)
+                if remaining == 0 or (not drain and remaining < self.batch_size):
+                    return True
+
+    def _post(self, rows: List[Dict]) -> Dict:
+        """NDJSON 배치를 gzip으로 압축해 전송하고 응답 JSON 반환"""
+        body = gzip.compress(
+            '\n'.join(json.dumps(row, ensure_ascii=False) for row in rows).encode('utf-8'),
+            compresslevel=6
+        )
+        url = self.url
+        if self._targets_revision is not None:
+            # 아는 리비전과 같으면 서버가 담당 엔드포인트 목록을 생략
+            url += ('&' if '?' in url else '?') + f'revision={self._targets_revision}'
+        request = urllib.request.Request(url, data=body, method='POST', headers={
+            'Authorization': f'Bearer {self.token}',
+            'Content-Type': 'application/x-ndjson; charset=utf-8',
+            'Content-Encoding': 'gzip',
+        })
+        with urllib.request.urlopen(request, timeout=self.timeout, context=self._ssl_context) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def _requeue(self, rows: List[Dict]):
+        """전송 실패한 결과를 버퍼 앞에 되돌림 (max_buffer 초과분은 오래된 것부터 버림)"""
+        with self._lock:
+            self._buffer[:0] = rows
+            overflow = len(self._buffer) - self.max_buffer
+            if overflow > 0:
+                del self._buffer[:overflow]
+                logger.warning(f"수집 API 전송 대기 버퍼가 가득 차 오래된 결과 {overflow}건을 버렸습니다.")
+
+    def _apply(self, data: Dict):
+        """응답의 설정 리비전/담당 엔드포인트 반영 (로컬에서 더 늦게 잡힌 다음 체크 시각은 유지)"""
+        self.config_revision = data['config_revision']
+        self.network_group_id = data.get('network_group_id')
+        self.network_group_name = data.get('network_group_name')
+        endpoints = data.get('endpoints')
+        if endpoints is None:
+            return
+
+        with self._lock:
+            targets = {}
+            for row in endpoints:
+                row['last_checked_at'] = _from_db_time(row['last_checked_at'])
+                row['next_check_due'] = _from_db_time(row['next_check_due'])
+                known = self.targets.get(row['endpoint_id'])
+                if known and known['next_check_due'] > row['next_check_due']:
+                    row['last_checked_at'] = known['last_checked_at']
+                    row['next_check_due'] = known['next_check_due']
+                targets[row['endpoint_id']] = row
+            self.targets = targets
+            self._targets_revision = self.config_revision
+        logger.info(
+            f"담당 엔드포인트 {len(targets)}개 수신 - 망구분: {self.network_group_name}, 리비전: {self.config_revision}"
+        )
@@ -0,0 +1,697 @@
+# SVCMON 폴러 부하 벤치마크
+# 로컬 가짜 HTTP 서버 팜과 SQLite 저장소(DatabaseManager 대체)로 실제 폴링 루프의 처리량을 측정
+#
+# 사용 예 (오프라인, Linux/Windows 공통):
+#   python benchmark.py --endpoints 2000 --interval 30,60 --duration 120
+#   python benchmark.py --endpoints 500 --mix fast=70,slow=20,error=4,reset=1,hang=5 --json result.json
+#   python benchmark.py --endpoints 500 --baseline result.json   # 회귀 발생 시 종료 코드 1
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CONSOLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 가짜 서버 응답 유형
+PROFILES = ('fast', 'slow', 'hang', 'error', 'reset', 'tls')
+DEFAULT_MIX = 'fast=70,slow=20,hang=3,error=4,reset=1,tls=2'
+
+BENCH_CONFIG = """[Database]
+connection_string = benchmark
+
+[Logging]
+console = false
+success_sample_every = 0
+"""
+
+
+# ---------------------------------------------------------------------------
+# 가짜 HTTP 서버 팜 (별도 프로세스, 폴러와 GIL/이벤트 루프를 공유하지 않음)
+# ---------------------------------------------------------------------------
+
+def _run_server_farm(servers: int, hang_sec: float, tls_files: Optional[tuple], ready_queue, stop_event):
+    """서버 팜 프로세스 진입점"""
+    import asyncio
+    asyncio.run(_serve_farm(servers, hang_sec, tls_files, ready_queue, stop_event))
+
+
+async def _serve_farm(servers: int, hang_sec: float, tls_files: Optional[tuple], ready_queue, stop_event):
+    import asyncio
+    import ssl
+    from aiohttp import web
+
+    async def fast(request):
+        return web.Response(text='ok')
+
+    async def slow(request):
+        await asyncio.sleep(int(request.match_info['ms']) / 1000.0)
+        return web.Response(text='ok')
+
+    async def hang(request):
+        await asyncio.sleep(hang_sec)
+        return web.Response(text='late')
+
+    async def error(request):
+        return web.Response(status=500, text='error')
+
+    async def reset(request):
+        # 응답 없이 연결 종료
+        request.transport.close()
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get('/fast', fast)
+    app.router.add_get('/slow/{ms}', slow)
+    app.router.add_get('/hang', hang)
+    app.router.add_get('/error', error)
+    app.router.add_get('/reset', reset)
+
+    runner = web.AppRunner(app, access_log=None, handle_signals=False)
+    await runner.setup()
+
+    ssl_context = None
+    if tls_files:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(*tls_files)
+
+    ports = {'http': [], 'tls': []}
+    for _ in range(servers):
+        site = web.TCPSite(runner, '127.0.0.1', 0, backlog=1024)
+        await site.start()
+        ports['http'].append(site._server.sockets[0].getsockname()[1])
+        if ssl_context:
+            site = web.TCPSite(runner, '127.0.0.1', 0, ssl_context=ssl_context, backlog=1024)
+            await site.start()
+            ports['tls'].append(site._server.sockets[0].getsockname()[1])
+    ready_queue.put(ports)
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, stop_event.wait)
+    await runner.cleanup()
+
+
+class ServerFarm:
+    """가짜 HTTP/HTTPS 서버 팜"""
+
+    def __init__(self, servers: int, hang_sec: float, workdir: str, tls: bool = True):
+        self.servers = servers
+        self.hang_sec = hang_sec
+        self.workdir = workdir
+        self.tls_files = self._make_certificate() if tls else None
+        self.ports: Dict[str, List[int]] = {}
+        self._process = None
+        self._stop_event = multiprocessing.Event()
+
+    def _make_certificate(self) -> Optional[tuple]:
+        """openssl로 127.0.0.1용 자체 서명 인증서 생성 (없으면 TLS 생략)"""
+        if not shutil.which('openssl'):
+            print("openssl을 찾을 수 없어 TLS 서버를 생략합니다.")
+            return None
+        cert = os.path.join(self.workdir, 'bench_cert.pem')
+        key = os.path.join(self.workdir, 'bench_key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-keyout', key, '-out', cert, '-subj', '/CN=127.0.0.1',
+             '-addext', 'subjectAltName=IP:127.0.0.1'],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return cert, key
+
+    def start(self):
+        ready_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_run_server_farm,
+            args=(self.servers, self.hang_sec, self.tls_files, ready_queue, self._stop_event),
+            daemon=True
+        )
+        self._process.start()
+        self.ports = ready_queue.get(timeout=30)
+
+    def stop(self):
+        self._stop_event.set()
+        if self._process:
+            self._process.join(timeout=10)
+            if self._process.is_alive():
+                self._process.terminate()
+
+
+# ---------------------------------------------------------------------------
+# DatabaseManager 대체 (SQLite)
+# ---------------------------------------------------------------------------
+
+def _to_db_time(value: datetime) -> str:
+    """KST 기준 naive 시각 문자열 (MSSQL DATETIME2와 동일하게 시간대 없이 저장)"""
+    from svcmon_service import KST
+    if value.tzinfo is not None:
+        value = value.astimezone(KST).replace(tzinfo=None)
+    return value.isoformat(sep=' ', timespec='microseconds')
+
+
+class BenchmarkDatabase:
+    """
+    SQLite 기반 DatabaseManager 대체
+
+    폴러가 사용하는 usp_next_poll_batch, usp_get_poll_targets, usp_record_check, usp_mark_suppressed,
+    설정 리비전 조회만 구현합니다. (즉시 점검 요청 큐는 항상 비어 있음)
+    체크 결과에는 스케줄 지연과 지연시간 측정 오차를 함께 기록합니다.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.executescript("""
+            CREATE TABLE bench_endpoints (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                profile TEXT NOT NULL,
+                expected_ms INTEGER,
+                poll_interval_sec INTEGER NOT NULL,
+                domain TEXT NOT NULL,
+                site_name TEXT NOT NULL,
+                network_group_id INTEGER NOT NULL,
+                network_group_name TEXT NOT NULL,
+                last_checked_at TEXT,
+                next_check_due TEXT NOT NULL
+            );
+            CREATE INDEX ix_bench_endpoints_due ON bench_endpoints (next_check_due);
+            CREATE TABLE bench_checks (
+                id INTEGER PRIMARY KEY,
+                endpoint_id INTEGER NOT NULL,
+                profile TEXT NOT NULL,
+                status_code INTEGER,
+                latency_ms INTEGER,
+                headers TEXT,
+                error TEXT,
+                checked_at TEXT NOT NULL,
+                lag_ms INTEGER NOT NULL,
+                latency_error_ms INTEGER
+            );
+        """)
+
+    def load_endpoints(self, rows: List[dict]):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO bench_endpoints (id, url, profile, expected_ms, poll_interval_sec, domain, site_name, "
+                "network_group_id, network_group_name, last_checked_at, next_check_due) "
+                "VALUES (:id, :url, :profile, :expected_ms, :poll_interval_sec, :domain, :site_name, "
+                ":network_group_id, :network_group_name, NULL, :next_check_due)",
+                rows
+            )
+            self._conn.commit()
+
+    def execute_query(self, query: str, params: List = None) -> List[Dict]:
+        if 'config_revisions' in query:
+            return [{'id': 1}]
+        return []
+
+    def execute_sp(self, sp_name: str, params: Dict = None) -> List[Dict]:
+        handlers = {
+            'usp_next_poll_batch': self._next_poll_batch,
+            'usp_get_poll_targets': self._get_poll_targets,
+            'usp_record_check': self._record_check,
+            'usp_mark_suppressed': self._mark_suppressed,
+            'usp_claim_check_requests': lambda **_: [],
+            'usp_complete_check_requests': lambda **_: [],
+        }
+        if sp_name not in handlers:
+            raise ValueError(f"벤치마크 DB에서 지원하지 않는 저장프로시저: {sp_name}")
+        with self._lock:
+            return handlers[sp_name](**(params or {}))
+
+    def execute_sp_non_query(self, sp_name: str, params: Dict = None) -> bool:
+        self.execute_sp(sp_name, params)
+        return True
+
+    def _next_poll_batch(self, now, limit=50, network_group_id=None, spread_from=None, **_):
+        cursor = self._conn.execute(
+            "SELECT id, url, poll_interval_sec, domain, site_name, network_group_name, "
+            "last_checked_at, next_check_due FROM bench_endpoints "
+            "WHERE next_check_due <= ? AND (? IS NULL OR network_group_id = ?) "
+            "ORDER BY next_check_due, network_group_id, id",
+            (_to_db_time(now), network_group_id, network_group_id)
+        )
+        rows = self._endpoint_rows(cursor, now)
+        if spread_from is not None:
+            # usp_next_poll_batch와 같이 시작 전 due는 시작 후 첫 위상 시각으로 분산
+            from scheduler import next_slot
+            from svcmon_service import KST
+            spread_ts = spread_from.timestamp()
+            for row in rows:
+                if KST.localize(row['next_check_due']).timestamp() < spread_ts:
+                    due_ts = next_slot(row['endpoint_id'], row['poll_interval_sec'], spread_ts)
+                    row['next_check_due'] = datetime.fromtimestamp(due_ts, KST).replace(tzinfo=None)
+                    # 스케줄 지연 측정 기준도 분산된 시각으로 맞춤
+                    self._conn.execute(
+                        "UPDATE bench_endpoints SET next_check_due = ? WHERE id = ?",
+                        (_to_db_time(row['next_check_due']), row['endpoint_id'])
+                    )
+            rows = [row for row in rows if row['next_check_due'] <= now.replace(tzinfo=None)]
+            rows.sort(key=lambda row: (row['next_check_due'], row['endpoint_id']))
+        return rows[:limit]
+
+    def _get_poll_targets(self, network_group_id=None, **_):
+        from svcmon_service import get_seoul_time
+        cursor = self._conn.execute(
+            "SELECT id, url, poll_interval_sec, domain, site_name, network_group_name, "
+            "last_checked_at, next_check_due FROM bench_endpoints "
+            "WHERE (? IS NULL OR network_group_id = ?) ORDER BY id",
+            (network_group_id, network_group_id)
+        )
+        return self._endpoint_rows(cursor, get_seoul_time())
+
+    @staticmethod
+    def _endpoint_rows(cursor, now: datetime) -> List[Dict]:
+        never = now.replace(tzinfo=None) - timedelta(days=365)
+        return [
+            {
+                'endpoint_id': row[0],
+                'url': row[1],
+                'poll_interval_sec': row[2],
+                'domain': row[3],
+                'site_name': row[4],
+                'network_group_name': row[5],
+                'last_checked_at': datetime.fromisoformat(row[6]) if row[6] else never,
+                'next_check_due': datetime.fromisoformat(row[7]),
+                'parent_endpoint_id': None,
+            }
+            for row in cursor.fetchall()
+        ]
+
+    def _record_check(self, endpoint_id, status_code=None, latency_ms=None, headers=None, error=None,
+                      checked_at=None, **_):
+        row = self._conn.execute(
+            "SELECT profile, expected_ms, poll_interval_sec, next_check_due FROM bench_endpoints WHERE id = ?",
+            (endpoint_id,)
+        ).fetchone()
+        profile, expected_ms, interval, due = row
+        checked = datetime.fromisoformat(_to_db_time(checked_at))
+        lag_ms = int((checked - datetime.fromisoformat(due)).total_seconds() * 1000)
+        latency_error = None
+        if latency_ms is not None and status_code is not None and expected_ms is not None:
+            latency_error = latency_ms - expected_ms
+
+        self._conn.execute(
+            "INSERT INTO bench_checks (endpoint_id, profile, status_code, latency_ms, headers, error, "
+            "checked_at, lag_ms, latency_error_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (endpoint_id, profile, status_code, latency_ms, headers, error, checked.isoformat(sep=' '),
+             lag_ms, latency_error)
+        )
+        from scheduler import next_due
+        from svcmon_service import KST
+        due_ts = next_due(endpoint_id, interval, KST.localize(checked).timestamp())
+        self._conn.execute(
+            "UPDATE bench_endpoints SET last_checked_at = ?, next_check_due = ? WHERE id = ?",
+            (_to_db_time(checked), _to_db_time(datetime.fromtimestamp(due_ts, KST)), endpoint_id)
+        )
+        self._conn.commit()
+        return []
+
+    def _mark_suppressed(self, endpoint_ids, reason=None, suppressed_at=None, **_):
+        # usp_next_poll_batch와 같이 생략 시각을 기준으로 다음 체크 시각을 미룸 (체크 기록은 남기지 않음)
+        from scheduler import next_due
+        from svcmon_service import KST
+        suppressed = datetime.fromisoformat(_to_db_time(suppressed_at))
+        for endpoint_id in (int(value) for value in endpoint_ids.split(',')):
+            interval = self._conn.execute(
+                "SELECT poll_interval_sec FROM bench_endpoints WHERE id = ?", (endpoint_id,)
+            ).fetchone()[0]
+            due_ts = next_due(endpoint_id, interval, KST.localize(suppressed).timestamp())
+            self._conn.execute(
+                "UPDATE bench_endpoints SET next_check_due = ? WHERE id = ?",
+                (_to_db_time(datetime.fromtimestamp(due_ts, KST)), endpoint_id)
+            )
+        self._conn.commit()
+        return []
+
+    def checks_between(self, start: datetime, end: datetime) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT profile, status_code, error, lag_ms, latency_error_ms FROM bench_checks "
+                "WHERE checked_at >= ? AND checked_at < ?",
+                (_to_db_time(start), _to_db_time(end))
+            ).fetchall()
+
+    def overdue_count(self, now: datetime, grace_sec: int) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM bench_endpoints WHERE next_check_due < ?",
+                (_to_db_time(now - timedelta(seconds=grace_sec)),)
+            ).fetchone()[0]
+
+
+# ---------------------------------------------------------------------------
+# 엔드포인트 생성 및 결과 집계
+# ---------------------------------------------------------------------------
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in PROFILES:
+            raise argparse.ArgumentTypeError(f"알 수 없는 응답 유형: {name} (사용 가능: {', '.join(PROFILES)})")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def build_endpoints(args, ports: Dict[str, List[int]], now: datetime) -> List[dict]:
+    """응답 유형 비율에 따라 엔드포인트 생성 (초기 다음 체크 시각은 주기 내 분산, --cold-start 시 모두 즉시)"""
+    rng = random.Random(args.seed)
+    mix = dict(args.mix)
+    if not ports.get('tls'):
+        mix.pop('tls', None)
+    profiles = list(mix)
+    weights = [mix[p] for p in profiles]
+    intervals = [int(v) for v in args.interval.split(',')]
+
+    rows = []
+    for endpoint_id in range(1, args.endpoints + 1):
+        profile = rng.choices(profiles, weights)[0]
+        scheme, port_list = ('https', ports['tls']) if profile == 'tls' else ('http', ports['http'])
+        port = port_list[endpoint_id % len(port_list)]
+        expected_ms = 0
+        if profile == 'slow':
+            expected_ms = rng.randint(args.slow_min_ms, args.slow_max_ms)
+            path = f'/slow/{expected_ms}'
+        elif profile == 'tls':
+            path = '/fast'
+        else:
+            path = f'/{profile}'
+        if profile in ('hang', 'reset'):
+            expected_ms = None
+
+        interval = rng.choice(intervals)
+        offset = 0 if args.cold_start else rng.uniform(0, interval)
+        group = endpoint_id % args.network_groups + 1
+        rows.append({
+            'id': endpoint_id,
+            'url': f'{scheme}://127.0.0.1:{port}{path}?ep={endpoint_id}',
+            'profile': profile,
+            'expected_ms': expected_ms,
+            'poll_interval_sec': interval,
+            'domain': f'bench{port}.local',
+            'site_name': f'벤치마크 {port}',
+            'network_group_id': group,
+            'network_group_name': f'BENCH{group}',
+            'next_check_due': _to_db_time(now + timedelta(seconds=offset)),
+        })
+    return rows
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100.0 * (len(values) - 1))))]
+
+
+def _histogram_mean_ms(histogram) -> Optional[float]:
+    totals = [(entry[1], entry[2]) for entry in histogram._values.values()]
+    count = sum(c for _, c in totals)
+    if not count:
+        return None
+    return round(sum(s for s, _ in totals) / count * 1000, 2)
+
+
+def _histogram_quantile_ms(histogram, q: float) -> Optional[float]:
+    """버킷 상한 기준 근사 분위수"""
+    counts = [0] * len(histogram.buckets)
+    count = 0
+    for bucket_counts, _, entry_count in histogram._values.values():
+        counts = [a + b for a, b in zip(counts, bucket_counts)]
+        count += entry_count
+    if not count:
+        return None
+    for bound, cumulative in zip(histogram.buckets, counts):
+        if cumulative >= q * count:
+            return bound * 1000
+    return float('inf')
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def summarize(args, rows, db: BenchmarkDatabase, service, start: datetime, end: datetime) -> dict:
+    checks = db.checks_between(start, end)
+    duration = (end - start).total_seconds()
+    outcome = {'success': 0, 'http_error': 0, 'timeout': 0, 'client_error': 0}
+    lags = []
+    latency_errors = []
+    for profile, status_code, error, lag_ms, latency_error in checks:
+        if status_code is not None:
+            outcome['success' if 200 <= status_code < 300 else 'http_error'] += 1
+        elif error and '시간 초과' in error:
+            outcome['timeout'] += 1
+        else:
+            outcome['client_error'] += 1
+        lags.append(lag_ms)
+        if latency_error is not None:
+            latency_errors.append(abs(latency_error))
+
+    metrics = service.metrics
+    report = {
+        'endpoints': len(rows),
+        'duration_sec': round(duration, 1),
+        'loop_interval_sec': args.loop_interval,
+        'batch_size': args.batch_size,
+        'max_concurrent': args.max_concurrent,
+        'scheduler': args.scheduler,
+        'suppressed_checks': sum(metrics.suppressed_checks._values.values()),
+        'breaker_rejections': sum(metrics.breaker_rejections._values.values()),
+        'max_checks_per_sec': args.max_checks_per_sec,
+        'required_checks_per_sec': round(sum(1.0 / r['poll_interval_sec'] for r in rows), 2),
+        'checks': len(checks),
+        'checks_per_sec': round(len(checks) / duration, 2) if duration else 0,
+        'results': outcome,
+        'overdue_endpoints': db.overdue_count(end, args.loop_interval),
+        'schedule_lag_ms': {
+            'p50': _percentile(lags, 50),
+            'p95': _percentile(lags, 95),
+            'p99': _percentile(lags, 99),
+            'max': max(lags) if lags else None,
+        },
+        'latency_error_ms': {
+            'p50': _percentile(latency_errors, 50),
+            'p99': _percentile(latency_errors, 99),
+            'max': max(latency_errors) if latency_errors else None,
+        },
+        'db_write_ms_mean': _histogram_mean_ms(metrics.db_write_latency),
+        'event_loop_lag_ms': {
+            'mean': _histogram_mean_ms(metrics.loop_lag_histogram),
+            'p99_bucket': _histogram_quantile_ms(metrics.loop_lag_histogram, 0.99),
+        },
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+    if args.tracemalloc:
+        report['python_heap_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+    return report
+
+
+def print_report(report: dict):
+    print("\n=== SVCMON 폴러 벤치마크 결과 ===")
+    print(f"엔드포인트        : {report['endpoints']}개 "
+          f"(필요 처리량 {report['required_checks_per_sec']}건/초)")
+    print(f"측정 시간         : {report['duration_sec']}초 "
+          f"(루프 간격 {report['loop_interval_sec']}초, 배치 {report['batch_size']}, "
+          f"동시 {report['max_concurrent']})")
+    print(f"스케줄러          : {report['scheduler']} (초당 예산 {report['max_checks_per_sec'] or '제한 없음'})")
+    print(f"처리량            : {report['checks']}건, {report['checks_per_sec']}건/초")
+    results = report['results']
+    print(f"결과              : 성공 {results['success']}, HTTP 오류 {results['http_error']}, "
+          f"시간 초과 {results['timeout']}, 연결 오류 {results['client_error']}")
+    print(f"밀린 엔드포인트   : {report['overdue_endpoints']}개")
+    lag = report['schedule_lag_ms']
+    print(f"스케줄 지연(ms)   : p50 {lag['p50']}, p95 {lag['p95']}, p99 {lag['p99']}, 최대 {lag['max']}")
+    err = report['latency_error_ms']
+    print(f"지연 측정 오차(ms): p50 {err['p50']}, p99 {err['p99']}, 최대 {err['max']}")
+    print(f"DB 기록 평균(ms)  : {report['db_write_ms_mean']}")
+    loop_lag = report['event_loop_lag_ms']
+    print(f"이벤트 루프 지연  : 평균 {loop_lag['mean']}ms, p99 <= {loop_lag['p99_bucket']}ms")
+    print(f"최대 RSS          : {report['peak_rss_mb']}MB")
+    if 'python_heap_peak_mb' in report:
+        print(f"파이썬 힙 최대    : {report['python_heap_peak_mb']}MB")
+
+
+# (지표, 나빠지는 방향, 허용 절대 차이)
+REGRESSION_CHECKS = (
+    (('checks_per_sec',), 'lower', 0),
+    (('schedule_lag_ms', 'p99'), 'higher', 500),
+    (('latency_error_ms', 'p99'), 'higher', 20),
+    (('peak_rss_mb',), 'higher', 20),
+)
+
+
+def compare_with_baseline(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """기준 결과 대비 회귀 목록 반환"""
+    regressions = []
+    for path, worse, slack in REGRESSION_CHECKS:
+        current, base = report, baseline
+        for key in path:
+            current = current.get(key) if isinstance(current, dict) else None
+            base = base.get(key) if isinstance(base, dict) else None
+        if current is None or base is None:
+            continue
+        name = '.'.join(path)
+        if worse == 'lower' and current < base * (1 - tolerance) and base - current > slack:
+            regressions.append(f"{name}: {base} -> {current}")
+        elif worse == 'higher' and current > base * (1 + tolerance) and current - base > slack:
+            regressions.append(f"{name}: {base} -> {current}")
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def run(args) -> dict:
+    workdir = args.workdir or tempfile.mkdtemp(prefix='svcmon_bench_')
+    os.makedirs(workdir, exist_ok=True)
+    config_path = os.path.join(workdir, 'config.ini')
+    with open(config_path, 'w', encoding='utf-8') as f:
+        f.write(BENCH_CONFIG)
+
+    farm = ServerFarm(args.servers, hang_sec=args.timeout + 5, workdir=workdir, tls=not args.no_tls)
+    farm.start()
+    print(f"가짜 서버 팜 시작: HTTP {farm.ports['http']}, HTTPS {farm.ports.get('tls')}")
+
+    # svcmon_service는 import 시 설정 파일과 SSL 기본 컨텍스트를 읽으므로 환경을 먼저 준비
+    os.environ['SVCMON_CONFIG'] = config_path
+    if farm.tls_files:
+        os.environ['SSL_CERT_FILE'] = farm.tls_files[0]
+    os.chdir(workdir)  # 로그 파일은 작업 디렉터리에 기록
+    if CONSOLE_DIR not in sys.path:
+        sys.path.insert(0, CONSOLE_DIR)
+    import svcmon_service
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    db = BenchmarkDatabase(args.db)
+    rows = build_endpoints(args, farm.ports, svcmon_service.get_seoul_time())
+    db.load_endpoints(rows)
+
+    service = svcmon_service.MonitoringService(db=db)
+    # 운영 기본값 대신 벤치마크 설정 적용
+    service.poll_interval = args.loop_interval
+    service.batch_size = args.batch_size
+    service.max_concurrent = args.max_concurrent
+    service.timeout = args.timeout
+    service.http_checker = svcmon_service.HttpChecker(
+        timeout=args.timeout,
+        max_concurrent=args.max_concurrent,
+        metrics=service.metrics,
+        check_log=service.check_log,
+        breaker_policy=service._create_breaker_policy() if args.breaker else None,
+        header_allowlist=service.http_settings['header_allowlist']
+    )
+    service.metrics_settings = {'enabled': True, 'host': '127.0.0.1', 'port': 0}
+    service.scheduler_settings.update(
+        mode=args.scheduler,
+        max_checks_per_sec=args.max_checks_per_sec,
+        group_checks_per_sec=args.group_checks_per_sec,
+    )
+    service.scheduler = service._create_scheduler() if args.scheduler == 'adaptive' else None
+    service.state_settings['enabled'] = False  # 실행마다 독립적으로 측정
+    if not args.dependencies:
+        # 벤치마크 서버는 모두 같은 호스트이므로 기본은 체크 생략 없이 원시 처리량 측정
+        service.dependencies = None
+
+    print(f"{len(rows)}개 엔드포인트로 폴링 시작 (워밍업 {args.warmup}초, 측정 {args.duration}초)")
+    try:
+        service.start()
+        time.sleep(args.warmup)
+        start = svcmon_service.get_seoul_time()
+        time.sleep(args.duration)
+        end = svcmon_service.get_seoul_time()
+        report = summarize(args, rows, db, service, start, end)
+    finally:
+        service.stop()
+        farm.stop()
+
+    report['workdir'] = workdir
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SVCMON 폴러 부하 벤치마크')
+    parser.add_argument('--endpoints', type=int, default=1000, help='엔드포인트 수')
+    parser.add_argument('--interval', default='60', help='폴링 간격(초), 쉼표로 여러 값 지정 시 무작위 배정')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f'응답 유형 비율 (기본: {DEFAULT_MIX})')
+    parser.add_argument('--servers', type=int, default=4, help='가짜 서버 포트 수 (HTTP/HTTPS 각각)')
+    parser.add_argument('--no-tls', action='store_true', help='HTTPS 서버 생략')
+    parser.add_argument('--slow-min-ms', type=int, default=200)
+    parser.add_argument('--slow-max-ms', type=int, default=2000)
+    parser.add_argument('--network-groups', type=int, default=3, help='망구분 수 (메트릭 레이블용)')
+    parser.add_argument('--cold-start', action='store_true', help='모든 엔드포인트를 시작 시점에 동시에 체크 대상으로 설정')
+    parser.add_argument('--duration', type=int, default=60, help='측정 시간(초)')
+    parser.add_argument('--warmup', type=int, default=5, help='측정 전 워밍업 시간(초)')
+    parser.add_argument('--loop-interval', type=int, default=10, help='메인 루프 간격(초), 운영 기본값 10')
+    parser.add_argument('--batch-size', type=int, default=50, help='배치 크기, 운영 기본값 50')
+    parser.add_argument('--max-concurrent', type=int, default=50, help='동시 요청 수, 운영 기본값 50')
+    parser.add_argument('--timeout', type=int, default=5, help='HTTP 요청 시간 초과(초)')
+    parser.add_argument('--scheduler', choices=('fixed', 'adaptive'), default='fixed',
+                        help='스케줄러 모드 (adaptive는 스케줄 지연이 기본 주기 기준이라 음수/큰 값이 섞임)')
+    parser.add_argument('--max-checks-per-sec', type=float, default=0, help='adaptive 전체 초당 체크 예산 (0: 제한 없음)')
+    parser.add_argument('--group-checks-per-sec', type=float, default=0, help='adaptive 망구분별 초당 체크 예산')
+    parser.add_argument('--breaker', action='store_true', help='호스트별 회로 차단 사용')
+    parser.add_argument('--dependencies', action='store_true', help='상위 노드 장애 시 체크 생략 사용')
+    parser.add_argument('--db', default=':memory:', help='SQLite 경로 (기본: 메모리)')
+    parser.add_argument('--tracemalloc', action='store_true', help='파이썬 힙 최대 사용량 측정 (처리량 저하 있음)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--workdir', help='설정/로그 파일 디렉터리 (기본: 임시 디렉터리)')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='회귀 판정 허용 비율 (기본 20%%)')
+    args = parser.parse_args()
+
+    if args.json:
+        args.json = os.path.abspath(args.json)
+    if args.baseline:
+        args.baseline = os.path.abspath(args.baseline)
+    if args.db != ':memory:':
+        args.db = os.path.abspath(args.db)
+
+    report = run(args)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("\n회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n기준 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# SVCMON 콘솔 호스트별 회로 차단기(circuit breaker)
+# 연결 실패/시간 초과가 이어지는 호스트에는 요청을 보내지 않고 즉시 실패 결과를 돌려줘
+# 죽은 호스트가 동시 요청 한도(세마포어)와 타임아웃 시간을 차지하지 않도록 합니다.
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+@dataclass
+class BreakerPolicy:
+    """차단 기준 ([Http] breaker_* 설정)"""
+    failure_threshold: int = 5      # 연속 연결 실패 횟수 → open
+    open_sec: float = 30            # open 후 첫 탐침(half-open)까지 대기
+    max_open_sec: float = 300       # 탐침 실패마다 대기를 2배로 늘리는 상한
+
+
+@dataclass
+class Breaker:
+    """호스트 하나의 차단 상태"""
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0          # epoch 초 (스냅샷 복원 가능하도록 wall clock)
+    open_sec: float = 0.0
+    last_error: Optional[str] = None
+
+
+class CircuitBreakers:
+    """
+    호스트(호스트명:포트)별 회로 차단기
+
+    - closed: 정상 요청, 응답 없음(연결 실패/시간 초과)이 failure_threshold회 연속이면 open
+    - open: 요청 없이 즉시 실패, open_sec 경과 후 요청 1건만 탐침으로 허용(half-open)
+    - half_open: 탐침이 응답을 받으면(HTTP 오류 포함) closed, 실패하면 대기를 2배로 늘려 다시 open
+    """
+
+    def __init__(self, policy: BreakerPolicy):
+        self.policy = policy
+        self.breakers: Dict[str, Breaker] = {}
+
+    def allow(self, host: str, now: Optional[float] = None) -> bool:
+        """요청을 보내도 되는지 (half-open 전환 시 호출한 요청이 탐침이 됨)"""
+        breaker = self.breakers.get(host)
+        if breaker is None or breaker.state == CLOSED:
+            return True
+        if breaker.state == HALF_OPEN:
+            return False
+        if now is None:
+            now = time.time()
+        if now - breaker.opened_at < breaker.open_sec:
+            return False
+        breaker.state = HALF_OPEN
+        return True
+
+    def record(self, host: str, responded: bool, error: Optional[str] = None,
+               now: Optional[float] = None) -> Optional[str]:
+        """요청 결과 반영, 반환값: 바뀐 상태 (변화 없으면 None)"""
+        breaker = self.breakers.get(host)
+        if responded:
+            if breaker is None:
+                return None
+            changed = CLOSED if breaker.state != CLOSED else None
+            del self.breakers[host]
+            return changed
+
+        if breaker is None:
+            breaker = Breaker()
+            self.breakers[host] = breaker
+        breaker.failures += 1
+        breaker.last_error = error
+        if now is None:
+            now = time.time()
+        if breaker.state == HALF_OPEN:
+            breaker.open_sec = min(breaker.open_sec * 2, self.policy.max_open_sec)
+        elif breaker.state == CLOSED and breaker.failures >= self.policy.failure_threshold:
+            breaker.open_sec = self.policy.open_sec
+        else:
+            return None
+        breaker.state = OPEN
+        breaker.opened_at = now
+        return OPEN
+
+    def release(self, host: str):
+        """탐침이 결과 없이 취소된 경우 다시 탐침할 수 있도록 open으로 되돌림"""
+        breaker = self.breakers.get(host)
+        if breaker is not None and breaker.state == HALF_OPEN:
+            breaker.state = OPEN
+
+    def reason(self, host: str) -> str:
+        """즉시 실패 결과에 남길 사유"""
+        breaker = self.breakers[host]
+        reason = f"회로 차단 - {host} 연속 {breaker.failures}회 연결 실패"
+        if breaker.last_error:
+            reason += f" (마지막 오류: {breaker.last_error})"
+        return reason[:500]
+
+    def open_count(self) -> int:
+        return sum(1 for breaker in self.breakers.values() if breaker.state != CLOSED)
+
+    def export(self) -> List[list]:
+        """스냅샷용 [host, 상태, 연속 실패, open 시각, 대기(초), 마지막 오류] (open/half-open만)"""
+        return [
+            [host, OPEN, breaker.failures, round(breaker.opened_at, 1), breaker.open_sec, breaker.last_error]
+            for host, breaker in self.breakers.items()
+            if breaker.state != CLOSED
+        ]
+
+    def restore(self, rows: List[list]):
+        """스냅샷에서 복원 (half-open이던 차단기는 open으로 복원해 탐침을 다시 보냄)"""
+        for host, _state, failures, opened_at, open_sec, last_error in rows:
+            self.breakers.setdefault(host, Breaker(
+                state=OPEN, failures=failures, opened_at=opened_at, open_sec=open_sec, last_error=last_error
+            ))
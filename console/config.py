@@ -1,19 +1,186 @@
 import configparser
 import os
 
-def get_connection_string():
-    """config.ini 파일에서 연결 문자열을 읽어 반환합니다."""
+# SVCMON_CONFIG 환경변수로 다른 설정 파일 지정 가능 (벤치마크 등)
+CONFIG_PATH = os.environ.get('SVCMON_CONFIG') or os.path.join(os.path.dirname(__file__), 'config.ini')
+
+
+def load_config():
+    """config.ini 파일을 읽어 ConfigParser 객체를 반환합니다."""
     config = configparser.ConfigParser()
-    config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
     
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"설정 파일({config_path})을 찾을 수 없습니다.")
+    if not os.path.exists(CONFIG_PATH):
+        raise FileNotFoundError(f"설정 파일({CONFIG_PATH})을 찾을 수 없습니다.")
         
-    config.read(config_path, encoding='utf-8')
+    config.read(CONFIG_PATH, encoding='utf-8')
+    return config
+
+
+def get_connection_string():
+    """config.ini 파일에서 연결 문자열을 읽어 반환합니다."""
+    config = load_config()
     
     try:
         return config['Database']['connection_string']
     except KeyError:
         raise KeyError("설정 파일에 [Database] 섹션이나 connection_string 키가 없습니다.")
 
-CONNECTION_STRING = get_connection_string()
+
+def get_metrics_settings():
+    """config.ini의 [Metrics] 섹션 설정을 반환합니다. (섹션이 없으면 비활성화)"""
+    config = load_config()
+    return {
+        'enabled': config.getboolean('Metrics', 'enabled', fallback=False),
+        'host': config.get('Metrics', 'host', fallback='127.0.0.1'),
+        'port': config.getint('Metrics', 'port', fallback=9108),
+    }
+
+
+def get_logging_settings():
+    """config.ini의 [Logging] 섹션 설정을 반환합니다."""
+    config = load_config()
+    return {
+        'format': config.get('Logging', 'format', fallback='text').lower(),
+        'console': config.getboolean('Logging', 'console', fallback=True),
+        'max_bytes': config.getint('Logging', 'max_bytes', fallback=10 * 1024 * 1024),
+        'backup_count': config.getint('Logging', 'backup_count', fallback=5),
+        'queue_size': config.getint('Logging', 'queue_size', fallback=10000),
+        'success_sample_every': config.getint('Logging', 'success_sample_every', fallback=100),
+        'summary_interval_sec': config.getint('Logging', 'summary_interval_sec', fallback=60),
+    }
+
+
+def get_scheduler_settings():
+    """config.ini의 [Scheduler] 섹션 설정을 반환합니다. (섹션이 없으면 고정 주기)"""
+    config = load_config()
+    return {
+        'mode': config.get('Scheduler', 'mode', fallback='fixed').lower(),
+        'max_checks_per_sec': config.getfloat('Scheduler', 'max_checks_per_sec', fallback=0),
+        'group_checks_per_sec': config.getfloat('Scheduler', 'group_checks_per_sec', fallback=0),
+        'failure_recheck_sec': config.getint('Scheduler', 'failure_recheck_sec', fallback=15),
+        'confirm_checks': config.getint('Scheduler', 'confirm_checks', fallback=3),
+        'backoff_after': config.getint('Scheduler', 'backoff_after', fallback=10),
+        'backoff_factor': config.getfloat('Scheduler', 'backoff_factor', fallback=1.5),
+        'max_interval_sec': config.getint('Scheduler', 'max_interval_sec', fallback=900),
+        'tick_sec': config.getfloat('Scheduler', 'tick_sec', fallback=1.0),
+        'refresh_sec': config.getint('Scheduler', 'refresh_sec', fallback=60),
+    }
+
+
+# 체크 결과에 기록할 응답 헤더 기본값 (Date 등 매번 바뀌는 헤더는 제외해야 헤더 조합이 재사용됨)
+DEFAULT_HEADER_ALLOWLIST = (
+    'Server, Content-Type, Cache-Control, Content-Encoding, Location, Strict-Transport-Security, X-Powered-By'
+)
+
+
+def get_http_settings():
+    """config.ini의 [Http] 섹션 설정을 반환합니다."""
+    config = load_config()
+    header_allowlist = config.get('Http', 'header_allowlist', fallback=DEFAULT_HEADER_ALLOWLIST)
+    return {
+        'header_allowlist': [name.strip().lower() for name in header_allowlist.split(',') if name.strip()],
+        'dns_cache_ttl_sec': config.getint('Http', 'dns_cache_ttl_sec', fallback=300),
+        'breaker_enabled': config.getboolean('Http', 'breaker_enabled', fallback=False),
+        'breaker_failures': config.getint('Http', 'breaker_failures', fallback=5),
+        'breaker_open_sec': config.getfloat('Http', 'breaker_open_sec', fallback=30),
+        'breaker_max_open_sec': config.getfloat('Http', 'breaker_max_open_sec', fallback=300),
+    }
+
+
+def get_state_settings():
+    """config.ini의 [State] 섹션 설정을 반환합니다. (재시작 시 복원할 폴러 상태 스냅샷)"""
+    config = load_config()
+    return {
+        'enabled': config.getboolean('State', 'enabled', fallback=True),
+        'file': config.get('State', 'file', fallback=''),
+        'interval_sec': config.getint('State', 'interval_sec', fallback=60),
+        'max_age_sec': config.getint('State', 'max_age_sec', fallback=86400),
+    }
+
+
+def get_dependency_settings():
+    """config.ini의 [Dependencies] 섹션 설정을 반환합니다. (상위 노드 장애 시 하위 엔드포인트 체크 생략)"""
+    config = load_config()
+    return {
+        'enabled': config.getboolean('Dependencies', 'enabled', fallback=False),
+        'parent_failures': config.getint('Dependencies', 'parent_failures', fallback=2),
+        'host_failures': config.getint('Dependencies', 'host_failures', fallback=3),
+        'domain_failures': config.getint('Dependencies', 'domain_failures', fallback=5),
+        'group_failures': config.getint('Dependencies', 'group_failures', fallback=20),
+        'canary_interval_sec': config.getint('Dependencies', 'canary_interval_sec', fallback=60),
+    }
+
+
+def get_supervisor_settings():
+    """config.ini의 [Supervisor] 섹션 설정을 반환합니다. (한 프로세스에서 여러 망구분 실행)"""
+    config = load_config()
+    groups = config.get('Supervisor', 'network_groups', fallback='')
+    return {
+        'network_groups': [name.strip() for name in groups.split(',') if name.strip()],
+        'config_check_sec': config.getint('Supervisor', 'config_check_sec', fallback=10),
+        'db_pool_size': config.getint('Supervisor', 'db_pool_size', fallback=0),
+        'processes': config.getint('Supervisor', 'processes', fallback=1),
+    }
+
+
+def get_sharding_settings():
+    """config.ini의 [Sharding] 섹션 설정을 반환합니다. (여러 폴러 인스턴스가 샤드 임대로 엔드포인트 분배)"""
+    config = load_config()
+    return {
+        'enabled': config.getboolean('Sharding', 'enabled', fallback=False),
+        'shard_count': config.getint('Sharding', 'shard_count', fallback=64),
+        'lease_sec': config.getint('Sharding', 'lease_sec', fallback=30),
+        'renew_sec': config.getint('Sharding', 'renew_sec', fallback=10),
+        'instance_id': config.get('Sharding', 'instance_id', fallback=''),
+    }
+
+
+def get_agent_settings():
+    """config.ini의 [Agent] 섹션 설정을 반환합니다. (DB 대신 웹앱 수집 API로 결과 전송)"""
+    config = load_config()
+    return {
+        'enabled': config.getboolean('Agent', 'enabled', fallback=False),
+        'url': config.get('Agent', 'url', fallback=''),
+        'token': config.get('Agent', 'token', fallback=''),
+        'batch_size': config.getint('Agent', 'batch_size', fallback=500),
+        'flush_sec': config.getfloat('Agent', 'flush_sec', fallback=5),
+        'timeout': config.getint('Agent', 'timeout', fallback=30),
+        'max_buffer': config.getint('Agent', 'max_buffer', fallback=50000),
+        'ca_file': config.get('Agent', 'ca_file', fallback=''),
+    }
+
+
+
+def get_on_demand_settings():
+    """config.ini의 [OnDemand] 섹션 설정을 반환합니다. (웹앱 즉시 점검 요청 큐)"""
+    config = load_config()
+    return {
+        'enabled': config.getboolean('OnDemand', 'enabled', fallback=True),
+        'poll_sec': config.getfloat('OnDemand', 'poll_sec', fallback=1),
+        'batch_size': config.getint('OnDemand', 'batch_size', fallback=20),
+        'stale_sec': config.getint('OnDemand', 'stale_sec', fallback=60),
+    }
+
+
+def get_notification_settings():
+    """config.ini의 [Notification] 섹션 설정을 반환합니다. (상태 전환 알림 메일 발송)"""
+    config = load_config()
+    recipients = config.get('Notification', 'fallback_recipients', fallback='')
+    return {
+        'enabled': config.getboolean('Notification', 'enabled', fallback=False),
+        'smtp_host': config.get('Notification', 'smtp_host', fallback='localhost'),
+        'smtp_port': config.getint('Notification', 'smtp_port', fallback=25),
+        'smtp_security': config.get('Notification', 'smtp_security', fallback='none').strip().lower(),
+        'smtp_user': config.get('Notification', 'smtp_user', fallback=''),
+        'smtp_password': config.get('Notification', 'smtp_password', fallback=''),
+        'from_addr': config.get('Notification', 'from_addr', fallback='svcmon@localhost'),
+        'timeout': config.getint('Notification', 'timeout', fallback=30),
+        'pool_size': config.getint('Notification', 'pool_size', fallback=2),
+        'digest_sec': config.getfloat('Notification', 'digest_sec', fallback=60),
+        'max_digest_events': config.getint('Notification', 'max_digest_events', fallback=500),
+        'refresh_sec': config.getfloat('Notification', 'refresh_sec', fallback=300),
+        'fallback_recipients': [item.strip() for item in recipients.split(',') if item.strip()],
+    }
+
+# 에이전트 모드에서는 DB에 연결하지 않으므로 [Database] 섹션이 없어도 됨
+CONNECTION_STRING = '' if get_agent_settings()['enabled'] else get_connection_string()
@@ -0,0 +1,168 @@
+# SVCMON 콘솔 의존 관계 기반 체크 생략(suppression)
+# 호스트 → 도메인 → 망구분 순의 상위 노드와 명시적 상위 엔드포인트(게이트웨이 등)가 장애로 확인되면
+# 하위 엔드포인트는 체크하지 않고 노드마다 카나리 1건만 주기적으로 체크합니다.
+# 카나리가 성공하면 노드가 복구된 것으로 보고 하위 엔드포인트 체크를 재개합니다.
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+NodeKey = Tuple[str, str]
+
+LEVEL_NAMES = {
+    'parent': '상위 엔드포인트',
+    'host': '호스트',
+    'domain': '도메인',
+    'group': '망구분',
+}
+
+
+@dataclass
+class DependencyPolicy:
+    """장애 확인 기준 ([Dependencies] 설정)"""
+    parent_failures: int = 2      # 명시적 상위 엔드포인트 연속 실패 횟수
+    host_failures: int = 3        # 호스트 연속 연결 실패(응답 없음) 횟수
+    domain_failures: int = 5      # 도메인 연속 실패 횟수
+    group_failures: int = 20      # 망구분 연속 실패 횟수
+    canary_interval_sec: int = 60
+
+    def threshold(self, level: str) -> int:
+        return getattr(self, f'{level}_failures')
+
+
+@dataclass
+class NodeState:
+    """상위 노드 상태 (하위 엔드포인트 체크 결과를 순서대로 누적)"""
+    members: Set[int] = field(default_factory=set)
+    failures: int = 0
+    failing_members: Set[int] = field(default_factory=set)
+    down_since: Optional[float] = None
+    last_canary: float = 0.0
+
+
+def endpoint_host(url: str) -> str:
+    """URL의 호스트:포트"""
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    return f'{(parsed.hostname or "").lower()}:{port}'
+
+
+class DependencyTracker:
+    """
+    상위 노드 장애 판정 및 체크 생략 결정
+
+    - 호스트: 연결 실패/시간 초과(응답 없음)만 셈 (HTTP 오류는 호스트가 살아 있다는 뜻)
+    - 도메인/망구분/상위 엔드포인트: 응답 없음과 HTTP 오류를 모두 셈
+    - 성공 1건이면 연속 실패 초기화 (노드 복구)
+    - 호스트/도메인/망구분은 서로 다른 엔드포인트 2개 이상이 연속 실패해야 장애로 확인
+      (하위 엔드포인트가 하나뿐인 노드는 생략할 대상이 없음)
+    """
+
+    def __init__(self, policy: DependencyPolicy):
+        self.policy = policy
+        self.nodes: Dict[NodeKey, NodeState] = {}
+        self.parent_ids: Set[int] = set()
+
+    def _keys(self, endpoint) -> List[NodeKey]:
+        """엔드포인트의 상위 노드 (가까운 순)"""
+        keys = []
+        parent_id = getattr(endpoint, 'parent_endpoint_id', None)
+        if parent_id:
+            keys.append(('parent', str(parent_id)))
+        keys.append(('host', endpoint_host(endpoint.url)))
+        keys.append(('domain', endpoint.domain))
+        keys.append(('group', endpoint.network_group_name or ''))
+        return keys
+
+    def _node(self, key: NodeKey) -> NodeState:
+        node = self.nodes.get(key)
+        if node is None:
+            node = NodeState()
+            self.nodes[key] = node
+        return node
+
+    def is_down(self, key: NodeKey) -> bool:
+        node = self.nodes.get(key)
+        return node is not None and node.down_since is not None
+
+    def split(self, endpoints: list, now: Optional[float] = None) -> Tuple[list, Dict[NodeKey, list]]:
+        """
+        (체크할 엔드포인트, {장애 노드: 생략할 엔드포인트 목록})
+
+        장애 노드의 하위 엔드포인트 중 canary_interval_sec마다 1건은 카나리로 체크합니다.
+        """
+        now = now or time.time()
+        checks = []
+        suppressed: Dict[NodeKey, list] = {}
+        for endpoint in endpoints:
+            keys = self._keys(endpoint)
+            for key in keys:
+                if key[0] == 'parent':
+                    self.parent_ids.add(int(key[1]))
+                else:
+                    self._node(key).members.add(endpoint.endpoint_id)
+
+            down = next((key for key in keys if self.is_down(key)), None)
+            if down is None:
+                checks.append(endpoint)
+                continue
+
+            node = self.nodes[down]
+            if now - node.last_canary >= self.policy.canary_interval_sec:
+                node.last_canary = now
+                checks.append(endpoint)
+                continue
+            suppressed.setdefault(down, []).append(endpoint)
+        return checks, suppressed
+
+    def record(self, endpoint, status_code: Optional[int], now: Optional[float] = None) -> List[NodeKey]:
+        """체크 결과 반영, 반환값: 이번 결과로 상태가 바뀐(장애 확인/복구) 노드"""
+        now = now or time.time()
+        success = status_code is not None and 200 <= status_code < 300
+        changed = []
+
+        keys = [key for key in self._keys(endpoint) if key[0] != 'parent']
+        # 명시적 상위 엔드포인트 노드는 그 엔드포인트 자신의 결과로 판정
+        if endpoint.endpoint_id in self.parent_ids:
+            keys.insert(0, ('parent', str(endpoint.endpoint_id)))
+        for key in keys:
+            level = key[0]
+            node = self._node(key)
+            if level == 'host':
+                # HTTP 오류라도 응답이 있으면 호스트는 살아 있음
+                failed = status_code is None
+            else:
+                failed = not success
+
+            if not failed:
+                if node.down_since is not None:
+                    changed.append(key)
+                node.failures = 0
+                node.failing_members.clear()
+                node.down_since = None
+                continue
+
+            node.failures += 1
+            node.failing_members.add(endpoint.endpoint_id)
+            if node.down_since is None and self._confirmed(level, node):
+                node.down_since = now
+                node.last_canary = now
+                changed.append(key)
+        return changed
+
+    def _confirmed(self, level: str, node: NodeState) -> bool:
+        if node.failures < self.policy.threshold(level):
+            return False
+        if level == 'parent':
+            return True
+        return len(node.members) >= 2 and len(node.failing_members) >= 2
+
+    def reason(self, key: NodeKey) -> str:
+        """롤업에 남길 생략 사유"""
+        level, name = key
+        if level == 'parent':
+            return f'{LEVEL_NAMES[level]} #{name} 장애'
+        return f'{LEVEL_NAMES[level]} {name} 장애'
+
+    def down_nodes(self) -> List[NodeKey]:
+        return [key for key, node in self.nodes.items() if node.down_since is not None]
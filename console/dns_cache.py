@@ -0,0 +1,68 @@
+# SVCMON 콘솔 DNS 캐시
+# 요청마다 새 ClientSession/커넥터를 만들어도 이름 해석 결과를 공유하도록 하는 aiohttp 리졸버
+# 캐시는 상태 스냅샷에 저장되어 재시작 직후에도 DNS 조회가 몰리지 않습니다.
+import socket
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+CacheKey = Tuple[str, int, int]
+
+
+class CachingResolver(AbstractResolver):
+    """
+    TTL 기반 공유 DNS 캐시
+
+    만료된 항목은 다시 조회하되, 조회가 실패하면 마지막 결과를 그대로 사용합니다.
+    (DNS 서버 장애가 모든 엔드포인트 장애로 보이지 않도록)
+    """
+
+    def __init__(self, ttl_sec: int = 300, max_entries: int = 10000):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._resolver: Optional[AbstractResolver] = None
+        # {(host, port, family): (만료 시각, 조회 결과)}
+        self._cache: Dict[CacheKey, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict[str, Any]]:
+        key = (host, port, int(family))
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.time():
+            return [dict(item) for item in entry[1]]
+
+        # 기본 리졸버는 이벤트 루프 안에서 생성
+        if self._resolver is None:
+            self._resolver = DefaultResolver()
+        try:
+            results = await self._resolver.resolve(host, port, family)
+        except OSError:
+            if entry is not None:
+                return [dict(item) for item in entry[1]]
+            raise
+
+        if len(self._cache) >= self.max_entries and key not in self._cache:
+            self._cache.pop(min(self._cache, key=lambda k: self._cache[k][0]))
+        self._cache[key] = (time.time() + self.ttl_sec, [dict(item) for item in results])
+        return results
+
+    async def close(self):
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+    def export(self) -> List[list]:
+        """스냅샷용 [host, port, family, 만료 시각, 결과 목록]"""
+        return [
+            [host, port, family, round(expires, 1), results]
+            for (host, port, family), (expires, results) in self._cache.items()
+        ]
+
+    def restore(self, entries: List[list]):
+        """스냅샷에서 복원 (만료된 항목도 조회 실패 시 대비용으로 보관)"""
+        for host, port, family, expires, results in entries[:self.max_entries]:
+            self._cache.setdefault((host, port, family), (expires, results))
+
+    def __len__(self):
+        return len(self._cache)
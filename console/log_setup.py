@@ -0,0 +1,151 @@
+# SVCMON 콘솔 로깅 설정
+# 이벤트 루프 스레드가 디스크 I/O로 막히지 않도록 QueueHandler + 리스너 스레드로 기록
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 형식 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        extra = getattr(record, 'fields', None)
+        if extra:
+            payload.update(extra)
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def setup_queue_logging(logger: logging.Logger, log_filename: str, settings: dict) -> logging.handlers.QueueListener:
+    """
+    로거에 QueueHandler를 연결하고 실제 기록은 리스너 스레드에서 처리합니다.
+
+    Args:
+        logger: 설정할 로거
+        log_filename: 로그 파일 경로 (크기 기준 로테이션)
+        settings: config.get_logging_settings() 결과
+
+    Returns:
+        시작된 QueueListener (종료 시 stop() 호출 필요)
+    """
+    if settings['format'] == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+    handlers = []
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_filename,
+        maxBytes=settings['max_bytes'],
+        backupCount=settings['backup_count'],
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
+
+    if settings['console']:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    # 큐가 가득 차면 이벤트 루프를 막지 않고 버림 (QueueHandler는 put_nowait 사용)
+    log_queue = queue.Queue(maxsize=settings['queue_size'])
+    queue_handler = _DroppingQueueHandler(log_queue)
+
+    logger.handlers.clear()
+    logger.addHandler(queue_handler)
+    # 루트 로거에 핸들러가 있는 환경(서비스 호스트 등)에서 중복 기록되지 않도록 전파 차단
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 찼을 때 예외 대신 버린 건수를 집계하는 QueueHandler"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class CheckLogSampler:
+    """
+    체크 성공 로그 샘플링/요약기
+
+    성공 건은 sample_every건마다 한 줄만 남기고(0이면 개별 로그 없음),
+    summary_interval_sec마다 성공 건수와 평균 응답시간 요약을 남깁니다.
+    실패 건은 호출자가 그대로 WARNING 이상으로 기록합니다.
+    """
+
+    def __init__(self, logger: logging.Logger, sample_every: int = 0, summary_interval_sec: int = 60):
+        self.logger = logger
+        self.sample_every = sample_every
+        self.summary_interval_sec = summary_interval_sec
+        self._lock = threading.Lock()
+        self._total = 0
+        self._window_count = 0
+        self._window_latency = 0
+        self._window_max_latency = 0
+        self._window_started = time.monotonic()
+
+    def record_success(self, url: str, status: int, latency_ms: Optional[int]):
+        """성공 체크 1건 기록"""
+        latency = latency_ms or 0
+        with self._lock:
+            self._total += 1
+            self._window_count += 1
+            self._window_latency += latency
+            self._window_max_latency = max(self._window_max_latency, latency)
+            sampled = self.sample_every > 0 and self._total % self.sample_every == 0
+
+        if sampled:
+            self.logger.info(
+                f"체크 완료: {url} - {status} ({latency}ms)",
+                extra={'fields': {'url': url, 'status': status, 'latency_ms': latency}}
+            )
+        self.flush_summary()
+
+    def flush_summary(self, force: bool = False):
+        """요약 주기가 지났으면(또는 force) 요약 한 줄 기록"""
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._window_started
+            if not force and elapsed < self.summary_interval_sec:
+                return
+            count = self._window_count
+            avg = (self._window_latency / count) if count else 0
+            max_latency = self._window_max_latency
+            self._window_count = 0
+            self._window_latency = 0
+            self._window_max_latency = 0
+            self._window_started = now
+
+        if count:
+            self.logger.info(
+                f"체크 성공 요약: {count}건 / {elapsed:.0f}초, 평균 {avg:.0f}ms, 최대 {max_latency}ms",
+                extra={'fields': {'success_count': count, 'window_sec': round(elapsed),
+                                  'avg_latency_ms': round(avg), 'max_latency_ms': max_latency}}
+            )
@@ -0,0 +1,282 @@
+# SVCMON 콘솔 모니터링 메트릭
+# 폴러 내부 상태를 Prometheus 텍스트 형식으로 노출 (asyncio 내장 HTTP 리스너)
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('SVCMON')
+
+# 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DB_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_labels(key: LabelKey, extra: str = '') -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _quote(value) -> str:
+    return '"' + _escape(str(value)) + '"'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, labels: Optional[Dict[str, str]] = None):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(key)} {value:g}')
+        return lines
+
+
+class Gauge:
+    """현재값 게이지"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, labels: Optional[Dict[str, str]] = None):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1, labels: Optional[Dict[str, str]] = None):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, labels: Optional[Dict[str, str]] = None):
+        self.inc(-amount, labels)
+
+    def get(self, labels: Optional[Dict[str, str]] = None) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} gauge']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(key)} {value:g}')
+        return lines
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        # {레이블: [버킷별 건수, 합계, 건수]}
+        self._values: Dict[LabelKey, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Optional[Dict[str, str]] = None):
+        key = _label_key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = [[0] * len(self.buckets), 0.0, 0]
+                self._values[key] = entry
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                for bound, value in zip(self.buckets, counts):
+                    lines.append(f'{self.name}_bucket{_format_labels(key, "le=%s" % _quote(bound))} {value}')
+                lines.append(f'{self.name}_bucket{_format_labels(key, "le=%s" % _quote("+Inf"))} {count}')
+                lines.append(f'{self.name}_sum{_format_labels(key)} {total:.6f}')
+                lines.append(f'{self.name}_count{_format_labels(key)} {count}')
+        return lines
+
+
+class PollerMetrics:
+    """폴러 메트릭 저장소"""
+
+    def __init__(self, rate_window_sec: int = 60):
+        self.started_at = time.time()
+        self.rate_window_sec = rate_window_sec
+        self._check_times = deque()
+        self._rate_lock = threading.Lock()
+
+        self.checks_total = Counter('svcmon_poller_checks_total', 'Completed endpoint checks')
+        self.check_latency = Histogram(
+            'svcmon_poller_check_latency_seconds', 'Measured endpoint latency per network group', LATENCY_BUCKETS
+        )
+        self.checks_per_second = Gauge(
+            'svcmon_poller_checks_per_second', f'Checks per second over the last {rate_window_sec}s'
+        )
+        self.in_flight = Gauge('svcmon_poller_in_flight_checks', 'Checks holding a concurrency slot')
+        self.max_concurrent = Gauge('svcmon_poller_max_concurrent', 'Concurrency limit (semaphore size)')
+        self.waiting = Gauge('svcmon_poller_waiting_checks', 'Checks waiting for a concurrency slot')
+        self.due_endpoints = Gauge('svcmon_poller_due_endpoints', 'Endpoints returned as due in the last batch')
+        self.overdue_endpoints = Gauge(
+            'svcmon_poller_overdue_endpoints', 'Endpoints in the last batch more than one loop interval late'
+        )
+        self.max_lag = Gauge('svcmon_poller_schedule_lag_seconds', 'Largest scheduling lag in the last batch')
+        self.batch_size = Gauge('svcmon_poller_batch_size', 'Configured batch size')
+        self.batch_full_total = Counter(
+            'svcmon_poller_batch_full_total', 'Batches that hit the batch size limit (backlog remains)'
+        )
+        self.suppressed_checks = Counter(
+            'svcmon_poller_suppressed_checks_total', 'Checks skipped because a parent node is down'
+        )
+        self.breaker_rejections = Counter(
+            'svcmon_poller_breaker_rejections_total', 'Checks failed immediately by an open host circuit breaker'
+        )
+        self.open_breakers = Gauge('svcmon_poller_open_breakers', 'Hosts with an open or half-open circuit breaker')
+        self.db_write_latency = Histogram(
+            'svcmon_poller_db_write_seconds', 'Latency of check result writes', DB_BUCKETS
+        )
+        self.db_write_errors = Counter('svcmon_poller_db_write_errors_total', 'Failed check result writes')
+        self.spool_depth = Gauge('svcmon_poller_spool_depth', 'Check results waiting to be written')
+        self.loop_lag = Gauge('svcmon_poller_event_loop_lag_seconds', 'Most recent event loop lag')
+        self.loop_lag_histogram = Histogram(
+            'svcmon_poller_event_loop_lag_distribution_seconds', 'Event loop lag', LOOP_LAG_BUCKETS
+        )
+
+    def record_check(self, network_group: str, latency_ms: Optional[int], success: bool):
+        """체크 1건 완료 기록"""
+        labels = {'network_group': network_group or 'unknown'}
+        self.checks_total.inc(labels={**labels, 'result': 'success' if success else 'failure'})
+        if latency_ms is not None:
+            self.check_latency.observe(latency_ms / 1000.0, labels)
+
+        now = time.monotonic()
+        with self._rate_lock:
+            self._check_times.append(now)
+            self._trim_rate(now)
+
+    def _trim_rate(self, now: float):
+        cutoff = now - self.rate_window_sec
+        while self._check_times and self._check_times[0] < cutoff:
+            self._check_times.popleft()
+
+    def record_batch(self, network_group: str, due: int, overdue: int, max_lag_sec: float, batch_limit: int):
+        """스케줄러 배치 조회 결과 기록"""
+        labels = {'network_group': network_group or 'all'}
+        self.due_endpoints.set(due, labels)
+        self.overdue_endpoints.set(overdue, labels)
+        self.max_lag.set(max_lag_sec, labels)
+        self.batch_size.set(batch_limit, labels)
+        if due >= batch_limit:
+            self.batch_full_total.inc(labels=labels)
+
+    def render(self) -> str:
+        now = time.monotonic()
+        with self._rate_lock:
+            self._trim_rate(now)
+            window = min(self.rate_window_sec, max(time.time() - self.started_at, 1))
+            self.checks_per_second.set(len(self._check_times) / window)
+
+        lines = []
+        for metric in (
+            self.checks_total, self.checks_per_second, self.check_latency,
+            self.in_flight, self.waiting, self.max_concurrent,
+            self.due_endpoints, self.overdue_endpoints, self.max_lag, self.batch_size, self.batch_full_total,
+            self.suppressed_checks, self.breaker_rejections, self.open_breakers, self.db_write_latency, self.db_write_errors, self.spool_depth,
+            self.loop_lag, self.loop_lag_histogram,
+        ):
+            lines.extend(metric.render())
+        lines.append('# HELP svcmon_poller_uptime_seconds Seconds since the poller started')
+        lines.append('# TYPE svcmon_poller_uptime_seconds gauge')
+        lines.append(f'svcmon_poller_uptime_seconds {time.time() - self.started_at:.0f}')
+        return '\n'.join(lines) + '\n'
+
+
+async def monitor_event_loop_lag(metrics: PollerMetrics, interval: float = 0.5):
+    """이벤트 루프 지연 측정 (sleep 초과 시간)"""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        metrics.loop_lag.set(lag)
+        metrics.loop_lag_histogram.observe(lag)
+
+
+class MetricsServer:
+    """asyncio 기반 최소 HTTP 메트릭 리스너 (GET /metrics)"""
+
+    def __init__(self, metrics: PollerMetrics, host: str = '127.0.0.1', port: int = 9108):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"메트릭 리스너 시작: http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # 나머지 헤더는 읽고 버림
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5)
+                if not line or line in (b'\r\n', b'\n'):
+                    break
+
+            parts = request_line.decode('latin-1').split()
+            path = parts[1].split('?')[0] if len(parts) >= 2 else ''
+            if len(parts) >= 2 and parts[0] == 'GET' and path in ('/metrics', '/'):
+                body = self.metrics.render().encode('utf-8')
+                status = '200 OK'
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            else:
+                body = b'not found\n'
+                status = '404 Not Found'
+                content_type = 'text/plain; charset=utf-8'
+
+            writer.write(
+                f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+                f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"메트릭 요청 처리 오류: {e}")
+        finally:
+            writer.close()
@@ -0,0 +1,334 @@
+# SVCMON 콘솔 알림 발송
+# usp_record_check가 돌려준 이전/현재 상태가 다르면(상태 전환) 알림 이벤트를 만들고,
+# 수신자(도메인 담당자)별로 digest_sec 동안 모아 한 통으로 보냅니다. (망 전체 장애 시 담당자당 1통)
+# 같은 엔드포인트/상태 알림은 중복 제거 창(dbo.settings notification_dedupe_minutes) 안에서 한 번만 보내고,
+# 발송 결과는 usp_record_notifications_bulk로 한 번에 기록합니다.
+import asyncio
+import json
+import logging
+import queue
+import re
+import smtplib
+import ssl
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from typing import Dict, List, Optional, Set
+
+import pytz
+
+logger = logging.getLogger('SVCMON')
+
+KST = pytz.timezone('Asia/Seoul')
+
+STATUS_LABELS = {
+    'RED': '장애',
+    'AMBER': '응답 없음',
+    'GREEN': '복구',
+}
+
+
+@dataclass
+class NotificationPolicy:
+    """알림 묶음/중복 제거 기준 ([Notification] 설정)"""
+    digest_sec: float = 60          # 수신자별 첫 이벤트 후 모으는 시간
+    max_digest_events: int = 500    # 메일 한 통에 담을 최대 이벤트 수
+    dedupe_sec: float = 1800        # 같은 엔드포인트/상태 알림을 다시 보내지 않는 시간
+    refresh_sec: float = 300        # 알림 대상(담당자) 다시 읽는 주기
+
+
+@dataclass
+class NotificationEvent:
+    """상태 전환 1건"""
+    endpoint_id: int
+    url: str
+    site_name: str
+    previous_status: str
+    status: str
+    reason: str
+    occurred_at: datetime
+
+    @property
+    def dedupe_key(self) -> str:
+        return f'{self.endpoint_id}:{self.status}'
+
+    def line(self) -> str:
+        """메일 본문 한 줄"""
+        occurred = self.occurred_at.astimezone(KST) if self.occurred_at.tzinfo else self.occurred_at
+        text = f"[{STATUS_LABELS[self.status]}] {occurred:%Y-%m-%d %H:%M:%S}  {self.site_name}  {self.url}"
+        return f"{text}  - {self.reason}" if self.reason else text
+
+
+def parse_recipients(value: Optional[str]) -> List[str]:
+    """쉼표/세미콜론/공백으로 구분한 주소 중 메일 주소만 (담당자 연락처에는 전화번호도 들어 있음)"""
+    return [item for item in re.split(r'[,;\s]+', value or '') if '@' in item]
+
+
+class SmtpPool:
+    """
+    SMTP 연결 풀
+
+    smtplib은 블로킹이므로 send()는 스레드풀에서 호출합니다. (동시 발송 수는 호출하는 쪽이 제한)
+    연결은 재사용하고, 서버가 끊은 유휴 연결이면 새로 연결해 한 번 더 보냅니다.
+    """
+
+    def __init__(self, host: str, port: int = 25, security: str = 'none', username: str = '',
+                 password: str = '', timeout: int = 30):
+        self.host = host
+        self.port = port
+        self.security = security
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.security == 'ssl':
+            conn = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout,
+                                    context=ssl.create_default_context())
+        else:
+            conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.security == 'starttls':
+                conn.starttls(context=ssl.create_default_context())
+        if self.username:
+            conn.login(self.username, self.password)
+        return conn
+
+    def send(self, message: EmailMessage):
+        """메일 1통 발송 (실패 시 예외)"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            conn.send_message(message)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            # 유휴 중 끊긴 연결이면 새 연결로 재시도
+            self._discard(conn)
+            conn = self._connect()
+            try:
+                conn.send_message(message)
+            except BaseException:
+                self._discard(conn)
+                raise
+        except BaseException:
+            self._discard(conn)
+            raise
+        self._idle.put(conn)
+
+    @staticmethod
+    def _discard(conn: smtplib.SMTP):
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+    def close(self):
+        """유휴 연결 종료"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.quit()
+            except (smtplib.SMTPException, OSError):
+                self._discard(conn)
+
+
+class Notifier:
+    """
+    상태 전환 알림 (메모리 중복 제거 + 수신자별 묶음 발송 + 결과 일괄 기록)
+
+    - 장애(RED/AMBER)로 바뀌면 알림, 같은 엔드포인트/상태는 dedupe_sec 안에 한 번만
+    - 복구(GREEN) 알림은 장애 알림을 보낸 엔드포인트만 (장애 알림이 중복 제거된 깜빡임은 복구도 생략)
+    - 알림 대상은 email_on_failure가 켜진 엔드포인트, 수신자는 도메인 담당자 연락처의 메일 주소
+      (없으면 fallback_recipients)
+    """
+
+    def __init__(self, db, smtp: SmtpPool, from_addr: str, policy: NotificationPolicy,
+                 network_group_id: Optional[int] = None, network_group_name: Optional[str] = None,
+                 fallback_recipients: Optional[List[str]] = None, pool_size: int = 2):
+        self.db = db
+        self.smtp = smtp
+        self.from_addr = from_addr
+        self.policy = policy
+        self.network_group_id = network_group_id
+        self.network_group_name = network_group_name
+        self.fallback_recipients = fallback_recipients or []
+        self.pool_size = pool_size
+
+        self.targets: Dict[int, Dict] = {}
+        self._refreshed_at = 0.0
+        self._seeded = False
+        self._sent: Dict[str, float] = {}        # 중복 제거 키 → 마지막 발송 시각
+        self._down_notified: Set[int] = set()    # 장애 알림을 보낸(복구 알림 대상) 엔드포인트
+        self._pending: Dict[str, List[NotificationEvent]] = {}
+        self._pending_since: Dict[str, float] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def refresh_due(self) -> bool:
+        return time.monotonic() - self._refreshed_at >= self.policy.refresh_sec
+
+    def refresh(self):
+        """알림 대상/담당자 다시 읽기 (DB 호출이므로 스레드풀에서 실행), 처음에는 중복 제거 창도 복원"""
+        # 실패해도 refresh_sec 후 다시 시도
+        self._refreshed_at = time.monotonic()
+        rows = self.db.execute_sp('usp_get_notification_targets', {'network_group_id': self.network_group_id})
+        self.targets = {row['endpoint_id']: row for row in rows}
+        if rows and rows[0].get('dedupe_minutes'):
+            self.policy.dedupe_sec = rows[0]['dedupe_minutes'] * 60
+        if self._seeded:
+            return
+        self._seeded = True
+
+        now = time.time()
+        for row in rows:
+            level, sent_at = row.get('last_level'), row.get('last_sent_at')
+            if level not in STATUS_LABELS or sent_at is None:
+                continue
+            sent_ts = (KST.localize(sent_at) if sent_at.tzinfo is None else sent_at).timestamp()
+            self._sent[f"{row['endpoint_id']}:{level}"] = min(sent_ts, now)
+            if level != 'GREEN':
+                self._down_notified.add(row['endpoint_id'])
+        logger.info(f"알림 대상 {len(self.targets)}개 (중복 제거 {self.policy.dedupe_sec / 60:.0f}분)")
+
+    def recipients(self, target: Dict) -> List[str]:
+        return parse_recipients(target.get('owner_contact')) or self.fallback_recipients
+
+    def on_status(self, endpoint_id: int, previous_status: Optional[str], status: Optional[str],
+                  reason: Optional[str], occurred_at: datetime) -> bool:
+        """체크 기록 결과 반영, 반환값: 알림 이벤트를 만들었는지"""
+        if previous_status == status or previous_status not in STATUS_LABELS or status not in STATUS_LABELS:
+            return False
+        target = self.targets.get(endpoint_id)
+        if target is None:
+            return False
+
+        if status == 'GREEN':
+            if endpoint_id not in self._down_notified:
+                return False
+            self._down_notified.discard(endpoint_id)
+        else:
+            key = f'{endpoint_id}:{status}'
+            now = time.time()
+            if now - self._sent.get(key, 0.0) < self.policy.dedupe_sec:
+                return False
+            self._sent[key] = now
+            self._down_notified.add(endpoint_id)
+
+        recipients = self.recipients(target)
+        if not recipients:
+            logger.warning(f"알림 수신자가 없습니다 (담당자 연락처/fallback_recipients): {target['url']}")
+            return False
+
+        event = NotificationEvent(
+            endpoint_id=endpoint_id,
+            url=target['url'],
+            site_name=target['site_name'],
+            previous_status=previous_status,
+            status=status,
+            reason='' if status == 'GREEN' else (reason or ''),
+            occurred_at=occurred_at,
+        )
+        mono = time.monotonic()
+        for recipient in recipients:
+            self._pending.setdefault(recipient, []).append(event)
+            self._pending_since.setdefault(recipient, mono)
+        return True
+
+    def pending_count(self) -> int:
+        return sum(len(events) for events in self._pending.values())
+
+    def _take_due(self, force: bool) -> Dict[str, List[NotificationEvent]]:
+        """digest_sec이 지났거나 한 통 분량이 찬 수신자의 이벤트 꺼내기"""
+        mono = time.monotonic()
+        due = {}
+        for recipient in list(self._pending):
+            events = self._pending[recipient]
+            if (force or mono - self._pending_since[recipient] >= self.policy.digest_sec
+                    or len(events) >= self.policy.max_digest_events):
+                due[recipient] = self._pending.pop(recipient)
+                del self._pending_since[recipient]
+        return due
+
+    def compose(self, recipient: str, events: List[NotificationEvent]) -> EmailMessage:
+        """묶음 메일 작성 (1건이면 엔드포인트 제목, 여러 건이면 상태별 건수 제목)"""
+        group = f" [{self.network_group_name}]" if self.network_group_name else ''
+        if len(events) == 1:
+            event = events[0]
+            subject = f"[SVCMON]{group} {STATUS_LABELS[event.status]}: {event.site_name} ({event.url})"
+        else:
+            counts = {}
+            for event in events:
+                counts[STATUS_LABELS[event.status]] = counts.get(STATUS_LABELS[event.status], 0) + 1
+            subject = f"[SVCMON]{group} " + ', '.join(f"{label} {count}건" for label, count in counts.items())
+
+        message = EmailMessage()
+        message['Subject'] = subject
+        message['From'] = self.from_addr
+        message['To'] = recipient
+        message['Date'] = formatdate(localtime=True)
+        message['Message-ID'] = make_msgid(domain=self.from_addr.partition('@')[2] or None)
+        message.set_content(
+            f"SVCMON 모니터링 알림 - 망구분: {self.network_group_name or '전체'}, {len(events)}건\n\n"
+            + '\n'.join(event.line() for event in events) + '\n'
+        )
+        return message
+
+    async def dispatch(self, force: bool = False) -> int:
+        """
+        발송할 묶음 메일 보내고 결과 일괄 기록, 반환값: 보낸 메일 수
+
+        force면 digest_sec을 기다리지 않고 모두 보냅니다. (종료 시)
+        """
+        due = self._take_due(force)
+        if not due:
+            return 0
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.pool_size)
+
+        batches = []
+        for recipient, events in due.items():
+            for start in range(0, len(events), self.policy.max_digest_events):
+                batches.append((recipient, events[start:start + self.policy.max_digest_events]))
+
+        results = await asyncio.gather(*(self._send(recipient, events) for recipient, events in batches))
+        rows = [row for batch_rows in results for row in batch_rows]
+
+        loop = asyncio.get_event_loop()
+        try:
+            params = {'notifications': json.dumps(rows, ensure_ascii=False)}
+            await loop.run_in_executor(
+                None, lambda: self.db.execute_sp_non_query('usp_record_notifications_bulk', params)
+            )
+        except Exception as e:
+            logger.error(f"알림 기록 오류 ({len(rows)}건): {e}")
+        return len(batches)
+
+    async def _send(self, recipient: str, events: List[NotificationEvent]) -> List[Dict]:
+        """메일 1통 발송 후 이벤트별 기록 행 반환"""
+        message = self.compose(recipient, events)
+        loop = asyncio.get_event_loop()
+        status = 'SENT'
+        async with self._semaphore:
+            try:
+                await loop.run_in_executor(None, self.smtp.send, message)
+                logger.info(f"알림 발송: {recipient} - {message['Subject']}")
+            except Exception as e:
+                status = 'FAILED'
+                logger.error(f"알림 발송 오류 ({recipient}, {len(events)}건): {e}")
+
+        sent_at = datetime.now(KST).replace(tzinfo=None).isoformat()
+        return [{
+            'endpoint_id': event.endpoint_id,
+            'level': event.status,
+            'title': message['Subject'],
+            'body': event.line(),
+            'sent_to': recipient,
+            'dedupe_key': event.dedupe_key,
+            'status': status,
+            'sent_at': sent_at,
+        } for event in events]
@@ -0,0 +1,27 @@
+# SVCMON 콘솔 응답 헤더 정규화
+# [Http] header_allowlist에 있는 헤더만 같은 형식의 JSON으로 만들어 DB header_sets에서 한 행을 공유하게 합니다.
+# (webapp HeaderSet.normalize와 같은 형식)
+import json
+from typing import Dict, Optional
+
+# header_sets.headers 크기
+MAX_HEADERS_LENGTH = 4000
+
+
+def normalize_headers(headers, allowlist: frozenset) -> Optional[str]:
+    """
+    허용 목록의 응답 헤더만 정규화한 JSON (이름 소문자, 이름순, 값 앞뒤 공백 제거, 최대 4000자)
+
+    같은 헤더 조합은 항상 같은 문자열이 되어 DB header_sets에서 한 행을 공유합니다.
+    허용 목록에 해당하는 헤더가 없으면 None
+    """
+    normalized: Dict[str, str] = {}
+    for name, value in headers.items():
+        name = name.lower()
+        if name in allowlist:
+            value = ' '.join(value.split())
+            # 같은 이름이 여러 번 오면 HTTP 규칙대로 쉼표로 합침
+            normalized[name] = f"{normalized[name]}, {value}" if name in normalized else value
+    if not normalized:
+        return None
+    return json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(',', ':'))[:MAX_HEADERS_LENGTH]
@@ -0,0 +1,299 @@
+# SVCMON 콘솔 적응형 폴링 스케줄러
+# 엔드포인트별 다음 체크 시각과 유효 주기를 메모리에서 관리하고,
+# 전체/망구분별 초당 체크 예산(토큰 버킷) 안에서 체크를 고르게 분배합니다.
+# 체크 시각은 엔드포인트별 고정 위상(phase)에 맞춰 같은 주기의 엔드포인트가 한꺼번에 몰리지 않게 합니다.
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# usp_next_poll_batch와 같은 해시 (Knuth 곱셈 해시)
+PHASE_MULTIPLIER = 2654435761
+PHASE_MODULUS = 2 ** 32
+
+
+def phase_offset(endpoint_id: int, interval: float) -> float:
+    """주기 안에서 엔드포인트의 고정 위상(초), 재시작/주기 변경 후에도 주기 대비 비율은 같음"""
+    return (endpoint_id * PHASE_MULTIPLIER) % PHASE_MODULUS * interval / PHASE_MODULUS
+
+
+def next_slot(endpoint_id: int, interval: float, after: float) -> float:
+    """after 이후 첫 위상 시각 (epoch 초)"""
+    if interval <= 0:
+        return after
+    return after + (phase_offset(endpoint_id, interval) - after) % interval
+
+
+def next_due(endpoint_id: int, interval: float, last_checked: float) -> float:
+    """마지막 체크 + 주기/2 이후 첫 위상 시각 (체크 간격은 주기의 0.5~1.5배)"""
+    return next_slot(endpoint_id, interval, last_checked + interval / 2)
+
+
+@dataclass
+class AdaptivePolicy:
+    """적응형 주기 정책 ([Scheduler] 설정)"""
+    failure_recheck_sec: int = 15   # 실패 직후 재확인 주기
+    confirm_checks: int = 3         # 빠른 재확인 횟수 (이후에는 기본 주기)
+    backoff_after: int = 10         # 연속 성공 N회마다 주기 늘림
+    backoff_factor: float = 1.5
+    max_interval_sec: int = 900     # 늘어난 주기 상한 (기본 주기보다 작으면 기본 주기 사용)
+
+    def next_interval(self, state: 'EndpointState', success: bool) -> float:
+        """체크 결과에 따른 다음 주기 (state의 연속 성공/실패 횟수는 갱신된 상태)"""
+        base = state.endpoint.poll_interval_sec
+        if not success:
+            if state.failures <= self.confirm_checks:
+                return min(self.failure_recheck_sec, base)
+            return base
+        if state.interval < base:
+            # 장애 복구 직후는 기본 주기로 복귀
+            return base
+        if self.backoff_after > 0 and state.successes % self.backoff_after == 0:
+            return min(state.interval * self.backoff_factor, max(self.max_interval_sec, base))
+        return state.interval
+
+
+class TokenBucket:
+    """초당 rate개 토큰, 최대 burst개 적립 (rate <= 0이면 무제한)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self, now: float) -> bool:
+        if self.unlimited:
+            return True
+        self._refill(now)
+        return self._tokens >= 1
+
+    def take(self, now: float):
+        if not self.unlimited:
+            self._refill(now)
+            self._tokens -= 1
+
+
+class EndpointState:
+    """엔드포인트별 스케줄 상태"""
+    __slots__ = ('endpoint', 'interval', 'next_due', 'last_checked', 'failures', 'successes', 'in_flight', 'ready')
+
+    def __init__(self, endpoint, next_due: float, last_checked: Optional[float] = None):
+        self.endpoint = endpoint
+        self.interval = float(endpoint.poll_interval_sec)
+        self.next_due = next_due
+        self.last_checked = last_checked
+        self.failures = 0
+        self.successes = 0
+        self.in_flight = False
+        self.ready = False  # 마감이 지나 망구분 대기열에 있음
+
+
+class AdaptiveScheduler:
+    """
+    적응형 스케줄러
+
+    시각은 모두 time.time() 기준 초 단위입니다.
+    마감이 지난 엔드포인트는 예약 힙에서 망구분별 대기열로 한 번만 옮기고, 토큰이 있는 망구분의
+    대기열에서만 꺼내므로 예산이 부족해도 틱마다 밀린 항목 전체를 다시 정렬하지 않습니다.
+    밀린 체크는 다음 틱으로 넘어가며, 전체 체크량은 예산을 넘지 않습니다.
+    """
+
+    def __init__(self, policy: AdaptivePolicy, max_checks_per_sec: float = 0, group_checks_per_sec: float = 0):
+        self.policy = policy
+        self.group_checks_per_sec = group_checks_per_sec
+        self.global_bucket = TokenBucket(max_checks_per_sec)
+        self.group_buckets: Dict[str, TokenBucket] = {}
+        self.states: Dict[int, EndpointState] = {}
+        self._heap: List[tuple] = []
+        # 망구분별 마감 지난 (다음 체크, id) 힙과 그 엔드포인트 수
+        self._ready: Dict[str, List[tuple]] = {}
+        self._ready_count = 0
+        self.started_at = time.time()
+        # 스냅샷에서 복원한 상태 (첫 load()에서 DB 목록과 대조)
+        self._restored: Dict[int, list] = {}
+        self._restored_gap = 0.0
+
+    def load(self, targets: List[tuple], now: float):
+        """
+        (엔드포인트, 마지막 체크 시각) 목록 반영 (주기적으로 다시 호출)
+
+        이미 있는 엔드포인트는 상태를 유지하고, 기본 주기가 바뀐 경우만 주기를 초기화합니다.
+        새 엔드포인트는 마지막 체크 기준 위상 시각부터 체크하되, 그 시각이 스케줄러 시작 전이면
+        (재시작 중 놓친 체크, 체크 이력 없음) 시작 후 첫 위상 시각으로 분산합니다.
+        """
+        current = {}
+        for endpoint, last_checked in targets:
+            state = self.states.get(endpoint.endpoint_id)
+            if state is None:
+                state = self._restore(endpoint, last_checked, now)
+                if state is None:
+                    state = EndpointState(endpoint, self._initial_due(endpoint, last_checked), last_checked)
+                self._push(state)
+            else:
+                if endpoint.poll_interval_sec != state.endpoint.poll_interval_sec:
+                    # 주기 비율 기준 위상은 유지하고 새 주기로 다시 예약
+                    state.interval = float(endpoint.poll_interval_sec)
+                    state.next_due = next_due(endpoint.endpoint_id, state.interval, state.last_checked or now)
+                    state.ready = False
+                    self._push(state)
+                state.endpoint = endpoint
+            current[endpoint.endpoint_id] = state
+        self.states = current
+        # 제거/재예약된 엔드포인트의 대기열 항목은 꺼낼 때 버림
+        self._ready_count = sum(1 for state in current.values() if state.ready)
+        self._restored = {}
+
+    def _initial_due(self, endpoint, last_checked: Optional[float]) -> float:
+        interval = endpoint.poll_interval_sec
+        due = next_due(endpoint.endpoint_id, interval, last_checked) if last_checked is not None else None
+        if due is None or due < self.started_at:
+            due = next_slot(endpoint.endpoint_id, interval, self.started_at)
+        return due
+
+    def export_state(self) -> List[list]:
+        """스냅샷용 [id, 기본 주기, 유효 주기, 다음 체크, 마지막 체크, 연속 실패, 연속 성공]"""
+        return [
+            [
+                state.endpoint.endpoint_id, state.endpoint.poll_interval_sec, round(state.interval, 3),
+                round(state.next_due, 3), state.last_checked and round(state.last_checked, 3),
+                state.failures, state.successes,
+            ]
+            for state in self.states.values()
+        ]
+
+    def restore_state(self, rows: List[list], saved_at: float, now: float):
+        """스냅샷 상태 보관 (다음 load()에서 DB 목록과 대조해 반영)"""
+        self._restored = {row[0]: row for row in rows}
+        self._restored_gap = max(0.0, now - saved_at)
+
+    def _restore(self, endpoint, last_checked: Optional[float], now: float) -> Optional[EndpointState]:
+        """
+        스냅샷 상태로 EndpointState 생성
+
+        기본 주기가 바뀌었거나 DB에 스냅샷 이후 체크가 있으면(다른 폴러가 체크) 사용하지 않습니다.
+        중단 중 지난 체크는 중단 시간(최대 주기) 안에서 위상 비율대로 분산합니다.
+        """
+        row = self._restored.get(endpoint.endpoint_id)
+        if row is None:
+            return None
+        _, base, interval, due, restored_last, failures, successes = row
+        if base != endpoint.poll_interval_sec:
+            return None
+        if last_checked is not None and last_checked > (restored_last or 0) + 1:
+            return None
+
+        if due < now:
+            window = min(interval, max(self._restored_gap, 1.0))
+            due = now + phase_offset(endpoint.endpoint_id, window)
+        state = EndpointState(endpoint, due, restored_last)
+        state.interval = interval
+        state.failures = failures
+        state.successes = successes
+        return state
+
+    def _push(self, state: EndpointState):
+        heapq.heappush(self._heap, (state.next_due, state.endpoint.endpoint_id))
+
+    def _group_bucket(self, group: str) -> TokenBucket:
+        bucket = self.group_buckets.get(group)
+        if bucket is None:
+            bucket = TokenBucket(self.group_checks_per_sec)
+            self.group_buckets[group] = bucket
+        return bucket
+
+    def _collect(self, now: float):
+        """마감이 지난 예약 항목을 망구분별 대기열로 옮김 (항목마다 한 번)"""
+        while self._heap and self._heap[0][0] <= now:
+            due, endpoint_id = heapq.heappop(self._heap)
+            state = self.states.get(endpoint_id)
+            # 제거되었거나 다시 예약되어 이전 항목이 된 경우 무시
+            if state is None or state.in_flight or state.ready or state.next_due != due:
+                continue
+            state.ready = True
+            self._ready_count += 1
+            heapq.heappush(self._ready.setdefault(state.endpoint.network_group_name, []), (due, endpoint_id))
+
+    def _ready_head(self, ready: List[tuple]) -> Optional[tuple]:
+        """대기열의 가장 이른 유효 항목 (이전 항목은 버림)"""
+        while ready:
+            due, endpoint_id = ready[0]
+            state = self.states.get(endpoint_id)
+            if state is not None and state.ready and state.next_due == due:
+                return ready[0]
+            heapq.heappop(ready)
+        return None
+
+    def take_due(self, now: float, limit: int) -> list:
+        """예산 안에서 체크할 엔드포인트를 최대 limit개 꺼냄 (토큰이 있는 망구분 중 마감 시각이 빠른 순)"""
+        self._collect(now)
+        selected = []
+        mono = time.monotonic()
+        heads = []
+        for group, ready in list(self._ready.items()):
+            head = self._ready_head(ready)
+            if head is None:
+                del self._ready[group]
+            elif self._group_bucket(group).available(mono):
+                heads.append((*head, group))
+        heapq.heapify(heads)
+        while heads and len(selected) < limit and self.global_bucket.available(mono):
+            _, endpoint_id, group = heapq.heappop(heads)
+            ready = self._ready[group]
+            heapq.heappop(ready)
+            state = self.states[endpoint_id]
+            group_bucket = self._group_bucket(group)
+            self.global_bucket.take(mono)
+            group_bucket.take(mono)
+            state.ready = False
+            state.in_flight = True
+            self._ready_count -= 1
+            selected.append(state.endpoint)
+            head = self._ready_head(ready)
+            if head is not None and group_bucket.available(mono):
+                heapq.heappush(heads, (*head, group))
+        return selected
+
+    def record(self, endpoint_id: int, success: bool, now: float) -> Optional[float]:
+        """체크 결과 반영 후 다음 주기 반환"""
+        state = self.states.get(endpoint_id)
+        if state is None:
+            return None
+        state.in_flight = False
+        state.last_checked = now
+        if success:
+            state.successes += 1
+            state.failures = 0
+        else:
+            state.failures += 1
+            state.successes = 0
+        state.interval = self.policy.next_interval(state, success)
+        state.next_due = next_due(endpoint_id, state.interval, now)
+        self._push(state)
+        return state.interval
+
+    def skip(self, endpoint_id: int, now: float):
+        """체크 생략(상위 노드 장애) 시 성공/실패 횟수는 그대로 두고 다음 위상 시각으로 미룸"""
+        state = self.states.get(endpoint_id)
+        if state is None:
+            return
+        state.in_flight = False
+        state.next_due = next_due(endpoint_id, state.interval, now)
+        self._push(state)
+
+    def due_count(self, now: float) -> int:
+        """마감이 지났지만 아직 꺼내지 않은 엔드포인트 수"""
+        self._collect(now)
+        return self._ready_count
+
+    def required_rate(self) -> float:
+        """현재 유효 주기 기준 초당 필요 체크 수"""
+        return sum(1.0 / state.interval for state in self.states.values() if state.interval > 0)
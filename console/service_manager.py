@@ -29,16 +29,18 @@ def check_admin():
     except:
         return False
 
-def get_service_name(network_group_name=None):
+def get_service_name(network_group_name=None, supervisor=False):
     """망구분에 따른 서비스 이름 반환"""
+    if supervisor:
+        return "SVCMON_SUPERVISOR"
     if network_group_name:
         return f"SVCMON_{network_group_name}"
     else:
         return "SVCMON_ALL"
 
-def install_service(network_group_id=None, network_group_name=None):
-    """서비스 설치 (망구분별)"""
-    service_name = get_service_name(network_group_name)
+def install_service(network_group_id=None, network_group_name=None, supervisor=False):
+    """서비스 설치 (망구분별, supervisor: 전체 망구분 통합 서비스)"""
+    service_name = get_service_name(network_group_name, supervisor)
     print(f"=== {service_name} 서비스 설치 ===")
     
     if not check_admin():
@@ -55,6 +57,8 @@ def install_service(network_group_id=None, network_group_name=None):
     
     # 서비스 설치 명령 구성
     cmd = f'python "{service_path}"'
+    if supervisor:
+        cmd += " --supervisor"
     if network_group_id:
         cmd += f" --network-group-id {network_group_id}"
     if network_group_name:
@@ -63,9 +67,9 @@ def install_service(network_group_id=None, network_group_name=None):
     
     return run_command(cmd)
 
-def remove_service(network_group_name=None):
+def remove_service(network_group_name=None, supervisor=False):
     """서비스 제거 (망구분별)"""
-    service_name = get_service_name(network_group_name)
+    service_name = get_service_name(network_group_name, supervisor)
     print(f"=== {service_name} 서비스 제거 ===")
     
     if not check_admin():
@@ -79,38 +83,40 @@ def remove_service(network_group_name=None):
     # 서비스 제거
     service_path = os.path.join(os.getcwd(), "svcmon_service.py")
     cmd = f'python "{service_path}"'
+    if supervisor:
+        cmd += " --supervisor"
     if network_group_name:
         cmd += f" --network-group-name {network_group_name}"
     cmd += " remove"
     return run_command(cmd)
 
-def start_service(network_group_name=None):
+def start_service(network_group_name=None, supervisor=False):
     """서비스 시작 (망구분별)"""
-    service_name = get_service_name(network_group_name)
+    service_name = get_service_name(network_group_name, supervisor)
     print(f"=== {service_name} 서비스 시작 ===")
     return run_command(f"net start {service_name}")
 
-def stop_service(network_group_name=None):
+def stop_service(network_group_name=None, supervisor=False):
     """서비스 중지 (망구분별)"""
-    service_name = get_service_name(network_group_name)
+    service_name = get_service_name(network_group_name, supervisor)
     print(f"=== {service_name} 서비스 중지 ===")
     return run_command(f"net stop {service_name}")
 
-def status_service(network_group_name=None):
+def status_service(network_group_name=None, supervisor=False):
     """서비스 상태 확인 (망구분별)"""
-    service_name = get_service_name(network_group_name)
+    service_name = get_service_name(network_group_name, supervisor)
     print(f"=== {service_name} 서비스 상태 ===")
     return run_command(f"sc query {service_name}")
 
-def restart_service(network_group_name=None):
+def restart_service(network_group_name=None, supervisor=False):
     """서비스 재시작 (망구분별)"""
-    service_name = get_service_name(network_group_name)
+    service_name = get_service_name(network_group_name, supervisor)
     print(f"=== {service_name} 서비스 재시작 ===")
-    stop_service(network_group_name)
+    stop_service(network_group_name, supervisor)
     time.sleep(2)
-    return start_service(network_group_name)
+    return start_service(network_group_name, supervisor)
 
-def run_console(network_group_id=None, network_group_name=None):
+def run_console(network_group_id=None, network_group_name=None, supervisor=False):
     """콘솔 모드로 실행 (망구분별)"""
     print("=== SVCMON 콘솔 모드 실행 ===")
     if network_group_name:
@@ -125,6 +131,8 @@ def run_console(network_group_id=None, network_group_name=None):
     
     # 명령 구성
     cmd = [sys.executable, service_path]
+    if supervisor:
+        cmd.append("--supervisor")
     if network_group_id:
         cmd.extend(["--network-group-id", str(network_group_id)])
     if network_group_name:
@@ -181,6 +189,7 @@ def main():
     parser = argparse.ArgumentParser(description='SVCMON 서비스 관리 도구')
     parser.add_argument('--network-group-id', type=int, help='망구분 ID')
     parser.add_argument('--network-group-name', type=str, help='망구분 이름')
+    parser.add_argument('--supervisor', action='store_true', help='전체 망구분을 한 프로세스로 실행하는 통합 서비스')
     parser.add_argument('action', nargs='?', help='액션 (install|remove|start|stop|restart|status|console|list)')
     
     # 명령줄 인수 파싱
@@ -195,13 +204,13 @@ def main():
             sys.exit(0)
         
         actions = {
-            'install': lambda: install_service(args.network_group_id, args.network_group_name),
-            'remove': lambda: remove_service(args.network_group_name),
-            'start': lambda: start_service(args.network_group_name),
-            'stop': lambda: stop_service(args.network_group_name),
-            'restart': lambda: restart_service(args.network_group_name),
-            'status': lambda: status_service(args.network_group_name),
-            'console': lambda: run_console(args.network_group_id, args.network_group_name)
+            'install': lambda: install_service(args.network_group_id, args.network_group_name, args.supervisor),
+            'remove': lambda: remove_service(args.network_group_name, args.supervisor),
+            'start': lambda: start_service(args.network_group_name, args.supervisor),
+            'stop': lambda: stop_service(args.network_group_name, args.supervisor),
+            'restart': lambda: restart_service(args.network_group_name, args.supervisor),
+            'status': lambda: status_service(args.network_group_name, args.supervisor),
+            'console': lambda: run_console(args.network_group_id, args.network_group_name, args.supervisor)
         }
         
         if action in actions:
@@ -211,6 +220,7 @@ def main():
             print(f"지원하지 않는 명령: {action}")
             print("사용법: python service_manager.py [install|remove|start|stop|restart|status|console|list]")
             print("예시: python service_manager.py --network-group-name INTERNAL --network-group-id 1 install")
+            print("      python service_manager.py --supervisor install  (전체 망구분 통합 서비스)")
             sys.exit(1)
     
     # 대화형 메뉴
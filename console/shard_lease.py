@@ -0,0 +1,76 @@
+# SVCMON 콘솔 샤드 임대
+# 같은 망구분을 여러 폴러 인스턴스(프로세스/VM)가 나눠 체크하도록
+# usp_claim_shard_leases로 샤드(endpoint_id % shard_count)를 임대하고 주기적으로 갱신합니다.
+# 인스턴스가 늘거나 죽으면 다음 갱신 때 DB가 샤드를 다시 나눠 줍니다.
+import logging
+import os
+import socket
+import time
+from typing import List, Optional
+
+logger = logging.getLogger('SVCMON')
+
+
+def default_instance_id() -> str:
+    """기본 인스턴스 ID (호스트명:PID)"""
+    return f'{socket.gethostname()}:{os.getpid()}'[:100]
+
+
+class ShardLeaseManager:
+    """
+    샤드 임대 관리
+
+    renew()는 DB 호출이므로 스레드풀에서 실행합니다.
+    마지막 갱신 성공 후 lease_sec가 지나면(DB 장애 등) 다른 인스턴스가 가져갔을 수 있으므로
+    보유 샤드를 비워 중복 체크를 막습니다.
+    """
+
+    def __init__(self, db, network_group_id: Optional[int], shard_count: int = 64, lease_sec: int = 30,
+                 instance_id: str = ''):
+        self.db = db
+        self.network_group_id = network_group_id
+        self.shard_count = shard_count
+        self.lease_sec = lease_sec
+        self.instance_id = instance_id or default_instance_id()
+        self.shards: List[int] = []
+        self.instance_count = 0
+        self._renewed_at = 0.0
+
+    def renew(self) -> bool:
+        """임대 획득/갱신, 반환값: 보유 샤드가 바뀌었는지"""
+        params = {
+            'instance_id': self.instance_id,
+            'network_group_id': self.network_group_id,
+            'shard_count': self.shard_count,
+            'lease_sec': self.lease_sec,
+        }
+        previous = self.shards
+        try:
+            rows = self.db.execute_sp('usp_claim_shard_leases', params)
+        except Exception as e:
+            logger.error(f"샤드 임대 갱신 오류: {e}")
+            if self.shards and time.monotonic() - self._renewed_at >= self.lease_sec:
+                logger.warning("샤드 임대가 만료되어 체크를 중단합니다. (DB 연결 복구 후 다시 임대)")
+                self.shards = []
+            return self.shards != previous
+
+        self._renewed_at = time.monotonic()
+        self.shards = [row['shard_no'] for row in rows]
+        if rows:
+            self.instance_count = rows[0]['instance_count']
+        if self.shards != previous:
+            logger.info(
+                f"샤드 임대 변경 - {len(self.shards)}/{self.shard_count}개 보유 "
+                f"(인스턴스 {self.instance_count or '?'}개, {self.instance_id})"
+            )
+        return self.shards != previous
+
+    def release(self):
+        """보유 임대 반납 (종료 시)"""
+        params = {'instance_id': self.instance_id, 'network_group_id': self.network_group_id}
+        if self.db.execute_sp_non_query('usp_release_shard_leases', params):
+            self.shards = []
+
+    def poll_params(self) -> dict:
+        """usp_next_poll_batch/usp_get_poll_targets 뒤쪽 매개변수 (@shard_count, @shards)"""
+        return {'shard_count': self.shard_count, 'shards': ','.join(str(shard) for shard in self.shards)}
@@ -0,0 +1,61 @@
+# SVCMON 콘솔 상태 스냅샷
+# 스케줄러 상태(다음 체크 시각, 적응형 주기)와 DNS 캐시를 로컬 파일에 저장했다가
+# 재시작 시 복원해 체크가 한꺼번에 몰리거나 비는 구간이 없도록 합니다.
+import gzip
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+logger = logging.getLogger('SVCMON')
+
+SNAPSHOT_VERSION = 1
+
+
+def save_snapshot(path: str, network_group_id: Optional[int], state: dict):
+    """
+    상태를 gzip JSON으로 원자적으로 저장
+
+    state는 이벤트 루프 스레드에서 미리 만든 값(scheduler/dns 목록)이어야 합니다.
+    """
+    payload = {
+        'version': SNAPSHOT_VERSION,
+        'saved_at': time.time(),
+        'network_group_id': network_group_id,
+        **state,
+    }
+    data = gzip.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.svcmon_state.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def load_snapshot(path: str, network_group_id: Optional[int], max_age_sec: int) -> Optional[dict]:
+    """스냅샷 읽기 (없거나, 손상되었거나, 다른 망구분이거나, 너무 오래되었으면 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            payload = json.loads(gzip.decompress(f.read()).decode('utf-8'))
+    except (OSError, ValueError) as e:
+        logger.warning(f"상태 스냅샷을 읽을 수 없어 무시합니다 ({path}): {e}")
+        return None
+
+    if payload.get('version') != SNAPSHOT_VERSION or payload.get('network_group_id') != network_group_id:
+        logger.warning(f"상태 스냅샷 버전/망구분이 달라 무시합니다 ({path})")
+        return None
+    age = time.time() - payload.get('saved_at', 0)
+    if age > max_age_sec:
+        logger.info(f"상태 스냅샷이 오래되어 무시합니다 ({age:.0f}초 전)")
+        return None
+    return payload
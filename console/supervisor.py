@@ -0,0 +1,208 @@
+# SVCMON 콘솔 supervisor (망구분 통합 실행)
+# 망구분별 MonitoringService를 한 프로세스의 이벤트 루프 하나에서 함께 실행합니다.
+# DB 연결 풀, 설정 변경 감시, 메트릭 리스너는 공유하고 동시 요청 한도(세마포어)는 망구분별로 유지합니다.
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from typing import Dict, List
+
+from config import CONNECTION_STRING, get_metrics_settings, get_logging_settings, get_supervisor_settings
+from metrics import PollerMetrics, MetricsServer, monitor_event_loop_lag
+from log_setup import setup_queue_logging
+from svcmon_service import DatabaseManager, MonitoringService, logger
+
+
+class Supervisor:
+    """여러 망구분 모니터링을 한 이벤트 루프에서 실행"""
+
+    def __init__(self, process_index: int = 0, process_count: int = 1):
+        self.settings = get_supervisor_settings()
+        self.process_index = process_index
+        self.process_count = max(process_count, 1)
+
+        # 로그 (프로세스별 파일)
+        self.logging_settings = get_logging_settings()
+        suffix = f'_{process_index}' if self.process_count > 1 else ''
+        self._log_listener = setup_queue_logging(logger, f'svcmon_supervisor{suffix}.log', self.logging_settings)
+
+        # 공유 메트릭 (프로세스 i는 port + i)
+        self.metrics_settings = get_metrics_settings()
+        self.metrics = PollerMetrics()
+        self._metrics_server = None
+        self._loop_lag_task = None
+
+        # 공유 DB 연결 풀 (망구분 수를 안 뒤 크기 결정)
+        self.db = DatabaseManager(CONNECTION_STRING)
+        self.services: Dict[int, MonitoringService] = {}
+        self.config_revision = 0
+
+        self.running = False
+        self.stop_event = threading.Event()
+
+    def _get_current_revision(self) -> int:
+        """현재 설정 리비전 번호 조회"""
+        result = self.db.execute_query("SELECT TOP 1 id FROM dbo.config_revisions ORDER BY changed_at DESC")
+        return result[0]['id'] if result else 0
+
+    def _load_network_groups(self) -> List[Dict]:
+        """이 프로세스가 맡을 망구분 목록 (설정의 이름 목록, 프로세스별 id 배정 적용)"""
+        groups = self.db.execute_query("SELECT id, name FROM dbo.network_groups ORDER BY id")
+        names = self.settings['network_groups']
+        return [
+            group for group in groups
+            if (not names or group['name'] in names) and group['id'] % self.process_count == self.process_index
+        ]
+
+    def start(self):
+        """supervisor 시작 (이벤트 루프를 별도 스레드에서 실행)"""
+        logger.info(f"SVCMON supervisor를 시작합니다 - 프로세스 {self.process_index + 1}/{self.process_count}")
+        self.running = True
+        self.loop_thread = threading.Thread(target=lambda: asyncio.run(self._run()), daemon=True)
+        self.loop_thread.start()
+
+    def stop(self):
+        """supervisor 종료 (망구분별 루프 종료 및 상태 저장까지 대기)"""
+        logger.info("SVCMON supervisor를 종료합니다.")
+        self.running = False
+        self.stop_event.set()
+        if hasattr(self, 'loop_thread'):
+            self.loop_thread.join(timeout=30)
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
+    async def _run(self):
+        """설정 리비전이 바뀔 때마다 망구분 목록을 다시 읽어 망구분별 루프 재시작"""
+        await self._start_metrics()
+        loop = asyncio.get_event_loop()
+
+        while self.running:
+            self.config_revision = await loop.run_in_executor(None, self._get_current_revision)
+            groups = await loop.run_in_executor(None, self._load_network_groups)
+            if not groups:
+                logger.warning("실행할 망구분이 없습니다.")
+
+            pool_size = self.settings['db_pool_size'] or len(groups) * 2 + 2
+            self.db.resize(pool_size)
+            tasks = [asyncio.ensure_future(self._start_group(group)) for group in groups]
+            logger.info(
+                f"망구분 {len(groups)}개 실행 ({', '.join(group['name'] for group in groups)}), "
+                f"DB 연결 풀 {pool_size}, 리비전 {self.config_revision}"
+            )
+
+            await self._watch_config()
+
+            for service in self.services.values():
+                service.stop()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self.services.clear()
+
+        await self._stop_metrics()
+        logger.info("SVCMON supervisor가 종료되었습니다.")
+
+    async def _start_group(self, group: Dict):
+        """망구분 하나의 MonitoringService 실행 (공유 DB/메트릭 사용)"""
+        service = MonitoringService(
+            network_group_id=group['id'],
+            network_group_name=group['name'],
+            db=self.db,
+            metrics=self.metrics,
+            supervised=True
+        )
+        self.services[group['id']] = service
+        try:
+            await service.run()
+        except Exception as e:
+            logger.error(f"망구분 모니터링 오류 ({group['name']}): {e}")
+
+    async def _watch_config(self):
+        """설정 리비전 변경 또는 종료까지 대기"""
+        loop = asyncio.get_event_loop()
+        checked_at = time.monotonic()
+        while self.running:
+            await asyncio.sleep(1)
+            if time.monotonic() - checked_at < self.settings['config_check_sec']:
+                continue
+            checked_at = time.monotonic()
+            latest_revision = await loop.run_in_executor(None, self._get_current_revision)
+            if latest_revision != self.config_revision:
+                logger.warning(
+                    f"설정 변경 감지 (이전: {self.config_revision}, 현재: {latest_revision}). 망구분 모니터링을 재시작합니다."
+                )
+                return
+
+    async def _start_metrics(self):
+        """공유 메트릭 리스너 및 이벤트 루프 지연 측정 시작 (설정 시)"""
+        if not self.metrics_settings['enabled']:
+            return
+        self._loop_lag_task = asyncio.ensure_future(monitor_event_loop_lag(self.metrics))
+        try:
+            self._metrics_server = MetricsServer(
+                self.metrics,
+                host=self.metrics_settings['host'],
+                port=self.metrics_settings['port'] + self.process_index
+            )
+            await self._metrics_server.start()
+        except OSError as e:
+            logger.error(f"메트릭 리스너 시작 오류: {e}")
+            self._metrics_server = None
+
+    async def _stop_metrics(self):
+        """메트릭 리스너 종료"""
+        if self._loop_lag_task:
+            self._loop_lag_task.cancel()
+        if self._metrics_server:
+            await self._metrics_server.stop()
+
+
+def _run_process(process_index: int, process_count: int):
+    """프로세스 하나에서 supervisor 실행 (Ctrl+C 또는 종료 신호까지)"""
+    supervisor = Supervisor(process_index, process_count)
+    try:
+        supervisor.start()
+        while supervisor.loop_thread.is_alive():
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+
+
+def main():
+    """콘솔 실행 - 모든 망구분을 한 프로세스(또는 코어별 프로세스)에서 모니터링"""
+    parser = argparse.ArgumentParser(description='SVCMON supervisor (망구분 통합 실행)')
+    parser.add_argument('--processes', type=int, help='프로세스 수 (0: CPU 코어 수, 기본: [Supervisor] processes)')
+    args = parser.parse_args()
+
+    process_count = args.processes if args.processes is not None else get_supervisor_settings()['processes']
+    if process_count <= 0:
+        process_count = os.cpu_count() or 1
+
+    print(f"SVCMON supervisor를 실행합니다 (프로세스 {process_count}개). Ctrl+C로 종료하세요.")
+    if process_count == 1:
+        _run_process(0, 1)
+    else:
+        processes = [
+            multiprocessing.Process(target=_run_process, args=(index, process_count), name=f'svcmon-{index}')
+            for index in range(process_count)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            # 자식 프로세스도 같은 Ctrl+C를 받아 각자 정리 후 종료
+            for process in processes:
+                process.join(timeout=40)
+    print("supervisor가 종료되었습니다.")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -16,13 +16,35 @@ from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import pyodbc
-import win32serviceutil
-import win32service
-import win32event
-import servicemanager
+
+try:
+    import win32serviceutil
+    import win32service
+    import win32event
+    import servicemanager
+    _ServiceFramework = win32serviceutil.ServiceFramework
+except ImportError:
+    # Windows 외 환경(벤치마크 등)에서는 콘솔 모드만 사용
+    win32serviceutil = None
+    _ServiceFramework = object
 
 # 설정 파일 import
-from config import CONNECTION_STRING
+from config import (
+    CONNECTION_STRING, get_metrics_settings, get_logging_settings, get_scheduler_settings,
+    get_http_settings, get_state_settings, get_dependency_settings, get_sharding_settings, get_agent_settings,
+    get_on_demand_settings, get_notification_settings
+)
+from metrics import PollerMetrics, MetricsServer, monitor_event_loop_lag
+from log_setup import setup_queue_logging, CheckLogSampler
+from scheduler import AdaptivePolicy, AdaptiveScheduler
+from dns_cache import CachingResolver
+from circuit_breaker import BreakerPolicy, CircuitBreakers, OPEN, CLOSED
+from response_headers import normalize_headers
+from state_snapshot import save_snapshot, load_snapshot
+from dependencies import DependencyPolicy, DependencyTracker
+from shard_lease import ShardLeaseManager, default_instance_id
+from agent_client import AgentClient
+from notifier import NotificationPolicy, Notifier, SmtpPool
 
 # 서울 시간대 설정
 KST = pytz.timezone('Asia/Seoul')
@@ -31,15 +53,7 @@ def get_seoul_time():
     """서울 시간 반환"""
     return datetime.now(KST)
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('svcmon_service.log'),
-        logging.StreamHandler()
-    ]
-)
+# 로깅 핸들러는 MonitoringService/Supervisor가 setup_queue_logging으로 설정
 logger = logging.getLogger('SVCMON')
 
 
@@ -54,6 +68,7 @@ class EndpointCheck:
     network_group_name: str
     last_checked_at: datetime
     next_check_due: datetime
+    parent_endpoint_id: Optional[int] = None
 
 
 @dataclass
@@ -70,10 +85,10 @@ class CheckResult:
 class DatabaseManager:
     """데이터베이스 연결 및 저장프로시저 실행 관리"""
     
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, pool_size: int = 5):
         self.connection_string = connection_string
         self._connection_pool = []
-        self._pool_size = 5
+        self._pool_size = pool_size
         self._pool_lock = threading.Lock()
         
     def _get_connection(self) -> pyodbc.Connection:
@@ -92,6 +107,13 @@ class DatabaseManager:
         # 새 연결 생성
         return pyodbc.connect(self.connection_string)
     
+    def resize(self, pool_size: int):
+        """풀 크기 변경 (초과 연결은 닫음)"""
+        with self._pool_lock:
+            self._pool_size = pool_size
+            while len(self._connection_pool) > pool_size:
+                self._connection_pool.pop().close()
+    
     def _return_connection(self, conn: pyodbc.Connection):
         """연결을 풀에 반환"""
         with self._pool_lock:
@@ -201,44 +223,155 @@ class DatabaseManager:
 class HttpChecker:
     """HTTP 엔드포인트 체크 담당"""
     
-    def __init__(self, timeout: int = 30, max_concurrent: int = 50):
+    def __init__(self, timeout: int = 30, max_concurrent: int = 50, metrics: Optional[PollerMetrics] = None,
+                 check_log: Optional[CheckLogSampler] = None, dns_cache_ttl_sec: int = 300,
+                 breaker_policy: Optional[BreakerPolicy] = None, network_group: Optional[str] = None,
+                 header_allowlist: Optional[List[str]] = None):
         self.timeout = timeout
         self.max_concurrent = max_concurrent
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        
+        # 요청마다 세션을 새로 만들므로 이름 해석 결과는 공유 리졸버에 캐시
+        self.resolver = CachingResolver(ttl_sec=dns_cache_ttl_sec)
+        # 호스트별 회로 차단기 (None이면 사용 안 함)
+        self.breakers = CircuitBreakers(breaker_policy) if breaker_policy else None
+        self.metrics = metrics
+        # 동시 요청 게이지는 망구분별 (supervisor에서 메트릭을 공유)
+        self._metric_labels = {'network_group': network_group or 'all'}
+        self.check_log = check_log or CheckLogSampler(logger, sample_every=1)
+        # 체크 결과에 기록할 응답 헤더 (소문자)
+        self.header_allowlist = frozenset(name.lower() for name in header_allowlist or ())
+        if self.metrics:
+            self.metrics.max_concurrent.set(max_concurrent, self._metric_labels)
+    
+    def _breaker_key(self, url: str) -> str:
+        """회로 차단기 키 (호스트명:포트, DNS 캐시 갱신과 관계없이 같은 키)"""
+        parsed = urlparse(url)
+        hostname = (parsed.hostname or '').lower()
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        return f"{hostname}:{port}"
+    
     async def check_endpoint(self, endpoint: EndpointCheck) -> CheckResult:
-        """단일 엔드포인트 체크"""
+        """단일 엔드포인트 체크 (회로 차단 및 메트릭 집계 포함)"""
+        if not self.breakers:
+            return await self._check_with_metrics(endpoint)
+        
+        host = self._breaker_key(endpoint.url)
+        if not self.breakers.allow(host):
+            # 차단 중인 호스트는 요청 없이 즉시 실패
+            if self.metrics:
+                self.metrics.breaker_rejections.inc(labels={'network_group': endpoint.network_group_name or 'unknown'})
+            return CheckResult(
+                endpoint_id=endpoint.endpoint_id,
+                error=self.breakers.reason(host),
+                checked_at=get_seoul_time()
+            )
+        
+        try:
+            result = await self._check_with_metrics(endpoint)
+        except BaseException:
+            self.breakers.release(host)
+            raise
+        
+        self._record_breaker(endpoint, result)
+        return result
+    
+    async def check_now(self, endpoint: EndpointCheck) -> CheckResult:
+        """
+        즉시 점검 (동시 요청 대기열과 회로 차단을 거치지 않고 바로 요청)
+
+        사용자가 요청한 체크이므로 차단 중인 호스트도 실제로 요청하고, 결과는 회로 차단기에 반영합니다.
+        """
+        result = await self._run_check(endpoint)
+        if self.metrics:
+            self._record_metrics(endpoint, result)
+        if self.breakers:
+            self._record_breaker(endpoint, result)
+        return result
+    
+    def _record_breaker(self, endpoint: EndpointCheck, result: CheckResult):
+        """체크 결과를 회로 차단기에 반영"""
+        host = self._breaker_key(endpoint.url)
+        changed = self.breakers.record(host, result.status_code is not None, result.error)
+        if changed == OPEN:
+            logger.warning(f"회로 차단 - {host} 요청 중단: {result.error}")
+        elif changed == CLOSED:
+            logger.info(f"회로 차단 해제 - {host} 응답 확인")
+        if changed and self.metrics:
+            self.metrics.open_breakers.set(self.breakers.open_count(), self._metric_labels)
+    
+    async def _check_with_metrics(self, endpoint: EndpointCheck) -> CheckResult:
+        """단일 엔드포인트 체크 (메트릭 집계 포함)"""
+        if not self.metrics:
+            return await self._check_endpoint(endpoint)
+        
+        labels = self._metric_labels
+        self.metrics.waiting.inc(labels=labels)
+        waiting = True
+        try:
+            async with self._semaphore:
+                self.metrics.waiting.dec(labels=labels)
+                waiting = False
+                self.metrics.in_flight.inc(labels=labels)
+                try:
+                    result = await self._run_check(endpoint)
+                finally:
+                    self.metrics.in_flight.dec(labels=labels)
+        finally:
+            if waiting:
+                self.metrics.waiting.dec(labels=labels)
+        
+        self._record_metrics(endpoint, result)
+        return result
+    
+    def _record_metrics(self, endpoint: EndpointCheck, result: CheckResult):
+        """체크 결과 메트릭 집계"""
+        self.metrics.record_check(
+            endpoint.network_group_name,
+            result.latency_ms,
+            result.status_code is not None and 200 <= result.status_code < 300
+        )
+    
+    async def _check_endpoint(self, endpoint: EndpointCheck) -> CheckResult:
+        """메트릭 없이 체크"""
         async with self._semaphore:
-            start_time = get_seoul_time()
-            result = CheckResult(endpoint_id=endpoint.endpoint_id, checked_at=start_time)
+            return await self._run_check(endpoint)
+    
+    async def _run_check(self, endpoint: EndpointCheck) -> CheckResult:
+        """HTTP 요청 실행 (세마포어 획득 후 호출)"""
+        start_time = get_seoul_time()
+        result = CheckResult(endpoint_id=endpoint.endpoint_id, checked_at=start_time)
+        
+        try:
+            # aiohttp로 HTTP 요청
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            connector = aiohttp.TCPConnector(resolver=self.resolver, use_dns_cache=False)
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+                async with session.get(endpoint.url) as response:
+                    end_time = get_seoul_time()
+                    latency = int((end_time - start_time).total_seconds() * 1000)
+                    
+                    result.status_code = response.status
+                    result.latency_ms = latency
+                    result.headers = normalize_headers(response.headers, self.header_allowlist)
+                    
+                    if 200 <= response.status < 300:
+                        self.check_log.record_success(endpoint.url, response.status, latency)
+                    else:
+                        logger.warning(f"체크 완료(오류 응답): {endpoint.url} - {response.status} ({latency}ms)")
+                    
+        except asyncio.TimeoutError:
+            result.error = "요청 시간 초과"
+            logger.warning(f"시간 초과: {endpoint.url}")
             
-            try:
-                # aiohttp로 HTTP 요청
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(endpoint.url) as response:
-                        end_time = get_seoul_time()
-                        latency = int((end_time - start_time).total_seconds() * 1000)
-                        
-                        result.status_code = response.status
-                        result.latency_ms = latency
-                        result.headers = str(dict(response.headers))[:4000]  # 헤더 크기 제한
-                        
-                        logger.info(f"체크 완료: {endpoint.url} - {response.status} ({latency}ms)")
-                        
-            except asyncio.TimeoutError:
-                result.error = "요청 시간 초과"
-                logger.warning(f"시간 초과: {endpoint.url}")
-                
-            except aiohttp.ClientError as e:
-                result.error = f"클라이언트 오류: {str(e)}"
-                logger.warning(f"클라이언트 오류: {endpoint.url} - {e}")
-                
-            except Exception as e:
-                result.error = f"예상치 못한 오류: {str(e)}"
-                logger.error(f"예상치 못한 오류: {endpoint.url} - {e}")
+        except aiohttp.ClientError as e:
+            result.error = f"클라이언트 오류: {str(e)}"
+            logger.warning(f"클라이언트 오류: {endpoint.url} - {e}")
             
-            return result
+        except Exception as e:
+            result.error = f"예상치 못한 오류: {str(e)}"
+            logger.error(f"예상치 못한 오류: {endpoint.url} - {e}")
+        
+        return result
     
     async def check_batch(self, endpoints: List[EndpointCheck]) -> List[CheckResult]:
         """여러 엔드포인트 동시 체크"""
@@ -269,7 +402,9 @@ class HttpChecker:
 class MonitoringService:
     """모니터링 서비스 메인 클래스 (망구분별 실행)"""
     
-    def __init__(self, network_group_id: Optional[int] = None, network_group_name: Optional[str] = None):
+    def __init__(self, network_group_id: Optional[int] = None, network_group_name: Optional[str] = None,
+                 db: Optional[DatabaseManager] = None, metrics: Optional[PollerMetrics] = None,
+                 supervised: bool = False):
         # 설정
         self.connection_string = CONNECTION_STRING
         self.batch_size = 50
@@ -289,41 +424,183 @@ class MonitoringService:
             self.service_name = "SVCMON_ALL"
             self.service_display_name = "SVCMON 모니터링 서비스 - 전체"
         
+        # supervisor 하위 실행 시 로그/메트릭 리스너/설정 변경 감시는 supervisor가 담당
+        self.supervised = supervised
+        
         # 로그 파일 설정 (망구분별)
-        log_filename = f'svcmon_{network_group_name or "all"}.log'
-        self._setup_logging(log_filename)
+        self.logging_settings = get_logging_settings()
+        self._log_listener = None
+        if not supervised:
+            log_filename = f'svcmon_{network_group_name or "all"}.log'
+            self._setup_logging(log_filename)
+        self.check_log = CheckLogSampler(
+            logger,
+            sample_every=self.logging_settings['success_sample_every'],
+            summary_interval_sec=self.logging_settings['summary_interval_sec']
+        )
+        
+        # 메트릭 설정
+        self.metrics_settings = get_metrics_settings()
+        self.metrics = metrics or PollerMetrics()
+        self._metrics_server = None
+        self._loop_lag_task = None
         
         # 컴포넌트 초기화
-        self.db = DatabaseManager(self.connection_string)
-        self.http_checker = HttpChecker(timeout=self.timeout, max_concurrent=self.max_concurrent)
+        self.http_settings = get_http_settings()
+        # 에이전트 모드: DB 대신 웹앱 수집 API 사용 (supervisor가 DB를 넘겨주는 경우 제외)
+        self.agent_settings = get_agent_settings()
+        self.agent = None
+        if self.agent_settings['enabled'] and db is None:
+            self.agent = AgentClient(
+                self.agent_settings['url'],
+                self.agent_settings['token'],
+                batch_size=self.agent_settings['batch_size'],
+                flush_sec=self.agent_settings['flush_sec'],
+                timeout=self.agent_settings['timeout'],
+                max_buffer=self.agent_settings['max_buffer'],
+                ca_file=self.agent_settings['ca_file'],
+            )
+            self.agent.flush()
+        self._agent_flush_task = None
+        self.db = db or self.agent or DatabaseManager(self.connection_string)
+        self.http_checker = HttpChecker(
+            timeout=self.timeout,
+            max_concurrent=self.max_concurrent,
+            metrics=self.metrics,
+            check_log=self.check_log,
+            dns_cache_ttl_sec=self.http_settings['dns_cache_ttl_sec'],
+            breaker_policy=self._create_breaker_policy(),
+            network_group=network_group_name,
+            header_allowlist=self.http_settings['header_allowlist']
+        )
+        
+        # 스케줄러 설정 (adaptive 모드에서만 메모리 스케줄러 사용)
+        self.scheduler_settings = get_scheduler_settings()
+        self.scheduler = None
+        if self.scheduler_settings['mode'] == 'adaptive':
+            self.scheduler = self._create_scheduler()
+        self._check_tasks = set()
+        
+        # 의존 관계 기반 체크 생략 (상위 노드 장애 시)
+        self.dependency_settings = get_dependency_settings()
+        self.dependencies = None
+        if self.dependency_settings['enabled']:
+            self.dependencies = DependencyTracker(DependencyPolicy(
+                parent_failures=self.dependency_settings['parent_failures'],
+                host_failures=self.dependency_settings['host_failures'],
+                domain_failures=self.dependency_settings['domain_failures'],
+                group_failures=self.dependency_settings['group_failures'],
+                canary_interval_sec=self.dependency_settings['canary_interval_sec'],
+            ))
+        
+        # 샤드 임대 (여러 폴러 인스턴스가 같은 망구분을 나눠 체크)
+        self.sharding_settings = get_sharding_settings()
+        self.shard_leases = None
+        if self.sharding_settings['enabled'] and self.agent:
+            logger.warning("에이전트 모드에서는 샤드 임대를 사용하지 않습니다. (담당 엔드포인트는 웹앱에서 지정)")
+        elif self.sharding_settings['enabled']:
+            self.shard_leases = ShardLeaseManager(
+                self.db,
+                network_group_id,
+                shard_count=self.sharding_settings['shard_count'],
+                lease_sec=self.sharding_settings['lease_sec'],
+                instance_id=self.sharding_settings['instance_id'],
+            )
+        self._leases_renewed_at = 0.0
+        
+        # 즉시 점검 요청 큐 (웹앱 점검 버튼, 샤드 임대와 같은 인스턴스 ID로 가져감)
+        self.on_demand_settings = get_on_demand_settings()
+        self.on_demand = self.on_demand_settings['enabled'] and not self.agent
+        if self.shard_leases:
+            self.instance_id = self.shard_leases.instance_id
+        else:
+            self.instance_id = self.sharding_settings['instance_id'] or default_instance_id()
+        self._on_demand_tasks = set()
+        
+        # 상태 전환 알림 메일 (usp_record_check 결과의 이전/현재 상태 기준)
+        self.notification_settings = get_notification_settings()
+        self.notifier = None
+        if self.notification_settings['enabled'] and self.agent:
+            logger.warning("에이전트 모드에서는 알림 메일을 보내지 않습니다.")
+        elif self.notification_settings['enabled']:
+            self.notifier = self._create_notifier()
+        
+        # 상태 스냅샷 설정 (망구분별 파일)
+        self.state_settings = get_state_settings()
+        self.state_file = self.state_settings['file'] or f'svcmon_state_{network_group_name or "all"}.json.gz'
+        self._snapshot_saved_at = time.monotonic()
         
         # 설정 리비전
-        self.config_revision = self._get_current_revision()
+        self.config_revision = 0 if supervised else self._get_current_revision()
 
         # 제어 플래그
         self.running = False
+        self.started_at = None
         self.stop_event = threading.Event()
         
         logger.info(f"모니터링 서비스 초기화 완료 - 망구분: {network_group_name or '전체'}, 리비전: {self.config_revision}")
     
+    def _create_breaker_policy(self) -> Optional[BreakerPolicy]:
+        """[Http] breaker_* 설정으로 회로 차단 기준 생성 (사용 안 함이면 None)"""
+        if not self.http_settings['breaker_enabled']:
+            return None
+        return BreakerPolicy(
+            failure_threshold=self.http_settings['breaker_failures'],
+            open_sec=self.http_settings['breaker_open_sec'],
+            max_open_sec=self.http_settings['breaker_max_open_sec'],
+        )
+    
+    def _create_notifier(self) -> Notifier:
+        """[Notification] 설정으로 알림 발송기 생성"""
+        settings = self.notification_settings
+        smtp = SmtpPool(
+            settings['smtp_host'],
+            settings['smtp_port'],
+            security=settings['smtp_security'],
+            username=settings['smtp_user'],
+            password=settings['smtp_password'],
+            timeout=settings['timeout'],
+        )
+        policy = NotificationPolicy(
+            digest_sec=settings['digest_sec'],
+            max_digest_events=settings['max_digest_events'],
+            refresh_sec=settings['refresh_sec'],
+        )
+        return Notifier(
+            self.db,
+            smtp,
+            settings['from_addr'],
+            policy,
+            network_group_id=self.network_group_id,
+            network_group_name=self.network_group_name,
+            fallback_recipients=settings['fallback_recipients'],
+            pool_size=settings['pool_size'],
+        )
+    
+    def _create_scheduler(self) -> AdaptiveScheduler:
+        """[Scheduler] 설정으로 적응형 스케줄러 생성"""
+        settings = self.scheduler_settings
+        policy = AdaptivePolicy(
+            failure_recheck_sec=settings['failure_recheck_sec'],
+            confirm_checks=settings['confirm_checks'],
+            backoff_after=settings['backoff_after'],
+            backoff_factor=settings['backoff_factor'],
+            max_interval_sec=settings['max_interval_sec'],
+        )
+        return AdaptiveScheduler(
+            policy,
+            max_checks_per_sec=settings['max_checks_per_sec'],
+            group_checks_per_sec=settings['group_checks_per_sec'],
+        )
+
     def _setup_logging(self, log_filename: str):
-        """망구분별 로깅 설정"""
-        # 기존 핸들러 제거
-        logger.handlers.clear()
-        
-        # 새 핸들러 추가
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-        console_handler = logging.StreamHandler()
-        
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        """망구분별 로깅 설정 (큐 기반 비동기 기록, 파일 로테이션)"""
+        self._log_listener = setup_queue_logging(logger, log_filename, self.logging_settings)
 
     def _get_current_revision(self) -> int:
-        """현재 설정 리비전 번호 조회"""
+        """현재 설정 리비전 번호 조회 (에이전트 모드는 마지막 수집 API 응답 기준)"""
+        if self.agent:
+            return self.agent.config_revision
         try:
             query = "SELECT TOP 1 id FROM dbo.config_revisions ORDER BY changed_at DESC"
             result = self.db.execute_query(query)
@@ -335,10 +612,15 @@ class MonitoringService:
 
     async def _check_config_changes(self):
         """설정 변경 확인 및 서비스 재시작 트리거"""
+        if self.supervised:
+            return
         loop = asyncio.get_event_loop()
         latest_revision = await loop.run_in_executor(None, self._get_current_revision)
         
-        if self.config_revision != latest_revision:
+        if self.agent and self.config_revision == 0:
+            # 시작 시 수집 API에 연결하지 못했으면 첫 응답의 리비전을 기준으로 삼음
+            self.config_revision = latest_revision
+        elif self.config_revision != latest_revision:
             logger.warning(f"설정 변경 감지 (이전: {self.config_revision}, 현재: {latest_revision}). 서비스를 재시작합니다.")
             self.stop()
 
@@ -346,6 +628,7 @@ class MonitoringService:
         """서비스 시작"""
         logger.info(f"SVCMON 모니터링 서비스를 시작합니다 - 망구분: {self.network_group_name or '전체'}")
         self.running = True
+        self.started_at = get_seoul_time()
         
         # 비동기 루프를 별도 스레드에서 실행
         self.loop_thread = threading.Thread(target=self._run_async_loop, daemon=True)
@@ -357,19 +640,44 @@ class MonitoringService:
         self.running = False
         self.stop_event.set()
         
-        if hasattr(self, 'loop_thread'):
+        # 설정 변경 감지 시에는 루프 스레드 안에서 호출되므로 join/로그 종료는 건너뜀
+        if hasattr(self, 'loop_thread') and self.loop_thread is not threading.current_thread():
             self.loop_thread.join(timeout=10)
+            
+            # 남은 성공 요약과 큐에 쌓인 로그 기록
+            self.check_log.flush_summary(force=True)
+            if self._log_listener:
+                self._log_listener.stop()
+                self._log_listener = None
     
     def _run_async_loop(self):
         """비동기 루프를 별도 스레드에서 실행"""
         asyncio.run(self._monitoring_loop())
     
+    async def run(self):
+        """현재 이벤트 루프에서 실행 (supervisor용, stop() 호출 시 반환)"""
+        logger.info(f"망구분 모니터링을 시작합니다 - 망구분: {self.network_group_name or '전체'}")
+        self.running = True
+        self.started_at = get_seoul_time()
+        await self._monitoring_loop()
+        self.check_log.flush_summary(force=True)
+    
     async def _monitoring_loop(self):
         """메인 모니터링 루프"""
         logger.info("모니터링 루프를 시작합니다.")
+        await self._start_metrics()
+        self._restore_state()
         
-        while self.running:
+        on_demand_task = asyncio.ensure_future(self._on_demand_loop()) if self.on_demand else None
+        notification_task = asyncio.ensure_future(self._notification_loop()) if self.notifier else None
+        
+        if self.scheduler:
+            await self._adaptive_loop()
+        
+        while self.running and not self.scheduler:
             try:
+                await self._renew_shard_leases()
+                self._flush_agent()
                 await self._process_batch()
 
                 # 설정 변경 확인
@@ -377,6 +685,8 @@ class MonitoringService:
                 if not self.running: # 변경 감지 시 루프 즉시 종료
                     break
                 
+                await self._maybe_save_state()
+                
                 # 다음 주기까지 대기
                 for _ in range(self.poll_interval):
                     if not self.running:
@@ -387,18 +697,365 @@ class MonitoringService:
                 logger.error(f"모니터링 루프 오류: {e}")
                 await asyncio.sleep(5)  # 오류 시 잠시 대기
         
+        if on_demand_task:
+            await on_demand_task
+        if notification_task:
+            await notification_task
+        self._save_state()
+        await self._release_shard_leases()
+        await self._drain_agent()
+        await self._stop_metrics()
         logger.info("모니터링 루프가 종료되었습니다.")
     
+    async def _adaptive_loop(self):
+        """적응형 스케줄러 루프 (틱마다 예산 안에서 due 엔드포인트를 개별 체크)"""
+        logger.info(
+            f"적응형 스케줄러 사용 - 초당 최대 {self.scheduler_settings['max_checks_per_sec'] or '제한 없음'}"
+            f"(망구분별 {self.scheduler_settings['group_checks_per_sec'] or '제한 없음'})"
+        )
+        tick = self.scheduler_settings['tick_sec']
+        refreshed_at = 0.0
+        
+        while self.running:
+            try:
+                if await self._renew_shard_leases():
+                    refreshed_at = 0.0  # 보유 샤드가 바뀌면 대상 즉시 다시 조회
+                if time.monotonic() - refreshed_at >= self.scheduler_settings['refresh_sec']:
+                    await self._load_poll_targets()
+                    refreshed_at = time.monotonic()
+                    
+                    await self._check_config_changes()
+                    if not self.running:
+                        break
+                
+                self._dispatch_due_checks()
+                self._flush_agent()
+                await self._maybe_save_state()
+                await asyncio.sleep(tick)
+                
+            except Exception as e:
+                logger.error(f"모니터링 루프 오류: {e}")
+                await asyncio.sleep(5)
+        
+        # 진행 중인 체크는 잠시 기다림 (끝나지 않은 체크는 재시작 후 다시 예약됨)
+        if self._check_tasks:
+            await asyncio.wait(self._check_tasks, timeout=5)
+    
+    async def _renew_shard_leases(self) -> bool:
+        """renew_sec마다 샤드 임대 갱신, 반환값: 보유 샤드가 바뀌었는지"""
+        if not self.shard_leases:
+            return False
+        if time.monotonic() - self._leases_renewed_at < self.sharding_settings['renew_sec']:
+            return False
+        self._leases_renewed_at = time.monotonic()
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.shard_leases.renew)
+    
+    async def _release_shard_leases(self):
+        """종료 시 샤드 임대 반납 (다른 인스턴스가 만료를 기다리지 않고 가져가도록)"""
+        if not self.shard_leases:
+            return
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.shard_leases.release)
+    
+    async def _on_demand_loop(self):
+        """poll_sec마다 즉시 점검 요청 큐를 조회해 예약된 체크보다 먼저 실행 (stop() 후 진행 중인 점검까지 대기)"""
+        loop = asyncio.get_event_loop()
+        while self.running:
+            try:
+                capacity = self.on_demand_settings['batch_size'] - len(self._on_demand_tasks)
+                if capacity > 0 and (not self.shard_leases or self.shard_leases.shards):
+                    rows = await loop.run_in_executor(None, self._claim_check_requests, capacity)
+                    for row in rows:
+                        task = asyncio.ensure_future(self._check_on_demand(self._to_on_demand_endpoint(row)))
+                        self._on_demand_tasks.add(task)
+                        task.add_done_callback(self._on_demand_tasks.discard)
+            except Exception as e:
+                logger.error(f"즉시 점검 요청 조회 오류: {e}")
+            await asyncio.sleep(self.on_demand_settings['poll_sec'])
+        
+        if self._on_demand_tasks:
+            await asyncio.wait(self._on_demand_tasks, timeout=self.timeout)
+    
+    async def _notification_loop(self):
+        """1초마다 묶음 시간이 지난 알림 발송, refresh_sec마다 알림 대상 갱신 (종료 시 남은 알림 모두 발송)"""
+        loop = asyncio.get_event_loop()
+        while self.running:
+            try:
+                if self.notifier.refresh_due():
+                    await loop.run_in_executor(None, self.notifier.refresh)
+                await self.notifier.dispatch()
+            except Exception as e:
+                logger.error(f"알림 발송 루프 오류: {e}")
+            await asyncio.sleep(1)
+        
+        # 진행 중인 체크 결과까지 반영한 뒤 발송
+        if self._check_tasks:
+            await asyncio.wait(self._check_tasks, timeout=5)
+        try:
+            await self.notifier.dispatch(force=True)
+        except Exception as e:
+            logger.error(f"알림 발송 오류: {e}")
+        await loop.run_in_executor(None, self.notifier.smtp.close)
+    
+    def _claim_check_requests(self, limit: int) -> List[Dict]:
+        """즉시 점검 요청 가져오기 (보유 샤드 범위만)"""
+        params = {
+            'network_group_id': self.network_group_id,
+            'instance_id': self.instance_id,
+            'limit': limit,
+            'stale_sec': self.on_demand_settings['stale_sec'],
+        }
+        if self.shard_leases:
+            params.update(self.shard_leases.poll_params())
+        return self.db.execute_sp('usp_claim_check_requests', params)
+    
+    def _to_on_demand_endpoint(self, row: Dict) -> EndpointCheck:
+        """요청 행을 EndpointCheck로 변환 (마지막 체크 시각은 사용하지 않음)"""
+        now = get_seoul_time()
+        return self._to_endpoint({**row, 'last_checked_at': None, 'next_check_due': now})
+    
+    async def _check_on_demand(self, endpoint: EndpointCheck):
+        """즉시 점검 실행 후 결과 저장, 요청 완료 처리 및 스케줄 갱신"""
+        logger.info(f"즉시 점검: {endpoint.url}")
+        result = await self.http_checker.check_now(endpoint)
+        self._record_dependency(endpoint, result)
+        check_id = (await self._save_results([result]))[0]
+        
+        params = {'endpoint_id': endpoint.endpoint_id, 'check_id': check_id, 'instance_id': self.instance_id}
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, lambda: self.db.execute_sp_non_query('usp_complete_check_requests', params))
+        except Exception as e:
+            logger.error(f"즉시 점검 완료 기록 오류 (endpoint_id: {endpoint.endpoint_id}): {e}")
+        
+        # 적응형 스케줄러: 예약 체크가 진행 중이 아니면 이 결과를 마지막 체크로 반영
+        if self.scheduler:
+            state = self.scheduler.states.get(endpoint.endpoint_id)
+            if state is not None and not state.in_flight:
+                success = result.status_code is not None and 200 <= result.status_code < 300
+                self.scheduler.record(endpoint.endpoint_id, success, time.time())
+    
+    def _flush_agent(self):
+        """에이전트 모드: flush_sec마다 모인 결과를 백그라운드로 전송 (수집 API 장애가 체크를 막지 않도록)"""
+        if not self.agent or not self.agent.flush_due():
+            return
+        if self._agent_flush_task and not self._agent_flush_task.done():
+            return
+        loop = asyncio.get_event_loop()
+        self._agent_flush_task = loop.run_in_executor(None, self.agent.flush)
+    
+    async def _drain_agent(self):
+        """에이전트 모드 종료 시 남은 결과 전송"""
+        if not self.agent:
+            return
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, lambda: self.agent.flush(drain=True))
+    
+    def _restore_state(self):
+        """시작 시 상태 스냅샷 복원 (스케줄러 상태는 첫 대상 조회 때 DB와 대조)"""
+        if not self.state_settings['enabled']:
+            return
+        snapshot = load_snapshot(self.state_file, self.network_group_id, self.state_settings['max_age_sec'])
+        if not snapshot:
+            return
+        self.http_checker.resolver.restore(snapshot.get('dns', []))
+        if self.http_checker.breakers:
+            self.http_checker.breakers.restore(snapshot.get('breakers', []))
+            self.metrics.open_breakers.set(
+                self.http_checker.breakers.open_count(), {'network_group': self.network_group_name or 'all'}
+            )
+        endpoints = snapshot.get('scheduler', [])
+        if self.scheduler and endpoints:
+            self.scheduler.restore_state(endpoints, snapshot['saved_at'], time.time())
+        logger.info(
+            f"상태 스냅샷 복원 - 엔드포인트 {len(endpoints)}개, DNS {len(self.http_checker.resolver)}개 "
+            f"({time.time() - snapshot['saved_at']:.0f}초 전 저장)"
+        )
+    
+    def _snapshot_state(self) -> dict:
+        """현재 상태를 스냅샷용 값으로 변환 (이벤트 루프 스레드에서 호출)"""
+        return {
+            'scheduler': self.scheduler.export_state() if self.scheduler else [],
+            'dns': self.http_checker.resolver.export(),
+            'breakers': self.http_checker.breakers.export() if self.http_checker.breakers else [],
+        }
+    
+    def _save_state(self):
+        """상태 스냅샷 저장 (종료 시)"""
+        if not self.state_settings['enabled']:
+            return
+        try:
+            save_snapshot(self.state_file, self.network_group_id, self._snapshot_state())
+        except OSError as e:
+            logger.error(f"상태 스냅샷 저장 오류: {e}")
+    
+    async def _maybe_save_state(self):
+        """interval_sec마다 상태 스냅샷 저장 (파일 쓰기는 스레드풀에서)"""
+        if not self.state_settings['enabled']:
+            return
+        if time.monotonic() - self._snapshot_saved_at < self.state_settings['interval_sec']:
+            return
+        self._snapshot_saved_at = time.monotonic()
+        state = self._snapshot_state()
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(
+                None, lambda: save_snapshot(self.state_file, self.network_group_id, state)
+            )
+        except OSError as e:
+            logger.error(f"상태 스냅샷 저장 오류: {e}")
+    
+    async def _load_poll_targets(self):
+        """폴링 대상 전체를 조회해 스케줄러에 반영 (마지막 체크 시각 기준)"""
+        loop = asyncio.get_event_loop()
+        params = {'network_group_id': self.network_group_id}
+        if self.shard_leases:
+            params.update(self.shard_leases.poll_params())
+        rows = await loop.run_in_executor(None, lambda: self.db.execute_sp('usp_get_poll_targets', params))
+        targets = []
+        for row in rows:
+            endpoint = self._to_endpoint(row)
+            last_checked = endpoint.last_checked_at
+            if last_checked is not None and last_checked.tzinfo is None:
+                last_checked = KST.localize(last_checked)
+            targets.append((endpoint, last_checked.timestamp() if last_checked is not None else None))
+        self.scheduler.load(targets, time.time())
+        logger.info(f"폴링 대상 {len(targets)}개 (필요 처리량 {self.scheduler.required_rate():.2f}건/초)")
+    
+    def _dispatch_due_checks(self):
+        """예산 안에서 due 엔드포인트 체크 시작 (동시 요청 한도의 2배까지만 대기열에 올림)"""
+        now = time.time()
+        capacity = self.max_concurrent * 2 - len(self._check_tasks)
+        if capacity <= 0:
+            return
+        endpoints = self.scheduler.take_due(now, capacity)
+        if not endpoints:
+            return
+        
+        lags = [now - self.scheduler.states[endpoint.endpoint_id].next_due for endpoint in endpoints]
+        self.metrics.record_batch(
+            self.network_group_name,
+            due=len(endpoints) + self.scheduler.due_count(now),
+            overdue=sum(1 for lag in lags if lag > self.scheduler_settings['tick_sec']),
+            max_lag_sec=max(lags),
+            batch_limit=capacity
+        )
+        endpoints = self._apply_dependencies(endpoints, now)
+        for endpoint in endpoints:
+            task = asyncio.ensure_future(self._check_and_record(endpoint))
+            self._check_tasks.add(task)
+            task.add_done_callback(self._check_tasks.discard)
+    
+    async def _check_and_record(self, endpoint: EndpointCheck):
+        """단일 체크 실행 후 결과 저장 및 스케줄 갱신"""
+        success = False
+        try:
+            results = await self.http_checker.check_batch([endpoint])
+            result = results[0]
+            success = result.status_code is not None and 200 <= result.status_code < 300
+            self._record_dependency(endpoint, result)
+            await self._save_results(results)
+        finally:
+            self.scheduler.record(endpoint.endpoint_id, success, time.time())
+    
+    def _to_endpoint(self, row: Dict) -> EndpointCheck:
+        """조회 결과 행을 EndpointCheck로 변환"""
+        return EndpointCheck(
+            endpoint_id=row['endpoint_id'],
+            url=row['url'],
+            poll_interval_sec=row['poll_interval_sec'],
+            domain=row['domain'],
+            site_name=row['site_name'],
+            network_group_name=row['network_group_name'],
+            last_checked_at=row['last_checked_at'],
+            next_check_due=row['next_check_due'],
+            parent_endpoint_id=row.get('parent_endpoint_id')
+        )
+    
+    def _apply_dependencies(self, endpoints: List[EndpointCheck], now: float) -> List[EndpointCheck]:
+        """상위 노드 장애로 생략할 엔드포인트를 제외하고 체크할 엔드포인트만 반환"""
+        if not self.dependencies:
+            return endpoints
+        checks, suppressed = self.dependencies.split(endpoints, now)
+        for node, skipped in suppressed.items():
+            self.metrics.suppressed_checks.inc(len(skipped), labels={
+                'network_group': self.network_group_name or 'all', 'level': node[0]
+            })
+            if self.scheduler:
+                for endpoint in skipped:
+                    self.scheduler.skip(endpoint.endpoint_id, now)
+            task = asyncio.ensure_future(self._mark_suppressed(skipped, self.dependencies.reason(node)))
+            self._check_tasks.add(task)
+            task.add_done_callback(self._check_tasks.discard)
+        return checks
+    
+    def _record_dependency(self, endpoint: EndpointCheck, result: CheckResult):
+        """체크 결과를 상위 노드 상태에 반영하고 장애 확인/복구를 기록"""
+        if not self.dependencies:
+            return
+        for node in self.dependencies.record(endpoint, result.status_code):
+            if self.dependencies.is_down(node):
+                logger.warning(f"{self.dependencies.reason(node)} 확인 - 하위 엔드포인트 체크를 생략합니다.")
+            else:
+                logger.info(f"{self.dependencies.reason(node)} 복구 - 하위 엔드포인트 체크를 재개합니다.")
+    
+    async def _mark_suppressed(self, endpoints: List[EndpointCheck], reason: str):
+        """생략한 엔드포인트를 롤업에 표시 (체크 기록은 남기지 않음, 다음 체크 시각만 미룸)"""
+        params = {
+            'endpoint_ids': ','.join(str(endpoint.endpoint_id) for endpoint in endpoints),
+            'reason': reason,
+            'suppressed_at': get_seoul_time()
+        }
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, lambda: self.db.execute_sp_non_query('usp_mark_suppressed', params))
+        except Exception as e:
+            logger.error(f"체크 생략 기록 오류 ({reason}): {e}")
+    
+    async def _start_metrics(self):
+        """메트릭 리스너 및 이벤트 루프 지연 측정 시작 (설정 시)"""
+        if not self.metrics_settings['enabled'] or self.supervised:
+            return
+        
+        self._loop_lag_task = asyncio.ensure_future(monitor_event_loop_lag(self.metrics))
+        try:
+            self._metrics_server = MetricsServer(
+                self.metrics,
+                host=self.metrics_settings['host'],
+                port=self.metrics_settings['port']
+            )
+            await self._metrics_server.start()
+        except OSError as e:
+            logger.error(f"메트릭 리스너 시작 오류: {e}")
+            self._metrics_server = None
+    
+    async def _stop_metrics(self):
+        """메트릭 리스너 종료"""
+        if self._loop_lag_task:
+            self._loop_lag_task.cancel()
+        if self._metrics_server:
+            await self._metrics_server.stop()
+    
     async def _process_batch(self):
         """한 배치의 엔드포인트들을 처리 (망구분별)"""
         try:
             # 다음 폴링 배치 조회 (망구분 필터링)
             now = get_seoul_time()
+            # execute_sp는 위치 인자로 전달하므로 저장프로시저 매개변수 순서와 같아야 함
+            # spread_from: 시작 전에 놓친 체크는 시작 후 각 엔드포인트의 위상 시각으로 분산
             params = {
                 'now': now,
                 'limit': self.batch_size,
-                'network_group_id': self.network_group_id
+                'max_concurrency': self.max_concurrent,
+                'network_group_id': self.network_group_id,
+                'spread_from': self.started_at
             }
+            if self.shard_leases:
+                # 임대한 샤드의 엔드포인트만 (보유 샤드가 없으면 다른 인스턴스가 모두 체크 중)
+                if not self.shard_leases.shards:
+                    return
+                params.update(self.shard_leases.poll_params())
             
             # 망구분 ID를 사용하여 DB에서 직접 필터링된 결과 조회
             batch_data = self.db.execute_sp('usp_next_poll_batch', params)
@@ -408,24 +1065,19 @@ class MonitoringService:
                 return
             
             # EndpointCheck 객체로 변환
-            endpoints = []
-            for row in batch_data:
-                endpoint = EndpointCheck(
-                    endpoint_id=row['endpoint_id'],
-                    url=row['url'],
-                    poll_interval_sec=row['poll_interval_sec'],
-                    domain=row['domain'],
-                    site_name=row['site_name'],
-                    network_group_name=row['network_group_name'],
-                    last_checked_at=row['last_checked_at'],
-                    next_check_due=row['next_check_due']
-                )
-                endpoints.append(endpoint)
+            endpoints = [self._to_endpoint(row) for row in batch_data]
+            self._record_batch_metrics(endpoints, now)
             
+            # 상위 노드 장애로 생략할 엔드포인트 제외
+            endpoints = self._apply_dependencies(endpoints, time.time())
+            if not endpoints:
+                return
             logger.info(f"{len(endpoints)}개 엔드포인트를 체크합니다.")
             
             # HTTP 체크 실행
             results = await self.http_checker.check_batch(endpoints)
+            for endpoint, result in zip(endpoints, results):
+                self._record_dependency(endpoint, result)
             
             # 결과를 데이터베이스에 저장
             await self._save_results(results)
@@ -433,9 +1085,36 @@ class MonitoringService:
         except Exception as e:
             logger.error(f"배치 처리 오류: {e}")
     
-    async def _save_results(self, results: List[CheckResult]):
-        """체크 결과들을 데이터베이스에 저장"""
+    def _record_batch_metrics(self, endpoints: List[EndpointCheck], now: datetime):
+        """배치의 스케줄 지연(backlog/overdue) 메트릭 기록"""
+        max_lag = 0.0
+        overdue = 0
+        for endpoint in endpoints:
+            due = endpoint.next_check_due
+            if due is None:
+                continue
+            if due.tzinfo is None:
+                due = KST.localize(due)
+            lag = (now - due).total_seconds()
+            max_lag = max(max_lag, lag)
+            if lag > self.poll_interval:
+                overdue += 1
+        
+        self.metrics.record_batch(
+            self.network_group_name,
+            due=len(endpoints),
+            overdue=overdue,
+            max_lag_sec=max_lag,
+            batch_limit=self.batch_size
+        )
+    
+    async def _save_results(self, results: List[CheckResult]) -> List[Optional[int]]:
+        """체크 결과들을 데이터베이스에 저장, 반환값: 결과별 체크 ID (실패 또는 에이전트 모드는 None)"""
+        labels = {'network_group': self.network_group_name or 'all'}
+        self.metrics.spool_depth.inc(len(results), labels)
+        check_ids = []
         for result in results:
+            check_id = None
             try:
                 params = {
                     'endpoint_id': result.endpoint_id,
@@ -448,16 +1127,31 @@ class MonitoringService:
                 
                 # 비동기로 저장하기 위해 스레드풀에서 실행
                 loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
+                write_start = time.perf_counter()
+                rows = await loop.run_in_executor(
                     None, 
                     lambda: self.db.execute_sp('usp_record_check', params)
                 )
+                self.metrics.db_write_latency.observe(time.perf_counter() - write_start)
+                if rows:
+                    check_id = rows[0].get('check_id') or None
+                    if self.notifier:
+                        self.notifier.on_status(
+                            result.endpoint_id, rows[0].get('previous_status'), rows[0].get('status'),
+                            result.error or (f"HTTP {result.status_code}" if result.status_code else None),
+                            params['checked_at']
+                        )
                 
             except Exception as e:
+                self.metrics.db_write_errors.inc()
                 logger.error(f"결과 저장 오류 (endpoint_id: {result.endpoint_id}): {e}")
+            finally:
+                self.metrics.spool_depth.dec(labels=labels)
+            check_ids.append(check_id)
+        return check_ids
 
 
-class SVCMONService(win32serviceutil.ServiceFramework):
+class SVCMONService(_ServiceFramework):
     """Windows 서비스 래퍼 (망구분별)"""
     
     _svc_name_ = "SVCMON"  # 기본값, 동적으로 변경됨
@@ -473,6 +1167,7 @@ class SVCMONService(win32serviceutil.ServiceFramework):
         # 명령행 인수에서 망구분 정보 추출
         self.network_group_id = getattr(args, 'network_group_id', None)
         self.network_group_name = getattr(args, 'network_group_name', None)
+        self.supervisor = getattr(args, 'supervisor', False)
     
     def SvcStop(self):
         """서비스 중지"""
@@ -491,11 +1186,16 @@ class SVCMONService(win32serviceutil.ServiceFramework):
         )
         
         try:
-            # 모니터링 서비스 시작 (망구분 지정)
-            self.monitoring_service = MonitoringService(
-                network_group_id=self.network_group_id,
-                network_group_name=self.network_group_name
-            )
+            if self.supervisor:
+                # 모든 망구분을 이 프로세스에서 실행 (supervisor.py)
+                from supervisor import Supervisor
+                self.monitoring_service = Supervisor()
+            else:
+                # 모니터링 서비스 시작 (망구분 지정)
+                self.monitoring_service = MonitoringService(
+                    network_group_id=self.network_group_id,
+                    network_group_name=self.network_group_name
+                )
             self.monitoring_service.start()
             
             # 서비스 종료 신호까지 대기
@@ -517,6 +1217,7 @@ def main():
     parser = argparse.ArgumentParser(description='SVCMON 모니터링 서비스')
     parser.add_argument('--network-group-id', type=int, help='망구분 ID')
     parser.add_argument('--network-group-name', type=str, help='망구분 이름')
+    parser.add_argument('--supervisor', action='store_true', help='모든 망구분을 한 서비스로 실행 (SVCMON_SUPERVISOR)')
     parser.add_argument('action', nargs='?', help='서비스 액션 (install/remove/start/stop/debug)')
     
     # 서비스 관련 인수와 사용자 정의 인수 분리
@@ -526,7 +1227,9 @@ def main():
     i = 0
     while i < len(sys.argv[1:]):
         arg = sys.argv[i + 1]
-        if arg.startswith('--network-group'):
+        if arg == '--supervisor':
+            custom_args.append(arg)
+        elif arg.startswith('--network-group'):
             custom_args.append(arg)
             if '=' not in arg and i + 1 < len(sys.argv[1:]):
                 i += 1
@@ -538,7 +1241,12 @@ def main():
     # 사용자 정의 인수 파싱
     args, _ = parser.parse_known_args(custom_args)
     
-    if len(service_args) == 0:
+    if len(service_args) == 0 and args.supervisor:
+        # 콘솔에서 supervisor 실행 (단일 프로세스)
+        from supervisor import main as supervisor_main
+        sys.argv = [sys.argv[0]]
+        supervisor_main()
+    elif len(service_args) == 0:
         # 콘솔에서 직접 실행
         print(f"SVCMON 모니터링 서비스를 콘솔 모드로 실행합니다.")
         if args.network_group_name:
@@ -563,8 +1271,21 @@ def main():
             print("서비스가 종료되었습니다.")
     else:
         # Windows 서비스로 실행
+        if win32serviceutil is None:
+            print("Windows 서비스 명령은 pywin32가 설치된 Windows에서만 사용할 수 있습니다.")
+            sys.exit(1)
+        
         # 망구분별 서비스 이름 설정
-        if args.network_group_name:
+        if args.supervisor:
+            SVCMONService._svc_name_ = "SVCMON_SUPERVISOR"
+            SVCMONService._svc_display_name_ = "SVCMON 모니터링 서비스 - 통합(supervisor)"
+            
+            original_init = SVCMONService.__init__
+            def patched_init(self, svc_args):
+                original_init(self, svc_args)
+                self.supervisor = True
+            SVCMONService.__init__ = patched_init
+        elif args.network_group_name:
             SVCMONService._svc_name_ = f"SVCMON_{args.network_group_name}"
             SVCMONService._svc_display_name_ = f"SVCMON 모니터링 서비스 - {args.network_group_name}"
             
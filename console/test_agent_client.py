@@ -0,0 +1,93 @@
+"""AgentClient 전송/재전송 테스트 (python -m unittest test_agent_client)"""
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from agent_client import KST, AgentClient
+from scheduler import next_due
+
+RESPONSE = {'config_revision': 1, 'network_group_id': 1, 'network_group_name': 'TEST'}
+
+
+class AgentClientTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = AgentClient('http://localhost/monitoring/api/ingest/', 'token', batch_size=10)
+        self.sent = []
+
+    def record(self, endpoint_id):
+        self.client.execute_sp('usp_record_check', {
+            'endpoint_id': endpoint_id, 'status_code': 200, 'latency_ms': 30, 'headers': None, 'error': None,
+            'checked_at': datetime(2026, 10, 19, 10, 0),
+        })
+
+    def post_then_fail(self, rows):
+        """서버는 기록했지만 응답을 받지 못한 경우"""
+        self.sent.append([row['trace_id'] for row in rows])
+        raise OSError('응답 시간 초과')
+
+    def post_ok(self, rows):
+        self.sent.append([row['trace_id'] for row in rows])
+        return dict(RESPONSE)
+
+    def test_retry_resends_same_trace_ids(self):
+        for endpoint_id in range(3):
+            self.record(endpoint_id)
+        with mock.patch.object(self.client, '_post', self.post_then_fail):
+            self.assertFalse(self.client.flush(drain=True))
+        with mock.patch.object(self.client, '_post', self.post_ok):
+            self.assertTrue(self.client.flush(drain=True))
+        self.assertEqual(len(self.sent), 2)
+        self.assertEqual(self.sent[0], self.sent[1])
+        self.assertEqual(len(set(self.sent[0])), 3)
+
+    def test_requeued_rows_stay_before_new_rows(self):
+        self.record(1)
+        with mock.patch.object(self.client, '_post', self.post_then_fail):
+            self.client.flush(drain=True)
+        self.record(2)
+        self.assertEqual([row['endpoint_id'] for row in self.client._buffer], [1, 2])
+
+    def test_requeue_drops_oldest_over_max_buffer(self):
+        self.client.max_buffer = 2
+        for endpoint_id in range(3):
+            self.record(endpoint_id)
+        with mock.patch.object(self.client, '_post', self.post_then_fail):
+            self.client.flush(drain=True)
+        self.assertEqual([row['endpoint_id'] for row in self.client._buffer], [1, 2])
+
+    def test_full_buffer_flushes_batch(self):
+        with mock.patch.object(self.client, '_post', self.post_ok):
+            for endpoint_id in range(10):
+                self.record(endpoint_id)
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(len(self.sent[0]), 10)
+        self.assertEqual(self.client.config_revision, 1)
+
+    def test_unsupported_sp_returns_empty(self):
+        with self.assertLogs('SVCMON', 'ERROR'):
+            self.assertEqual(self.client.execute_sp('usp_get_active_endpoints'), [])
+
+    def test_next_batch_uses_phase_spread(self):
+        now = datetime(2026, 10, 19, 10, 0)
+        self.client.targets = {
+            endpoint_id: {'endpoint_id': endpoint_id, 'poll_interval_sec': 60, 'next_check_due': now,
+                          'last_checked_at': None}
+            for endpoint_id in range(1, 21)
+        }
+        batch = self.client.execute_sp('usp_next_poll_batch', {'now': now, 'limit': 100})
+        self.assertEqual(len(batch), 20)
+        now_sec = KST.localize(now).timestamp()
+        delays = {}
+        for endpoint_id, row in self.client.targets.items():
+            delay = (row['next_check_due'] - now).total_seconds()
+            self.assertAlmostEqual(delay, next_due(endpoint_id, 60, now_sec) - now_sec, places=3)
+            self.assertTrue(30 <= delay < 90)
+            delays[endpoint_id] = delay
+        # 같은 주기라도 다음 체크 시각이 한꺼번에 몰리지 않음
+        self.assertGreater(len({round(delay) for delay in delays.values()}), 10)
+        self.assertEqual(self.client.execute_sp('usp_next_poll_batch', {'now': now, 'limit': 100}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
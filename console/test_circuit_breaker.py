@@ -0,0 +1,69 @@
+"""CircuitBreakers 상태 전이 테스트 (python -m unittest test_circuit_breaker)"""
+import unittest
+
+from circuit_breaker import BreakerPolicy, CircuitBreakers, CLOSED, OPEN, HALF_OPEN
+
+HOST = 'svc.jnu.ac.kr:443'
+
+
+class CircuitBreakerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.breakers = CircuitBreakers(BreakerPolicy(failure_threshold=3, open_sec=30, max_open_sec=100))
+
+    def fail(self, times, now=0.0):
+        return [self.breakers.record(HOST, False, '연결 시간 초과', now=now) for _ in range(times)]
+
+    def test_opens_after_consecutive_failures(self):
+        self.assertEqual(self.fail(3), [None, None, OPEN])
+        self.assertFalse(self.breakers.allow(HOST, now=10))
+        self.assertEqual(self.breakers.open_count(), 1)
+        self.assertIn('연속 3회', self.breakers.reason(HOST))
+
+    def test_response_resets_failures(self):
+        self.fail(2)
+        self.assertIsNone(self.breakers.record(HOST, True))
+        self.assertEqual(self.fail(2), [None, None])
+        self.assertTrue(self.breakers.allow(HOST))
+
+    def test_half_open_allows_single_probe(self):
+        self.fail(3)
+        self.assertTrue(self.breakers.allow(HOST, now=30))
+        self.assertEqual(self.breakers.breakers[HOST].state, HALF_OPEN)
+        self.assertFalse(self.breakers.allow(HOST, now=31))
+        # HTTP 오류라도 응답이 오면 해제
+        self.assertEqual(self.breakers.record(HOST, True), CLOSED)
+        self.assertTrue(self.breakers.allow(HOST, now=31))
+        self.assertEqual(self.breakers.open_count(), 0)
+
+    def test_failed_probe_doubles_wait_up_to_max(self):
+        self.fail(3)
+        waits = []
+        now = 0.0
+        for _ in range(4):
+            now += self.breakers.breakers[HOST].open_sec
+            self.assertTrue(self.breakers.allow(HOST, now=now))
+            self.assertEqual(self.breakers.record(HOST, False, now=now), OPEN)
+            waits.append(self.breakers.breakers[HOST].open_sec)
+        self.assertEqual(waits, [60, 100, 100, 100])
+        self.assertFalse(self.breakers.allow(HOST, now=now + 99))
+
+    def test_release_cancelled_probe(self):
+        self.fail(3)
+        self.assertTrue(self.breakers.allow(HOST, now=30))
+        self.breakers.release(HOST)
+        self.assertTrue(self.breakers.allow(HOST, now=30))
+
+    def test_snapshot_restores_open(self):
+        self.fail(3, now=100)
+        self.breakers.allow(HOST, now=130)
+        rows = self.breakers.export()
+        restored = CircuitBreakers(self.breakers.policy)
+        restored.restore(rows)
+        self.assertEqual(restored.breakers[HOST].state, OPEN)
+        self.assertFalse(restored.allow(HOST, now=120))
+        self.assertTrue(restored.allow(HOST, now=130))
+
+
+if __name__ == '__main__':
+    unittest.main()
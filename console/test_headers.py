@@ -0,0 +1,45 @@
+"""응답 헤더 정규화 테스트 (python -m unittest test_headers)"""
+import unittest
+
+from response_headers import normalize_headers
+
+ALLOWLIST = frozenset({'server', 'content-type', 'set-cookie'})
+
+
+class NormalizeHeadersTests(unittest.TestCase):
+
+    def test_allowlist_lowercase_sorted(self):
+        headers = {'Server': 'nginx', 'Content-Type': ' text/html;  charset=utf-8 ', 'Date': 'Mon, 19 Oct 2026'}
+        self.assertEqual(
+            normalize_headers(headers, ALLOWLIST), '{"content-type":"text/html; charset=utf-8","server":"nginx"}'
+        )
+
+    def test_same_headers_same_string(self):
+        first = normalize_headers({'SERVER': 'nginx', 'content-type': 'text/html'}, ALLOWLIST)
+        second = normalize_headers({'Content-Type': 'text/html', 'Server': 'nginx'}, ALLOWLIST)
+        self.assertEqual(first, second)
+
+    def test_repeated_header_joined(self):
+        headers = [('Set-Cookie', 'a=1'), ('set-cookie', 'b=2')]
+        self.assertEqual(normalize_headers(_MultiDict(headers), ALLOWLIST), '{"set-cookie":"a=1, b=2"}')
+
+    def test_none_without_allowed_headers(self):
+        self.assertIsNone(normalize_headers({'Date': 'Mon, 19 Oct 2026'}, ALLOWLIST))
+        self.assertIsNone(normalize_headers({'Server': 'nginx'}, frozenset()))
+
+    def test_truncated_to_column_size(self):
+        self.assertEqual(len(normalize_headers({'Server': 'x' * 5000}, ALLOWLIST)), 4000)
+
+
+class _MultiDict:
+    """같은 이름이 여러 번 오는 응답 헤더 (aiohttp CIMultiDictProxy처럼 items()만 사용)"""
+
+    def __init__(self, items):
+        self._items = items
+
+    def items(self):
+        return iter(self._items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Notifier 중복 제거/묶음 발송 테스트 (python -m unittest test_notifier)"""
+import asyncio
+import json
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from notifier import NotificationPolicy, Notifier, parse_recipients
+
+OWNER = 'owner@jnu.ac.kr'
+
+
+class FakeDb:
+    def __init__(self, targets):
+        self.targets = targets
+        self.recorded = []
+
+    def execute_sp(self, sp_name, params=None):
+        return [dict(row) for row in self.targets]
+
+    def execute_sp_non_query(self, sp_name, params=None):
+        self.recorded.append((sp_name, json.loads(params['notifications'])))
+        return True
+
+
+class FakeSmtp:
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append(message)
+
+
+def target(endpoint_id, owner_contact=OWNER, **extra):
+    row = {
+        'endpoint_id': endpoint_id, 'url': f'https://svc{endpoint_id}.jnu.ac.kr/', 'site_name': f'사이트 {endpoint_id}',
+        'owner_contact': owner_contact, 'dedupe_minutes': None, 'last_level': None, 'last_sent_at': None,
+    }
+    row.update(extra)
+    return row
+
+
+class NotifierTests(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1_000_000.0
+        fake_time = SimpleNamespace(time=lambda: self.now, monotonic=lambda: self.now)
+        patcher = mock.patch('notifier.time', fake_time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.smtp = FakeSmtp()
+
+    def make_notifier(self, targets, **policy):
+        self.db = FakeDb(targets)
+        notifier = Notifier(
+            self.db, self.smtp, 'svcmon@jnu.ac.kr', NotificationPolicy(**policy), network_group_name='TEST'
+        )
+        notifier.refresh()
+        return notifier
+
+    def status(self, notifier, endpoint_id, previous, current):
+        return notifier.on_status(endpoint_id, previous, current, 'HTTP 500', datetime(2026, 10, 19, 10, 0))
+
+    def test_dedupe_within_window(self):
+        notifier = self.make_notifier([target(1)], dedupe_sec=1800)
+        self.assertTrue(self.status(notifier, 1, 'GREEN', 'RED'))
+        self.assertTrue(self.status(notifier, 1, 'RED', 'GREEN'))
+        # 깜빡임: 장애 알림이 중복 제거되면 복구 알림도 생략
+        self.now += 60
+        self.assertFalse(self.status(notifier, 1, 'GREEN', 'RED'))
+        self.assertFalse(self.status(notifier, 1, 'RED', 'GREEN'))
+        # 다른 상태(응답 없음)는 따로 셈
+        self.assertTrue(self.status(notifier, 1, 'GREEN', 'AMBER'))
+        self.now += 1800
+        self.assertTrue(self.status(notifier, 1, 'AMBER', 'RED'))
+        self.assertEqual(notifier.pending_count(), 4)
+
+    def test_ignores_unknown_targets_and_same_status(self):
+        notifier = self.make_notifier([target(1)])
+        self.assertFalse(self.status(notifier, 2, 'GREEN', 'RED'))
+        self.assertFalse(self.status(notifier, 1, 'RED', 'RED'))
+        self.assertFalse(self.status(notifier, 1, None, 'RED'))
+        self.assertFalse(self.status(notifier, 1, 'GREEN', 'GREEN'))
+
+    def test_refresh_restores_dedupe_window(self):
+        sent_at = datetime.fromtimestamp(self.now) - timedelta(minutes=10)
+        notifier = self.make_notifier([
+            target(1, last_level='RED', last_sent_at=sent_at.astimezone()),
+            target(2, last_level='GREEN', last_sent_at=sent_at.astimezone()),
+        ])
+        self.assertFalse(self.status(notifier, 1, 'GREEN', 'RED'))
+        # 장애 알림을 보낸 상태로 복원되어 복구 알림은 보냄
+        self.assertTrue(self.status(notifier, 1, 'RED', 'GREEN'))
+        self.assertFalse(self.status(notifier, 2, 'RED', 'GREEN'))
+        self.assertTrue(self.status(notifier, 2, 'GREEN', 'RED'))
+
+    def test_digest_per_recipient(self):
+        notifier = self.make_notifier(
+            [target(1), target(2), target(3, owner_contact='010-1234-5678, other@jnu.ac.kr')], digest_sec=60
+        )
+        for endpoint_id in (1, 2, 3):
+            self.status(notifier, endpoint_id, 'GREEN', 'RED')
+        self.assertEqual(asyncio.run(notifier.dispatch()), 0)
+
+        self.now += 60
+        self.assertEqual(asyncio.run(notifier.dispatch()), 2)
+        messages = {message['To']: message for message in self.smtp.messages}
+        self.assertEqual(messages[OWNER]['Subject'], '[SVCMON] [TEST] 장애 2건')
+        self.assertIn('사이트 3', messages['other@jnu.ac.kr']['Subject'])
+        # 발송 결과는 한 번에 기록
+        self.assertEqual(len(self.db.recorded), 1)
+        sp_name, rows = self.db.recorded[0]
+        self.assertEqual(sp_name, 'usp_record_notifications_bulk')
+        self.assertEqual(sorted(row['dedupe_key'] for row in rows), ['1:RED', '2:RED', '3:RED'])
+        self.assertEqual({row['status'] for row in rows}, {'SENT'})
+        self.assertEqual(notifier.pending_count(), 0)
+
+    def test_digest_split_by_max_events(self):
+        notifier = self.make_notifier([target(endpoint_id) for endpoint_id in range(1, 6)], max_digest_events=2)
+        for endpoint_id in range(1, 6):
+            self.status(notifier, endpoint_id, 'GREEN', 'AMBER')
+        # 한 통 분량이 차면 digest_sec을 기다리지 않음
+        self.assertEqual(asyncio.run(notifier.dispatch()), 3)
+        self.assertEqual([len(message.get_content().splitlines()) - 2 for message in self.smtp.messages], [2, 2, 1])
+
+    def test_force_dispatch(self):
+        notifier = self.make_notifier([target(1)])
+        self.status(notifier, 1, 'GREEN', 'RED')
+        self.assertEqual(asyncio.run(notifier.dispatch(force=True)), 1)
+
+
+class ParseRecipientsTests(unittest.TestCase):
+
+    def test_only_mail_addresses(self):
+        self.assertEqual(
+            parse_recipients('홍길동 010-1234-5678; a@jnu.ac.kr, b@jnu.ac.kr'), ['a@jnu.ac.kr', 'b@jnu.ac.kr']
+        )
+        self.assertEqual(parse_recipients(None), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
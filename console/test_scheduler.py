@@ -0,0 +1,117 @@
+"""AdaptiveScheduler 예산 분배 테스트 (python -m unittest test_scheduler)"""
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from scheduler import AdaptivePolicy, AdaptiveScheduler, TokenBucket
+
+
+def make_endpoint(endpoint_id, group='A', interval=60):
+    return SimpleNamespace(endpoint_id=endpoint_id, poll_interval_sec=interval, network_group_name=group)
+
+
+class FakeClock:
+    """scheduler 모듈의 time 대체 (TokenBucket은 monotonic 사용)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+class SchedulerThrottleTests(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('scheduler.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_scheduler(self, endpoints, max_rate=0, group_rate=0):
+        scheduler = AdaptiveScheduler(AdaptivePolicy(), max_checks_per_sec=max_rate, group_checks_per_sec=group_rate)
+        scheduler.started_at = 0
+        scheduler.load([(endpoint, None) for endpoint in endpoints], 0)
+        return scheduler
+
+    def ids(self, endpoints):
+        return sorted(endpoint.endpoint_id for endpoint in endpoints)
+
+    def test_unlimited_takes_all_due(self):
+        scheduler = self.make_scheduler([make_endpoint(i) for i in range(1, 11)])
+        self.assertEqual(scheduler.due_count(100), 10)
+        self.assertEqual(self.ids(scheduler.take_due(100, 100)), list(range(1, 11)))
+        self.assertEqual(scheduler.due_count(100), 0)
+
+    def test_limit_keeps_rest_due(self):
+        scheduler = self.make_scheduler([make_endpoint(i) for i in range(1, 11)])
+        self.assertEqual(len(scheduler.take_due(100, 4)), 4)
+        self.assertEqual(scheduler.due_count(100), 6)
+
+    def test_global_budget(self):
+        scheduler = self.make_scheduler([make_endpoint(i) for i in range(1, 11)], max_rate=2)
+        self.assertEqual(len(scheduler.take_due(100, 100)), 2)
+        self.assertEqual(scheduler.take_due(100, 100), [])
+        self.clock.now += 1.5
+        self.assertEqual(len(scheduler.take_due(100, 100)), 2)
+        self.assertEqual(scheduler.due_count(100), 6)
+
+    def test_group_budget_parks_busy_group(self):
+        endpoints = [make_endpoint(i, 'A') for i in range(1, 9)] + [make_endpoint(i, 'B') for i in range(9, 11)]
+        scheduler = self.make_scheduler(endpoints, group_rate=1)
+        # 망구분별 토큰 1개: A 1건, B 1건
+        taken = scheduler.take_due(100, 100)
+        self.assertEqual(sorted(endpoint.network_group_name for endpoint in taken), ['A', 'B'])
+        self.assertEqual(scheduler.take_due(100, 100), [])
+        self.assertEqual(scheduler.due_count(100), 8)
+        self.clock.now += 1
+        self.assertEqual(len(scheduler.take_due(100, 100)), 2)
+        self.assertEqual(scheduler.due_count(100), 6)
+
+    def test_earliest_due_first_across_groups(self):
+        endpoints = [make_endpoint(i, 'A' if i % 2 else 'B') for i in range(1, 21)]
+        scheduler = self.make_scheduler(endpoints, max_rate=1, group_rate=5)
+        due = {state.endpoint.endpoint_id: state.next_due for state in scheduler.states.values()}
+        order = []
+        for _ in range(5):
+            order += [endpoint.endpoint_id for endpoint in scheduler.take_due(100, 100)]
+            self.clock.now += 1
+        self.assertEqual(order, sorted(due, key=lambda endpoint_id: (due[endpoint_id], endpoint_id))[:5])
+
+    def test_record_reschedules_and_reload_drops_stale(self):
+        endpoints = [make_endpoint(i) for i in range(1, 5)]
+        scheduler = self.make_scheduler(endpoints, group_rate=1)
+        taken = scheduler.take_due(100, 100)
+        self.assertEqual(len(taken), 1)
+        scheduler.record(taken[0].endpoint_id, True, 100)
+        self.assertEqual(scheduler.due_count(100), 3)
+        # 대기 중인 엔드포인트 하나를 목록에서 제거하고 하나는 주기 변경
+        waiting = [endpoint for endpoint in endpoints if endpoint is not taken[0]]
+        changed = make_endpoint(waiting[1].endpoint_id, interval=600)
+        scheduler.load([(taken[0], None), (waiting[0], None), (changed, None)], 100)
+        self.assertEqual(scheduler.due_count(100), 1)
+        self.clock.now += 10
+        taken_ids = [endpoint.endpoint_id for endpoint in scheduler.take_due(100, 100)]
+        self.assertNotIn(waiting[2].endpoint_id, taken_ids)
+        self.assertEqual(len(taken_ids), len(set(taken_ids)))
+
+
+class TokenBucketTests(unittest.TestCase):
+
+    def test_refill_capped_at_burst(self):
+        bucket = TokenBucket(2, burst=3)
+        bucket._updated = 0
+        bucket._tokens = 0
+        self.assertFalse(bucket.available(0.4))
+        self.assertTrue(bucket.available(0.5))
+        self.assertTrue(bucket.available(100))
+        for _ in range(3):
+            bucket.take(100)
+        self.assertFalse(bucket.available(100))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,15 @@ USE [SVCMON]
 GO
 
 -- 기존 테이블 삭제 (역순으로)
+IF OBJECT_ID('dbo.header_sets', 'U') IS NOT NULL DROP TABLE dbo.header_sets;
+IF OBJECT_ID('dbo.check_requests', 'U') IS NOT NULL DROP TABLE dbo.check_requests;
+IF OBJECT_ID('dbo.probe_agents', 'U') IS NOT NULL DROP TABLE dbo.probe_agents;
+IF OBJECT_ID('dbo.poller_shard_leases', 'U') IS NOT NULL DROP TABLE dbo.poller_shard_leases;
+IF OBJECT_ID('dbo.poller_instances', 'U') IS NOT NULL DROP TABLE dbo.poller_instances;
+IF OBJECT_ID('dbo.incidents', 'U') IS NOT NULL DROP TABLE dbo.incidents;
+IF OBJECT_ID('dbo.check_hourly_latency', 'U') IS NOT NULL DROP TABLE dbo.check_hourly_latency;
+IF OBJECT_ID('dbo.check_hourly_stats', 'U') IS NOT NULL DROP TABLE dbo.check_hourly_stats;
+IF OBJECT_ID('dbo.check_daily_stats', 'U') IS NOT NULL DROP TABLE dbo.check_daily_stats;
 IF OBJECT_ID('dbo.notifications', 'U') IS NOT NULL DROP TABLE dbo.notifications;
 IF OBJECT_ID('dbo.checks', 'U') IS NOT NULL DROP TABLE dbo.checks;
 IF OBJECT_ID('dbo.rollups', 'U') IS NOT NULL DROP TABLE dbo.rollups;
@@ -70,6 +79,8 @@ CREATE TABLE dbo.domains (
     domain NVARCHAR(255) NOT NULL,
     site_name NVARCHAR(255) NOT NULL,
     owner_name NVARCHAR(100) NOT NULL,
+    owner_contact NVARCHAR(100) NULL,
+    is_active BIT NOT NULL DEFAULT 1,
     note NVARCHAR(MAX) NULL,
     created_at DATETIME2 NOT NULL DEFAULT GETDATE(),
     updated_at DATETIME2 NOT NULL DEFAULT GETDATE(),
@@ -84,6 +95,7 @@ CREATE TABLE dbo.endpoints (
     id BIGINT IDENTITY(1,1) PRIMARY KEY,
     domain_id BIGINT NOT NULL,
     url NVARCHAR(2000) NOT NULL,
+    parent_endpoint_id BIGINT NULL,  -- 상위 엔드포인트 (장애 확인 시 체크 생략)
     requires_db BIT NOT NULL DEFAULT 0,
     note NVARCHAR(MAX) NULL,
     poll_interval_sec INT NOT NULL DEFAULT 300,
@@ -92,7 +104,8 @@ CREATE TABLE dbo.endpoints (
     created_at DATETIME2 NOT NULL DEFAULT GETDATE(),
     updated_at DATETIME2 NOT NULL DEFAULT GETDATE(),
     
-    CONSTRAINT FK_endpoints_domain FOREIGN KEY (domain_id) REFERENCES dbo.domains(id) ON DELETE CASCADE
+    CONSTRAINT FK_endpoints_domain FOREIGN KEY (domain_id) REFERENCES dbo.domains(id) ON DELETE CASCADE,
+    CONSTRAINT FK_endpoints_parent FOREIGN KEY (parent_endpoint_id) REFERENCES dbo.endpoints(id)
 );
 GO
 
@@ -102,7 +115,8 @@ CREATE TABLE dbo.checks (
     endpoint_id BIGINT NOT NULL,
     status_code INT NULL,
     latency_ms INT NULL,
-    headers NVARCHAR(MAX) NULL,
+    headers NVARCHAR(MAX) NULL,  -- 이전 버전 기록용 (새 결과는 header_hash로 header_sets 참조)
+    header_hash BINARY(32) NULL,
     error NVARCHAR(4000) NULL,
     checked_at DATETIME2 NOT NULL DEFAULT GETDATE(),
     trace_id UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
@@ -119,6 +133,8 @@ CREATE TABLE dbo.rollups (
     last_status NVARCHAR(6) NOT NULL DEFAULT 'AMBER' CHECK (last_status IN ('GREEN', 'AMBER', 'RED')),
     last_change_at DATETIME2 NOT NULL DEFAULT GETDATE(),
     last_reason NVARCHAR(400) NULL,
+    suppressed_by NVARCHAR(200) NULL,  -- 상위 장애로 체크 생략 중인 경우 사유
+    suppressed_at DATETIME2 NULL,
     updated_at DATETIME2 NOT NULL DEFAULT GETDATE(),
     
     CONSTRAINT UQ_rollups_level_ref UNIQUE (level, ref_id)
@@ -162,6 +178,134 @@ CREATE TABLE dbo.notifications (
 );
 GO
 
+-- 10. 일별 체크 집계 테이블 (usp_record_check가 갱신, 체크 기록 화면 통계용)
+CREATE TABLE dbo.check_daily_stats (
+    id BIGINT IDENTITY(1,1) PRIMARY KEY,
+    stat_date DATE NOT NULL,
+    network_group_id BIGINT NOT NULL,
+    total_count BIGINT NOT NULL DEFAULT 0,
+    success_count BIGINT NOT NULL DEFAULT 0,
+    error_count BIGINT NOT NULL DEFAULT 0,
+    latency_sum BIGINT NOT NULL DEFAULT 0,
+    latency_count BIGINT NOT NULL DEFAULT 0,
+    
+    CONSTRAINT UQ_check_daily_stats UNIQUE (stat_date, network_group_id),
+    CONSTRAINT FK_check_daily_stats_network_group FOREIGN KEY (network_group_id) REFERENCES dbo.network_groups(id) ON DELETE CASCADE
+);
+GO
+
+-- 11. 시간별 체크 집계 테이블 (usp_record_check가 갱신, 장기간 응답시간 차트용)
+CREATE TABLE dbo.check_hourly_stats (
+    id BIGINT IDENTITY(1,1) PRIMARY KEY,
+    endpoint_id BIGINT NOT NULL,
+    bucket_start DATETIME2 NOT NULL,
+    total_count INT NOT NULL DEFAULT 0,
+    error_count INT NOT NULL DEFAULT 0,
+    latency_min INT NULL,
+    latency_max INT NULL,
+    latency_sum BIGINT NOT NULL DEFAULT 0,
+    latency_count INT NOT NULL DEFAULT 0,
+    
+    CONSTRAINT UQ_check_hourly_stats UNIQUE (endpoint_id, bucket_start),
+    CONSTRAINT FK_check_hourly_stats_endpoint FOREIGN KEY (endpoint_id) REFERENCES dbo.endpoints(id) ON DELETE CASCADE
+);
+GO
+
+-- 12. 장애 구간 테이블 (usp_record_check가 열고 닫음, 장애 이력/MTTR용)
+CREATE TABLE dbo.incidents (
+    id BIGINT IDENTITY(1,1) PRIMARY KEY,
+    endpoint_id BIGINT NOT NULL,
+    status NVARCHAR(6) NOT NULL CHECK (status IN ('AMBER', 'RED')),
+    started_at DATETIME2 NOT NULL,
+    ended_at DATETIME2 NULL,
+    duration_sec INT NULL,
+    first_error NVARCHAR(4000) NOT NULL DEFAULT '',
+    last_error NVARCHAR(4000) NOT NULL DEFAULT '',
+    check_count INT NOT NULL DEFAULT 1,
+    last_checked_at DATETIME2 NOT NULL,
+    
+    CONSTRAINT FK_incidents_endpoint FOREIGN KEY (endpoint_id) REFERENCES dbo.endpoints(id) ON DELETE CASCADE
+);
+GO
+
+-- 13. 폴러 인스턴스 (샤드 임대 재분배용 하트비트, scope_id: 망구분 ID 또는 0=전체)
+CREATE TABLE dbo.poller_instances (
+    scope_id BIGINT NOT NULL,
+    instance_id NVARCHAR(100) NOT NULL,
+    started_at DATETIME2 NOT NULL,
+    heartbeat_at DATETIME2 NOT NULL,
+    expires_at DATETIME2 NOT NULL,
+    
+    CONSTRAINT PK_poller_instances PRIMARY KEY (scope_id, instance_id)
+);
+GO
+
+-- 14. 샤드 임대 (endpoint_id % 샤드 수, usp_claim_shard_leases가 관리)
+CREATE TABLE dbo.poller_shard_leases (
+    scope_id BIGINT NOT NULL,
+    shard_no INT NOT NULL,
+    owner_instance_id NVARCHAR(100) NULL,
+    expires_at DATETIME2 NULL,
+    
+    CONSTRAINT PK_poller_shard_leases PRIMARY KEY (scope_id, shard_no)
+);
+GO
+
+-- 15. 원격 폴러 에이전트 (HTTP 수집 API 인증, 토큰은 SHA-256 해시만 저장)
+CREATE TABLE dbo.probe_agents (
+    id BIGINT IDENTITY(1,1) PRIMARY KEY,
+    name NVARCHAR(100) NOT NULL UNIQUE,
+    network_group_id BIGINT NOT NULL,
+    token_hash CHAR(64) NOT NULL UNIQUE,
+    is_active BIT NOT NULL DEFAULT 1,
+    note NVARCHAR(MAX) NULL,
+    last_seen_at DATETIME2 NULL,
+    last_address NVARCHAR(39) NULL,
+    created_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+    updated_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+    
+    CONSTRAINT FK_probe_agents_network_group FOREIGN KEY (network_group_id) REFERENCES dbo.network_groups(id) ON DELETE CASCADE
+);
+GO
+
+-- 16. 즉시 점검 요청 큐 (웹앱이 넣고 콘솔이 usp_claim_check_requests로 가져가 체크 후 check_id 기록)
+CREATE TABLE dbo.check_requests (
+    id BIGINT IDENTITY(1,1) PRIMARY KEY,
+    endpoint_id BIGINT NOT NULL,
+    requested_by BIGINT NULL,
+    requested_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+    claimed_by NVARCHAR(100) NULL,
+    claimed_at DATETIME2 NULL,
+    completed_at DATETIME2 NULL,
+    check_id BIGINT NULL,
+    
+    CONSTRAINT FK_check_requests_endpoint FOREIGN KEY (endpoint_id) REFERENCES dbo.endpoints(id) ON DELETE CASCADE,
+    CONSTRAINT FK_check_requests_user FOREIGN KEY (requested_by) REFERENCES dbo.users(id) ON DELETE SET NULL
+);
+GO
+
+-- 17. 응답 헤더 조합 (콘솔 [Http] header_allowlist로 정규화한 JSON, SHA2_256 해시로 한 번만 저장)
+CREATE TABLE dbo.header_sets (
+    header_hash BINARY(32) PRIMARY KEY,
+    headers NVARCHAR(4000) NOT NULL,
+    created_at DATETIME2 NOT NULL DEFAULT GETDATE()
+);
+GO
+
+-- 18. 시간별 응답시간 히스토그램 (usp_record_check가 갱신, 가용률 리포트 백분위용)
+-- latency_bin: 0 = 1ms 미만, 1~95 = 1ms~120초 로그 간격 구간, 95는 120초 이상 포함
+CREATE TABLE dbo.check_hourly_latency (
+    id BIGINT IDENTITY(1,1) PRIMARY KEY,
+    endpoint_id BIGINT NOT NULL,
+    bucket_start DATETIME2 NOT NULL,
+    latency_bin TINYINT NOT NULL,
+    check_count INT NOT NULL DEFAULT 0,
+    
+    CONSTRAINT UQ_check_hourly_latency UNIQUE (endpoint_id, bucket_start, latency_bin),
+    CONSTRAINT FK_check_hourly_latency_endpoint FOREIGN KEY (endpoint_id) REFERENCES dbo.endpoints(id) ON DELETE CASCADE
+);
+GO
+
 -- 인덱스 생성
 CREATE INDEX IX_users_username ON dbo.users (username);
 CREATE INDEX IX_users_email ON dbo.users (email);
@@ -176,19 +320,34 @@ CREATE INDEX IX_endpoints_poll_interval ON dbo.endpoints (poll_interval_sec);
 
 -- 커버링 인덱스: 최근 체크 결과 조회용
 CREATE INDEX IX_checks_endpoint_checked_at ON dbo.checks (endpoint_id, checked_at DESC) 
-INCLUDE (status_code, latency_ms, headers, error, trace_id);
+INCLUDE (status_code, latency_ms, header_hash, error, trace_id);
 
 CREATE INDEX IX_checks_checked_at ON dbo.checks (checked_at DESC);
+CREATE INDEX IX_checks_checked_at_id ON dbo.checks (checked_at DESC, id DESC);
 CREATE INDEX IX_checks_trace_id ON dbo.checks (trace_id);
 
+-- 가용률 리포트: 기간별 시간 집계 합산
+CREATE INDEX IX_check_hourly_stats_bucket ON dbo.check_hourly_stats (bucket_start)
+INCLUDE (endpoint_id, total_count, error_count, latency_sum, latency_count);
+CREATE INDEX IX_check_hourly_latency_bucket ON dbo.check_hourly_latency (bucket_start)
+INCLUDE (endpoint_id, latency_bin, check_count);
+
+-- 엔드포인트당 열린 장애 구간은 1개
+CREATE UNIQUE INDEX UQ_incidents_open ON dbo.incidents (endpoint_id) WHERE ended_at IS NULL;
+CREATE INDEX IX_incidents_endpoint ON dbo.incidents (endpoint_id, started_at DESC);
+CREATE INDEX IX_incidents_started_at_id ON dbo.incidents (started_at DESC, id DESC);
+
+-- 즉시 점검 대기 요청 조회 (콘솔이 1초마다 조회하므로 대기 중인 행만 담는 필터 인덱스)
+CREATE INDEX IX_check_requests_pending ON dbo.check_requests (requested_at) INCLUDE (endpoint_id, claimed_at) WHERE completed_at IS NULL;
+
 CREATE INDEX IX_rollups_level_ref ON dbo.rollups (level, ref_id);
 CREATE INDEX IX_rollups_status ON dbo.rollups (last_status);
 
 CREATE INDEX IX_config_revisions_changed_at ON dbo.config_revisions (changed_at DESC);
 
-CREATE INDEX IX_notifications_endpoint ON dbo.notifications (endpoint_id);
+CREATE INDEX IX_notifications_endpoint ON dbo.notifications (endpoint_id, sent_at DESC) INCLUDE (level, status);
 CREATE INDEX IX_notifications_sent_at ON dbo.notifications (sent_at DESC);
-CREATE INDEX IX_notifications_dedupe ON dbo.notifications (dedupe_key) WHERE dedupe_key IS NOT NULL;
+CREATE INDEX IX_notifications_dedupe ON dbo.notifications (dedupe_key, sent_at DESC) WHERE dedupe_key IS NOT NULL;
 
 -- 기본 설정 데이터 삽입
 INSERT INTO dbo.settings ([key], [value]) VALUES
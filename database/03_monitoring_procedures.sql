@@ -270,75 +270,72 @@ CREATE PROCEDURE dbo.usp_endpoint_clone_from_group
 AS
 BEGIN
     SET NOCOUNT ON;
+    SET XACT_ABORT ON;
     
     DECLARE @cloned_count INT = 0;
+    DECLARE @domain_count INT = 0;
+    -- 원본 도메인 ID -> 대상 도메인 ID 매핑 (action: 새로 만든 도메인은 INSERT, 기존 도메인 재사용은 UPDATE)
+    DECLARE @domain_map TABLE (
+        source_domain_id BIGINT PRIMARY KEY,
+        target_domain_id BIGINT NOT NULL,
+        action NVARCHAR(10) NOT NULL
+    );
     
     BEGIN TRY
-        BEGIN TRANSACTION;
-        
         -- 망구분 존재 확인
         IF NOT EXISTS (SELECT 1 FROM dbo.network_groups WHERE id = @source_network_group_id)
         BEGIN
             RAISERROR('소스 망구분이 존재하지 않습니다.', 16, 1);
-            RETURN;
         END
         
         IF NOT EXISTS (SELECT 1 FROM dbo.network_groups WHERE id = @target_network_group_id)
         BEGIN
             RAISERROR('대상 망구분이 존재하지 않습니다.', 16, 1);
-            RETURN;
         END
         
-        -- 도메인과 엔드포인트 복사
-        DECLARE @domain_id BIGINT, @new_domain_id BIGINT;
-        DECLARE @domain NVARCHAR(255), @site_name NVARCHAR(255), @owner_name NVARCHAR(100), @note NVARCHAR(MAX);
+        BEGIN TRANSACTION;
         
-        DECLARE domain_cursor CURSOR FOR
-        SELECT id, domain, site_name, owner_name, note
-        FROM dbo.domains 
-        WHERE network_group_id = @source_network_group_id;
+        -- 도메인 일괄 복사 (대상에 같은 도메인이 있으면 재사용, NetworkGroup.clone과 같은 컬럼)
+        -- INSERT ... OUTPUT은 원본 컬럼을 참조할 수 없어 MERGE의 OUTPUT으로 매핑을 얻음
+        MERGE dbo.domains AS t
+        USING (
+            SELECT id, domain, site_name, owner_name, owner_contact, is_active, note
+            FROM dbo.domains
+            WHERE network_group_id = @source_network_group_id
+        ) AS s
+        ON t.network_group_id = @target_network_group_id AND t.domain = s.domain
+        WHEN MATCHED THEN
+            UPDATE SET t.updated_at = t.updated_at
+        WHEN NOT MATCHED BY TARGET THEN
+            INSERT (network_group_id, domain, site_name, owner_name, owner_contact, is_active, note, created_at, updated_at)
+            VALUES (@target_network_group_id, s.domain, s.site_name, s.owner_name, s.owner_contact, s.is_active, s.note, GETDATE(), GETDATE())
+        OUTPUT s.id, inserted.id, $action INTO @domain_map (source_domain_id, target_domain_id, action);
         
-        OPEN domain_cursor;
-        FETCH NEXT FROM domain_cursor INTO @domain_id, @domain, @site_name, @owner_name, @note;
+        -- 재사용한 기존 도메인은 제외하고 새로 만든 도메인만 셈
+        SELECT @domain_count = COUNT(*) FROM @domain_map WHERE action = 'INSERT';
         
-        WHILE @@FETCH_STATUS = 0
-        BEGIN
-            -- 도메인 복사
-            INSERT INTO dbo.domains (network_group_id, domain, site_name, owner_name, note, created_at, updated_at)
-            VALUES (@target_network_group_id, @domain, @site_name, @owner_name, @note, GETDATE(), GETDATE());
-            
-            SET @new_domain_id = SCOPE_IDENTITY();
-            
-            -- 해당 도메인의 엔드포인트들 복사
-            INSERT INTO dbo.endpoints (domain_id, url, requires_db, note, poll_interval_sec, email_on_failure, is_enabled, created_at, updated_at)
-            SELECT @new_domain_id, url, requires_db, note, poll_interval_sec, email_on_failure, is_enabled, GETDATE(), GETDATE()
-            FROM dbo.endpoints 
-            WHERE domain_id = @domain_id;
-            
-            SET @cloned_count = @cloned_count + @@ROWCOUNT;
-            
-            FETCH NEXT FROM domain_cursor INTO @domain_id, @domain, @site_name, @owner_name, @note;
-        END
+        -- 엔드포인트 일괄 복사 (대상 도메인에 같은 URL이 있으면 제외)
+        INSERT INTO dbo.endpoints (domain_id, url, requires_db, note, poll_interval_sec, email_on_failure, is_enabled, created_at, updated_at)
+        SELECT m.target_domain_id, e.url, e.requires_db, e.note, e.poll_interval_sec, e.email_on_failure, e.is_enabled, GETDATE(), GETDATE()
+        FROM dbo.endpoints e
+        INNER JOIN @domain_map m ON e.domain_id = m.source_domain_id
+        WHERE NOT EXISTS (
+            SELECT 1 FROM dbo.endpoints x
+            WHERE x.domain_id = m.target_domain_id AND x.url = e.url
+        );
         
-        CLOSE domain_cursor;
-        DEALLOCATE domain_cursor;
+        SET @cloned_count = @@ROWCOUNT;
         
         COMMIT TRANSACTION;
         
-        SELECT @cloned_count AS cloned_count, 'SUCCESS' AS status, 
-               CONCAT('망구분 복사가 완료되었습니다. (', @cloned_count, '개 엔드포인트)') AS message;
+        SELECT @cloned_count AS cloned_count, @domain_count AS domain_count, 'SUCCESS' AS status, 
+               CONCAT('망구분 복사가 완료되었습니다. (', @domain_count, '개 도메인, ', @cloned_count, '개 엔드포인트)') AS message;
         
     END TRY
     BEGIN CATCH
         IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
         
-        IF CURSOR_STATUS('global', 'domain_cursor') >= -1
-        BEGIN
-            CLOSE domain_cursor;
-            DEALLOCATE domain_cursor;
-        END
-        
-        SELECT 0 AS cloned_count, 'ERROR' AS status, ERROR_MESSAGE() AS message;
+        SELECT 0 AS cloned_count, 0 AS domain_count, 'ERROR' AS status, ERROR_MESSAGE() AS message;
     END CATCH
 END
 GO
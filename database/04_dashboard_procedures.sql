@@ -136,7 +136,7 @@ BEGIN
         c.id,
         c.status_code,
         c.latency_ms,
-        c.headers,
+        COALESCE(hs.headers, c.headers) AS headers,  -- 이전 버전 기록은 checks.headers
         c.error,
         c.checked_at,
         c.trace_id,
@@ -146,6 +146,7 @@ BEGIN
             ELSE 'RED'
         END AS status
     FROM dbo.checks c
+    LEFT JOIN dbo.header_sets hs ON hs.header_hash = c.header_hash
     WHERE c.endpoint_id = @endpoint_id
     ORDER BY c.checked_at DESC;
 END
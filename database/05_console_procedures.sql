@@ -12,14 +12,27 @@ CREATE PROCEDURE dbo.usp_next_poll_batch
     @now DATETIME2,
     @limit INT = 50,
     @max_concurrency INT = 50,
-    @network_group_id BIGINT = NULL
+    @network_group_id BIGINT = NULL,
+    @spread_from DATETIME2 = NULL,
+    @shard_count INT = NULL,
+    @shards NVARCHAR(MAX) = NULL
 AS
 BEGIN
     SET NOCOUNT ON;
     
-    -- 현재 시간 기준으로 폴링이 필요한 엔드포인트들을 조회
-    -- 마지막 체크 시간 + 폴링 간격 <= 현재 시간인 것들
+    -- 엔드포인트마다 호출주기 안의 고정 위상(phase)을 두어 같은 주기의 엔드포인트가 한꺼번에 due 되지 않게 함
+    --   위상 = 호출주기 × (endpoint_id × 2654435761 mod 2^32) / 2^32 (콘솔 scheduler.py와 같은 해시)
+    --   다음 체크 = (마지막 체크 + 호출주기/2) 이후 첫 위상 시각 (간격은 호출주기의 0.5~1.5배)
+    -- 시각은 UTC epoch 초 기준으로 맞춤 (DB 시각은 KST이므로 1970-01-01 09:00 기준)
+    -- @spread_from(폴러 시작 시각)보다 앞선 due와 체크 이력이 없는 엔드포인트는 시작 후 첫 위상 시각으로 분산
+    -- (@spread_from이 NULL이면 즉시 체크)
+    -- 상위 장애로 체크를 생략한 엔드포인트는 생략 시각(rollups.suppressed_at)을 마지막 체크처럼 취급
+    -- @shard_count 지정 시 이 폴러가 임대한 샤드(endpoint_id % @shard_count, 쉼표 구분 @shards)만 반환
     -- 망구분 필터링 지원
+    DECLARE @epoch DATETIME2 = '1970-01-01T09:00:00';
+    DECLARE @now_sec BIGINT = DATEDIFF_BIG(second, @epoch, @now);
+    DECLARE @spread_sec BIGINT = DATEDIFF_BIG(second, @epoch, @spread_from);
+    
     SELECT TOP (@limit)
         e.id AS endpoint_id,
         e.url,
@@ -28,28 +41,371 @@ BEGIN
         d.site_name,
         ng.name AS network_group_name,
         ISNULL(latest_check.checked_at, DATEADD(year, -1, GETDATE())) AS last_checked_at,
-        DATEADD(second, e.poll_interval_sec, ISNULL(latest_check.checked_at, DATEADD(year, -1, GETDATE()))) AS next_check_due
+        DATEADD(second, CAST(due.due_sec - @now_sec AS INT), @now) AS next_check_due,
+        e.parent_endpoint_id
     FROM dbo.endpoints e
     INNER JOIN dbo.domains d ON e.domain_id = d.id
     INNER JOIN dbo.network_groups ng ON d.network_group_id = ng.id
+    LEFT JOIN dbo.rollups r ON r.level = 'endpoint' AND r.ref_id = e.id AND r.suppressed_by IS NOT NULL
     OUTER APPLY (
         SELECT TOP 1 checked_at
         FROM dbo.checks c
         WHERE c.endpoint_id = e.id
         ORDER BY c.checked_at DESC
     ) latest_check
+    CROSS APPLY (
+        SELECT CASE
+            WHEN r.suppressed_at > latest_check.checked_at OR latest_check.checked_at IS NULL THEN r.suppressed_at
+            ELSE latest_check.checked_at
+        END AS seen_at
+    ) seen
+    CROSS APPLY (
+        SELECT
+            (e.id * CAST(2654435761 AS BIGINT)) % 4294967296 * e.poll_interval_sec / 4294967296 AS phase_sec,
+            DATEDIFF_BIG(second, @epoch, seen.seen_at) + e.poll_interval_sec / 2 AS base_sec
+    ) p
+    CROSS APPLY (
+        SELECT p.base_sec + ((p.phase_sec - p.base_sec) % e.poll_interval_sec + e.poll_interval_sec) % e.poll_interval_sec AS slot_sec,
+               @spread_sec + ((p.phase_sec - @spread_sec) % e.poll_interval_sec + e.poll_interval_sec) % e.poll_interval_sec AS spread_slot_sec
+    ) s
+    CROSS APPLY (
+        SELECT CASE
+            WHEN s.slot_sec IS NULL OR s.slot_sec < @spread_sec THEN ISNULL(s.spread_slot_sec, @now_sec - 31536000)
+            ELSE s.slot_sec
+        END AS due_sec
+    ) due
     WHERE e.is_enabled = 1
       AND (@network_group_id IS NULL OR ng.id = @network_group_id)
-      AND DATEADD(second, e.poll_interval_sec, ISNULL(latest_check.checked_at, DATEADD(year, -1, GETDATE()))) <= @now
+      AND (@shard_count IS NULL OR e.id % @shard_count IN (SELECT TRY_CAST(value AS INT) FROM STRING_SPLIT(@shards, ',')))
+      AND due.due_sec <= @now_sec
     ORDER BY 
-        -- 우선순위: 오래된 것부터, 그 다음 ID 순
-        ISNULL(latest_check.checked_at, DATEADD(year, -1, GETDATE())),
+        -- 우선순위: due가 이른 것부터, 그 다음 ID 순
+        due.due_sec,
         ng.id,
         d.id,
         e.id;
 END
 GO
 
+-- 적응형 스케줄러용 전체 폴링 대상 조회 (콘솔용)
+-- 콘솔이 다음 체크 시각을 메모리에서 관리하므로 시각 필터 없이 활성 엔드포인트 전체를 반환
+-- (@shard_count 지정 시 임대한 샤드의 엔드포인트만)
+IF OBJECT_ID('dbo.usp_get_poll_targets', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_get_poll_targets;
+GO
+
+CREATE PROCEDURE dbo.usp_get_poll_targets
+    @network_group_id BIGINT = NULL,
+    @shard_count INT = NULL,
+    @shards NVARCHAR(MAX) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT
+        e.id AS endpoint_id,
+        e.url,
+        e.poll_interval_sec,
+        d.domain,
+        d.site_name,
+        ng.name AS network_group_name,
+        ISNULL(latest_check.checked_at, DATEADD(year, -1, GETDATE())) AS last_checked_at,
+        DATEADD(second, e.poll_interval_sec, ISNULL(latest_check.checked_at, DATEADD(year, -1, GETDATE()))) AS next_check_due,
+        e.parent_endpoint_id
+    FROM dbo.endpoints e
+    INNER JOIN dbo.domains d ON e.domain_id = d.id
+    INNER JOIN dbo.network_groups ng ON d.network_group_id = ng.id
+    OUTER APPLY (
+        SELECT TOP 1 checked_at
+        FROM dbo.checks c
+        WHERE c.endpoint_id = e.id
+        ORDER BY c.checked_at DESC
+    ) latest_check
+    WHERE e.is_enabled = 1
+      AND (@network_group_id IS NULL OR ng.id = @network_group_id)
+      AND (@shard_count IS NULL OR e.id % @shard_count IN (SELECT TRY_CAST(value AS INT) FROM STRING_SPLIT(@shards, ',')))
+    ORDER BY e.id;
+END
+GO
+
+-- 샤드 임대 획득/갱신 (콘솔용, 11_poller_shards.sql)
+-- 엔드포인트를 endpoint_id % @shard_count 샤드로 나누고, 같은 망구분(범위)의 살아 있는 폴러 인스턴스끼리 나눠 가짐
+--   1) 하트비트 기록, 만료된 인스턴스 삭제
+--   2) 몫 = CEILING(샤드 수 / 살아 있는 인스턴스 수)
+--   3) 보유 임대 갱신, 몫을 넘으면 번호가 큰 샤드부터 반납(새 인스턴스가 가져감)
+--   4) 몫보다 적으면 주인이 없거나 만료된 샤드를 가져옴(죽은 인스턴스의 샤드)
+-- 같은 범위의 호출은 애플리케이션 잠금으로 직렬화. 모든 인스턴스는 같은 @shard_count를 써야 함
+IF OBJECT_ID('dbo.usp_claim_shard_leases', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_claim_shard_leases;
+GO
+
+CREATE PROCEDURE dbo.usp_claim_shard_leases
+    @instance_id NVARCHAR(100),
+    @network_group_id BIGINT = NULL,
+    @shard_count INT = 64,
+    @lease_sec INT = 30,
+    @now DATETIME2 = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    
+    IF @now IS NULL SET @now = GETDATE();
+    DECLARE @scope_id BIGINT = ISNULL(@network_group_id, 0);
+    DECLARE @expires_at DATETIME2 = DATEADD(second, @lease_sec, @now);
+    DECLARE @lock_name NVARCHAR(255) = CONCAT(N'svcmon_shard_leases_', @scope_id);
+    DECLARE @instances INT, @fair_share INT, @owned INT;
+    
+    BEGIN TRANSACTION;
+    EXEC sp_getapplock @Resource = @lock_name, @LockMode = 'Exclusive', @LockOwner = 'Transaction', @LockTimeout = 10000;
+    
+    -- 1) 하트비트
+    DELETE FROM dbo.poller_instances WHERE scope_id = @scope_id AND expires_at < @now;
+    
+    UPDATE dbo.poller_instances
+    SET heartbeat_at = @now, expires_at = @expires_at
+    WHERE scope_id = @scope_id AND instance_id = @instance_id;
+    
+    IF @@ROWCOUNT = 0
+        INSERT INTO dbo.poller_instances (scope_id, instance_id, started_at, heartbeat_at, expires_at)
+        VALUES (@scope_id, @instance_id, @now, @now, @expires_at);
+    
+    -- 샤드 행 준비 (샤드 수가 바뀌면 범위 밖 샤드 삭제)
+    DELETE FROM dbo.poller_shard_leases WHERE scope_id = @scope_id AND shard_no >= @shard_count;
+    
+    WITH numbers AS (
+        SELECT TOP (@shard_count) CAST(ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 AS INT) AS shard_no
+        FROM sys.all_objects
+    )
+    INSERT INTO dbo.poller_shard_leases (scope_id, shard_no)
+    SELECT @scope_id, n.shard_no
+    FROM numbers n
+    WHERE NOT EXISTS (
+        SELECT 1 FROM dbo.poller_shard_leases l WHERE l.scope_id = @scope_id AND l.shard_no = n.shard_no
+    );
+    
+    -- 2) 몫
+    SELECT @instances = COUNT(*) FROM dbo.poller_instances WHERE scope_id = @scope_id;
+    SET @fair_share = CEILING(@shard_count * 1.0 / @instances);
+    
+    -- 3) 보유 임대 갱신 및 초과분 반납
+    UPDATE dbo.poller_shard_leases
+    SET expires_at = @expires_at
+    WHERE scope_id = @scope_id AND owner_instance_id = @instance_id;
+    SET @owned = @@ROWCOUNT;
+    
+    IF @owned > @fair_share
+    BEGIN
+        UPDATE l
+        SET owner_instance_id = NULL, expires_at = NULL
+        FROM dbo.poller_shard_leases l
+        WHERE l.scope_id = @scope_id
+          AND l.shard_no IN (
+              SELECT TOP (@owned - @fair_share) shard_no
+              FROM dbo.poller_shard_leases
+              WHERE scope_id = @scope_id AND owner_instance_id = @instance_id
+              ORDER BY shard_no DESC
+          );
+    END
+    -- 4) 빈 샤드/만료된 샤드 가져오기
+    ELSE IF @owned < @fair_share
+    BEGIN
+        UPDATE l
+        SET owner_instance_id = @instance_id, expires_at = @expires_at
+        FROM dbo.poller_shard_leases l
+        WHERE l.scope_id = @scope_id
+          AND l.shard_no IN (
+              SELECT TOP (@fair_share - @owned) shard_no
+              FROM dbo.poller_shard_leases
+              WHERE scope_id = @scope_id AND (owner_instance_id IS NULL OR expires_at < @now)
+              ORDER BY shard_no
+          );
+    END
+    
+    COMMIT TRANSACTION;
+    
+    SELECT shard_no, @instances AS instance_count, @expires_at AS expires_at
+    FROM dbo.poller_shard_leases
+    WHERE scope_id = @scope_id AND owner_instance_id = @instance_id
+    ORDER BY shard_no;
+END
+GO
+
+-- 샤드 임대 반납 (콘솔 종료 시, 남은 인스턴스가 다음 갱신 때 바로 가져가도록)
+IF OBJECT_ID('dbo.usp_release_shard_leases', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_release_shard_leases;
+GO
+
+CREATE PROCEDURE dbo.usp_release_shard_leases
+    @instance_id NVARCHAR(100),
+    @network_group_id BIGINT = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    DECLARE @scope_id BIGINT = ISNULL(@network_group_id, 0);
+    
+    UPDATE dbo.poller_shard_leases
+    SET owner_instance_id = NULL, expires_at = NULL
+    WHERE scope_id = @scope_id AND owner_instance_id = @instance_id;
+    
+    DELETE FROM dbo.poller_instances WHERE scope_id = @scope_id AND instance_id = @instance_id;
+END
+GO
+
+-- 즉시 점검 요청 가져오기 (콘솔용, 13_check_requests.sql)
+-- 웹앱이 넣은 대기 요청을 요청 순으로 @limit건 가져감. 다른 인스턴스가 잡고 있는 행은 건너뜀(READPAST)
+-- 가져간 뒤 @stale_sec 안에 완료되지 않은 요청(인스턴스 종료 등)은 다시 가져갈 수 있음
+-- 같은 엔드포인트의 요청이 여러 건이면 한 행으로 반환 (usp_complete_check_requests가 함께 완료 처리)
+IF OBJECT_ID('dbo.usp_claim_check_requests', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_claim_check_requests;
+GO
+
+CREATE PROCEDURE dbo.usp_claim_check_requests
+    @network_group_id BIGINT = NULL,
+    @instance_id NVARCHAR(100),
+    @limit INT = 20,
+    @stale_sec INT = 60,
+    @shard_count INT = NULL,
+    @shards NVARCHAR(MAX) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    DECLARE @now DATETIME2 = GETDATE();
+    DECLARE @stale_before DATETIME2 = DATEADD(second, -@stale_sec, @now);
+    DECLARE @claimed TABLE (request_id BIGINT, endpoint_id BIGINT);
+    
+    WITH pending AS (
+        SELECT TOP (@limit) r.id, r.endpoint_id, r.claimed_by, r.claimed_at
+        FROM dbo.check_requests r WITH (READPAST, UPDLOCK, ROWLOCK)
+        INNER JOIN dbo.endpoints e ON r.endpoint_id = e.id
+        INNER JOIN dbo.domains d ON e.domain_id = d.id
+        WHERE r.completed_at IS NULL
+          AND (r.claimed_at IS NULL OR r.claimed_at < @stale_before)
+          AND (@network_group_id IS NULL OR d.network_group_id = @network_group_id)
+          AND (@shard_count IS NULL OR e.id % @shard_count IN (SELECT TRY_CAST(value AS INT) FROM STRING_SPLIT(@shards, ',')))
+        ORDER BY r.requested_at
+    )
+    UPDATE pending
+    SET claimed_by = @instance_id, claimed_at = @now
+    OUTPUT inserted.id, inserted.endpoint_id INTO @claimed;
+    
+    IF NOT EXISTS (SELECT 1 FROM @claimed) RETURN;
+    
+    -- usp_get_poll_targets와 같은 열 + 요청 ID
+    SELECT
+        MIN(c.request_id) AS request_id,
+        e.id AS endpoint_id,
+        e.url,
+        e.poll_interval_sec,
+        d.domain,
+        d.site_name,
+        ng.name AS network_group_name,
+        e.parent_endpoint_id
+    FROM @claimed c
+    INNER JOIN dbo.endpoints e ON c.endpoint_id = e.id
+    INNER JOIN dbo.domains d ON e.domain_id = d.id
+    INNER JOIN dbo.network_groups ng ON d.network_group_id = ng.id
+    GROUP BY e.id, e.url, e.poll_interval_sec, d.domain, d.site_name, ng.name, e.parent_endpoint_id
+    ORDER BY MIN(c.request_id);
+END
+GO
+
+-- 즉시 점검 요청 완료 (콘솔용, 가져간 요청에 기록한 체크 ID 연결)
+IF OBJECT_ID('dbo.usp_complete_check_requests', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_complete_check_requests;
+GO
+
+CREATE PROCEDURE dbo.usp_complete_check_requests
+    @endpoint_id BIGINT,
+    @check_id BIGINT = NULL,
+    @instance_id NVARCHAR(100)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    UPDATE dbo.check_requests
+    SET completed_at = GETDATE(), check_id = @check_id
+    WHERE endpoint_id = @endpoint_id
+      AND completed_at IS NULL
+      AND claimed_by = @instance_id;
+END
+GO
+
+-- 상위 장애로 체크를 생략한 엔드포인트 표시 (콘솔용, 10_endpoint_dependencies.sql)
+-- checks 행은 남기지 않고 롤업만 갱신: 정상이던 엔드포인트는 신호없음으로 바꾸고 사유에 상위 장애 표시
+-- suppressed_at은 usp_next_poll_batch에서 마지막 체크처럼 취급되어 다음 생략/카나리 시각이 호출주기만큼 밀림
+IF OBJECT_ID('dbo.usp_mark_suppressed', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_mark_suppressed;
+GO
+
+CREATE PROCEDURE dbo.usp_mark_suppressed
+    @endpoint_ids NVARCHAR(MAX),  -- 쉼표로 구분한 엔드포인트 ID
+    @reason NVARCHAR(200),
+    @suppressed_at DATETIME2 = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    IF @suppressed_at IS NULL SET @suppressed_at = GETDATE();
+    DECLARE @ids TABLE (id BIGINT PRIMARY KEY);
+    
+    INSERT INTO @ids (id)
+    SELECT DISTINCT TRY_CAST(value AS BIGINT)
+    FROM STRING_SPLIT(@endpoint_ids, ',')
+    WHERE TRY_CAST(value AS BIGINT) IS NOT NULL;
+    
+    BEGIN TRY
+        BEGIN TRANSACTION;
+        
+        UPDATE r
+        SET last_status = CASE WHEN r.last_status = 'GREEN' THEN 'AMBER' ELSE r.last_status END,
+            last_change_at = CASE WHEN r.last_status = 'GREEN' THEN @suppressed_at ELSE r.last_change_at END,
+            last_reason = LEFT(CONCAT(N'체크 생략 - ', @reason), 400),
+            suppressed_by = @reason,
+            suppressed_at = @suppressed_at,
+            updated_at = GETDATE()
+        FROM dbo.rollups r
+        INNER JOIN @ids i ON r.level = 'endpoint' AND r.ref_id = i.id;
+        
+        INSERT INTO dbo.rollups (level, ref_id, last_status, last_change_at, last_reason, suppressed_by, suppressed_at, updated_at)
+        SELECT 'endpoint', i.id, 'AMBER', @suppressed_at, LEFT(CONCAT(N'체크 생략 - ', @reason), 400), @reason, @suppressed_at, GETDATE()
+        FROM @ids i
+        WHERE NOT EXISTS (SELECT 1 FROM dbo.rollups r WHERE r.level = 'endpoint' AND r.ref_id = i.id);
+        
+        COMMIT TRANSACTION;
+    END TRY
+    BEGIN CATCH
+        IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
+        THROW;
+    END CATCH
+    
+    -- 영향받은 도메인/망구분 롤업 갱신 (엔드포인트마다가 아니라 한 번씩)
+    DECLARE @ref_id BIGINT;
+    DECLARE domain_cursor CURSOR LOCAL FAST_FORWARD FOR
+        SELECT DISTINCT e.domain_id FROM dbo.endpoints e INNER JOIN @ids i ON e.id = i.id;
+    OPEN domain_cursor;
+    FETCH NEXT FROM domain_cursor INTO @ref_id;
+    WHILE @@FETCH_STATUS = 0
+    BEGIN
+        EXEC dbo.usp_rollup_update 'domain', @ref_id;
+        FETCH NEXT FROM domain_cursor INTO @ref_id;
+    END
+    CLOSE domain_cursor;
+    DEALLOCATE domain_cursor;
+    
+    DECLARE network_cursor CURSOR LOCAL FAST_FORWARD FOR
+        SELECT DISTINCT d.network_group_id
+        FROM dbo.endpoints e
+        INNER JOIN @ids i ON e.id = i.id
+        INNER JOIN dbo.domains d ON e.domain_id = d.id;
+    OPEN network_cursor;
+    FETCH NEXT FROM network_cursor INTO @ref_id;
+    WHILE @@FETCH_STATUS = 0
+    BEGIN
+        EXEC dbo.usp_rollup_update 'network', @ref_id;
+        FETCH NEXT FROM network_cursor INTO @ref_id;
+    END
+    CLOSE network_cursor;
+    DEALLOCATE network_cursor;
+END
+GO
+
 -- 체크 결과 기록
 IF OBJECT_ID('dbo.usp_record_check', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_record_check;
 GO
@@ -67,15 +423,27 @@ BEGIN
     
     DECLARE @check_id BIGINT;
     DECLARE @current_status NVARCHAR(6);
+    DECLARE @header_hash BINARY(32);
     
     IF @checked_at IS NULL SET @checked_at = GETDATE();
     
+    -- 응답 헤더는 header_sets에 내용 해시로 한 번만 저장하고 checks에는 해시만 기록
+    SET @headers = LEFT(NULLIF(@headers, ''), 4000);
+    SET @header_hash = HASHBYTES('SHA2_256', @headers);
+    
     BEGIN TRY
         BEGIN TRANSACTION;
         
+        IF @header_hash IS NOT NULL
+            INSERT INTO dbo.header_sets (header_hash, headers)
+            SELECT @header_hash, @headers
+            WHERE NOT EXISTS (
+                SELECT 1 FROM dbo.header_sets WITH (UPDLOCK, HOLDLOCK) WHERE header_hash = @header_hash
+            );
+        
         -- 체크 결과 기록
-        INSERT INTO dbo.checks (endpoint_id, status_code, latency_ms, headers, error, checked_at)
-        VALUES (@endpoint_id, @status_code, @latency_ms, @headers, @error, @checked_at);
+        INSERT INTO dbo.checks (endpoint_id, status_code, latency_ms, header_hash, error, checked_at)
+        VALUES (@endpoint_id, @status_code, @latency_ms, @header_hash, @error, @checked_at);
         
         SET @check_id = SCOPE_IDENTITY();
         
@@ -100,18 +468,476 @@ BEGIN
         EXEC dbo.usp_rollup_update 'domain', @domain_id;
         EXEC dbo.usp_rollup_update 'network', @network_group_id;
         
+        -- 장애 구간 열기/닫기 (09_incidents.sql)
+        -- 상태가 바뀌면(정상 복구 또는 장애 ↔ 신호없음 전환) 열린 구간을 이 체크 시각으로 닫음
+        DECLARE @incident_id BIGINT, @incident_status NVARCHAR(6);
+        DECLARE @incident_error NVARCHAR(4000) = COALESCE(
+            @error,
+            CASE WHEN @current_status = 'RED' THEN CONCAT('HTTP ', @status_code) ELSE N'응답 없음' END
+        );
+        
+        SELECT @incident_id = id, @incident_status = status
+        FROM dbo.incidents WITH (UPDLOCK, SERIALIZABLE)
+        WHERE endpoint_id = @endpoint_id AND ended_at IS NULL;
+        
+        IF @incident_id IS NOT NULL AND @incident_status = @current_status
+        BEGIN
+            UPDATE dbo.incidents
+            SET check_count = check_count + 1,
+                last_error = @incident_error,
+                last_checked_at = @checked_at
+            WHERE id = @incident_id;
+        END
+        ELSE
+        BEGIN
+            IF @incident_id IS NOT NULL
+                UPDATE dbo.incidents
+                SET ended_at = @checked_at,
+                    duration_sec = DATEDIFF(SECOND, started_at, @checked_at)
+                WHERE id = @incident_id;
+            
+            IF @current_status <> 'GREEN'
+                INSERT INTO dbo.incidents 
+                    (endpoint_id, status, started_at, first_error, last_error, check_count, last_checked_at)
+                VALUES 
+                    (@endpoint_id, @current_status, @checked_at, @incident_error, @incident_error, 1, @checked_at);
+        END
+        
+        -- 일별/망구분별 집계 카운터 갱신 (체크 기록 화면 통계용, 07_check_history_keyset.sql)
+        DECLARE @stat_date DATE = CAST(@checked_at AS DATE);
+        DECLARE @is_success BIT = CASE 
+            WHEN TRY_CAST(@status_code AS INT) BETWEEN 200 AND 299 AND @error IS NULL THEN 1 
+            ELSE 0 
+        END;
+        DECLARE @success_latency INT = CASE WHEN @is_success = 1 THEN @latency_ms END;
+        
+        UPDATE dbo.check_daily_stats WITH (UPDLOCK, SERIALIZABLE)
+        SET total_count = total_count + 1,
+            success_count = success_count + @is_success,
+            error_count = error_count + (1 - @is_success),
+            latency_sum = latency_sum + ISNULL(@success_latency, 0),
+            latency_count = latency_count + CASE WHEN @success_latency IS NULL THEN 0 ELSE 1 END
+        WHERE stat_date = @stat_date AND network_group_id = @network_group_id;
+        
+        IF @@ROWCOUNT = 0
+            INSERT INTO dbo.check_daily_stats 
+                (stat_date, network_group_id, total_count, success_count, error_count, latency_sum, latency_count)
+            VALUES 
+                (@stat_date, @network_group_id, 1, @is_success, 1 - @is_success, 
+                 ISNULL(@success_latency, 0), CASE WHEN @success_latency IS NULL THEN 0 ELSE 1 END);
+        
+        -- 시간별/엔드포인트별 집계 갱신 (장기간 응답시간 차트용, 08_check_hourly_stats.sql)
+        DECLARE @bucket_start DATETIME2 = DATEADD(HOUR, DATEDIFF(HOUR, 0, @checked_at), 0);
+        
+        UPDATE dbo.check_hourly_stats WITH (UPDLOCK, SERIALIZABLE)
+        SET total_count = total_count + 1,
+            error_count = error_count + (1 - @is_success),
+            latency_min = CASE WHEN @latency_ms IS NULL OR latency_min <= @latency_ms THEN latency_min ELSE @latency_ms END,
+            latency_max = CASE WHEN @latency_ms IS NULL OR latency_max >= @latency_ms THEN latency_max ELSE @latency_ms END,
+            latency_sum = latency_sum + ISNULL(@latency_ms, 0),
+            latency_count = latency_count + CASE WHEN @latency_ms IS NULL THEN 0 ELSE 1 END
+        WHERE endpoint_id = @endpoint_id AND bucket_start = @bucket_start;
+        
+        IF @@ROWCOUNT = 0
+            INSERT INTO dbo.check_hourly_stats 
+                (endpoint_id, bucket_start, total_count, error_count, latency_min, latency_max, latency_sum, latency_count)
+            VALUES 
+                (@endpoint_id, @bucket_start, 1, 1 - @is_success, @latency_ms, @latency_ms,
+                 ISNULL(@latency_ms, 0), CASE WHEN @latency_ms IS NULL THEN 0 ELSE 1 END);
+        
+        -- 시간별 응답시간 히스토그램 갱신 (가용률 리포트 백분위용, 17_check_hourly_latency.sql)
+        IF @latency_ms IS NOT NULL
+        BEGIN
+            DECLARE @latency_bin TINYINT = CASE
+                WHEN @latency_ms < 1 THEN 0
+                WHEN @latency_ms >= 120000 THEN 95
+                ELSE CAST(FLOOR(LOG(@latency_ms) / (LOG(120000.0) / 95)) AS INT) + 1
+            END;
+            
+            UPDATE dbo.check_hourly_latency WITH (UPDLOCK, SERIALIZABLE)
+            SET check_count = check_count + 1
+            WHERE endpoint_id = @endpoint_id AND bucket_start = @bucket_start AND latency_bin = @latency_bin;
+            
+            IF @@ROWCOUNT = 0
+                INSERT INTO dbo.check_hourly_latency (endpoint_id, bucket_start, latency_bin, check_count)
+                VALUES (@endpoint_id, @bucket_start, @latency_bin, 1);
+        END
+        
         COMMIT TRANSACTION;
         
-        SELECT @check_id AS check_id, @current_status AS status, 'SUCCESS' AS result;
+        -- 이전 상태 (열린 장애 구간이 없으면 정상), 콘솔 알림이 상태 전환 판단에 사용
+        SELECT @check_id AS check_id, @current_status AS status, 'SUCCESS' AS result,
+               ISNULL(@incident_status, 'GREEN') AS previous_status;
         
     END TRY
     BEGIN CATCH
         IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
-        SELECT 0 AS check_id, 'ERROR' AS status, ERROR_MESSAGE() AS result;
+        SELECT 0 AS check_id, 'ERROR' AS status, ERROR_MESSAGE() AS result, NULL AS previous_status;
     END CATCH
 END
 GO
 
+-- 체크 결과 일괄 기록 (원격 에이전트 수집 API, webapp monitoring/ingest.py)
+-- usp_record_check를 결과마다 호출한 것과 같은 결과를 배치 단위로 처리:
+-- checks INSERT 1회, 장애 구간/일별·시간별 집계는 묶어서 한 번씩, 롤업은 영향받은 엔드포인트/도메인/망구분마다 한 번씩 갱신
+-- @results: [{"endpoint_id": 1, "status_code": 200, "latency_ms": 35, "headers": "...", "error": null, "checked_at": "2026-10-19T10:00:00",
+--             "trace_id": "..."}, ...]
+-- @network_group_id를 주면 그 망구분 엔드포인트의 결과만 기록 (에이전트 담당 밖의 결과는 건너뜀)
+-- trace_id가 이미 checks에 있는 결과는 건너뜀 (에이전트가 응답을 받지 못해 같은 배치를 다시 보내도 한 번만 반영)
+IF OBJECT_ID('dbo.usp_record_checks_bulk', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_record_checks_bulk;
+GO
+
+CREATE PROCEDURE dbo.usp_record_checks_bulk
+    @results NVARCHAR(MAX),
+    @network_group_id BIGINT = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    DECLARE @received INT = (SELECT COUNT(*) FROM OPENJSON(@results));
+    DECLARE @recorded INT;
+    DECLARE @duplicates INT = 0;
+    
+    CREATE TABLE #rows (
+        row_no INT IDENTITY(1,1) PRIMARY KEY,
+        endpoint_id BIGINT NOT NULL,
+        domain_id BIGINT NOT NULL,
+        network_group_id BIGINT NOT NULL,
+        status_code INT NULL,
+        latency_ms INT NULL,
+        headers NVARCHAR(4000) NULL,
+        header_hash BINARY(32) NULL,
+        error NVARCHAR(4000) NULL,
+        checked_at DATETIME2 NOT NULL,
+        trace_id UNIQUEIDENTIFIER NOT NULL,
+        status NVARCHAR(6) NOT NULL,
+        is_success BIT NOT NULL,
+        incident_error NVARCHAR(4000) NULL,
+        run_no INT NULL
+    );
+    CREATE TABLE #open_incidents (endpoint_id BIGINT PRIMARY KEY, id BIGINT NOT NULL, status NVARCHAR(6) NOT NULL);
+    CREATE TABLE #runs (
+        endpoint_id BIGINT NOT NULL,
+        run_no INT NOT NULL,
+        status NVARCHAR(6) NOT NULL,
+        started_at DATETIME2 NOT NULL,
+        ended_at DATETIME2 NULL,
+        last_checked_at DATETIME2 NOT NULL,
+        check_count INT NOT NULL,
+        first_error NVARCHAR(4000) NULL,
+        last_error NVARCHAR(4000) NULL,
+        PRIMARY KEY (endpoint_id, run_no)
+    );
+    
+    -- 엔드포인트별 체크 시각 순으로 적재 (row_no가 처리 순서)
+    INSERT INTO #rows 
+        (endpoint_id, domain_id, network_group_id, status_code, latency_ms, headers, header_hash, error, checked_at, trace_id,
+         status, is_success, incident_error)
+    SELECT 
+        j.endpoint_id, d.id, d.network_group_id, j.status_code, j.latency_ms, h.headers, HASHBYTES('SHA2_256', h.headers), j.error,
+        ISNULL(j.checked_at, GETDATE()),
+        ISNULL(j.trace_id, NEWID()),
+        s.status,
+        CASE WHEN j.status_code BETWEEN 200 AND 299 AND j.error IS NULL THEN 1 ELSE 0 END,
+        COALESCE(j.error, CASE WHEN s.status = 'RED' THEN CONCAT('HTTP ', j.status_code) ELSE N'응답 없음' END)
+    FROM OPENJSON(@results) WITH (
+        endpoint_id BIGINT,
+        status_code INT,
+        latency_ms INT,
+        headers NVARCHAR(MAX),
+        error NVARCHAR(4000),
+        checked_at DATETIME2,
+        trace_id UNIQUEIDENTIFIER
+    ) j
+    INNER JOIN dbo.endpoints e ON e.id = j.endpoint_id
+    INNER JOIN dbo.domains d ON e.domain_id = d.id
+    CROSS APPLY (
+        SELECT CASE WHEN j.status_code = 200 THEN 'GREEN' WHEN j.status_code IS NULL THEN 'AMBER' ELSE 'RED' END AS status
+    ) s
+    CROSS APPLY (SELECT LEFT(NULLIF(j.headers, ''), 4000) AS headers) h
+    WHERE @network_group_id IS NULL OR d.network_group_id = @network_group_id
+    ORDER BY j.endpoint_id, ISNULL(j.checked_at, GETDATE());
+    
+    SET @recorded = @@ROWCOUNT;
+    
+    IF @recorded > 0
+    BEGIN
+        BEGIN TRY
+            BEGIN TRANSACTION;
+            
+            -- 이미 기록된 결과(재전송) 제외, 같은 배치를 동시에 다시 보내도 한쪽만 기록되도록 잠금
+            DELETE r
+            FROM #rows r
+            WHERE EXISTS (
+                SELECT 1 FROM dbo.checks c WITH (UPDLOCK, HOLDLOCK) WHERE c.trace_id = r.trace_id
+            );
+            SET @duplicates = @@ROWCOUNT;
+            SET @recorded = @recorded - @duplicates;
+            
+            -- 처음 보는 응답 헤더 조합만 header_sets에 추가
+            INSERT INTO dbo.header_sets (header_hash, headers)
+            SELECT DISTINCT r.header_hash, r.headers
+            FROM #rows r
+            WHERE r.header_hash IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM dbo.header_sets hs WITH (UPDLOCK, HOLDLOCK) WHERE hs.header_hash = r.header_hash
+              );
+            
+            -- 체크 결과 기록 (한 번에, 헤더는 해시만)
+            INSERT INTO dbo.checks (endpoint_id, status_code, latency_ms, header_hash, error, checked_at, trace_id)
+            SELECT endpoint_id, status_code, latency_ms, header_hash, error, checked_at, trace_id
+            FROM #rows
+            ORDER BY row_no;
+            
+            -- 장애 구간: 엔드포인트별로 같은 상태가 이어지는 결과를 구간(run) 하나로 묶음
+            -- run 0은 열린 구간(없으면 정상)과 같은 상태로 이어지는 결과, 상태가 바뀔 때마다 run 번호 증가
+            INSERT INTO #open_incidents (endpoint_id, id, status)
+            SELECT i.endpoint_id, i.id, i.status
+            FROM dbo.incidents i WITH (UPDLOCK, SERIALIZABLE)
+            WHERE i.ended_at IS NULL
+              AND i.endpoint_id IN (SELECT DISTINCT endpoint_id FROM #rows);
+            
+            WITH marked AS (
+                SELECT 
+                    r.row_no,
+                    r.endpoint_id,
+                    CASE WHEN r.status = COALESCE(
+                        LAG(r.status) OVER (PARTITION BY r.endpoint_id ORDER BY r.row_no), o.status, 'GREEN'
+                    ) THEN 0 ELSE 1 END AS is_change
+                FROM #rows r
+                LEFT JOIN #open_incidents o ON o.endpoint_id = r.endpoint_id
+            ),
+            numbered AS (
+                SELECT row_no, SUM(is_change) OVER (PARTITION BY endpoint_id ORDER BY row_no ROWS UNBOUNDED PRECEDING) AS run_no
+                FROM marked
+            )
+            UPDATE r
+            SET run_no = n.run_no
+            FROM #rows r
+            INNER JOIN numbered n ON n.row_no = r.row_no;
+            
+            INSERT INTO #runs (endpoint_id, run_no, status, started_at, last_checked_at, check_count, first_error, last_error)
+            SELECT DISTINCT
+                endpoint_id,
+                run_no,
+                status,
+                MIN(checked_at) OVER (PARTITION BY endpoint_id, run_no),
+                MAX(checked_at) OVER (PARTITION BY endpoint_id, run_no),
+                COUNT(*) OVER (PARTITION BY endpoint_id, run_no),
+                FIRST_VALUE(incident_error) OVER (
+                    PARTITION BY endpoint_id, run_no ORDER BY row_no ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                ),
+                LAST_VALUE(incident_error) OVER (
+                    PARTITION BY endpoint_id, run_no ORDER BY row_no ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                )
+            FROM #rows;
+            
+            -- 구간은 다음 구간이 시작된 체크 시각에 닫힘 (마지막 구간은 열린 채로 둠)
+            WITH ordered AS (
+                SELECT ended_at, LEAD(started_at) OVER (PARTITION BY endpoint_id ORDER BY run_no) AS next_started_at
+                FROM #runs
+            )
+            UPDATE ordered SET ended_at = next_started_at;
+            
+            -- 열린 구간과 같은 상태로 이어진 결과는 누적 (다음 구간이 있으면 그 시작 시각에 닫음)
+            UPDATE i
+            SET check_count = i.check_count + r.check_count,
+                last_error = r.last_error,
+                last_checked_at = r.last_checked_at,
+                ended_at = r.ended_at,
+                duration_sec = CASE WHEN r.ended_at IS NOT NULL THEN DATEDIFF(SECOND, i.started_at, r.ended_at) END
+            FROM dbo.incidents i
+            INNER JOIN #open_incidents o ON o.id = i.id
+            INNER JOIN #runs r ON r.endpoint_id = o.endpoint_id AND r.run_no = 0;
+            
+            -- 첫 결과부터 상태가 바뀐 경우 열린 구간을 그 체크 시각으로 닫음
+            UPDATE i
+            SET ended_at = r.started_at,
+                duration_sec = DATEDIFF(SECOND, i.started_at, r.started_at)
+            FROM dbo.incidents i
+            INNER JOIN #open_incidents o ON o.id = i.id
+            INNER JOIN #runs r ON r.endpoint_id = o.endpoint_id AND r.run_no = 1
+            WHERE NOT EXISTS (SELECT 1 FROM #runs r0 WHERE r0.endpoint_id = o.endpoint_id AND r0.run_no = 0);
+            
+            INSERT INTO dbo.incidents 
+                (endpoint_id, status, started_at, ended_at, duration_sec, first_error, last_error, check_count, last_checked_at)
+            SELECT 
+                endpoint_id, status, started_at, ended_at,
+                CASE WHEN ended_at IS NOT NULL THEN DATEDIFF(SECOND, started_at, ended_at) END,
+                first_error, last_error, check_count, last_checked_at
+            FROM #runs
+            WHERE run_no > 0 AND status <> 'GREEN'
+            ORDER BY endpoint_id, run_no;
+            
+            -- 일별/망구분별 집계 카운터 (usp_record_check와 같은 기준)
+            SELECT 
+                CAST(checked_at AS DATE) AS stat_date,
+                network_group_id,
+                COUNT(*) AS total_count,
+                SUM(CAST(is_success AS INT)) AS success_count,
+                SUM(CASE WHEN is_success = 1 THEN CAST(ISNULL(latency_ms, 0) AS BIGINT) ELSE 0 END) AS latency_sum,
+                SUM(CASE WHEN is_success = 1 AND latency_ms IS NOT NULL THEN 1 ELSE 0 END) AS latency_count
+            INTO #daily
+            FROM #rows
+            GROUP BY CAST(checked_at AS DATE), network_group_id;
+            
+            UPDATE s
+            SET total_count = s.total_count + d.total_count,
+                success_count = s.success_count + d.success_count,
+                error_count = s.error_count + (d.total_count - d.success_count),
+                latency_sum = s.latency_sum + d.latency_sum,
+                latency_count = s.latency_count + d.latency_count
+            FROM dbo.check_daily_stats s WITH (UPDLOCK, SERIALIZABLE)
+            INNER JOIN #daily d ON s.stat_date = d.stat_date AND s.network_group_id = d.network_group_id;
+            
+            INSERT INTO dbo.check_daily_stats 
+                (stat_date, network_group_id, total_count, success_count, error_count, latency_sum, latency_count)
+            SELECT d.stat_date, d.network_group_id, d.total_count, d.success_count, 
+                   d.total_count - d.success_count, d.latency_sum, d.latency_count
+            FROM #daily d
+            WHERE NOT EXISTS (
+                SELECT 1 FROM dbo.check_daily_stats s WITH (UPDLOCK, SERIALIZABLE)
+                WHERE s.stat_date = d.stat_date AND s.network_group_id = d.network_group_id
+            );
+            
+            -- 시간별/엔드포인트별 집계 (usp_record_check와 같은 기준)
+            SELECT 
+                endpoint_id,
+                DATEADD(HOUR, DATEDIFF(HOUR, 0, checked_at), 0) AS bucket_start,
+                COUNT(*) AS total_count,
+                SUM(1 - CAST(is_success AS INT)) AS error_count,
+                MIN(latency_ms) AS latency_min,
+                MAX(latency_ms) AS latency_max,
+                SUM(CAST(ISNULL(latency_ms, 0) AS BIGINT)) AS latency_sum,
+                COUNT(latency_ms) AS latency_count
+            INTO #hourly
+            FROM #rows
+            GROUP BY endpoint_id, DATEADD(HOUR, DATEDIFF(HOUR, 0, checked_at), 0);
+            
+            UPDATE s
+            SET total_count = s.total_count + h.total_count,
+                error_count = s.error_count + h.error_count,
+                latency_min = CASE WHEN h.latency_min IS NULL OR s.latency_min <= h.latency_min THEN s.latency_min ELSE h.latency_min END,
+                latency_max = CASE WHEN h.latency_max IS NULL OR s.latency_max >= h.latency_max THEN s.latency_max ELSE h.latency_max END,
+                latency_sum = s.latency_sum + h.latency_sum,
+                latency_count = s.latency_count + h.latency_count
+            FROM dbo.check_hourly_stats s WITH (UPDLOCK, SERIALIZABLE)
+            INNER JOIN #hourly h ON s.endpoint_id = h.endpoint_id AND s.bucket_start = h.bucket_start;
+            
+            INSERT INTO dbo.check_hourly_stats 
+                (endpoint_id, bucket_start, total_count, error_count, latency_min, latency_max, latency_sum, latency_count)
+            SELECT h.endpoint_id, h.bucket_start, h.total_count, h.error_count, h.latency_min, h.latency_max,
+                   h.latency_sum, h.latency_count
+            FROM #hourly h
+            WHERE NOT EXISTS (
+                SELECT 1 FROM dbo.check_hourly_stats s WITH (UPDLOCK, SERIALIZABLE)
+                WHERE s.endpoint_id = h.endpoint_id AND s.bucket_start = h.bucket_start
+            );
+            
+            -- 시간별 응답시간 히스토그램 (usp_record_check와 같은 구간)
+            SELECT endpoint_id, bucket_start, latency_bin, COUNT(*) AS check_count
+            INTO #latency
+            FROM (
+                SELECT 
+                    endpoint_id,
+                    DATEADD(HOUR, DATEDIFF(HOUR, 0, checked_at), 0) AS bucket_start,
+                    CASE
+                        WHEN latency_ms < 1 THEN 0
+                        WHEN latency_ms >= 120000 THEN 95
+                        ELSE CAST(FLOOR(LOG(latency_ms) / (LOG(120000.0) / 95)) AS INT) + 1
+                    END AS latency_bin
+                FROM #rows
+                WHERE latency_ms IS NOT NULL
+            ) b
+            GROUP BY endpoint_id, bucket_start, latency_bin;
+            
+            UPDATE s
+            SET check_count = s.check_count + l.check_count
+            FROM dbo.check_hourly_latency s WITH (UPDLOCK, SERIALIZABLE)
+            INNER JOIN #latency l 
+                ON s.endpoint_id = l.endpoint_id AND s.bucket_start = l.bucket_start AND s.latency_bin = l.latency_bin;
+            
+            INSERT INTO dbo.check_hourly_latency (endpoint_id, bucket_start, latency_bin, check_count)
+            SELECT l.endpoint_id, l.bucket_start, l.latency_bin, l.check_count
+            FROM #latency l
+            WHERE NOT EXISTS (
+                SELECT 1 FROM dbo.check_hourly_latency s WITH (UPDLOCK, SERIALIZABLE)
+                WHERE s.endpoint_id = l.endpoint_id AND s.bucket_start = l.bucket_start AND s.latency_bin = l.latency_bin
+            );
+            
+            COMMIT TRANSACTION;
+        END TRY
+        BEGIN CATCH
+            IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
+            THROW;
+        END CATCH
+        
+        -- 엔드포인트 롤업: 영향받은 엔드포인트마다 최신 체크 기준으로 한 번씩 (usp_rollup_update 'endpoint'와 같은 기준)
+        DECLARE @latest TABLE (endpoint_id BIGINT PRIMARY KEY, status NVARCHAR(6), reason NVARCHAR(400));
+        
+        INSERT INTO @latest (endpoint_id, status, reason)
+        SELECT 
+            e.endpoint_id,
+            CASE WHEN c.status_code = 200 THEN 'GREEN' WHEN c.status_code IS NULL THEN 'AMBER' ELSE 'RED' END,
+            CASE 
+                WHEN c.status_code = 200 THEN '정상 응답'
+                WHEN c.status_code IS NULL THEN '응답 없음'
+                ELSE CONCAT('HTTP ', c.status_code, CASE WHEN c.error IS NOT NULL THEN ': ' + LEFT(c.error, 100) ELSE '' END)
+            END
+        FROM (SELECT DISTINCT endpoint_id FROM #rows) e
+        CROSS APPLY (
+            SELECT TOP 1 status_code, error
+            FROM dbo.checks
+            WHERE endpoint_id = e.endpoint_id
+            ORDER BY checked_at DESC
+        ) c;
+        
+        UPDATE r
+        SET last_status = l.status,
+            last_change_at = CASE WHEN r.last_status != l.status THEN GETDATE() ELSE r.last_change_at END,
+            last_reason = l.reason,
+            suppressed_by = NULL,
+            suppressed_at = NULL,
+            updated_at = GETDATE()
+        FROM dbo.rollups r
+        INNER JOIN @latest l ON r.level = 'endpoint' AND r.ref_id = l.endpoint_id;
+        
+        INSERT INTO dbo.rollups (level, ref_id, last_status, last_change_at, last_reason, updated_at)
+        SELECT 'endpoint', l.endpoint_id, l.status, GETDATE(), l.reason, GETDATE()
+        FROM @latest l
+        WHERE NOT EXISTS (SELECT 1 FROM dbo.rollups r WHERE r.level = 'endpoint' AND r.ref_id = l.endpoint_id);
+        
+        -- 영향받은 도메인/망구분 롤업 갱신 (결과마다가 아니라 한 번씩)
+        DECLARE @ref_id BIGINT;
+        DECLARE domain_cursor CURSOR LOCAL FAST_FORWARD FOR
+            SELECT DISTINCT domain_id FROM #rows;
+        OPEN domain_cursor;
+        FETCH NEXT FROM domain_cursor INTO @ref_id;
+        WHILE @@FETCH_STATUS = 0
+        BEGIN
+            EXEC dbo.usp_rollup_update 'domain', @ref_id;
+            FETCH NEXT FROM domain_cursor INTO @ref_id;
+        END
+        CLOSE domain_cursor;
+        DEALLOCATE domain_cursor;
+        
+        DECLARE network_cursor CURSOR LOCAL FAST_FORWARD FOR
+            SELECT DISTINCT network_group_id FROM #rows;
+        OPEN network_cursor;
+        FETCH NEXT FROM network_cursor INTO @ref_id;
+        WHILE @@FETCH_STATUS = 0
+        BEGIN
+            EXEC dbo.usp_rollup_update 'network', @ref_id;
+            FETCH NEXT FROM network_cursor INTO @ref_id;
+        END
+        CLOSE network_cursor;
+        DEALLOCATE network_cursor;
+    END
+    
+    SELECT @recorded AS recorded_count, @received - @recorded - @duplicates AS skipped_count, @duplicates AS duplicate_count;
+END
+GO
+
 -- 롤업 상태 업데이트
 IF OBJECT_ID('dbo.usp_rollup_update', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_rollup_update;
 GO
@@ -226,6 +1052,9 @@ BEGIN
             SET last_status = @status,
                 last_change_at = CASE WHEN last_status != @status THEN GETDATE() ELSE last_change_at END,
                 last_reason = @reason,
+                -- 실제 체크가 기록되면 체크 생략 표시 해제
+                suppressed_by = CASE WHEN @level = 'endpoint' THEN NULL ELSE suppressed_by END,
+                suppressed_at = CASE WHEN @level = 'endpoint' THEN NULL ELSE suppressed_at END,
                 updated_at = GETDATE()
             WHERE level = @level AND ref_id = @ref_id;
         END
@@ -262,6 +1091,10 @@ BEGIN
         
         SET @deleted_count = @@ROWCOUNT;
         
+        -- 하루 지난 즉시 점검 요청 (완료 여부와 무관)
+        DELETE FROM dbo.check_requests
+        WHERE requested_at < DATEADD(day, -1, GETDATE());
+        
         SELECT @deleted_count AS deleted_count, 'SUCCESS' AS status, 
                CONCAT('오래된 체크 데이터 ', @deleted_count, '건이 삭제되었습니다.') AS message;
         
@@ -326,6 +1159,83 @@ BEGIN
 END
 GO
 
+-- 알림 대상 조회 (콘솔 알림 발송용, 14_notification_dispatch.sql)
+-- 장애 알림을 받는 엔드포인트와 담당자, 중복 제거 창 안에 발송한 마지막 알림(재시작 후 중복 발송 방지)
+IF OBJECT_ID('dbo.usp_get_notification_targets', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_get_notification_targets;
+GO
+
+CREATE PROCEDURE dbo.usp_get_notification_targets
+    @network_group_id BIGINT = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    DECLARE @dedupe_minutes INT = 30;
+    SELECT @dedupe_minutes = TRY_CAST([value] AS INT)
+    FROM dbo.settings
+    WHERE [key] = 'notification_dedupe_minutes';
+    SET @dedupe_minutes = ISNULL(@dedupe_minutes, 30);
+    
+    DECLARE @since DATETIME2 = DATEADD(minute, -@dedupe_minutes, GETDATE());
+    
+    SELECT
+        e.id AS endpoint_id,
+        e.url,
+        d.domain,
+        d.site_name,
+        d.owner_name,
+        d.owner_contact,
+        @dedupe_minutes AS dedupe_minutes,
+        last_sent.level AS last_level,
+        last_sent.sent_at AS last_sent_at
+    FROM dbo.endpoints e
+    INNER JOIN dbo.domains d ON e.domain_id = d.id
+    OUTER APPLY (
+        SELECT TOP 1 n.level, n.sent_at
+        FROM dbo.notifications n
+        WHERE n.endpoint_id = e.id AND n.sent_at >= @since AND n.status = 'SENT'
+        ORDER BY n.sent_at DESC
+    ) last_sent
+    WHERE e.is_enabled = 1
+      AND e.email_on_failure = 1
+      AND (@network_group_id IS NULL OR d.network_group_id = @network_group_id)
+    ORDER BY e.id;
+END
+GO
+
+-- 알림 발송 결과 일괄 기록 (콘솔 알림 발송용)
+-- @notifications: [{"endpoint_id": 1, "level": "RED", "title": "...", "body": "...", "sent_to": "...",
+--                   "dedupe_key": "1:RED", "status": "SENT", "sent_at": "2026-10-19T10:00:00"}, ...]
+-- 중복 제거는 콘솔이 메모리에서 처리하므로 여기서는 notifications를 조회하지 않음
+IF OBJECT_ID('dbo.usp_record_notifications_bulk', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_record_notifications_bulk;
+GO
+
+CREATE PROCEDURE dbo.usp_record_notifications_bulk
+    @notifications NVARCHAR(MAX)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    
+    INSERT INTO dbo.notifications (endpoint_id, level, title, body, sent_to, dedupe_key, status, sent_at)
+    SELECT j.endpoint_id, j.level, LEFT(j.title, 200), j.body, LEFT(j.sent_to, 254), j.dedupe_key, j.status,
+           ISNULL(j.sent_at, GETDATE())
+    FROM OPENJSON(@notifications)
+    WITH (
+        endpoint_id BIGINT '$.endpoint_id',
+        level NVARCHAR(10) '$.level',
+        title NVARCHAR(400) '$.title',
+        body NVARCHAR(MAX) '$.body',
+        sent_to NVARCHAR(400) '$.sent_to',
+        dedupe_key NVARCHAR(100) '$.dedupe_key',
+        status NVARCHAR(10) '$.status',
+        sent_at DATETIME2 '$.sent_at'
+    ) j
+    WHERE EXISTS (SELECT 1 FROM dbo.endpoints e WHERE e.id = j.endpoint_id);
+    
+    SELECT @@ROWCOUNT AS recorded_count;
+END
+GO
+
 -- 일괄 설정 업데이트
 IF OBJECT_ID('dbo.usp_bulk_update_settings', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_bulk_update_settings;
 GO
@@ -376,6 +1286,7 @@ END
 GO
 
 -- 엔드포인트의 마지막 체크 시간 조회
+-- suppressed_at: 상위 장애로 체크를 생략 중이면 생략 시각 (AMBER 서비스는 N/A를 기록하지 않음)
 IF OBJECT_ID('dbo.usp_get_last_check_time', 'P') IS NOT NULL DROP PROCEDURE dbo.usp_get_last_check_time;
 GO
 
@@ -385,14 +1296,21 @@ AS
 BEGIN
     SET NOCOUNT ON;
     
-    SELECT TOP 1 
-        checked_at AS last_checked_at,
-        status_code,
-        latency_ms,
-        error
-    FROM dbo.checks
-    WHERE endpoint_id = @endpoint_id
-    ORDER BY checked_at DESC;
+    SELECT
+        c.checked_at AS last_checked_at,
+        c.status_code,
+        c.latency_ms,
+        c.error,
+        r.suppressed_at
+    FROM (SELECT @endpoint_id AS endpoint_id) e
+    OUTER APPLY (
+        SELECT TOP 1 checked_at, status_code, latency_ms, error
+        FROM dbo.checks
+        WHERE endpoint_id = e.endpoint_id
+        ORDER BY checked_at DESC
+    ) c
+    LEFT JOIN dbo.rollups r ON r.level = 'endpoint' AND r.ref_id = e.endpoint_id
+    WHERE c.checked_at IS NOT NULL OR r.suppressed_at IS NOT NULL;
 END
 GO
 
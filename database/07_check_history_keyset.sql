@@ -0,0 +1,65 @@
+-- 체크 기록 화면 성능 개선
+-- 1. 키셋 페이지네이션용 (checked_at, id) 인덱스
+-- 2. 일별/망구분별 체크 집계 카운터 테이블 (전체 COUNT/AVG 대신 사용)
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 usp_record_check를 갱신하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+-- 키셋 페이지네이션 인덱스
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.checks') AND name = 'IX_checks_checked_at_id')
+BEGIN
+    CREATE INDEX IX_checks_checked_at_id ON dbo.checks (checked_at DESC, id DESC);
+    PRINT 'IX_checks_checked_at_id 인덱스가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'IX_checks_checked_at_id 인덱스가 이미 존재합니다.';
+END
+GO
+
+-- 일별 집계 카운터 테이블
+IF OBJECT_ID('dbo.check_daily_stats', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.check_daily_stats (
+        id BIGINT IDENTITY(1,1) PRIMARY KEY,
+        stat_date DATE NOT NULL,
+        network_group_id BIGINT NOT NULL,
+        total_count BIGINT NOT NULL DEFAULT 0,
+        success_count BIGINT NOT NULL DEFAULT 0,
+        error_count BIGINT NOT NULL DEFAULT 0,
+        latency_sum BIGINT NOT NULL DEFAULT 0,
+        latency_count BIGINT NOT NULL DEFAULT 0,
+
+        CONSTRAINT UQ_check_daily_stats UNIQUE (stat_date, network_group_id),
+        CONSTRAINT FK_check_daily_stats_network_group FOREIGN KEY (network_group_id)
+            REFERENCES dbo.network_groups(id) ON DELETE CASCADE
+    );
+    PRINT 'check_daily_stats 테이블이 생성되었습니다.';
+
+    -- 기존 체크 기록으로 초기 적재
+    INSERT INTO dbo.check_daily_stats
+        (stat_date, network_group_id, total_count, success_count, error_count, latency_sum, latency_count)
+    SELECT
+        CAST(c.checked_at AS DATE),
+        d.network_group_id,
+        COUNT_BIG(*),
+        SUM(CASE WHEN c.status_code BETWEEN 200 AND 299 AND c.error IS NULL THEN 1 ELSE 0 END),
+        SUM(CASE WHEN c.status_code BETWEEN 200 AND 299 AND c.error IS NULL THEN 0 ELSE 1 END),
+        ISNULL(SUM(CAST(CASE WHEN c.status_code BETWEEN 200 AND 299 AND c.error IS NULL THEN c.latency_ms END AS BIGINT)), 0),
+        COUNT_BIG(CASE WHEN c.status_code BETWEEN 200 AND 299 AND c.error IS NULL THEN c.latency_ms END)
+    FROM dbo.checks c
+    INNER JOIN dbo.endpoints e ON c.endpoint_id = e.id
+    INNER JOIN dbo.domains d ON e.domain_id = d.id
+    GROUP BY CAST(c.checked_at AS DATE), d.network_group_id;
+    PRINT '기존 체크 기록 집계가 적재되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'check_daily_stats 테이블이 이미 존재합니다.';
+END
+GO
+
+PRINT '체크 기록 스키마 업데이트가 완료되었습니다.';
@@ -0,0 +1,50 @@
+-- 장기간 응답시간 차트용 시간별/엔드포인트별 체크 집계 테이블
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 usp_record_check를 갱신하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.check_hourly_stats', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.check_hourly_stats (
+        id BIGINT IDENTITY(1,1) PRIMARY KEY,
+        endpoint_id BIGINT NOT NULL,
+        bucket_start DATETIME2 NOT NULL,
+        total_count INT NOT NULL DEFAULT 0,
+        error_count INT NOT NULL DEFAULT 0,
+        latency_min INT NULL,
+        latency_max INT NULL,
+        latency_sum BIGINT NOT NULL DEFAULT 0,
+        latency_count INT NOT NULL DEFAULT 0,
+
+        CONSTRAINT UQ_check_hourly_stats UNIQUE (endpoint_id, bucket_start),
+        CONSTRAINT FK_check_hourly_stats_endpoint FOREIGN KEY (endpoint_id)
+            REFERENCES dbo.endpoints(id) ON DELETE CASCADE
+    );
+    PRINT 'check_hourly_stats 테이블이 생성되었습니다.';
+
+    -- 기존 체크 기록으로 초기 적재
+    INSERT INTO dbo.check_hourly_stats
+        (endpoint_id, bucket_start, total_count, error_count, latency_min, latency_max, latency_sum, latency_count)
+    SELECT
+        c.endpoint_id,
+        DATEADD(HOUR, DATEDIFF(HOUR, 0, c.checked_at), 0),
+        COUNT(*),
+        SUM(CASE WHEN c.status_code BETWEEN 200 AND 299 AND c.error IS NULL THEN 0 ELSE 1 END),
+        MIN(c.latency_ms),
+        MAX(c.latency_ms),
+        ISNULL(SUM(CAST(c.latency_ms AS BIGINT)), 0),
+        COUNT(c.latency_ms)
+    FROM dbo.checks c
+    GROUP BY c.endpoint_id, DATEADD(HOUR, DATEDIFF(HOUR, 0, c.checked_at), 0);
+    PRINT '기존 체크 기록 집계가 적재되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'check_hourly_stats 테이블이 이미 존재합니다.';
+END
+GO
+
+PRINT '시간별 체크 집계 스키마 업데이트가 완료되었습니다.';
@@ -0,0 +1,91 @@
+-- 장애 구간(incidents) 테이블
+-- 엔드포인트 상태가 장애/신호없음으로 바뀐 시점부터 다시 바뀐 시점까지를 한 행으로 기록합니다.
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 usp_record_check를 갱신하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.incidents', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.incidents (
+        id BIGINT IDENTITY(1,1) PRIMARY KEY,
+        endpoint_id BIGINT NOT NULL,
+        status NVARCHAR(6) NOT NULL CHECK (status IN ('AMBER', 'RED')),
+        started_at DATETIME2 NOT NULL,
+        ended_at DATETIME2 NULL,
+        duration_sec INT NULL,
+        first_error NVARCHAR(4000) NOT NULL DEFAULT '',
+        last_error NVARCHAR(4000) NOT NULL DEFAULT '',
+        check_count INT NOT NULL DEFAULT 1,
+        last_checked_at DATETIME2 NOT NULL,
+
+        CONSTRAINT FK_incidents_endpoint FOREIGN KEY (endpoint_id)
+            REFERENCES dbo.endpoints(id) ON DELETE CASCADE
+    );
+    PRINT 'incidents 테이블이 생성되었습니다.';
+
+    -- 기존 체크 기록으로 초기 적재
+    -- 엔드포인트별로 같은 상태가 연속된 구간(gaps and islands)을 찾고,
+    -- 구간 마지막 체크의 다음 체크 시각을 종료 시각으로 사용 (다음 체크가 없으면 진행 중)
+    ;WITH classified AS (
+        SELECT
+            c.endpoint_id,
+            c.checked_at,
+            c.id,
+            CASE
+                WHEN c.status_code = 200 THEN 'GREEN'
+                WHEN c.status_code IS NULL THEN 'AMBER'
+                ELSE 'RED'
+            END AS status,
+            COALESCE(LEFT(c.error, 4000), CASE WHEN c.status_code IS NULL THEN N'응답 없음' ELSE CONCAT('HTTP ', c.status_code) END) AS message,
+            LEAD(c.checked_at) OVER (PARTITION BY c.endpoint_id ORDER BY c.checked_at, c.id) AS next_checked_at,
+            ROW_NUMBER() OVER (PARTITION BY c.endpoint_id ORDER BY c.checked_at, c.id) AS seq
+        FROM dbo.checks c
+    ),
+    islands AS (
+        SELECT
+            *,
+            seq - ROW_NUMBER() OVER (PARTITION BY endpoint_id, status ORDER BY checked_at, id) AS island
+        FROM classified
+    ),
+    bounded AS (
+        SELECT
+            *,
+            FIRST_VALUE(message) OVER (PARTITION BY endpoint_id, status, island ORDER BY checked_at, id) AS first_error,
+            LAST_VALUE(message) OVER (
+                PARTITION BY endpoint_id, status, island ORDER BY checked_at, id
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            ) AS last_error
+        FROM islands
+        WHERE status <> 'GREEN'
+    )
+    INSERT INTO dbo.incidents
+        (endpoint_id, status, started_at, ended_at, duration_sec, first_error, last_error, check_count, last_checked_at)
+    SELECT
+        endpoint_id,
+        status,
+        MIN(checked_at),
+        CASE WHEN COUNT(next_checked_at) = COUNT(*) THEN MAX(next_checked_at) END,
+        CASE WHEN COUNT(next_checked_at) = COUNT(*) THEN DATEDIFF(SECOND, MIN(checked_at), MAX(next_checked_at)) END,
+        MIN(first_error),
+        MIN(last_error),
+        COUNT(*),
+        MAX(checked_at)
+    FROM bounded
+    GROUP BY endpoint_id, status, island;
+    PRINT '기존 체크 기록으로 장애 구간이 적재되었습니다.';
+
+    -- 엔드포인트당 열린 장애 구간은 1개
+    CREATE UNIQUE INDEX UQ_incidents_open ON dbo.incidents (endpoint_id) WHERE ended_at IS NULL;
+    CREATE INDEX IX_incidents_endpoint ON dbo.incidents (endpoint_id, started_at DESC);
+    CREATE INDEX IX_incidents_started_at_id ON dbo.incidents (started_at DESC, id DESC);
+END
+ELSE
+BEGIN
+    PRINT 'incidents 테이블이 이미 존재합니다.';
+END
+GO
+
+PRINT '장애 구간 스키마 업데이트가 완료되었습니다.';
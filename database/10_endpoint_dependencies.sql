@@ -0,0 +1,38 @@
+-- 의존 관계 기반 체크 생략(suppression)용 필드 추가
+-- endpoints.parent_endpoint_id: 상위 엔드포인트(게이트웨이 등), 장애로 확인되면 하위 엔드포인트 체크 생략
+-- rollups.suppressed_by/suppressed_at: 콘솔이 체크를 생략한 엔드포인트 표시 (다음 실제 체크 시 해제)
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 저장프로시저를 갱신하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.columns WHERE object_id = OBJECT_ID('dbo.endpoints') AND name = 'parent_endpoint_id')
+BEGIN
+    ALTER TABLE dbo.endpoints
+    ADD parent_endpoint_id BIGINT NULL
+        CONSTRAINT FK_endpoints_parent FOREIGN KEY REFERENCES dbo.endpoints(id);
+    PRINT 'parent_endpoint_id 필드가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'parent_endpoint_id 필드가 이미 존재합니다.';
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.columns WHERE object_id = OBJECT_ID('dbo.rollups') AND name = 'suppressed_by')
+BEGIN
+    ALTER TABLE dbo.rollups
+    ADD suppressed_by NVARCHAR(200) NULL,
+        suppressed_at DATETIME2 NULL;
+    PRINT 'suppressed_by/suppressed_at 필드가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'suppressed_by/suppressed_at 필드가 이미 존재합니다.';
+END
+GO
+
+PRINT '의존 관계 스키마 업데이트가 완료되었습니다.';
+GO
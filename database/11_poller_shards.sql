@@ -0,0 +1,49 @@
+-- 폴러 샤드 임대 테이블 추가
+-- 같은 망구분을 여러 폴러 인스턴스가 나눠 체크하도록 엔드포인트를 샤드(endpoint_id % 샤드 수)로 나누고
+-- usp_claim_shard_leases로 임대/갱신/재분배 ([Sharding] enabled = true일 때만 사용)
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 저장프로시저를 갱신하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.poller_instances', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.poller_instances (
+        scope_id BIGINT NOT NULL,
+        instance_id NVARCHAR(100) NOT NULL,
+        started_at DATETIME2 NOT NULL,
+        heartbeat_at DATETIME2 NOT NULL,
+        expires_at DATETIME2 NOT NULL,
+        
+        CONSTRAINT PK_poller_instances PRIMARY KEY (scope_id, instance_id)
+    );
+    PRINT 'poller_instances 테이블이 생성되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'poller_instances 테이블이 이미 존재합니다.';
+END
+GO
+
+IF OBJECT_ID('dbo.poller_shard_leases', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.poller_shard_leases (
+        scope_id BIGINT NOT NULL,
+        shard_no INT NOT NULL,
+        owner_instance_id NVARCHAR(100) NULL,
+        expires_at DATETIME2 NULL,
+        
+        CONSTRAINT PK_poller_shard_leases PRIMARY KEY (scope_id, shard_no)
+    );
+    PRINT 'poller_shard_leases 테이블이 생성되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'poller_shard_leases 테이블이 이미 존재합니다.';
+END
+GO
+
+PRINT '폴러 샤드 임대 스키마 업데이트가 완료되었습니다.';
+GO
@@ -0,0 +1,36 @@
+-- 원격 폴러 에이전트 테이블 추가
+-- KT망/LG망/해외망처럼 DB에 직접 연결할 수 없는 망 안의 폴러가 웹앱 수집 API(/monitoring/api/ingest/)로
+-- 체크 결과를 보낼 때 사용하는 에이전트별 인증 정보 (토큰은 SHA-256 해시만 저장)
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 저장프로시저(usp_record_checks_bulk)를 추가하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.probe_agents', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.probe_agents (
+        id BIGINT IDENTITY(1,1) PRIMARY KEY,
+        name NVARCHAR(100) NOT NULL UNIQUE,
+        network_group_id BIGINT NOT NULL,
+        token_hash CHAR(64) NOT NULL UNIQUE,
+        is_active BIT NOT NULL DEFAULT 1,
+        note NVARCHAR(MAX) NULL,
+        last_seen_at DATETIME2 NULL,
+        last_address NVARCHAR(39) NULL,
+        created_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+        updated_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+        
+        CONSTRAINT FK_probe_agents_network_group FOREIGN KEY (network_group_id) REFERENCES dbo.network_groups(id) ON DELETE CASCADE
+    );
+    PRINT 'probe_agents 테이블이 생성되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'probe_agents 테이블이 이미 존재합니다.';
+END
+GO
+
+PRINT '원격 폴러 에이전트 스키마 업데이트가 완료되었습니다.';
+GO
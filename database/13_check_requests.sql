@@ -0,0 +1,48 @@
+-- 즉시 점검 요청 큐 테이블 추가
+-- 웹앱의 "즉시 점검"이 요청을 넣으면 실행 중인 콘솔이 1초 안에 usp_claim_check_requests로 가져가
+-- 예약된 체크보다 먼저 실행하고, 웹앱은 check_id가 기록될 때까지 기다려 결과를 보여 줌
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 저장프로시저(usp_claim_check_requests, usp_complete_check_requests)를 추가하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.check_requests', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.check_requests (
+        id BIGINT IDENTITY(1,1) PRIMARY KEY,
+        endpoint_id BIGINT NOT NULL,
+        requested_by BIGINT NULL,
+        requested_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+        claimed_by NVARCHAR(100) NULL,
+        claimed_at DATETIME2 NULL,
+        completed_at DATETIME2 NULL,
+        check_id BIGINT NULL,
+        
+        CONSTRAINT FK_check_requests_endpoint FOREIGN KEY (endpoint_id) REFERENCES dbo.endpoints(id) ON DELETE CASCADE,
+        CONSTRAINT FK_check_requests_user FOREIGN KEY (requested_by) REFERENCES dbo.users(id) ON DELETE SET NULL
+    );
+    PRINT 'check_requests 테이블이 생성되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'check_requests 테이블이 이미 존재합니다.';
+END
+GO
+
+-- 콘솔이 1초마다 조회하므로 대기 중인 행만 담는 필터 인덱스
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.check_requests') AND name = 'IX_check_requests_pending')
+BEGIN
+    CREATE INDEX IX_check_requests_pending ON dbo.check_requests (requested_at) 
+    INCLUDE (endpoint_id, claimed_at) WHERE completed_at IS NULL;
+    PRINT 'IX_check_requests_pending 인덱스가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'IX_check_requests_pending 인덱스가 이미 존재합니다.';
+END
+GO
+
+PRINT '즉시 점검 요청 큐 스키마 업데이트가 완료되었습니다.';
+GO
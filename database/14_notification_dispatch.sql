@@ -0,0 +1,63 @@
+-- 알림 발송(콘솔 [Notification])용 인덱스 정리
+-- 콘솔은 시작 시 usp_get_notification_targets로 엔드포인트별 마지막 발송 알림을 읽어 중복 제거 창을 복원하고,
+-- 발송 결과는 usp_record_notifications_bulk로 한 번에 기록합니다.
+-- usp_record_notification의 중복 확인(dedupe_key + sent_at)도 인덱스만으로 처리되도록 sent_at을 키에 추가
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 저장프로시저를 추가하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+-- 엔드포인트별 최근 알림 (endpoint_id, sent_at DESC)
+IF EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.notifications') AND name = 'IX_notifications_endpoint')
+   AND NOT EXISTS (
+       SELECT * FROM sys.index_columns ic
+       INNER JOIN sys.indexes i ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+       WHERE i.object_id = OBJECT_ID('dbo.notifications') AND i.name = 'IX_notifications_endpoint'
+         AND COL_NAME(ic.object_id, ic.column_id) = 'sent_at'
+   )
+BEGIN
+    DROP INDEX IX_notifications_endpoint ON dbo.notifications;
+    PRINT '기존 IX_notifications_endpoint 인덱스를 삭제했습니다.';
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.notifications') AND name = 'IX_notifications_endpoint')
+BEGIN
+    CREATE INDEX IX_notifications_endpoint ON dbo.notifications (endpoint_id, sent_at DESC) INCLUDE (level, status);
+    PRINT 'IX_notifications_endpoint 인덱스가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'IX_notifications_endpoint 인덱스가 이미 존재합니다.';
+END
+GO
+
+-- 중복 확인 (dedupe_key, sent_at)
+IF EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.notifications') AND name = 'IX_notifications_dedupe')
+   AND NOT EXISTS (
+       SELECT * FROM sys.index_columns ic
+       INNER JOIN sys.indexes i ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+       WHERE i.object_id = OBJECT_ID('dbo.notifications') AND i.name = 'IX_notifications_dedupe'
+         AND COL_NAME(ic.object_id, ic.column_id) = 'sent_at'
+   )
+BEGIN
+    DROP INDEX IX_notifications_dedupe ON dbo.notifications;
+    PRINT '기존 IX_notifications_dedupe 인덱스를 삭제했습니다.';
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.notifications') AND name = 'IX_notifications_dedupe')
+BEGIN
+    CREATE INDEX IX_notifications_dedupe ON dbo.notifications (dedupe_key, sent_at DESC) WHERE dedupe_key IS NOT NULL;
+    PRINT 'IX_notifications_dedupe 인덱스가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'IX_notifications_dedupe 인덱스가 이미 존재합니다.';
+END
+GO
+
+PRINT '알림 발송 스키마 업데이트가 완료되었습니다.';
+GO
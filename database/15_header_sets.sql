@@ -0,0 +1,66 @@
+-- 응답 헤더 조합 테이블 추가
+-- 콘솔이 [Http] header_allowlist에 있는 헤더만 정규화한 JSON으로 보내면 usp_record_check/usp_record_checks_bulk가
+-- SHA2_256 해시를 키로 header_sets에 한 번만 저장하고, checks에는 해시(header_hash)만 기록합니다.
+-- 이전 버전이 checks.headers에 기록한 헤더는 그대로 두며 보존 기간이 지나면 체크 결과와 함께 정리됩니다.
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 04_dashboard_procedures.sql, 05_console_procedures.sql을 다시 실행하세요.
+-- 실행 전에 백업을 권장합니다 (checks 커버링 인덱스를 다시 만들므로 체크 결과가 많으면 시간이 걸립니다)
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.header_sets', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.header_sets (
+        header_hash BINARY(32) PRIMARY KEY,
+        headers NVARCHAR(4000) NOT NULL,
+        created_at DATETIME2 NOT NULL DEFAULT GETDATE()
+    );
+    PRINT 'header_sets 테이블이 생성되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'header_sets 테이블이 이미 존재합니다.';
+END
+GO
+
+-- 체크 결과의 헤더 조합 해시
+IF NOT EXISTS (SELECT * FROM sys.columns WHERE object_id = OBJECT_ID('dbo.checks') AND name = 'header_hash')
+BEGIN
+    ALTER TABLE dbo.checks
+    ADD header_hash BINARY(32) NULL;
+    PRINT 'header_hash 필드가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'header_hash 필드가 이미 존재합니다.';
+END
+GO
+
+-- 커버링 인덱스: headers 대신 header_hash 포함
+IF EXISTS (
+    SELECT * FROM sys.index_columns ic
+    INNER JOIN sys.indexes i ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+    WHERE i.object_id = OBJECT_ID('dbo.checks') AND i.name = 'IX_checks_endpoint_checked_at'
+      AND COL_NAME(ic.object_id, ic.column_id) = 'headers'
+)
+BEGIN
+    DROP INDEX IX_checks_endpoint_checked_at ON dbo.checks;
+    PRINT '기존 IX_checks_endpoint_checked_at 인덱스를 삭제했습니다.';
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.checks') AND name = 'IX_checks_endpoint_checked_at')
+BEGIN
+    CREATE INDEX IX_checks_endpoint_checked_at ON dbo.checks (endpoint_id, checked_at DESC)
+    INCLUDE (status_code, latency_ms, header_hash, error, trace_id);
+    PRINT 'IX_checks_endpoint_checked_at 인덱스가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'IX_checks_endpoint_checked_at 인덱스가 이미 존재합니다.';
+END
+GO
+
+PRINT '응답 헤더 스키마 업데이트가 완료되었습니다.';
+GO
@@ -0,0 +1,20 @@
+-- 시간별 집계 기간 조회 인덱스
+-- 가용률(SLA) 리포트는 체크 기록 대신 check_hourly_stats의 한 달치를 엔드포인트별로 합산하므로
+-- bucket_start 범위로 집계 컬럼만 읽도록 커버링 인덱스 추가
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE object_id = OBJECT_ID('dbo.check_hourly_stats') AND name = 'IX_check_hourly_stats_bucket')
+BEGIN
+    CREATE INDEX IX_check_hourly_stats_bucket ON dbo.check_hourly_stats (bucket_start)
+    INCLUDE (endpoint_id, total_count, error_count, latency_sum, latency_count);
+    PRINT 'IX_check_hourly_stats_bucket 인덱스가 추가되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'IX_check_hourly_stats_bucket 인덱스가 이미 존재합니다.';
+END
+GO
@@ -0,0 +1,51 @@
+-- 가용률(SLA) 리포트 응답시간 백분위용 시간별 응답시간 히스토그램 테이블
+-- 시간별 평균만으로는 p95/p99가 평균에 묻히므로 체크마다 로그 간격 구간 건수를 누적
+-- 기존 설치본 업그레이드용 (신규 설치는 01_create_tables.sql에 포함)
+-- 실행 후 05_console_procedures.sql을 다시 실행해 usp_record_check, usp_record_checks_bulk를 갱신하세요.
+-- 실행 전에 백업을 권장합니다
+
+USE svcmon;
+GO
+
+IF OBJECT_ID('dbo.check_hourly_latency', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.check_hourly_latency (
+        id BIGINT IDENTITY(1,1) PRIMARY KEY,
+        endpoint_id BIGINT NOT NULL,
+        bucket_start DATETIME2 NOT NULL,
+        latency_bin TINYINT NOT NULL,
+        check_count INT NOT NULL DEFAULT 0,
+
+        CONSTRAINT UQ_check_hourly_latency UNIQUE (endpoint_id, bucket_start, latency_bin),
+        CONSTRAINT FK_check_hourly_latency_endpoint FOREIGN KEY (endpoint_id)
+            REFERENCES dbo.endpoints(id) ON DELETE CASCADE
+    );
+    CREATE INDEX IX_check_hourly_latency_bucket ON dbo.check_hourly_latency (bucket_start)
+    INCLUDE (endpoint_id, latency_bin, check_count);
+    PRINT 'check_hourly_latency 테이블이 생성되었습니다.';
+
+    -- 기존 체크 기록으로 초기 적재 (구간: 0 = 1ms 미만, 1~95 = 1ms~120초 로그 간격, 95는 120초 이상 포함)
+    INSERT INTO dbo.check_hourly_latency (endpoint_id, bucket_start, latency_bin, check_count)
+    SELECT b.endpoint_id, b.bucket_start, b.latency_bin, COUNT(*)
+    FROM (
+        SELECT
+            c.endpoint_id,
+            DATEADD(HOUR, DATEDIFF(HOUR, 0, c.checked_at), 0) AS bucket_start,
+            CASE
+                WHEN c.latency_ms < 1 THEN 0
+                WHEN c.latency_ms >= 120000 THEN 95
+                ELSE CAST(FLOOR(LOG(c.latency_ms) / (LOG(120000.0) / 95)) AS INT) + 1
+            END AS latency_bin
+        FROM dbo.checks c
+        WHERE c.latency_ms IS NOT NULL
+    ) b
+    GROUP BY b.endpoint_id, b.bucket_start, b.latency_bin;
+    PRINT '기존 체크 기록 응답시간 히스토그램이 적재되었습니다.';
+END
+ELSE
+BEGIN
+    PRINT 'check_hourly_latency 테이블이 이미 존재합니다.';
+END
+GO
+
+PRINT '시간별 응답시간 히스토그램 스키마 업데이트가 완료되었습니다.';
@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+    
+    def ready(self):
+        """사용자 변경 시 인증 백엔드 캐시 무효화"""
+        from django.db.models.signals import post_save, post_delete
+        from .models import User
+        from .backends import invalidate_user_cache
+        
+        def _invalidate(sender, instance, **kwargs):
+            invalidate_user_cache(instance.pk)
+        
+        post_save.connect(_invalidate, sender=User, dispatch_uid='accounts_user_cache_save', weak=False)
+        post_delete.connect(_invalidate, sender=User, dispatch_uid='accounts_user_cache_delete', weak=False)
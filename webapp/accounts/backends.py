@@ -1,9 +1,28 @@
+import copy
+import threading
+import time
+
+from django.conf import settings
 from django.contrib.auth.backends import BaseBackend
 from django.contrib.auth.hashers import check_password
 from django.db import connection
 from .models import User
 
 
+# 프로세스 단위 사용자 캐시 {user_id: (만료시각, User)}
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_user_cache(user_id=None):
+    """사용자 캐시 무효화 (user_id가 없으면 전체)"""
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
+
 class CustomAuthBackend(BaseBackend):
     """커스텀 인증 백엔드 - raw SQL 사용"""
     
@@ -58,7 +77,27 @@ class CustomAuthBackend(BaseBackend):
             return None
     
     def get_user(self, user_id):
-        """사용자 ID로 사용자 조회"""
+        """사용자 ID로 사용자 조회 (짧은 시간 프로세스 캐시 사용)"""
+        ttl = getattr(settings, 'AUTH_USER_CACHE_SECONDS', 0)
+        if ttl <= 0:
+            return self._load_user(user_id)
+        
+        now = time.monotonic()
+        with _user_cache_lock:
+            cached = _user_cache.get(user_id)
+        if cached and cached[0] > now:
+            # 요청 간 객체 공유를 막기 위해 복사본 반환
+            return copy.copy(cached[1])
+        
+        user = self._load_user(user_id)
+        if user is not None:
+            with _user_cache_lock:
+                _user_cache[user_id] = (now + ttl, user)
+            return copy.copy(user)
+        return None
+    
+    def _load_user(self, user_id):
+        """DB에서 사용자 조회"""
         try:
             with connection.cursor() as cursor:
                 cursor.execute("""
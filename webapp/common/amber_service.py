@@ -98,7 +98,12 @@ class AmberCheckService:
         # 마지막 체크 시간 조회
         last_check_data = self._get_last_check_time(endpoint_id)
         
-        if not last_check_data:
+        if last_check_data and last_check_data[0].get('suppressed_at'):
+            # 상위 장애로 콘솔이 체크를 생략 중 (롤업의 "체크 생략" 표시와 장애 구간을 N/A로 덮어쓰지 않음)
+            logger.debug(f"엔드포인트 {endpoint_id} 체크 생략 중 - N/A 체크 건너뜀")
+            return
+        
+        if not last_check_data or last_check_data[0]['last_checked_at'] is None:
             logger.info(f"엔드포인트 {endpoint_id}의 체크 데이터가 없습니다. N/A 레코드 삽입")
             # 체크 데이터가 없으면 현재 시간에서 폴링 간격 이전 시간을 기준으로 N/A 삽입
             reference_time = current_time - timedelta(seconds=poll_interval * 2)
@@ -0,0 +1,31 @@
+"""
+DB 저장 시각 변환
+콘솔은 KST 벽시계 시각을 naive datetime으로 저장하고 Django(USE_TZ)는 이 값을 UTC로 읽습니다.
+조회 조건은 같은 기준(KST 벽시계 값 + UTC tzinfo)으로 만들고, 화면/응답에는 현지 시각으로 되돌려 씁니다.
+"""
+
+from datetime import datetime, time, timezone as dt_timezone
+
+from django.utils import timezone
+
+
+def to_stored(value: datetime) -> datetime:
+    """일시를 저장 기준 값으로 변환 (naive 값은 현지 시각으로 간주)"""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.replace(tzinfo=dt_timezone.utc)
+
+
+def stored_now() -> datetime:
+    """저장 기준 현재 시각"""
+    return to_stored(timezone.now())
+
+
+def stored_start_of_day(day) -> datetime:
+    """저장 기준 해당 일자 0시"""
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+
+
+def from_stored(value: datetime) -> datetime:
+    """저장 값을 현지 시간대 aware datetime으로 변환"""
+    return timezone.make_aware(value.replace(tzinfo=None))
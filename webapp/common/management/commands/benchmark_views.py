@@ -0,0 +1,195 @@
+import json
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+from django.utils import timezone
+
+from monitoring.models import NetworkGroup, Domain, Endpoint, CheckRequest
+
+User = get_user_model()
+
+# 벤치마크 대상 URL 네임스페이스
+NAMESPACES = ('dashboard', 'monitoring')
+
+# GET 요청만으로 데이터가 변경되는 뷰는 제외
+EXCLUDED_VIEWS = {
+    'monitoring:network_group_delete',
+    'monitoring:domain_delete',
+    'monitoring:endpoint_delete',
+}
+
+# 기본 요청 외에 추가로 측정할 쿼리스트링 (목록 뒤쪽 페이지, 검색 등)
+VIEW_VARIANTS = {
+    'monitoring:endpoint_list': ('search=health', 'page=100'),
+    'monitoring:domain_list': ('page=50',),
+    'monitoring:check_history': ('status=error', 'endpoint={endpoint_id}'),
+    'monitoring:check_export': ('format=ndjson&endpoint={endpoint_id}',),
+    'monitoring:incident_list': ('state=open', 'endpoint={endpoint_id}'),
+    'monitoring:sla_report': ('level=domain', 'level=endpoint&format=csv'),
+    'dashboard:endpoint_chart': ('page=100',),
+    'dashboard:endpoint_chart_api': ('page=10',),
+    'dashboard:endpoint_series_api': ('from={month_ago}', 'from={month_ago}&mode=lttb'),
+}
+
+
+class Command(BaseCommand):
+    help = '대시보드/모니터링 뷰와 JSON API의 응답시간(p50/p99)과 쿼리 수를 측정합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=10, help='뷰별 반복 횟수 (기본값: 10)')
+        parser.add_argument('--warmup', type=int, default=1, help='측정 전 워밍업 요청 수 (기본값: 1)')
+        parser.add_argument('--username', type=str, help='요청에 사용할 관리자 사용자명 (기본값: 첫 번째 superuser)')
+        parser.add_argument('--prefix', type=str, default='SCALE',
+                            help='대상 ID를 고를 망구분명 접두어 (기본값: SCALE, 없으면 전체에서 선택)')
+        parser.add_argument('--view', action='append', dest='views', help='특정 뷰만 측정 (예: dashboard:home)')
+        parser.add_argument('--json', type=str, help='결과를 JSON 파일로 저장')
+
+    def handle(self, *args, **options):
+        user = self._get_user(options['username'])
+        sample_ids = self._sample_ids(options['prefix'])
+
+        # 뷰 예외는 500 응답으로 기록하고 다음 뷰를 계속 측정
+        client = Client(raise_request_exception=False, HTTP_HOST=self._host())
+        client.force_login(user, backend='django.contrib.auth.backends.ModelBackend')
+
+        budgets = getattr(settings, 'VIEW_QUERY_BUDGETS', {})
+        results = []
+        for view_name, url in self._targets(sample_ids, options['views']):
+            result = self._measure(client, url, options['iterations'], options['warmup'])
+            result['view'] = view_name
+            result['budget'] = budgets.get(view_name)
+            results.append(result)
+            self._print_result(result)
+
+        over_budget = [r for r in results if r['budget'] is not None and r['queries'] > r['budget']]
+        self.stdout.write('')
+        if over_budget:
+            self.stdout.write(self.style.WARNING(
+                f'쿼리 예산 초과 {len(over_budget)}건: ' + ', '.join(r['url'] for r in over_budget)
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{len(results)}개 요청 모두 쿼리 예산 이내'))
+
+        if options['json']:
+            with open(options['json'], 'w', encoding='utf-8') as f:
+                json.dump({'sample_ids': sample_ids, 'results': results}, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f'결과 저장: {options["json"]}')
+
+    def _get_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+        else:
+            user = User.objects.filter(is_superuser=True, is_active=True).order_by('id').first()
+        if user is None:
+            raise CommandError('요청에 사용할 관리자 사용자가 없습니다. create_admin으로 생성하거나 --username을 지정하세요.')
+        return user
+
+    @staticmethod
+    def _host():
+        """ALLOWED_HOSTS에서 요청 Host 헤더 선택"""
+        for host in settings.ALLOWED_HOSTS:
+            if host and host != '*' and not host.startswith('.'):
+                return host
+        return 'localhost'
+
+    @staticmethod
+    def _sample_ids(prefix):
+        """URL 인자로 사용할 망구분/도메인/엔드포인트 ID (대상 망구분의 첫 번째 엔드포인트 기준)"""
+        groups = NetworkGroup.objects.filter(name__startswith=f'{prefix}-')
+        if not groups.exists():
+            groups = NetworkGroup.objects.all()
+        endpoint = Endpoint.objects.filter(domain__network_group__in=groups).order_by('id').first()
+        if endpoint is None:
+            raise CommandError('엔드포인트가 없습니다. generate_scale_data로 데이터를 먼저 생성하세요.')
+        domain = Domain.objects.get(id=endpoint.domain_id)
+        sample_ids = {
+            'network_group_id': domain.network_group_id,
+            'domain_id': domain.id,
+            'endpoint_id': endpoint.id,
+        }
+        # 즉시 점검 요청 상태 조회용 (요청이 없으면 해당 뷰는 건너뜀)
+        check_request_id = CheckRequest.objects.order_by('-id').values_list('id', flat=True).first()
+        if check_request_id is not None:
+            sample_ids['request_id'] = check_request_id
+        return sample_ids
+
+    @staticmethod
+    def _targets(sample_ids, only_views):
+        """(뷰 이름, URL) 목록"""
+        resolver = get_resolver()
+        targets = []
+        # 기간 파라미터용 값 (시간대 없는 현지 시각)
+        query_values = dict(
+            sample_ids,
+            month_ago=(timezone.localtime() - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M'),
+        )
+        for namespace in NAMESPACES:
+            _, sub_resolver = resolver.namespace_dict[namespace]
+            for name, entries in sorted(sub_resolver.reverse_dict.items(), key=lambda item: str(item[0])):
+                if not isinstance(name, str):
+                    continue
+                view_name = f'{namespace}:{name}'
+                if view_name in EXCLUDED_VIEWS or (only_views and view_name not in only_views):
+                    continue
+                params = entries[0][0][1]
+                if any(param not in sample_ids for param in params):
+                    continue
+                url = reverse(view_name, kwargs={param: sample_ids[param] for param in params})
+                targets.append((view_name, url))
+                for query in VIEW_VARIANTS.get(view_name, ()):
+                    targets.append((view_name, f'{url}?{query.format(**query_values)}'))
+        return targets
+
+    @staticmethod
+    def _measure(client, url, iterations, warmup):
+        for _ in range(warmup):
+            client.get(url)
+
+        durations = []
+        queries = 0
+        status_code = None
+        response_bytes = 0
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = client.get(url)
+                # 스트리밍 응답은 본문을 모두 읽을 때까지 측정
+                if getattr(response, 'streaming', False):
+                    response_bytes = sum(len(chunk) for chunk in response.streaming_content)
+                else:
+                    response_bytes = len(response.content)
+                durations.append((time.perf_counter() - start) * 1000)
+            queries = max(queries, len(context))
+            status_code = response.status_code
+
+        durations.sort()
+        return {
+            'url': url,
+            'status': status_code,
+            'p50_ms': round(durations[len(durations) // 2], 1),
+            'p99_ms': round(durations[min(len(durations) - 1, int(len(durations) * 0.99))], 1),
+            'max_ms': round(durations[-1], 1),
+            'queries': queries,
+            'response_bytes': response_bytes,
+        }
+
+    def _print_result(self, result):
+        budget = result['budget']
+        line = (
+            f"{result['url']:<60} {result['status']:>3}  p50 {result['p50_ms']:>8.1f}ms  "
+            f"p99 {result['p99_ms']:>8.1f}ms  쿼리 {result['queries']:>4}"
+            f"{'' if budget is None else f' / {budget}'}  {result['response_bytes']:>9,}B"
+        )
+        if budget is not None and result['queries'] > budget:
+            self.stdout.write(self.style.WARNING(line))
+        elif result['status'] >= 400:
+            self.stdout.write(self.style.ERROR(line))
+        else:
+            self.stdout.write(line)
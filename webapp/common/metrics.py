@@ -0,0 +1,163 @@
+"""
+뷰 단위 요청 메트릭 수집
+쿼리 수, SQL 시간, 전체 처리 시간, 응답 크기를 최근 구간(rolling window)
+히스토그램으로 보관하고 Prometheus 텍스트 형식으로 출력합니다.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 히스토그램 버킷 (상한값)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class RollingHistogram:
+    """
+    최근 window_sec 동안의 관측값만 집계하는 히스토그램
+    window_sec을 slots개 구간으로 나누어 오래된 구간은 재사용 시 초기화합니다.
+    """
+
+    def __init__(self, buckets: Iterable[float], window_sec: int = 300, slots: int = 5):
+        self.buckets = tuple(buckets)
+        self.slots = slots
+        self.slot_sec = window_sec / slots
+        # [구간번호, 버킷별 건수, 합계, 건수]
+        self._slots = [[-1, [0] * (len(self.buckets) + 1), 0.0, 0] for _ in range(slots)]
+
+    def observe(self, value: float, now: Optional[float] = None):
+        """관측값 추가 (호출자가 잠금을 보장)"""
+        epoch = int((now if now is not None else time.monotonic()) // self.slot_sec)
+        slot = self._slots[epoch % self.slots]
+        if slot[0] != epoch:
+            slot[0] = epoch
+            slot[1] = [0] * (len(self.buckets) + 1)
+            slot[2] = 0.0
+            slot[3] = 0
+
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        slot[1][index] += 1
+        slot[2] += value
+        slot[3] += 1
+
+    def snapshot(self, now: Optional[float] = None) -> Tuple[List[int], float, int]:
+        """(누적 버킷 건수, 합계, 건수) 반환"""
+        epoch = int((now if now is not None else time.monotonic()) // self.slot_sec)
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        count = 0
+        for slot_epoch, slot_counts, slot_sum, slot_count in self._slots:
+            if epoch - self.slots < slot_epoch <= epoch:
+                for i, c in enumerate(slot_counts):
+                    counts[i] += c
+                total += slot_sum
+                count += slot_count
+
+        cumulative = []
+        running = 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return cumulative, total, count
+
+
+class ViewMetricsRegistry:
+    """뷰별 요청 메트릭 저장소 (프로세스 단위)"""
+
+    SERIES = {
+        'queries': ('svcmon_view_queries', 'SQL queries per request', QUERY_COUNT_BUCKETS),
+        'sql_seconds': ('svcmon_view_sql_seconds', 'SQL execution time per request', SECONDS_BUCKETS),
+        'duration_seconds': ('svcmon_view_duration_seconds', 'Total request time', SECONDS_BUCKETS),
+        'response_bytes': ('svcmon_view_response_bytes', 'Response body size', BYTES_BUCKETS),
+    }
+
+    def __init__(self, window_sec: int = 300):
+        self.window_sec = window_sec
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], RollingHistogram] = {}
+        self._requests: Dict[Tuple[str, int], int] = {}
+        self._budget_exceeded: Dict[str, int] = {}
+
+    def record(self, view_name: str, status_code: int, queries: int, sql_seconds: float,
+               duration_seconds: float, response_bytes: Optional[int], over_budget: bool = False):
+        """요청 1건 기록"""
+        now = time.monotonic()
+        values = {
+            'queries': queries,
+            'sql_seconds': sql_seconds,
+            'duration_seconds': duration_seconds,
+            'response_bytes': response_bytes,
+        }
+        with self._lock:
+            for series, value in values.items():
+                if value is None:
+                    continue
+                key = (series, view_name)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = RollingHistogram(self.SERIES[series][2], window_sec=self.window_sec)
+                    self._histograms[key] = histogram
+                histogram.observe(value, now)
+
+            request_key = (view_name, status_code)
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            if over_budget:
+                self._budget_exceeded[view_name] = self._budget_exceeded.get(view_name, 0) + 1
+
+    def reset(self):
+        """모든 메트릭 초기화"""
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+            self._budget_exceeded.clear()
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        now = time.monotonic()
+        lines = []
+        with self._lock:
+            lines.append('# HELP svcmon_view_requests_total Requests handled per view and status code')
+            lines.append('# TYPE svcmon_view_requests_total counter')
+            for (view_name, status_code), count in sorted(self._requests.items()):
+                lines.append(
+                    f'svcmon_view_requests_total{{view="{_escape(view_name)}",status="{status_code}"}} {count}'
+                )
+
+            lines.append('# HELP svcmon_view_query_budget_exceeded_total Requests over the per-view query budget')
+            lines.append('# TYPE svcmon_view_query_budget_exceeded_total counter')
+            for view_name, count in sorted(self._budget_exceeded.items()):
+                lines.append(
+                    f'svcmon_view_query_budget_exceeded_total{{view="{_escape(view_name)}"}} {count}'
+                )
+
+            for series, (metric, help_text, buckets) in self.SERIES.items():
+                lines.append(f'# HELP {metric} {help_text} (last {self.window_sec}s)')
+                lines.append(f'# TYPE {metric} histogram')
+                for (key_series, view_name), histogram in sorted(self._histograms.items()):
+                    if key_series != series:
+                        continue
+                    label = f'view="{_escape(view_name)}"'
+                    cumulative, total, count = histogram.snapshot(now)
+                    for bound, value in zip(buckets, cumulative):
+                        lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {value}')
+                    lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {cumulative[-1]}')
+                    lines.append(f'{metric}_sum{{{label}}} {total:.6f}')
+                    lines.append(f'{metric}_count{{{label}}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    """Prometheus 레이블 값 이스케이프"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# 글로벌 레지스트리 인스턴스
+view_metrics = ViewMetricsRegistry()
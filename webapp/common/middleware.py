@@ -0,0 +1,141 @@
+"""
+공통 미들웨어
+"""
+
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from common.metrics import view_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PollingSessionMiddleware(SessionMiddleware):
+    """
+    폴링 API 요청에서는 세션 저장을 건너뛰는 세션 미들웨어
+
+    대시보드 화면은 5~10초마다 API를 호출하므로 SESSION_SAVE_EVERY_REQUEST가
+    켜져 있으면 매 요청마다 세션 행이 DB에 다시 기록됩니다.
+    SESSION_SKIP_SAVE_PATH_PREFIXES에 해당하는 요청은 세션이 실제로
+    변경된 경우에만 저장하고, 그 외 요청은 기존 동작을 그대로 따릅니다.
+    """
+
+    def process_response(self, request, response):
+        session = getattr(request, 'session', None)
+        if session is not None and not session.modified and self._is_polling_request(request):
+            if session.accessed:
+                patch_vary_headers(response, ('Cookie',))
+            return response
+        return super().process_response(request, response)
+
+    @staticmethod
+    def _is_polling_request(request):
+        """폴링 API 경로 여부"""
+        prefixes = getattr(settings, 'SESSION_SKIP_SAVE_PATH_PREFIXES', ())
+        return any(request.path.startswith(prefix) for prefix in prefixes)
+
+
+class _QueryCounter:
+    """connection.execute_wrapper용 쿼리 수/시간 집계기"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class QueryMetricsMiddleware:
+    """
+    뷰별 쿼리 수, SQL 시간, 전체 처리 시간, 응답 크기 수집 미들웨어
+
+    수집 결과는 common.metrics.view_metrics에 최근 구간 히스토그램으로 보관되며
+    관리자 전용 /metrics/ 뷰에서 조회할 수 있습니다.
+    VIEW_QUERY_BUDGETS에 정의된 쿼리 수를 넘으면 경고 로그를 남깁니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+            return self.get_response(request)
+
+        counter = _QueryCounter()
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view_name = resolver_match.view_name if resolver_match else 'unresolved'
+
+        response_bytes = None
+        if not getattr(response, 'streaming', False):
+            response_bytes = len(response.content)
+
+        budget = getattr(settings, 'VIEW_QUERY_BUDGETS', {}).get(view_name)
+        over_budget = budget is not None and counter.count > budget
+        if over_budget:
+            logger.warning(
+                f"쿼리 예산 초과: {view_name} - {counter.count}개 (예산 {budget}개), "
+                f"SQL {counter.seconds * 1000:.1f}ms / 전체 {duration * 1000:.1f}ms"
+            )
+
+        view_metrics.record(
+            view_name=view_name,
+            status_code=response.status_code,
+            queries=counter.count,
+            sql_seconds=counter.seconds,
+            duration_seconds=duration,
+            response_bytes=response_bytes,
+            over_budget=over_budget,
+        )
+        return response
+
+
+class StatusPageWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    상태 페이지 스냅샷(STATIC_ROOT/status/)을 함께 서빙하는 WhiteNoise 미들웨어
+
+    WhiteNoise는 운영 모드에서 시작 시점의 파일 목록과 크기/수정시각 헤더를 고정해 두므로,
+    주기적으로 교체되는 스냅샷 파일은 요청마다 파일 정보를 다시 읽어 서빙합니다.
+    브라우저는 no-cache로 매번 재검증하고, 바뀌지 않았으면 304를 받습니다.
+    """
+
+    STATUS_PAGE_FILES = ('index.html', 'status.json')
+
+    def __init__(self, get_response=None, settings=settings):
+        # 부모 초기화 중 add_cache_headers가 호출되므로 경로를 먼저 설정
+        self.status_page_root = os.path.join(settings.STATIC_ROOT or '', settings.STATUS_PAGE_SUBDIR)
+        super().__init__(get_response, settings)
+        self.status_page_prefix = f'{self.static_prefix}{settings.STATUS_PAGE_SUBDIR}/'
+
+    def __call__(self, request):
+        path = request.path_info
+        if self.static_root and path.startswith(self.status_page_prefix):
+            name = path[len(self.status_page_prefix):] or 'index.html'
+            file_path = os.path.join(self.status_page_root, name)
+            if name in self.STATUS_PAGE_FILES and os.path.isfile(file_path):
+                return self.serve(self.get_static_file(file_path, path), request)
+        return super().__call__(request)
+
+    def add_cache_headers(self, headers, path, url):
+        if os.path.dirname(path) == self.status_page_root:
+            headers['Cache-Control'] = 'no-cache'
+            return
+        super().add_cache_headers(headers, path, url)
@@ -0,0 +1,98 @@
+"""
+키셋(커서) 페이지네이션
+(정렬 필드, id) 기준으로 다음/이전 페이지를 조회하므로 COUNT(*)와 OFFSET 스캔이 없고
+뒤쪽 페이지도 첫 페이지와 같은 비용으로 조회됩니다.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import Q
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def encode_cursor(value: datetime, pk: int) -> str:
+    """(시각, id)를 URL에 그대로 쓸 수 있는 커서 문자열로 변환"""
+    microseconds = (value - EPOCH) // timedelta(microseconds=1)
+    return f"{microseconds}_{pk}"
+
+
+def decode_cursor(cursor: str):
+    """커서 문자열을 (시각, id)로 변환, 형식이 잘못되면 None"""
+    try:
+        microseconds, pk = cursor.split('_', 1)
+        return EPOCH + timedelta(microseconds=int(microseconds)), int(pk)
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+
+class KeysetPage:
+    """키셋 페이지 (템플릿에서 Page처럼 순회)"""
+
+    def __init__(self, object_list, has_next, has_previous, field):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.field = field
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        """다음(더 오래된) 페이지 커서"""
+        if not self.has_next or not self.object_list:
+            return None
+        last = self.object_list[-1]
+        return encode_cursor(getattr(last, self.field), last.pk)
+
+    @property
+    def previous_cursor(self):
+        """이전(더 최신) 페이지 커서"""
+        if not self.has_previous or not self.object_list:
+            return None
+        first = self.object_list[0]
+        return encode_cursor(getattr(first, self.field), first.pk)
+
+
+class KeysetPaginator:
+    """
+    (field, id) 내림차순 키셋 페이지네이터
+
+    before 커서보다 오래된 행(다음 페이지) 또는 after 커서보다 최신 행(이전 페이지)을
+    per_page + 1건만 조회해 다음 페이지 존재 여부를 판단합니다.
+    필터는 queryset에 그대로 적용되어 seek 조건과 함께 인덱스에서 처리됩니다.
+    """
+
+    def __init__(self, queryset, per_page, field='checked_at'):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.field = field
+
+    def page(self, before=None, after=None):
+        before_key = decode_cursor(before) if before else None
+        after_key = decode_cursor(after) if after else None
+        field = self.field
+
+        if after_key:
+            value, pk = after_key
+            rows = list(
+                self.queryset
+                .filter(Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk}))
+                .order_by(field, 'pk')[:self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            rows.reverse()
+            return KeysetPage(rows, has_next=True, has_previous=has_previous, field=field)
+
+        queryset = self.queryset
+        if before_key:
+            value, pk = before_key
+            queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk}))
+        rows = list(queryset.order_by(f'-{field}', '-pk')[:self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        return KeysetPage(rows[:self.per_page], has_next=has_next, has_previous=bool(before_key), field=field)
@@ -0,0 +1,57 @@
+"""
+테스트 보조 도구
+뷰별 쿼리 수 예산(VIEW_QUERY_BUDGETS)을 테스트에서 검증할 때 사용합니다.
+
+    class DashboardQueryTests(QueryBudgetMixin, TestCase):
+        def test_home(self):
+            self.client.force_login(self.user)
+            self.assertViewQueryBudget('dashboard:home')
+
+        def test_chart(self):
+            with assert_max_queries(5):
+                self.client.get('/api/endpoint/1/chart/')
+"""
+
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+
+
+@contextmanager
+def assert_max_queries(max_queries, using='default'):
+    """블록 안에서 실행된 쿼리 수가 max_queries 이하인지 검증"""
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    executed = len(context)
+    if executed > max_queries:
+        queries = '\n'.join(
+            f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, start=1)
+        )
+        raise AssertionError(
+            f"쿼리 {executed}개가 실행되었습니다 (최대 {max_queries}개 허용).\n{queries}"
+        )
+
+
+class QueryBudgetMixin:
+    """TestCase용 쿼리 예산 검증 믹스인 (self.client 사용)"""
+
+    def assertViewQueryBudget(self, view_name, args=None, kwargs=None, max_queries=None,
+                              method='get', data=None):
+        """
+        뷰 하나를 호출하고 쿼리 수가 예산 이내인지 검증합니다.
+        max_queries가 없으면 settings.VIEW_QUERY_BUDGETS의 값을 사용합니다.
+        """
+        url = reverse(view_name, args=args, kwargs=kwargs)
+        resolved_name = resolve(url).view_name
+        if max_queries is None:
+            max_queries = getattr(settings, 'VIEW_QUERY_BUDGETS', {}).get(resolved_name)
+        if max_queries is None:
+            raise AssertionError(f"{resolved_name}의 쿼리 예산이 VIEW_QUERY_BUDGETS에 없습니다.")
+
+        with assert_max_queries(max_queries):
+            response = getattr(self.client, method)(url, data=data)
+        return response
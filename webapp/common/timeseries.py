@@ -0,0 +1,88 @@
+"""
+시계열 다운샘플링 (NumPy)
+긴 기간의 응답시간을 차트에 그릴 수 있는 점 개수로 줄입니다.
+- aggregate_buckets: 고정 간격 버킷별 최소/평균/최대
+- lttb: 모양을 유지하는 Largest-Triangle-Three-Buckets 점 선택
+"""
+
+import numpy as np
+
+
+def aggregate_buckets(times, totals, errors, mins, maxs, sums, counts, start, end, points):
+    """
+    [start, end) 구간을 points개 버킷으로 나누어 최소/평균/최대 응답시간과 건수 집계
+
+    원본 체크는 totals=1, mins=maxs=sums=응답시간, counts=1(응답시간 없으면 0)로,
+    시간별 집계 행은 행의 건수/최소/최대/합계를 그대로 넘기면 같은 방식으로 합쳐집니다.
+    times, start, end는 epoch 초 단위입니다. 데이터가 없는 버킷은 제외합니다.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if times.size == 0 or points <= 0 or end <= start:
+        return []
+
+    width = (end - start) / points
+    index = np.clip(((times - start) // width).astype(np.int64), 0, points - 1)
+    counts = np.asarray(counts, dtype=np.float64)
+
+    total = np.bincount(index, weights=np.asarray(totals, dtype=np.float64), minlength=points)
+    error_total = np.bincount(index, weights=np.asarray(errors, dtype=np.float64), minlength=points)
+    latency_count = np.bincount(index, weights=counts, minlength=points)
+    latency_sum = np.bincount(index, weights=np.asarray(sums, dtype=np.float64), minlength=points)
+
+    has_latency = counts > 0
+    bucket_min = np.full(points, np.inf)
+    bucket_max = np.full(points, -np.inf)
+    np.minimum.at(bucket_min, index[has_latency], np.asarray(mins, dtype=np.float64)[has_latency])
+    np.maximum.at(bucket_max, index[has_latency], np.asarray(maxs, dtype=np.float64)[has_latency])
+
+    result = []
+    for i in np.flatnonzero(total):
+        has_value = latency_count[i] > 0
+        result.append({
+            't': float(start + width * i),
+            'min': int(bucket_min[i]) if has_value else None,
+            'avg': round(float(latency_sum[i] / latency_count[i]), 1) if has_value else None,
+            'max': int(bucket_max[i]) if has_value else None,
+            'count': int(total[i]),
+            'errors': int(error_total[i]),
+        })
+    return result
+
+
+def lttb(times, values, points):
+    """
+    Largest-Triangle-Three-Buckets로 points개 점의 인덱스 선택
+
+    첫 점과 마지막 점은 항상 포함하고, 나머지 버킷마다 이전 선택점과
+    다음 버킷 평균점으로 만든 삼각형의 넓이가 가장 큰 점을 고릅니다.
+    """
+    x = np.asarray(times, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+    n = x.size
+    if points >= n or points < 3:
+        return np.arange(n)
+
+    # 내부 점(첫/마지막 제외)을 points - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    selected = np.empty(points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # 다음 버킷 평균점 (마지막 버킷은 마지막 점)
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x = x[next_lo:next_hi].mean()
+            avg_y = y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs(
+            (x[previous] - avg_x) * (y[lo:hi] - y[previous])
+            - (x[previous] - x[lo:hi]) * (avg_y - y[previous])
+        )
+        previous = lo + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
@@ -0,0 +1,19 @@
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import HttpResponse
+
+from .metrics import view_metrics
+
+
+def is_admin(user):
+    """관리자 권한 체크"""
+    return user.is_authenticated and user.is_admin()
+
+
+@login_required
+@user_passes_test(is_admin)
+def metrics_view(request):
+    """요청 메트릭 (Prometheus 텍스트 형식, 관리자 전용)"""
+    return HttpResponse(
+        view_metrics.render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -1,6 +1,21 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dashboard'
+    
+    def ready(self):
+        """STATUS_PAGE_ENABLED일 때만 웹 프로세스 안에서 상태 페이지 스냅샷 서비스 시작"""
+        if not settings.STATUS_PAGE_ENABLED:
+            return
+        try:
+            from .status_page import start_status_page_service
+            start_status_page_service()
+        except Exception:
+            logger.exception("상태 페이지 서비스 시작 중 오류")
@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from dashboard.status_page import status_page_dir, write_status_page
+
+
+class Command(BaseCommand):
+    help = '공개 상태 페이지 스냅샷(index.html, status.json)을 정적 파일 디렉터리에 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true',
+                            help='STATUS_PAGE_INTERVAL_SECONDS마다 계속 생성 (웹서버와 별도 프로세스로 실행할 때)')
+        parser.add_argument('--interval', type=int, help='생성 주기(초), 기본값: STATUS_PAGE_INTERVAL_SECONDS')
+        parser.add_argument('--output', type=str, help='출력 디렉터리 (기본값: STATIC_ROOT/status)')
+
+    def handle(self, *args, **options):
+        directory = options['output'] or status_page_dir()
+        interval = options['interval'] or settings.STATUS_PAGE_INTERVAL_SECONDS
+
+        while True:
+            started = time.monotonic()
+            tree = write_status_page(directory)
+            endpoint_count = sum(sum(group['counts'].values()) for group in tree['network_groups'])
+            self.stdout.write(
+                f'{tree["generated_at"]:%Y-%m-%d %H:%M:%S} 상태 페이지 생성: 전체 {tree["status"]}, '
+                f'엔드포인트 {endpoint_count}개 ({(time.monotonic() - started) * 1000:.0f}ms) → {directory}'
+            )
+            if not options['loop']:
+                return
+            close_old_connections()
+            time.sleep(interval)
@@ -0,0 +1,199 @@
+"""
+공개 상태 페이지 스냅샷
+망구분 → 도메인 → 엔드포인트 상태 트리를 주기적으로 HTML/JSON 파일로 만들어
+STATIC_ROOT/status/ 아래에 원자적으로 교체합니다.
+파일은 WhiteNoise가 바로 서빙하므로 조회하는 사람이 많아도 DB 쿼리가 발생하지 않습니다.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from monitoring.models import NetworkGroup, Domain, Endpoint, Rollup
+
+logger = logging.getLogger(__name__)
+
+STATUS_ORDER = {'GREEN': 0, 'AMBER': 1, 'RED': 2}
+REPLACE_RETRIES = 5
+
+
+def status_page_dir():
+    """스냅샷 파일을 쓸 디렉터리"""
+    return os.path.join(settings.STATIC_ROOT, settings.STATUS_PAGE_SUBDIR)
+
+
+def build_status_tree(now=None):
+    """
+    상태 트리 생성 (롤업 테이블 기준, 쿼리 4개)
+
+    엔드포인트 상태는 usp_record_check가 갱신하는 롤업을 그대로 사용합니다.
+    (콘솔이 멈춰 신호가 끊기면 AMBER 서비스가 N/A 체크를 기록하므로 롤업에도 반영됨)
+    도메인/망구분 상태는 하위 항목 중 가장 나쁜 상태입니다.
+    """
+    now = now or timezone.now()
+    rollups = {
+        ref_id: (status, reason)
+        for ref_id, status, reason in Rollup.objects.filter(level='endpoint').values_list(
+            'ref_id', 'last_status', 'last_reason'
+        )
+    }
+
+    endpoints_by_domain = {}
+    for endpoint_id, domain_id, url in (
+        Endpoint.objects.filter(is_enabled=True).order_by('url').values_list('id', 'domain_id', 'url')
+    ):
+        status, reason = rollups.get(endpoint_id, ('AMBER', '체크 이력 없음'))
+        endpoints_by_domain.setdefault(domain_id, []).append({
+            'id': endpoint_id,
+            'url': url,
+            'status': status,
+            'reason': reason,
+        })
+
+    domains_by_group = {}
+    for domain_id, network_group_id, domain, site_name in (
+        Domain.objects.filter(is_active=True).order_by('domain').values_list('id', 'network_group_id', 'domain', 'site_name')
+    ):
+        endpoints = endpoints_by_domain.get(domain_id)
+        if not endpoints:
+            continue
+        domains_by_group.setdefault(network_group_id, []).append({
+            'id': domain_id,
+            'domain': domain,
+            'site_name': site_name,
+            'status': _worst_status(endpoints),
+            'endpoints': endpoints,
+        })
+
+    network_groups = []
+    for network_group_id, name in NetworkGroup.objects.order_by('name').values_list('id', 'name'):
+        domains = domains_by_group.get(network_group_id, [])
+        endpoints = [endpoint for domain in domains for endpoint in domain['endpoints']]
+        network_groups.append({
+            'id': network_group_id,
+            'name': name,
+            'status': _worst_status(domains),
+            'counts': {
+                status: sum(1 for endpoint in endpoints if endpoint['status'] == status)
+                for status in STATUS_ORDER
+            },
+            'domains': domains,
+        })
+
+    return {
+        'generated_at': timezone.localtime(now),
+        'status': _worst_status(network_groups),
+        'network_groups': network_groups,
+    }
+
+
+def _worst_status(items):
+    """하위 항목 중 가장 나쁜 상태 (하위 항목이 없으면 AMBER)"""
+    if not items:
+        return 'AMBER'
+    return max((item['status'] for item in items), key=STATUS_ORDER.get)
+
+
+def write_status_page(directory=None):
+    """상태 트리를 index.html/status.json으로 저장, 반환값: 트리"""
+    directory = directory or status_page_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    tree = build_status_tree()
+    html = render_to_string('dashboard/status_page.html', {
+        'tree': tree,
+        'refresh_seconds': settings.STATUS_PAGE_INTERVAL_SECONDS,
+    })
+    _write_atomic(directory, 'status.json', json.dumps(tree, cls=DjangoJSONEncoder, ensure_ascii=False))
+    _write_atomic(directory, 'index.html', html)
+    return tree
+
+
+def _write_atomic(directory, name, content):
+    """
+    같은 디렉터리의 임시 파일에 쓴 뒤 교체 (읽는 쪽은 이전 파일 또는 새 파일 전체만 보게 됨)
+
+    Windows에서는 파일을 서빙 중이면 교체가 잠시 거부될 수 있어 몇 번 재시도합니다.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(temp_path, 0o644)
+        for attempt in range(REPLACE_RETRIES):
+            try:
+                os.replace(temp_path, os.path.join(directory, name))
+                return
+            except PermissionError:
+                if attempt == REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(0.1 * (attempt + 1))
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class StatusPageService:
+    """
+    상태 페이지 스냅샷 서비스
+    백그라운드 스레드에서 STATUS_PAGE_INTERVAL_SECONDS마다 스냅샷을 다시 씁니다.
+    """
+
+    def __init__(self):
+        self.is_running = False
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """백그라운드 스냅샷 서비스 시작"""
+        if self.is_running:
+            logger.warning("상태 페이지 서비스가 이미 실행 중입니다.")
+            return
+
+        self.is_running = True
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+        logger.info("상태 페이지 서비스가 시작되었습니다.")
+
+    def stop(self):
+        """백그라운드 스냅샷 서비스 중지"""
+        self.is_running = False
+        self.stop_event.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5)
+        logger.info("상태 페이지 서비스가 중지되었습니다.")
+
+    def _loop(self):
+        """메인 루프"""
+        while self.is_running:
+            try:
+                write_status_page()
+            except Exception:
+                logger.exception("상태 페이지 생성 중 오류")
+            finally:
+                close_old_connections()
+            self.stop_event.wait(settings.STATUS_PAGE_INTERVAL_SECONDS)
+
+
+# 글로벌 서비스 인스턴스
+status_page_service = StatusPageService()
+
+
+def start_status_page_service():
+    """상태 페이지 서비스 시작"""
+    status_page_service.start()
+
+
+def stop_status_page_service():
+    """상태 페이지 서비스 중지"""
+    status_page_service.stop()
@@ -1,3 +1,92 @@
+import unittest
+from datetime import timedelta, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+from common.dbtime import from_stored, stored_now
+from common.testing import QueryBudgetMixin, assert_max_queries
+from monitoring.models import NetworkGroup, Domain, Endpoint, Check
+
+
+class DashboardQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """대시보드 화면/폴링 API 쿼리 수가 VIEW_QUERY_BUDGETS 이내인지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser('admin', 'admin@jnu.ac.kr', '010-0000-0000', 'pw')
+        for g in range(3):
+            group = NetworkGroup.objects.create(name=f'TEST-{g}')
+            for d in range(3):
+                domain = Domain.objects.create(
+                    network_group=group, domain=f'd{g}-{d}.jnu.ac.kr', site_name=f'사이트 {g}-{d}', owner_name='담당자'
+                )
+                for e in range(3):
+                    endpoint = Endpoint.objects.create(domain=domain, url=f'https://{domain.domain}/health/{e}')
+                    Check.objects.create(endpoint=endpoint, status_code=200 if e else 500, latency_ms=30)
+        cls.group = group
+        cls.domain = domain
+        cls.endpoint = endpoint
+
+    def setUp(self):
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+        self.client.force_login(self.user, backend='django.contrib.auth.backends.ModelBackend')
+
+    @unittest.expectedFailure  # 망구분/도메인별 N+1, VIEW_QUERY_BUDGETS 참고
+    def test_home(self):
+        response = self.assertViewQueryBudget('dashboard:home')
+        self.assertEqual(response.status_code, 200)
+
+    @unittest.expectedFailure  # 망구분/도메인별 N+1
+    def test_dashboard_api(self):
+        response = self.assertViewQueryBudget('dashboard:dashboard_api')
+        self.assertEqual(response.status_code, 200)
+
+    @unittest.expectedFailure  # 도메인별 N+1
+    def test_network_detail(self):
+        response = self.assertViewQueryBudget('dashboard:network_detail', kwargs={'network_group_id': self.group.id})
+        self.assertEqual(response.status_code, 200)
+
+    def test_domain_detail_api(self):
+        response = self.assertViewQueryBudget('dashboard:domain_detail_api', kwargs={'domain_id': self.domain.id})
+        self.assertEqual(response.status_code, 200)
+
+    def test_endpoint_series_api(self):
+        response = self.assertViewQueryBudget('dashboard:endpoint_series_api', kwargs={'endpoint_id': self.endpoint.id})
+        self.assertEqual(response.status_code, 200)
+
+    def test_assert_max_queries_reports_overrun(self):
+        with self.assertRaises(AssertionError):
+            with assert_max_queries(1):
+                list(NetworkGroup.objects.all())
+                list(Domain.objects.all())
+
+
+class EndpointSeriesApiTests(TestCase):
+    """시계열 API 기본 구간/시각이 저장 기준(KST) 시각을 쓰는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        group = NetworkGroup.objects.create(name='TEST')
+        domain = Domain.objects.create(network_group=group, domain='d.jnu.ac.kr', site_name='사이트', owner_name='담당자')
+        cls.endpoint = Endpoint.objects.create(domain=domain, url='https://d.jnu.ac.kr/health')
+        now = stored_now().replace(microsecond=0)
+        cls.checked = [now - timedelta(hours=hours) for hours in (25, 23, 2)]
+        for checked_at in cls.checked:
+            Check.objects.create(endpoint=cls.endpoint, status_code=200, latency_ms=30, checked_at=checked_at)
+
+    def test_default_window_includes_latest_checks(self):
+        url = reverse('dashboard:endpoint_series_api', kwargs={'endpoint_id': self.endpoint.id})
+        data = self.client.get(url, {'mode': 'lttb'}).json()
+        self.assertEqual(data['rows'], 2)
+        self.assertEqual([point['t'] for point in data['series']], [from_stored(t).isoformat() for t in self.checked[1:]])
 
-# Create your tests here.
+    def test_explicit_range(self):
+        url = reverse('dashboard:endpoint_series_api', kwargs={'endpoint_id': self.endpoint.id})
+        # 시간대가 없으면 현지 시각, 있으면 KST로 바꾸어 비교
+        start = (self.checked[0] - timedelta(minutes=1)).replace(tzinfo=None).isoformat()
+        end = from_stored(self.checked[1]).astimezone(dt_timezone.utc).isoformat()
+        data = self.client.get(url, {'mode': 'lttb', 'from': start, 'to': end}).json()
+        self.assertEqual(data['rows'], 1)
+        self.assertEqual(data['from'], from_stored(self.checked[0] - timedelta(minutes=1)).isoformat())
@@ -16,4 +16,5 @@ urlpatterns = [
     path('api/network/<int:network_group_id>/detail/', views.network_detail_api_view, name='network_detail_api'),
     path('api/domain/<int:domain_id>/detail/', views.domain_detail_api_view, name='domain_detail_api'),
     path('api/endpoint/<int:endpoint_id>/chart/', views.endpoint_chart_api_view, name='endpoint_chart_api'),
+    path('api/endpoint/<int:endpoint_id>/series/', views.endpoint_series_api_view, name='endpoint_series_api'),
 ]
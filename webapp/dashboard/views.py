@@ -8,6 +8,9 @@ from django.core.paginator import Paginator
 from datetime import timedelta
 from monitoring.models import NetworkGroup, Domain, Endpoint, Check, Rollup
 from accounts.models import User
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 def calculate_endpoint_status(endpoint, current_time):
@@ -518,7 +521,7 @@ def endpoint_chart_api_view(request, endpoint_id):
     with connection.cursor() as cursor:
         cursor.execute("SELECT TOP 3 checked_at, status_code FROM [dbo].[checks] WHERE endpoint_id = %s ORDER BY checked_at DESC", [endpoint_id])
         raw_results = cursor.fetchall()
-        print(f"[DEBUG] Raw SQL 결과 (endpoint {endpoint_id}): {raw_results}")
+        logger.debug(f"Raw SQL 결과 (endpoint {endpoint_id}): {raw_results}")
     
     # 차트용 데이터 - Raw SQL로 직접 가져오기 (캐시 문제 해결)
     with connection.cursor() as cursor:
@@ -530,7 +533,7 @@ def endpoint_chart_api_view(request, endpoint_id):
             ORDER BY checked_at DESC
         """, [endpoint_id])
         raw_chart_data = cursor.fetchall()
-        print(f"[DEBUG] Raw SQL 차트 데이터 (최신 3개): {raw_chart_data[:3]}")
+        logger.debug(f"Raw SQL 차트 데이터 (최신 3개): {raw_chart_data[:3]}")
     
     # Raw 데이터를 Django 객체처럼 변환
     class MockCheck:
@@ -606,3 +609,118 @@ def endpoint_chart_api_view(request, endpoint_id):
     }
     
     return JsonResponse(data)
+
+
+# 이 건수 이하로 예상되는 기간은 원본 체크, 그 이상은 시간별 집계에서 조회
+SERIES_RAW_MAX_ROWS = 20000
+SERIES_DEFAULT_POINTS = 300
+SERIES_MAX_POINTS = 2000
+
+
+@csrf_exempt
+def endpoint_series_api_view(request, endpoint_id):
+    """
+    엔드포인트 응답시간 시계열 API (임의 기간, 다운샘플링)
+    
+    파라미터: from/to (ISO 8601, 기본 최근 24시간), points (기본 300), mode (minmax 또는 lttb)
+    짧은 기간은 원본 체크를, 긴 기간은 시간별 집계(check_hourly_stats)를 읽어 NumPy로 줄입니다.
+    """
+    from datetime import datetime, timezone as dt_timezone
+    from common.dbtime import from_stored, stored_now
+    from common.timeseries import aggregate_buckets, lttb
+    from monitoring.models import CheckHourlyStat
+    
+    endpoint = get_object_or_404(Endpoint, id=endpoint_id)
+    
+    # 조회 구간은 저장 기준(KST 시각 + UTC tzinfo)으로 비교
+    end = _parse_series_time(request.GET.get('to')) or stored_now()
+    start = _parse_series_time(request.GET.get('from')) or end - timedelta(hours=24)
+    if start >= end:
+        return JsonResponse({'error': 'from은 to보다 이전이어야 합니다.'}, status=400)
+    try:
+        points = min(max(int(request.GET.get('points', SERIES_DEFAULT_POINTS)), 10), SERIES_MAX_POINTS)
+    except ValueError:
+        return JsonResponse({'error': 'points는 숫자여야 합니다.'}, status=400)
+    mode = request.GET.get('mode', 'minmax')
+    if mode not in ('minmax', 'lttb'):
+        return JsonResponse({'error': 'mode는 minmax 또는 lttb여야 합니다.'}, status=400)
+    
+    range_sec = (end - start).total_seconds()
+    expected_rows = range_sec / max(endpoint.poll_interval_sec, 1)
+    
+    if expected_rows <= SERIES_RAW_MAX_ROWS:
+        source = 'raw'
+        rows = list(
+            endpoint.checks
+            .filter(checked_at__gte=start, checked_at__lt=end)
+            .order_by('checked_at')
+            .values_list('checked_at', 'status_code', 'error', 'latency_ms')
+        )
+        times = [row[0].timestamp() for row in rows]
+        errors = [0 if row[1] is not None and 200 <= row[1] < 300 and row[2] is None else 1 for row in rows]
+        latencies = [row[3] if row[3] is not None else 0 for row in rows]
+        totals = [1] * len(rows)
+        counts = [0 if row[3] is None else 1 for row in rows]
+        mins = maxs = sums = latencies
+    else:
+        source = 'hourly'
+        hour_start = start.replace(minute=0, second=0, microsecond=0)
+        rows = list(
+            CheckHourlyStat.objects
+            .filter(endpoint=endpoint, bucket_start__gte=hour_start, bucket_start__lt=end)
+            .order_by('bucket_start')
+            .values_list('bucket_start', 'total_count', 'error_count',
+                         'latency_min', 'latency_max', 'latency_sum', 'latency_count')
+        )
+        times = [row[0].timestamp() for row in rows]
+        totals = [row[1] for row in rows]
+        errors = [row[2] for row in rows]
+        mins = [row[3] or 0 for row in rows]
+        maxs = [row[4] or 0 for row in rows]
+        sums = [row[5] for row in rows]
+        counts = [row[6] for row in rows]
+    
+    def to_local(epoch):
+        return from_stored(datetime.fromtimestamp(round(epoch), dt_timezone.utc)).isoformat()
+    
+    if mode == 'minmax':
+        buckets = aggregate_buckets(
+            times, totals, errors, mins, maxs, sums, counts,
+            start.timestamp(), end.timestamp(), points
+        )
+        series = [dict(bucket, t=to_local(bucket['t'])) for bucket in buckets]
+    else:
+        # 응답시간이 있는 점만 대상으로 모양 유지 선택 (집계 행은 평균값 사용)
+        values = [
+            (t, s / c, e) for t, s, c, e in zip(times, sums, counts, errors) if c
+        ]
+        selected = lttb([v[0] for v in values], [v[1] for v in values], points)
+        series = [
+            {'t': to_local(values[i][0]), 'latency': round(values[i][1], 1), 'errors': values[i][2]}
+            for i in selected
+        ]
+    
+    data = {
+        'endpoint_id': endpoint.id,
+        'from': from_stored(start).isoformat(),
+        'to': from_stored(end).isoformat(),
+        'source': source,
+        'mode': mode,
+        'rows': len(rows),
+        'series': series,
+    }
+    return JsonResponse(data)
+
+
+def _parse_series_time(value):
+    """ISO 8601 일시 문자열을 저장 기준 일시로 변환 (잘못된 값은 None)"""
+    from datetime import datetime
+    from common.dbtime import to_stored
+    
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return to_stored(parsed)
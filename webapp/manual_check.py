@@ -16,7 +16,13 @@ from django.utils import timezone
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'svcmon.settings')
 django.setup()
 
-from monitoring.models import Endpoint, Check
+from monitoring.models import Endpoint, Check, HeaderSet
+
+# 기록할 응답 헤더 (콘솔 [Http] header_allowlist 기본값과 같음)
+HEADER_ALLOWLIST = {
+    'server', 'content-type', 'cache-control', 'content-encoding', 'location', 'strict-transport-security',
+    'x-powered-by',
+}
 
 def check_endpoint(endpoint):
     """단일 엔드포인트를 체크하고 결과를 저장"""
@@ -41,7 +47,9 @@ def check_endpoint(endpoint):
         check.endpoint = endpoint
         check.status_code = response.status_code
         check.latency_ms = latency_ms
-        check.headers = str(dict(response.headers))[:4000]  # 헤더 크기 제한
+        check.header_hash = HeaderSet.store(HeaderSet.normalize({
+            name: value for name, value in response.headers.items() if name.lower() in HEADER_ALLOWLIST
+        }))
         check.error = None
         check.checked_at = timezone.now()  # 시간대 인식 datetime 사용
         check.trace_id = uuid.uuid4()  # UUID 명시적 생성
@@ -1,7 +1,7 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import (
     NetworkGroup, Domain, Endpoint, Check, 
-    Rollup, Setting, ConfigRevision, Notification
+    Rollup, Setting, ConfigRevision, Notification, Incident, ProbeAgent
 )
 
 
@@ -41,6 +41,7 @@ class EndpointAdmin(admin.ModelAdmin):
     search_fields = ['url', 'domain__domain', 'domain__site_name']
     ordering = ['domain', 'url']
     readonly_fields = ['created_at', 'updated_at']
+    raw_id_fields = ['parent']
 
 
 @admin.register(Check)
@@ -64,7 +65,7 @@ class CheckAdmin(admin.ModelAdmin):
 class RollupAdmin(admin.ModelAdmin):
     """상태롤업 관리자"""
     
-    list_display = ['level', 'ref_id', 'last_status', 'last_change_at', 'updated_at']
+    list_display = ['level', 'ref_id', 'last_status', 'suppressed_by', 'last_change_at', 'updated_at']
     list_filter = ['level', 'last_status', 'last_change_at']
     ordering = ['level', 'ref_id']
     readonly_fields = ['updated_at']
@@ -108,3 +109,44 @@ class NotificationAdmin(admin.ModelAdmin):
     def has_add_permission(self, request):
         """추가 권한 없음 (자동 생성)"""
         return False
+
+
+@admin.register(Incident)
+class IncidentAdmin(admin.ModelAdmin):
+    """장애 구간 관리자"""
+    
+    list_display = ['endpoint', 'status', 'started_at', 'ended_at', 'duration_sec', 'check_count']
+    list_filter = ['status', 'started_at']
+    search_fields = ['endpoint__url', 'first_error']
+    ordering = ['-started_at']
+    raw_id_fields = ['endpoint']
+    
+    def has_add_permission(self, request):
+        """추가 권한 없음 (자동 생성)"""
+        return False
+
+
+@admin.register(ProbeAgent)
+class ProbeAgentAdmin(admin.ModelAdmin):
+    """원격 에이전트 관리자 (토큰은 생성/재발급 시 한 번만 표시)"""
+    
+    list_display = ['name', 'network_group', 'is_active', 'last_seen_at', 'last_address', 'created_at']
+    list_filter = ['is_active', 'network_group']
+    search_fields = ['name', 'note']
+    ordering = ['name']
+    readonly_fields = ['last_seen_at', 'last_address', 'created_at', 'updated_at']
+    actions = ['reissue_token']
+    
+    def save_model(self, request, obj, form, change):
+        """신규 에이전트는 토큰 발급 후 저장"""
+        token = None if change else obj.issue_token()
+        super().save_model(request, obj, form, change)
+        if token:
+            messages.warning(request, f'{obj.name} 토큰 (다시 표시되지 않음): {token}')
+    
+    @admin.action(description='선택한 에이전트 토큰 재발급')
+    def reissue_token(self, request, queryset):
+        for agent in queryset:
+            token = agent.issue_token()
+            agent.save(update_fields=['token_hash', 'updated_at'])
+            messages.warning(request, f'{agent.name} 새 토큰 (다시 표시되지 않음): {token}')
@@ -0,0 +1,411 @@
+"""
+설정 일괄 가져오기
+CSV, JSON 행 목록, 설정 백업(export_config) JSON을 읽어 모든 행을 먼저 검증한 뒤
+기존 망구분/도메인/엔드포인트와 비교해 추가/변경분만 한 트랜잭션에서 일괄 저장합니다.
+설정 변경 이력(ConfigRevision)은 한 번만 기록되므로 콘솔 프로그램도 한 번만 다시 읽습니다.
+"""
+
+import csv
+import io
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.utils import timezone
+
+from .models import NetworkGroup, Domain, Endpoint, ConfigRevision
+
+# MSSQL 문장당 파라미터 2100개 제한 이내로 나누어 저장
+IMPORT_BATCH_SIZE = 200
+
+# 검증 오류가 많을 때 화면에 보여줄 최대 건수
+MAX_REPORTED_ERRORS = 100
+
+# CSV/JSON 행 컬럼
+IMPORT_COLUMNS = [
+    'network_group', 'network_group_note',
+    'domain', 'site_name', 'owner_name', 'owner_contact', 'is_active', 'domain_note',
+    'url', 'poll_interval_sec', 'requires_db', 'email_on_failure', 'is_enabled', 'note',
+]
+
+# 모델 필드 (행 컬럼명 → 모델 필드명)
+NETWORK_GROUP_FIELDS = {'network_group_note': 'note'}
+DOMAIN_FIELDS = {
+    'site_name': 'site_name',
+    'owner_name': 'owner_name',
+    'owner_contact': 'owner_contact',
+    'is_active': 'is_active',
+    'domain_note': 'note',
+}
+ENDPOINT_FIELDS = {
+    'poll_interval_sec': 'poll_interval_sec',
+    'requires_db': 'requires_db',
+    'email_on_failure': 'email_on_failure',
+    'is_enabled': 'is_enabled',
+    'note': 'note',
+}
+
+BOOLEAN_COLUMNS = {'is_active', 'requires_db', 'email_on_failure', 'is_enabled'}
+TRUE_VALUES = {'1', 'true', 't', 'yes', 'y', 'on', '예', 'o'}
+FALSE_VALUES = {'0', 'false', 'f', 'no', 'n', 'off', '아니오', 'x'}
+
+MAX_LENGTHS = {
+    'network_group': 100,
+    'domain': 255,
+    'site_name': 255,
+    'owner_name': 100,
+    'owner_contact': 100,
+    'url': 2000,
+}
+
+
+class ConfigImportError(Exception):
+    """파일 형식 오류 또는 행 검증 오류"""
+
+    def __init__(self, errors):
+        if isinstance(errors, str):
+            errors = [errors]
+        self.errors = errors
+        super().__init__('; '.join(errors[:3]))
+
+
+def read_rows(content, filename=''):
+    """업로드 파일 내용을 (행 번호, 행 dict) 목록으로 변환"""
+    text = _decode(content)
+    if filename.lower().endswith('.json') or text.lstrip()[:1] in ('[', '{'):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ConfigImportError(f'JSON 형식 오류: {e}')
+        return _rows_from_json(data)
+    return _rows_from_csv(text)
+
+
+def _decode(content):
+    if isinstance(content, str):
+        return content
+    # 엑셀에서 저장한 CSV(BOM 포함 UTF-8 또는 CP949) 모두 허용
+    for encoding in ('utf-8-sig', 'cp949'):
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ConfigImportError('파일 인코딩을 확인할 수 없습니다. UTF-8로 저장해주세요.')
+
+
+def _rows_from_csv(text):
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise ConfigImportError('CSV 헤더가 없습니다.')
+    fieldnames = [name.strip() for name in reader.fieldnames]
+    unknown = [name for name in fieldnames if name and name not in IMPORT_COLUMNS]
+    if unknown:
+        raise ConfigImportError(f'알 수 없는 컬럼: {", ".join(unknown)}')
+    reader.fieldnames = fieldnames
+
+    rows = []
+    for line_no, raw in enumerate(reader, start=2):
+        # 빈 셀은 "값 없음"으로 보고 기존 값을 유지
+        row = {key: value.strip() for key, value in raw.items() if key and value is not None and value.strip() != ''}
+        if row:
+            rows.append((line_no, row))
+    return rows
+
+
+def _rows_from_json(data):
+    if isinstance(data, list):
+        rows = []
+        for index, item in enumerate(data, start=1):
+            if not isinstance(item, dict):
+                raise ConfigImportError(f'{index}번째 항목이 객체가 아닙니다.')
+            unknown = [key for key in item if key not in IMPORT_COLUMNS]
+            if unknown:
+                raise ConfigImportError(f'{index}번째 항목에 알 수 없는 키: {", ".join(unknown)}')
+            rows.append((index, {key: value for key, value in item.items() if value is not None}))
+        return rows
+    if isinstance(data, dict) and 'network_groups' in data:
+        return _rows_from_export(data)
+    raise ConfigImportError('JSON은 행 목록 또는 설정 백업(network_groups/domains/endpoints) 형식이어야 합니다.')
+
+
+def _rows_from_export(data):
+    """설정 백업 JSON의 ID 참조를 이름 기반 행으로 변환"""
+    try:
+        group_names = {group['id']: group['name'] for group in data.get('network_groups', [])}
+        rows = []
+        domains = {}
+        for group in data.get('network_groups', []):
+            rows.append(('망구분', {'network_group': group['name'], 'network_group_note': group.get('note') or ''}))
+        for domain in data.get('domains', []):
+            group_name = group_names[domain['network_group_id']]
+            domains[domain['id']] = {
+                'network_group': group_name,
+                'domain': domain['domain'],
+                'site_name': domain.get('site_name'),
+                'owner_name': domain.get('owner_name'),
+                'owner_contact': domain.get('owner_contact') or '',
+                'is_active': domain.get('is_active', True),
+                'domain_note': domain.get('note') or '',
+            }
+        for domain_row in domains.values():
+            rows.append(('도메인', {key: value for key, value in domain_row.items() if value is not None}))
+        for endpoint in data.get('endpoints', []):
+            row = {
+                'network_group': domains[endpoint['domain_id']]['network_group'],
+                'domain': domains[endpoint['domain_id']]['domain'],
+                'url': endpoint['url'],
+            }
+            for column in ENDPOINT_FIELDS:
+                if endpoint.get(column) is not None:
+                    row[column] = endpoint[column]
+            rows.append(('엔드포인트', row))
+    except (KeyError, TypeError) as e:
+        raise ConfigImportError(f'설정 백업 형식 오류: {e} 참조를 찾을 수 없습니다.')
+
+    # 행 번호 대신 구분과 순번 표시
+    return [(f'{kind} {index}', row) for index, (kind, row) in enumerate(rows, start=1)]
+
+
+def _clean_row(row):
+    """행 값 검증/변환, (정리된 행, 오류 목록) 반환"""
+    cleaned = {}
+    errors = []
+    for column, value in row.items():
+        if column in BOOLEAN_COLUMNS:
+            if isinstance(value, bool):
+                cleaned[column] = value
+            elif str(value).strip().lower() in TRUE_VALUES:
+                cleaned[column] = True
+            elif str(value).strip().lower() in FALSE_VALUES:
+                cleaned[column] = False
+            else:
+                errors.append(f'{column} 값이 올바르지 않습니다: {value}')
+        elif column == 'poll_interval_sec':
+            try:
+                interval = int(value)
+            except (TypeError, ValueError):
+                errors.append(f'호출주기가 숫자가 아닙니다: {value}')
+                continue
+            if not 30 <= interval <= 3600:
+                errors.append(f'호출주기는 30~3600초여야 합니다: {interval}')
+            cleaned[column] = interval
+        else:
+            value = str(value).strip()
+            max_length = MAX_LENGTHS.get(column)
+            if max_length and len(value) > max_length:
+                errors.append(f'{column} 길이가 {max_length}자를 넘습니다.')
+            cleaned[column] = value
+
+    if not cleaned.get('network_group'):
+        errors.append('network_group 값이 없습니다.')
+    if cleaned.get('url'):
+        if not cleaned.get('domain'):
+            errors.append('url이 있는 행은 domain 값이 필요합니다.')
+        try:
+            URLValidator()(cleaned['url'])
+        except ValidationError:
+            errors.append(f'URL 형식이 올바르지 않습니다: {cleaned["url"]}')
+    return cleaned, errors
+
+
+class ImportPlan:
+    """기존 설정과 비교한 추가/변경 목록"""
+
+    def __init__(self):
+        self.network_groups_to_create = []
+        self.network_groups_to_update = []
+        self.domains_to_create = []
+        self.domains_to_update = []
+        self.endpoints_to_create = []
+        self.endpoints_to_update = []
+        self.unchanged = 0
+
+    @property
+    def has_changes(self):
+        return any([
+            self.network_groups_to_create, self.network_groups_to_update,
+            self.domains_to_create, self.domains_to_update,
+            self.endpoints_to_create, self.endpoints_to_update,
+        ])
+
+    def summary(self):
+        return {
+            'network_groups_created': len(self.network_groups_to_create),
+            'network_groups_updated': len(self.network_groups_to_update),
+            'domains_created': len(self.domains_to_create),
+            'domains_updated': len(self.domains_to_update),
+            'endpoints_created': len(self.endpoints_to_create),
+            'endpoints_updated': len(self.endpoints_to_update),
+            'unchanged': self.unchanged,
+        }
+
+    def describe(self):
+        s = self.summary()
+        return (
+            f"망구분 +{s['network_groups_created']}/~{s['network_groups_updated']}, "
+            f"도메인 +{s['domains_created']}/~{s['domains_updated']}, "
+            f"엔드포인트 +{s['endpoints_created']}/~{s['endpoints_updated']}"
+        )
+
+
+def build_plan(rows):
+    """
+    모든 행을 검증하고 기존 데이터와 비교해 ImportPlan 생성
+
+    망구분은 이름, 도메인은 (망구분, 도메인명), 엔드포인트는 (도메인, URL)로 식별합니다.
+    행에 없는 컬럼은 기존 값을 유지하고, 새로 만드는 경우에만 모델 기본값을 사용합니다.
+    오류가 하나라도 있으면 ConfigImportError를 발생시킵니다.
+    """
+    errors = []
+    groups = {}
+    domains = {}
+    endpoints = {}
+
+    for line, row in rows:
+        cleaned, row_errors = _clean_row(row)
+        if row_errors:
+            errors.extend(f'{line}행: {message}' for message in row_errors)
+            continue
+
+        group_name = cleaned['network_group']
+        groups.setdefault(group_name, {}).update(_pick(cleaned, NETWORK_GROUP_FIELDS))
+
+        if cleaned.get('domain'):
+            domain_key = (group_name, cleaned['domain'])
+            domains.setdefault(domain_key, {'line': line, 'fields': {}})['fields'].update(_pick(cleaned, DOMAIN_FIELDS))
+
+        if cleaned.get('url'):
+            endpoint_key = (group_name, cleaned['domain'], cleaned['url'])
+            if endpoint_key in endpoints:
+                errors.append(f'{line}행: 같은 도메인에 중복된 URL입니다: {cleaned["url"]} ({endpoints[endpoint_key]["line"]}행)')
+                continue
+            endpoints[endpoint_key] = {'line': line, 'fields': _pick(cleaned, ENDPOINT_FIELDS)}
+
+    if not groups and not errors:
+        errors.append('가져올 행이 없습니다.')
+
+    # 기존 데이터 (망구분 단위로 조회해 대량 IN 목록을 피함)
+    existing_groups = {group.name: group for group in NetworkGroup.objects.filter(name__in=list(groups))}
+    group_ids = [group.id for group in existing_groups.values()]
+    group_names = {group.id: name for name, group in existing_groups.items()}
+    existing_domains = {
+        (group_names[domain.network_group_id], domain.domain): domain
+        for domain in Domain.objects.filter(network_group_id__in=group_ids)
+    }
+    domain_keys = {domain.id: key for key, domain in existing_domains.items()}
+    existing_endpoints = {}
+    for endpoint in Endpoint.objects.filter(domain__network_group_id__in=group_ids).order_by('id'):
+        existing_endpoints.setdefault(domain_keys[endpoint.domain_id] + (endpoint.url,), endpoint)
+
+    # 새 도메인은 필수값 확인
+    for key, entry in domains.items():
+        if key not in existing_domains:
+            missing = [column for column in ('site_name', 'owner_name') if not entry['fields'].get(column)]
+            if missing:
+                errors.append(f'{entry["line"]}행: 새 도메인 {key[1]}에 {", ".join(missing)} 값이 필요합니다.')
+    for key, entry in endpoints.items():
+        if key[:2] not in domains and key[:2] not in existing_domains:
+            errors.append(f'{entry["line"]}행: 도메인 {key[1]}이 없습니다.')
+
+    if errors:
+        raise ConfigImportError(errors)
+
+    plan = ImportPlan()
+    now = timezone.now()
+
+    for name, fields in groups.items():
+        group = existing_groups.get(name)
+        if group is None:
+            plan.network_groups_to_create.append(NetworkGroup(name=name, **fields))
+        elif _assign(group, fields, now):
+            plan.network_groups_to_update.append(group)
+        else:
+            plan.unchanged += 1
+
+    for (group_name, domain_name), entry in domains.items():
+        domain = existing_domains.get((group_name, domain_name))
+        if domain is None:
+            domain = Domain(domain=domain_name, **entry['fields'])
+            domain.group_name = group_name
+            plan.domains_to_create.append(domain)
+        elif _assign(domain, entry['fields'], now):
+            plan.domains_to_update.append(domain)
+        else:
+            plan.unchanged += 1
+
+    for (group_name, domain_name, url), entry in endpoints.items():
+        endpoint = existing_endpoints.get((group_name, domain_name, url))
+        if endpoint is None:
+            endpoint = Endpoint(url=url, **entry['fields'])
+            endpoint.domain_key = (group_name, domain_name)
+            plan.endpoints_to_create.append(endpoint)
+        elif _assign(endpoint, entry['fields'], now):
+            plan.endpoints_to_update.append(endpoint)
+        else:
+            plan.unchanged += 1
+
+    return plan
+
+
+def _pick(row, field_map):
+    return {field: row[column] for column, field in field_map.items() if column in row}
+
+
+def _assign(instance, fields, now):
+    """변경된 필드만 반영, 변경 여부 반환"""
+    changed = False
+    for field, value in fields.items():
+        if getattr(instance, field) != value:
+            setattr(instance, field, value)
+            changed = True
+    if changed:
+        # bulk_update는 auto_now를 갱신하지 않음
+        instance.updated_at = now
+    return changed
+
+
+def apply_plan(plan, user, source=''):
+    """ImportPlan을 한 트랜잭션에서 일괄 저장하고 설정 변경 이력을 한 번 기록"""
+    if not plan.has_changes:
+        return None
+
+    with transaction.atomic():
+        NetworkGroup.objects.bulk_create(plan.network_groups_to_create, batch_size=IMPORT_BATCH_SIZE)
+        NetworkGroup.objects.bulk_update(
+            plan.network_groups_to_update, ['note', 'updated_at'], batch_size=IMPORT_BATCH_SIZE
+        )
+
+        # 새로 만든 행의 ID는 백엔드마다 반환 여부가 달라 이름으로 다시 조회
+        group_names = {domain.group_name for domain in plan.domains_to_create}
+        group_names.update(endpoint.domain_key[0] for endpoint in plan.endpoints_to_create)
+        group_ids = dict(NetworkGroup.objects.filter(name__in=list(group_names)).values_list('name', 'id'))
+
+        for domain in plan.domains_to_create:
+            domain.network_group_id = group_ids[domain.group_name]
+        Domain.objects.bulk_create(plan.domains_to_create, batch_size=IMPORT_BATCH_SIZE)
+        Domain.objects.bulk_update(
+            plan.domains_to_update,
+            ['site_name', 'owner_name', 'owner_contact', 'is_active', 'note', 'updated_at'],
+            batch_size=IMPORT_BATCH_SIZE
+        )
+
+        if plan.endpoints_to_create:
+            names = {group_id: name for name, group_id in group_ids.items()}
+            domain_ids = {
+                (names[group_id], domain_name): domain_id
+                for domain_id, group_id, domain_name in Domain.objects.filter(
+                    network_group_id__in=list(names)
+                ).values_list('id', 'network_group_id', 'domain')
+            }
+            for endpoint in plan.endpoints_to_create:
+                endpoint.domain_id = domain_ids[endpoint.domain_key]
+            Endpoint.objects.bulk_create(plan.endpoints_to_create, batch_size=IMPORT_BATCH_SIZE)
+        Endpoint.objects.bulk_update(
+            plan.endpoints_to_update,
+            ['poll_interval_sec', 'requires_db', 'email_on_failure', 'is_enabled', 'note', 'updated_at'],
+            batch_size=IMPORT_BATCH_SIZE
+        )
+
+        reason = f'설정 가져오기{f" ({source})" if source else ""}: {plan.describe()}'
+        return ConfigRevision.objects.create(reason=reason[:500], changed_by=user)
@@ -68,10 +68,16 @@ class EndpointForm(forms.ModelForm):
     class Meta:
         model = Endpoint
         fields = [
-            'domain', 'url', 'note', 'poll_interval_sec', 'is_enabled'
+            'domain', 'url', 'note', 'poll_interval_sec', 'parent', 'is_enabled'
         ]
         widgets = {
             'domain': forms.Select(attrs={'class': SELECT_CLASSES}),
+            # 엔드포인트가 많으므로 선택 목록 대신 ID 입력
+            'parent': forms.NumberInput(attrs={
+                'class': INPUT_CLASSES,
+                'placeholder': '상위 엔드포인트 ID (선택사항)',
+                'min': 1
+            }),
             'url': forms.URLInput(attrs={
                 'class': INPUT_CLASSES,
                 'placeholder': 'URL을 입력하세요 (예: https://www.jnu.ac.kr/main.do)'
@@ -96,6 +102,7 @@ class EndpointForm(forms.ModelForm):
             'url': 'URL',
             'note': '비고',
             'poll_interval_sec': '호출 주기 (초)',
+            'parent': '상위 엔드포인트 ID',
             'is_enabled': '활성 상태',
         }
     
@@ -111,6 +118,20 @@ class EndpointForm(forms.ModelForm):
         
         self.fields['domain'].choices = [('', '도메인을 선택하세요')] + domain_choices
 
+    def clean_parent(self):
+        """자기 자신이나 하위 엔드포인트를 상위로 지정하지 못하도록 확인"""
+        parent = self.cleaned_data.get('parent')
+        if parent is None or self.instance.pk is None:
+            return parent
+        seen = set()
+        node = parent
+        while node is not None and node.pk not in seen:
+            if node.pk == self.instance.pk:
+                raise forms.ValidationError('자기 자신이나 하위 엔드포인트는 상위 엔드포인트로 지정할 수 없습니다.')
+            seen.add(node.pk)
+            node = node.parent
+        return parent
+
 
 class BulkSettingsForm(forms.Form):
     """일괄 설정 폼 (개선된 버전)"""
@@ -202,3 +223,30 @@ class CloneNetworkGroupForm(forms.Form):
         if NetworkGroup.objects.filter(name=new_name).exists():
             raise forms.ValidationError('이미 존재하는 망구분명입니다.')
         return new_name
+
+
+class ConfigImportForm(forms.Form):
+    """설정 일괄 가져오기 폼"""
+    
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={
+            'class': INPUT_CLASSES,
+            'accept': '.csv,.json'
+        }),
+        label='가져올 파일 (CSV, JSON, 설정 백업)'
+    )
+    
+    dry_run = forms.BooleanField(
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'h-4 w-4 text-blue-600 focus:ring-blue-500 border-gray-300 rounded'
+        }),
+        label='미리보기만 (저장하지 않음)'
+    )
+    
+    def clean_file(self):
+        upload = self.cleaned_data['file']
+        if upload.size > 20 * 1024 * 1024:
+            raise forms.ValidationError('파일은 20MB 이하여야 합니다.')
+        return upload
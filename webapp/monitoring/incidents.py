@@ -0,0 +1,82 @@
+"""
+장애 구간(incidents) 계산
+usp_record_check가 체크를 기록할 때 하는 열기/닫기 처리를 기존 체크 기록에 그대로 적용합니다.
+초기 적재(마이그레이션)와 대량 입력 후 재계산(Incident.rebuild)에서 사용합니다.
+"""
+
+MAX_ERROR_LENGTH = 4000
+
+
+def check_status(status_code):
+    """체크 결과 상태 (usp_record_check와 같은 기준)"""
+    if status_code == 200:
+        return 'GREEN'
+    if status_code is None:
+        return 'AMBER'
+    return 'RED'
+
+
+def incident_error(status_code, error):
+    """장애 구간에 기록할 오류 내용"""
+    if error:
+        return error[:MAX_ERROR_LENGTH]
+    if status_code is None:
+        return '응답 없음'
+    return f'HTTP {status_code}'
+
+
+def replay_checks(rows):
+    """
+    (endpoint_id, status_code, error, checked_at) 행을 엔드포인트/시각 순으로 받아 장애 구간 생성
+
+    상태가 바뀌면(정상 복구 또는 장애 ↔ 신호없음 전환) 열린 구간을 그 체크 시각으로 닫습니다.
+    마지막까지 닫히지 않은 구간은 ended_at이 None입니다.
+    """
+    current = None
+    for endpoint_id, status_code, error, checked_at in rows:
+        status = check_status(status_code)
+        if current is not None and current['endpoint_id'] != endpoint_id:
+            yield current
+            current = None
+
+        if current is not None and current['status'] == status:
+            current['check_count'] += 1
+            current['last_error'] = incident_error(status_code, error)
+            current['last_checked_at'] = checked_at
+            continue
+
+        if current is not None:
+            current['ended_at'] = checked_at
+            current['duration_sec'] = int((checked_at - current['started_at']).total_seconds())
+            yield current
+            current = None
+
+        if status != 'GREEN':
+            message = incident_error(status_code, error)
+            current = {
+                'endpoint_id': endpoint_id,
+                'status': status,
+                'started_at': checked_at,
+                'ended_at': None,
+                'duration_sec': None,
+                'first_error': message,
+                'last_error': message,
+                'check_count': 1,
+                'last_checked_at': checked_at,
+            }
+    if current is not None:
+        yield current
+
+
+def format_duration(seconds):
+    """초를 '1일 2시간 3분' 형태로 표시"""
+    if seconds is None:
+        return '-'
+    seconds = int(seconds)
+    if seconds < 60:
+        return f'{seconds}초'
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes = rest // 60
+    parts = [f'{days}일' if days else '', f'{hours}시간' if hours else '', f'{minutes}분' if minutes else '']
+    return ' '.join(part for part in parts if part)
@@ -0,0 +1,178 @@
+"""
+원격 에이전트 체크 결과 수집
+에이전트(망 안의 콘솔)가 보낸 NDJSON 배치(gzip 압축 가능)를 검증한 뒤
+usp_record_checks_bulk 한 번으로 기록하고, 응답으로 담당 엔드포인트와 설정 리비전을 돌려줍니다.
+
+NDJSON 한 줄:
+- 체크 결과: {"endpoint_id": 1, "status_code": 200, "latency_ms": 35, "headers": "{\"server\":\"nginx\"}", "error": null,
+  "checked_at": "2026-10-19T10:00:00.123456", "trace_id": "8f0c..."}  (checked_at은 DB와 같은 한국 시간, 시간대 없음)
+  trace_id(UUID)가 이미 기록된 결과는 건너뛰므로 응답을 받지 못한 배치는 그대로 다시 보내면 됩니다.
+- 체크 생략: {"type": "suppressed", "endpoint_ids": [1, 2], "reason": "호스트 a.jnu.ac.kr:443 장애",
+  "suppressed_at": "..."}
+"""
+
+import json
+import uuid
+import zlib
+from datetime import datetime
+
+from django.utils import timezone
+
+from common.database import DatabaseMiddleware
+from .models import ConfigRevision, Endpoint
+
+# 배치당 최대 행 수 / 압축 해제 후 최대 크기 (압축 폭탄 방지)
+MAX_BATCH_ROWS = 5000
+MAX_BATCH_BYTES = 32 * 1024 * 1024
+
+MAX_HEADERS_LENGTH = 4000  # header_sets.headers 크기
+MAX_ERROR_LENGTH = 4000
+MAX_REASON_LENGTH = 200
+
+
+class IngestError(Exception):
+    """배치 형식 오류 (400 응답)"""
+
+
+def read_batch(body, content_encoding=''):
+    """요청 본문을 NDJSON 행 목록으로 변환 (gzip/deflate 압축 해제 포함)"""
+    encoding = (content_encoding or '').strip().lower()
+    if encoding in ('gzip', 'deflate'):
+        # gzip은 헤더 포함(wbits 16+), deflate는 zlib 형식
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS if encoding == 'gzip' else zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(body, MAX_BATCH_BYTES)
+        except zlib.error as e:
+            raise IngestError(f'압축 해제 오류: {e}')
+        if decompressor.unconsumed_tail:
+            raise IngestError(f'배치가 너무 큽니다. (압축 해제 후 {MAX_BATCH_BYTES // (1024 * 1024)}MB 이하)')
+    elif encoding not in ('', 'identity'):
+        raise IngestError(f'지원하지 않는 Content-Encoding: {content_encoding}')
+
+    try:
+        text = body.decode('utf-8')
+    except UnicodeDecodeError:
+        raise IngestError('UTF-8 형식이 아닙니다.')
+
+    lines = [line for line in text.splitlines() if line.strip()]
+    if len(lines) > MAX_BATCH_ROWS:
+        raise IngestError(f'배치당 최대 {MAX_BATCH_ROWS}행까지 보낼 수 있습니다. ({len(lines)}행)')
+
+    checks = []
+    suppressions = []
+    for line_no, line in enumerate(lines, start=1):
+        try:
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError('JSON 객체가 아닙니다')
+            if row.get('type', 'check') == 'suppressed':
+                suppressions.append(_clean_suppression(row))
+            else:
+                checks.append(_clean_check(row))
+        except (ValueError, TypeError) as e:
+            raise IngestError(f'{line_no}행 형식 오류: {e}')
+    return checks, suppressions
+
+
+def _optional_int(value, name):
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f'{name}은(는) 정수여야 합니다')
+    return value
+
+
+def _optional_text(value, name, max_length):
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f'{name}은(는) 문자열이어야 합니다')
+    return value[:max_length]
+
+
+def _parse_time(value, name):
+    """ISO 8601 시각 → 한국 시간 기준 시간대 없는 문자열 (DB 저장 기준)"""
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(_optional_text(value, name, 40))
+    if timezone.is_aware(parsed):
+        parsed = timezone.make_naive(parsed)
+    return parsed.isoformat()
+
+
+def _clean_check(row):
+    """체크 결과 행 검증 (usp_record_checks_bulk @results 항목)"""
+    endpoint_id = _optional_int(row.get('endpoint_id'), 'endpoint_id')
+    if endpoint_id is None:
+        raise ValueError('endpoint_id가 없습니다')
+    return {
+        'endpoint_id': endpoint_id,
+        'status_code': _optional_int(row.get('status_code'), 'status_code'),
+        'latency_ms': _optional_int(row.get('latency_ms'), 'latency_ms'),
+        'headers': _optional_text(row.get('headers'), 'headers', MAX_HEADERS_LENGTH),
+        'error': _optional_text(row.get('error'), 'error', MAX_ERROR_LENGTH),
+        'checked_at': _parse_time(row.get('checked_at'), 'checked_at'),
+        'trace_id': _parse_uuid(row.get('trace_id'), 'trace_id'),
+    }
+
+
+def _parse_uuid(value, name):
+    """UUID 문자열 검증 (정규화한 문자열 반환)"""
+    if value is None:
+        return None
+    return str(uuid.UUID(_optional_text(value, name, 40)))
+
+
+def _clean_suppression(row):
+    """체크 생략 행 검증 (usp_mark_suppressed 매개변수)"""
+    endpoint_ids = row.get('endpoint_ids')
+    if not isinstance(endpoint_ids, list) or not endpoint_ids:
+        raise ValueError('endpoint_ids가 없습니다')
+    reason = _optional_text(row.get('reason'), 'reason', MAX_REASON_LENGTH)
+    if not reason:
+        raise ValueError('reason이 없습니다')
+    return {
+        'endpoint_ids': [_optional_int(endpoint_id, 'endpoint_ids') for endpoint_id in endpoint_ids],
+        'reason': reason,
+        'suppressed_at': _parse_time(row.get('suppressed_at'), 'suppressed_at'),
+    }
+
+
+def record_batch(agent, checks, suppressions):
+    """
+    배치 기록 (담당 망구분 밖의 엔드포인트는 건너뜀)
+
+    반환값: (기록한 체크 수, 건너뛴 체크 수, 이미 기록되어 건너뛴 체크 수)
+    """
+    recorded = skipped = duplicates = 0
+    if checks:
+        rows = DatabaseMiddleware.execute_sp('usp_record_checks_bulk', {
+            'results': json.dumps(checks, ensure_ascii=False),
+            'network_group_id': agent.network_group_id,
+        })
+        if rows:
+            recorded, skipped, duplicates = rows[0]['recorded_count'], rows[0]['skipped_count'], rows[0]['duplicate_count']
+
+    for suppression in suppressions:
+        endpoint_ids = list(
+            Endpoint.objects
+            .filter(id__in=suppression['endpoint_ids'], domain__network_group_id=agent.network_group_id)
+            .values_list('id', flat=True)
+        )
+        if endpoint_ids:
+            DatabaseMiddleware.execute_sp_non_query('usp_mark_suppressed', {
+                'endpoint_ids': ','.join(str(endpoint_id) for endpoint_id in endpoint_ids),
+                'reason': suppression['reason'],
+                'suppressed_at': suppression['suppressed_at'],
+            })
+    return recorded, skipped, duplicates
+
+
+def current_revision():
+    """현재 설정 리비전 번호 (콘솔과 같은 기준, 없으면 0)"""
+    return ConfigRevision.objects.order_by('-changed_at').values_list('id', flat=True).first() or 0
+
+
+def agent_assignment(agent):
+    """에이전트 담당 엔드포인트 (usp_get_poll_targets와 같은 행, 마지막 체크 시각 포함)"""
+    return DatabaseMiddleware.execute_sp('usp_get_poll_targets', {'network_group_id': agent.network_group_id})
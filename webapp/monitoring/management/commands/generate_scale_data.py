@@ -0,0 +1,259 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from monitoring.models import (
+    NetworkGroup, Domain, Endpoint, Check, HeaderSet, Rollup, CheckDailyStat, CheckHourlyStat, CheckHourlyLatency,
+    Incident,
+)
+
+# 엔드포인트 호출주기 분포 (초)
+POLL_INTERVALS = (30, 60, 60, 300, 300, 300, 600)
+
+# 장애 구간에서 사용하는 결과 (상태코드, 오류메시지)
+BURST_RESULTS = (
+    (500, None),
+    (503, None),
+    (None, '요청 시간 초과'),
+    (None, '클라이언트 오류: Cannot connect to host'),
+)
+
+SAMPLE_HEADERS = HeaderSet.normalize({
+    'Server': 'nginx',
+    'Content-Type': 'text/html; charset=UTF-8',
+    'Cache-Control': 'no-cache',
+})
+
+STATUS_ORDER = {'GREEN': 0, 'AMBER': 1, 'RED': 2}
+
+
+class Command(BaseCommand):
+    help = '부하 테스트용 대규모 망구분/도메인/엔드포인트/체크 데이터를 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--network-groups', type=int, default=10, help='망구분 수 (기본값: 10)')
+        parser.add_argument('--domains', type=int, default=2000, help='도메인 수 (기본값: 2000)')
+        parser.add_argument('--endpoints', type=int, default=20000, help='엔드포인트 수 (기본값: 20000)')
+        parser.add_argument(
+            '--checks', type=int, default=2000000,
+            help='체크 이력 총 건수 (기본값: 2000000, 예: 50000000)'
+        )
+        parser.add_argument('--days', type=int, default=30, help='체크 이력 기간(일) (기본값: 30)')
+        parser.add_argument('--failure-rate', type=float, default=0.01, help='평상시 실패 비율 (기본값: 0.01)')
+        parser.add_argument(
+            '--burst-endpoint-ratio', type=float, default=0.05,
+            help='장애 구간이 있는 엔드포인트 비율 (기본값: 0.05)'
+        )
+        parser.add_argument('--bursts', type=int, default=3, help='엔드포인트당 장애 구간 수 (기본값: 3)')
+        parser.add_argument('--burst-length', type=int, default=20, help='장애 구간 길이(체크 수) (기본값: 20)')
+        parser.add_argument('--with-headers', action='store_true', help='체크 결과에 응답 헤더 저장')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk insert 단위 (기본값: 5000)')
+        parser.add_argument('--prefix', type=str, default='SCALE', help='생성 데이터 망구분명 접두어 (기본값: SCALE)')
+        parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+        parser.add_argument('--clear', action='store_true', help='같은 접두어로 생성된 기존 데이터 삭제 후 생성')
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.rng = random.Random(options['seed'])
+        prefix = options['prefix']
+
+        if options['domains'] < options['network_groups'] or options['endpoints'] < options['domains']:
+            raise CommandError('망구분 <= 도메인 <= 엔드포인트 수여야 합니다.')
+
+        existing = NetworkGroup.objects.filter(name__startswith=f'{prefix}-')
+        if existing.exists():
+            if not options['clear']:
+                raise CommandError(f'"{prefix}-"로 시작하는 망구분이 이미 있습니다. --clear 옵션으로 삭제 후 생성하세요.')
+            self._clear(existing)
+
+        started = time.monotonic()
+        network_groups = self._create_network_groups(prefix)
+        domains = self._create_domains(prefix, network_groups)
+        endpoints = self._create_endpoints(domains)
+        last_status = self._create_checks(endpoints)
+        self._create_rollups(network_groups, domains, endpoints, last_status)
+        # bulk insert는 usp_record_check를 거치지 않으므로 일별/시간별 집계, 응답시간 히스토그램과 장애 구간을 다시 계산
+        group_ids = [group.id for group in network_groups]
+        CheckDailyStat.rebuild(network_group_ids=group_ids)
+        CheckHourlyStat.rebuild(network_group_ids=group_ids)
+        CheckHourlyLatency.rebuild(network_group_ids=group_ids)
+        Incident.rebuild(network_group_ids=group_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'생성 완료: 망구분 {len(network_groups)}개, 도메인 {len(domains)}개, '
+            f'엔드포인트 {len(endpoints)}개, 체크 {options["checks"]:,}건 ({time.monotonic() - started:.0f}초)'
+        ))
+
+    def _clear(self, network_groups):
+        """기존 생성 데이터 삭제 (체크는 단일 DELETE로 먼저 삭제)"""
+        self.stdout.write('기존 데이터 삭제 중...')
+        group_ids = list(network_groups.values_list('id', flat=True))
+        domain_ids = list(Domain.objects.filter(network_group_id__in=group_ids).values_list('id', flat=True))
+        endpoint_ids = Endpoint.objects.filter(domain_id__in=domain_ids).values_list('id', flat=True)
+
+        Check.objects.filter(endpoint__domain__network_group_id__in=group_ids).delete()
+        Rollup.objects.filter(level='network', ref_id__in=group_ids).delete()
+        Rollup.objects.filter(level='domain', ref_id__in=domain_ids).delete()
+        Rollup.objects.filter(level='endpoint', ref_id__in=list(endpoint_ids)).delete()
+        network_groups.delete()
+
+    def _create_network_groups(self, prefix):
+        NetworkGroup.objects.bulk_create([
+            NetworkGroup(name=f'{prefix}-{i:02d}', note='부하 테스트 데이터')
+            for i in range(1, self.options['network_groups'] + 1)
+        ])
+        return list(NetworkGroup.objects.filter(name__startswith=f'{prefix}-').order_by('id'))
+
+    def _create_domains(self, prefix, network_groups):
+        host_suffix = prefix.lower()
+        Domain.objects.bulk_create(
+            [
+                Domain(
+                    network_group=network_groups[i % len(network_groups)],
+                    domain=f'd{i}.{host_suffix}.test',
+                    site_name=f'{prefix} 사이트 {i}',
+                    owner_name='부하테스트',
+                )
+                for i in range(1, self.options['domains'] + 1)
+            ],
+            batch_size=self.options['batch_size']
+        )
+        return list(Domain.objects.filter(network_group__in=network_groups).order_by('id'))
+
+    def _create_endpoints(self, domains):
+        Endpoint.objects.bulk_create(
+            [
+                Endpoint(
+                    domain=domains[i % len(domains)],
+                    url=f'https://{domains[i % len(domains)].domain}/health/{i}',
+                    poll_interval_sec=self.rng.choice(POLL_INTERVALS),
+                )
+                for i in range(self.options['endpoints'])
+            ],
+            batch_size=self.options['batch_size']
+        )
+        return list(
+            Endpoint.objects.filter(domain__in=domains)
+            .order_by('id')
+            .only('id', 'domain_id', 'poll_interval_sec')
+        )
+
+    def _create_checks(self, endpoints):
+        """엔드포인트별 체크 이력 생성, 엔드포인트별 마지막 상태 반환"""
+        options = self.options
+        total = options['checks']
+        per_endpoint, remainder = divmod(total, len(endpoints))
+        span_sec = options['days'] * 86400
+        header_hash = HeaderSet.store(SAMPLE_HEADERS) if options['with_headers'] else None
+        now = timezone.now()
+
+        last_status = {}
+        batch = []
+        written = 0
+        started = time.monotonic()
+
+        for index, endpoint in enumerate(endpoints):
+            count = per_endpoint + (1 if index < remainder else 0)
+            if count == 0:
+                last_status[endpoint.id] = 'AMBER'
+                continue
+
+            # 마지막 체크가 현재 호출주기 안에 들어오도록 역순으로 배치
+            step = max(span_sec / count, 1)
+            last_at = now - timedelta(seconds=self.rng.uniform(0, endpoint.poll_interval_sec))
+            base_latency = self.rng.uniform(30, 400)
+            bursts = self._burst_ranges(count)
+
+            for n in range(count):
+                position = count - 1 - n
+                status_code, error = self._result(position, bursts)
+                latency = None
+                if status_code is not None:
+                    latency = int(self.rng.lognormvariate(0, 0.5) * base_latency)
+                batch.append(Check(
+                    endpoint_id=endpoint.id,
+                    status_code=status_code,
+                    latency_ms=latency,
+                    header_hash=header_hash,
+                    error=error,
+                    checked_at=last_at - timedelta(seconds=n * step),
+                ))
+                if n == 0:
+                    last_status[endpoint.id] = self._status(status_code)
+
+                if len(batch) >= options['batch_size']:
+                    written += self._flush(batch)
+                    self._progress(written, total, started)
+
+        if batch:
+            written += self._flush(batch)
+            self._progress(written, total, started)
+        return last_status
+
+    def _burst_ranges(self, count):
+        """장애 구간 (시작 위치, 끝 위치) 목록"""
+        options = self.options
+        if count <= options['burst_length'] or self.rng.random() >= options['burst_endpoint_ratio']:
+            return []
+        return [
+            (start, start + options['burst_length'])
+            for start in (
+                self.rng.randrange(0, count - options['burst_length']) for _ in range(options['bursts'])
+            )
+        ]
+
+    def _result(self, position, bursts):
+        if any(start <= position < end for start, end in bursts) or self.rng.random() < self.options['failure_rate']:
+            return self.rng.choice(BURST_RESULTS)
+        return 200, None
+
+    @staticmethod
+    def _status(status_code):
+        if status_code == 200:
+            return 'GREEN'
+        if status_code is None:
+            return 'AMBER'
+        return 'RED'
+
+    @staticmethod
+    def _flush(batch):
+        Check.objects.bulk_create(batch)
+        count = len(batch)
+        batch.clear()
+        return count
+
+    def _progress(self, written, total, started):
+        if written % (self.options['batch_size'] * 20) and written != total:
+            return
+        elapsed = max(time.monotonic() - started, 0.001)
+        self.stdout.write(f'  체크 {written:,}/{total:,}건 ({written / elapsed:,.0f}건/초)')
+
+    def _create_rollups(self, network_groups, domains, endpoints, last_status):
+        """마지막 체크 결과 기준으로 엔드포인트/도메인/망구분 롤업 생성"""
+        now = timezone.now()
+        domain_status = {}
+        for endpoint in endpoints:
+            status = last_status.get(endpoint.id, 'AMBER')
+            current = domain_status.get(endpoint.domain_id, 'GREEN')
+            domain_status[endpoint.domain_id] = max(current, status, key=STATUS_ORDER.get)
+
+        network_status = {}
+        for domain in domains:
+            status = domain_status.get(domain.id, 'AMBER')
+            current = network_status.get(domain.network_group_id, 'GREEN')
+            network_status[domain.network_group_id] = max(current, status, key=STATUS_ORDER.get)
+
+        rollups = (
+            [Rollup(level='endpoint', ref_id=e.id, last_status=last_status.get(e.id, 'AMBER'),
+                    last_change_at=now, last_reason='부하 테스트 데이터') for e in endpoints]
+            + [Rollup(level='domain', ref_id=d.id, last_status=domain_status.get(d.id, 'AMBER'),
+                      last_change_at=now, last_reason='부하 테스트 데이터') for d in domains]
+            + [Rollup(level='network', ref_id=g.id, last_status=network_status.get(g.id, 'AMBER'),
+                      last_change_at=now, last_reason='부하 테스트 데이터') for g in network_groups]
+        )
+        with transaction.atomic():
+            Rollup.objects.bulk_create(rollups, batch_size=self.options['batch_size'], ignore_conflicts=True)
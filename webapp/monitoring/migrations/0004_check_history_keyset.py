@@ -0,0 +1,88 @@
+# Generated by Django 5.0.7 on 2026-10-19 15:25
+
+from datetime import timezone as dt_timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_check_daily_stats(apps, schema_editor):
+    """기존 체크 기록으로 일별 집계 초기 적재"""
+    Endpoint = apps.get_model('monitoring', 'Endpoint')
+    CheckDailyStat = apps.get_model('monitoring', 'CheckDailyStat')
+
+    success = Q(checks__status_code__gte=200, checks__status_code__lt=300, checks__error__isnull=True)
+    success_latency = success & Q(checks__latency_ms__isnull=False)
+    rows = (
+        Endpoint.objects.filter(checks__isnull=False)
+        # DB에 저장된 시각 그대로 날짜를 자름 (usp_record_check와 같은 기준)
+        .annotate(stat_date=TruncDate('checks__checked_at', tzinfo=dt_timezone.utc))
+        .values('stat_date', 'domain__network_group_id')
+        .annotate(
+            total_count=Count('checks'),
+            success_count=Count('checks', filter=success),
+            latency_sum=Sum('checks__latency_ms', filter=success_latency),
+            latency_count=Count('checks', filter=success_latency),
+        )
+        .order_by()
+    )
+    CheckDailyStat.objects.bulk_create([
+        CheckDailyStat(
+            stat_date=row['stat_date'],
+            network_group_id=row['domain__network_group_id'],
+            total_count=row['total_count'],
+            success_count=row['success_count'],
+            error_count=row['total_count'] - row['success_count'],
+            latency_sum=row['latency_sum'] or 0,
+            latency_count=row['latency_count'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0003_auto_20250812_1349'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stat_date', models.DateField(verbose_name='집계일')),
+                ('total_count', models.BigIntegerField(default=0, verbose_name='전체 건수')),
+                ('success_count', models.BigIntegerField(default=0, verbose_name='성공 건수')),
+                ('error_count', models.BigIntegerField(default=0, verbose_name='오류 건수')),
+                ('latency_sum', models.BigIntegerField(default=0, verbose_name='성공 응답시간 합계(ms)')),
+                ('latency_count', models.BigIntegerField(default=0, verbose_name='성공 응답시간 건수')),
+            ],
+            options={
+                'verbose_name': '일별 체크 집계',
+                'verbose_name_plural': '일별 체크 집계',
+                'db_table': 'check_daily_stats',
+            },
+        ),
+        migrations.AlterField(
+            model_name='domain',
+            name='owner_contact',
+            field=models.CharField(blank=True, default='', max_length=100, verbose_name='담당자 연락처'),
+        ),
+        migrations.AddIndex(
+            model_name='check',
+            index=models.Index(fields=['-checked_at', '-id'], name='IX_checks_checked_at_id'),
+        ),
+        migrations.AddField(
+            model_name='checkdailystat',
+            name='network_group',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='check_daily_stats', to='monitoring.networkgroup', verbose_name='망구분'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='checkdailystat',
+            unique_together={('stat_date', 'network_group')},
+        ),
+        migrations.RunPython(backfill_check_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.0.7 on 2026-10-19 15:34
+
+from datetime import timezone as dt_timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncHour
+
+
+def backfill_check_hourly_stats(apps, schema_editor):
+    """기존 체크 기록으로 시간별 집계 초기 적재"""
+    Check = apps.get_model('monitoring', 'Check')
+    CheckHourlyStat = apps.get_model('monitoring', 'CheckHourlyStat')
+
+    success = Q(status_code__gte=200, status_code__lt=300, error__isnull=True)
+    rows = (
+        Check.objects
+        .annotate(bucket_start=TruncHour('checked_at', tzinfo=dt_timezone.utc))
+        .values('endpoint_id', 'bucket_start')
+        .annotate(
+            total_count=Count('id'),
+            success_count=Count('id', filter=success),
+            latency_min=Min('latency_ms'),
+            latency_max=Max('latency_ms'),
+            latency_sum=Sum('latency_ms'),
+            latency_count=Count('latency_ms'),
+        )
+        .order_by()
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=5000):
+        batch.append(CheckHourlyStat(
+            endpoint_id=row['endpoint_id'],
+            bucket_start=row['bucket_start'],
+            total_count=row['total_count'],
+            error_count=row['total_count'] - row['success_count'],
+            latency_min=row['latency_min'],
+            latency_max=row['latency_max'],
+            latency_sum=row['latency_sum'] or 0,
+            latency_count=row['latency_count'],
+        ))
+        if len(batch) >= 1000:
+            CheckHourlyStat.objects.bulk_create(batch)
+            batch = []
+    CheckHourlyStat.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0004_check_history_keyset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckHourlyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket_start', models.DateTimeField(verbose_name='집계 시작 시각')),
+                ('total_count', models.IntegerField(default=0, verbose_name='전체 건수')),
+                ('error_count', models.IntegerField(default=0, verbose_name='오류 건수')),
+                ('latency_min', models.IntegerField(null=True, verbose_name='최소 응답시간(ms)')),
+                ('latency_max', models.IntegerField(null=True, verbose_name='최대 응답시간(ms)')),
+                ('latency_sum', models.BigIntegerField(default=0, verbose_name='응답시간 합계(ms)')),
+                ('latency_count', models.IntegerField(default=0, verbose_name='응답시간 건수')),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_stats', to='monitoring.endpoint', verbose_name='엔드포인트')),
+            ],
+            options={
+                'verbose_name': '시간별 체크 집계',
+                'verbose_name_plural': '시간별 체크 집계',
+                'db_table': 'check_hourly_stats',
+                'unique_together': {('endpoint', 'bucket_start')},
+            },
+        ),
+        migrations.RunPython(backfill_check_hourly_stats, migrations.RunPython.noop),
+    ]
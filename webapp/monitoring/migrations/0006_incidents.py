@@ -0,0 +1,63 @@
+# Generated by Django 5.0.7 on 2026-10-19 15:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from monitoring.incidents import replay_checks
+
+
+def backfill_incidents(apps, schema_editor):
+    """기존 체크 기록으로 장애 구간 초기 적재"""
+    Check = apps.get_model('monitoring', 'Check')
+    Incident = apps.get_model('monitoring', 'Incident')
+
+    rows = (
+        Check.objects
+        .order_by('endpoint_id', 'checked_at', 'id')
+        .values_list('endpoint_id', 'status_code', 'error', 'checked_at')
+        .iterator(chunk_size=5000)
+    )
+    batch = []
+    for incident in replay_checks(rows):
+        batch.append(Incident(**incident))
+        if len(batch) >= 1000:
+            Incident.objects.bulk_create(batch)
+            batch = []
+    Incident.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0005_check_hourly_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Incident',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('AMBER', '신호없음'), ('RED', '장애')], max_length=6, verbose_name='상태')),
+                ('started_at', models.DateTimeField(verbose_name='시작일시')),
+                ('ended_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+                ('duration_sec', models.IntegerField(blank=True, null=True, verbose_name='지속시간(초)')),
+                ('first_error', models.TextField(blank=True, verbose_name='최초 오류')),
+                ('last_error', models.TextField(blank=True, verbose_name='최근 오류')),
+                ('check_count', models.IntegerField(default=1, verbose_name='체크 건수')),
+                ('last_checked_at', models.DateTimeField(verbose_name='최근 체크일시')),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='incidents', to='monitoring.endpoint', verbose_name='엔드포인트')),
+            ],
+            options={
+                'verbose_name': '장애 구간',
+                'verbose_name_plural': '장애 구간',
+                'db_table': 'incidents',
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['endpoint', '-started_at'], name='IX_incidents_endpoint'), models.Index(fields=['-started_at', '-id'], name='IX_incidents_started_at_id')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='incident',
+            constraint=models.UniqueConstraint(condition=models.Q(('ended_at__isnull', True)), fields=('endpoint',), name='UQ_incidents_open'),
+        ),
+        migrations.RunPython(backfill_incidents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.7 on 2026-10-19 16:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0006_incidents'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='endpoint',
+            name='parent',
+            field=models.ForeignKey(blank=True, db_column='parent_endpoint_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='children', to='monitoring.endpoint', verbose_name='상위 엔드포인트'),
+        ),
+        migrations.AddField(
+            model_name='rollup',
+            name='suppressed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='체크 생략 일시'),
+        ),
+        migrations.AddField(
+            model_name='rollup',
+            name='suppressed_by',
+            field=models.CharField(blank=True, max_length=200, null=True, verbose_name='체크 생략 사유'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.7 on 2026-10-19 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0007_endpoint_dependencies'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProbeAgent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='에이전트명')),
+                ('token_hash', models.CharField(editable=False, max_length=64, unique=True, verbose_name='토큰 해시')),
+                ('is_active', models.BooleanField(default=True, verbose_name='활성 상태')),
+                ('note', models.TextField(blank=True, verbose_name='비고')),
+                ('last_seen_at', models.DateTimeField(blank=True, null=True, verbose_name='최근 수집일시')),
+                ('last_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='최근 접속 주소')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('network_group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='probe_agents', to='monitoring.networkgroup', verbose_name='담당 망구분')),
+            ],
+            options={
+                'verbose_name': '원격 에이전트',
+                'verbose_name_plural': '원격 에이전트',
+                'db_table': 'probe_agents',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.7 on 2026-10-19 18:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0008_probe_agents'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('requested_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='요청일시')),
+                ('claimed_by', models.CharField(blank=True, max_length=100, null=True, verbose_name='처리 인스턴스')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='처리 시작일시')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일시')),
+                ('check_result', models.ForeignKey(blank=True, db_column='check_id', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='monitoring.check', verbose_name='체크 결과')),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='check_requests', to='monitoring.endpoint', verbose_name='엔드포인트')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='요청자')),
+            ],
+            options={
+                'verbose_name': '즉시 점검 요청',
+                'verbose_name_plural': '즉시 점검 요청',
+                'db_table': 'check_requests',
+                'ordering': ['-requested_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.7 on 2026-10-19 18:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0009_check_requests'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HeaderSet',
+            fields=[
+                ('header_hash', models.BinaryField(max_length=32, primary_key=True, serialize=False, verbose_name='헤더 해시')),
+                ('headers', models.CharField(max_length=4000, verbose_name='응답헤더')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': '응답 헤더 조합',
+                'verbose_name_plural': '응답 헤더 조합',
+                'db_table': 'header_sets',
+            },
+        ),
+        migrations.AddField(
+            model_name='check',
+            name='header_hash',
+            field=models.BinaryField(max_length=32, null=True, verbose_name='헤더 해시'),
+        ),
+    ]
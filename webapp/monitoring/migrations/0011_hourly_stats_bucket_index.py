@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-19 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0010_header_sets'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='checkhourlystat',
+            index=models.Index(fields=['bucket_start'], name='IX_check_hourly_stats_bucket'),
+        ),
+    ]
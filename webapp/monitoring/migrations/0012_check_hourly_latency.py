@@ -0,0 +1,66 @@
+# Generated by Django 5.0.7 on 2026-10-19 21:30
+
+import math
+from datetime import timezone as dt_timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Case, Count, FloatField, IntegerField, Value, When
+from django.db.models.functions import Cast, Floor, Ln, TruncHour
+
+
+def backfill_check_hourly_latency(apps, schema_editor):
+    """기존 체크 기록으로 시간별 응답시간 히스토그램 초기 적재"""
+    Check = apps.get_model('monitoring', 'Check')
+    CheckHourlyLatency = apps.get_model('monitoring', 'CheckHourlyLatency')
+
+    ratio = math.log(120000) / 95
+    latency_bin = Case(
+        When(latency_ms__lt=1, then=Value(0)),
+        When(latency_ms__gte=120000, then=Value(95)),
+        default=Cast(Floor(Ln(Cast('latency_ms', FloatField())) / Value(ratio)), IntegerField()) + 1,
+        output_field=IntegerField(),
+    )
+    rows = (
+        Check.objects
+        .filter(latency_ms__isnull=False)
+        .annotate(bucket_start=TruncHour('checked_at', tzinfo=dt_timezone.utc), latency_bin=latency_bin)
+        .values('endpoint_id', 'bucket_start', 'latency_bin')
+        .annotate(check_count=Count('id'))
+        .order_by()
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=5000):
+        batch.append(CheckHourlyLatency(**row))
+        if len(batch) >= 1000:
+            CheckHourlyLatency.objects.bulk_create(batch)
+            batch = []
+    CheckHourlyLatency.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0011_hourly_stats_bucket_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckHourlyLatency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket_start', models.DateTimeField(verbose_name='집계 시작 시각')),
+                ('latency_bin', models.PositiveSmallIntegerField(verbose_name='응답시간 구간')),
+                ('check_count', models.IntegerField(default=0, verbose_name='건수')),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_latency', to='monitoring.endpoint', verbose_name='엔드포인트')),
+            ],
+            options={
+                'verbose_name': '시간별 응답시간 히스토그램',
+                'verbose_name_plural': '시간별 응답시간 히스토그램',
+                'db_table': 'check_hourly_latency',
+                'indexes': [models.Index(fields=['bucket_start'], name='IX_check_hourly_latency_bucket')],
+                'unique_together': {('endpoint', 'bucket_start', 'latency_bin')},
+            },
+        ),
+        migrations.RunPython(backfill_check_hourly_latency, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.utils import timezone
+import hashlib
+import json
 import uuid
 
 
@@ -19,6 +21,62 @@ class NetworkGroup(models.Model):
     def __str__(self):
         return self.name
 
+    def clone(self, name, copy_domains=True, copy_endpoints=True):
+        """
+        망구분 복제 (도메인/엔드포인트를 행 단위가 아닌 bulk_create로 일괄 복사)
+
+        새 도메인 ID는 (새 망구분, 도메인명) 유니크 키로 다시 조회해 원본 도메인과 매핑합니다.
+        반환값: (새 망구분, 복제된 도메인 수, 복제된 엔드포인트 수)
+        """
+        from django.db import transaction
+
+        with transaction.atomic():
+            new_group = NetworkGroup.objects.create(name=name, note=f'{self.note} (복제본)')
+            if not copy_domains:
+                return new_group, 0, 0
+
+            source_domains = list(self.domains.order_by('id'))
+            Domain.objects.bulk_create(
+                [
+                    Domain(
+                        network_group=new_group,
+                        domain=domain.domain,
+                        site_name=domain.site_name,
+                        owner_name=domain.owner_name,
+                        owner_contact=domain.owner_contact,
+                        is_active=domain.is_active,
+                        note=domain.note,
+                    )
+                    for domain in source_domains
+                ],
+                batch_size=CLONE_BATCH_SIZE
+            )
+            if not copy_endpoints:
+                return new_group, len(source_domains), 0
+
+            new_ids = dict(new_group.domains.values_list('domain', 'id'))
+            domain_map = {domain.id: new_ids[domain.domain] for domain in source_domains}
+            endpoints = [
+                Endpoint(
+                    domain_id=domain_map[endpoint['domain_id']],
+                    url=endpoint['url'],
+                    requires_db=endpoint['requires_db'],
+                    note=endpoint['note'],
+                    poll_interval_sec=endpoint['poll_interval_sec'],
+                    email_on_failure=endpoint['email_on_failure'],
+                    is_enabled=endpoint['is_enabled'],
+                )
+                for endpoint in Endpoint.objects.filter(domain__network_group=self).order_by('id').values(
+                    'domain_id', 'url', 'requires_db', 'note', 'poll_interval_sec', 'email_on_failure', 'is_enabled'
+                )
+            ]
+            Endpoint.objects.bulk_create(endpoints, batch_size=CLONE_BATCH_SIZE)
+        return new_group, len(source_domains), len(endpoints)
+
+
+# 복제 시 bulk insert 단위 (MSSQL 문장당 파라미터 2100개 제한 이내)
+CLONE_BATCH_SIZE = 200
+
 
 class Domain(models.Model):
     """도메인 모델"""
@@ -58,6 +116,16 @@ class Endpoint(models.Model):
         related_name='endpoints'
     )
     url = models.URLField('URL', max_length=2000)
+    # 상위 엔드포인트(게이트웨이 등)가 장애로 확인되면 콘솔이 이 엔드포인트 체크를 생략(suppressed)
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name='상위 엔드포인트',
+        related_name='children',
+        db_column='parent_endpoint_id'
+    )
     requires_db = models.BooleanField('DB연결 필요여부', default=False)
     note = models.TextField('비고', blank=True)
     poll_interval_sec = models.IntegerField('호출주기(초)', default=300)  # 기본 5분
@@ -75,6 +143,40 @@ class Endpoint(models.Model):
         return f"{self.url} ({self.domain.site_name})"
 
 
+class HeaderSet(models.Model):
+    """응답 헤더 조합 모델 (콘솔이 허용 목록 헤더만 정규화한 JSON, SHA2_256 해시로 한 번만 저장)"""
+    
+    header_hash = models.BinaryField('헤더 해시', max_length=32, primary_key=True)
+    headers = models.CharField('응답헤더', max_length=4000)
+    created_at = models.DateTimeField('생성일시', default=timezone.now)
+    
+    class Meta:
+        db_table = 'header_sets'
+        verbose_name = '응답 헤더 조합'
+        verbose_name_plural = '응답 헤더 조합'
+    
+    def __str__(self):
+        return self.headers
+    
+    @staticmethod
+    def normalize(headers):
+        """헤더 dict → 콘솔과 같은 정규화 JSON (이름 소문자, 이름순, 최대 4000자, 비어 있으면 None)"""
+        normalized = {name.lower(): ' '.join(str(value).split()) for name, value in headers.items()}
+        if not normalized:
+            return None
+        return json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(',', ':'))[:4000]
+    
+    @classmethod
+    def store(cls, headers):
+        """정규화한 헤더 문자열 저장 (이미 있으면 재사용), 반환값: 헤더 해시 (없으면 None)"""
+        if not headers:
+            return None
+        # usp_record_check의 HASHBYTES('SHA2_256', NVARCHAR)와 같은 값 (UTF-16LE)
+        header_hash = hashlib.sha256(headers.encode('utf-16-le')).digest()
+        cls.objects.get_or_create(header_hash=header_hash, defaults={'headers': headers})
+        return header_hash
+
+
 class Check(models.Model):
     """헬스체크 결과 모델"""
     
@@ -86,7 +188,9 @@ class Check(models.Model):
     )
     status_code = models.IntegerField('HTTP 상태코드', null=True)
     latency_ms = models.IntegerField('응답시간(ms)', null=True)
+    # 이전 버전 기록용 (새 결과는 header_hash로 HeaderSet 참조)
     headers = models.TextField('응답헤더', null=True, blank=True)
+    header_hash = models.BinaryField('헤더 해시', max_length=32, null=True, editable=False)
     error = models.TextField('오류메시지', null=True, blank=True)
     checked_at = models.DateTimeField('체크일시', default=timezone.now)
     trace_id = models.UUIDField('추적ID', default=uuid.uuid4, editable=False)
@@ -98,6 +202,8 @@ class Check(models.Model):
         ordering = ['-checked_at']
         indexes = [
             models.Index(fields=['endpoint', '-checked_at']),
+            # 체크 기록 키셋 페이지네이션 (checked_at, id)
+            models.Index(fields=['-checked_at', '-id'], name='IX_checks_checked_at_id'),
         ]
     
     def __str__(self):
@@ -134,6 +240,9 @@ class Rollup(models.Model):
     last_status = models.CharField('최종상태', max_length=6, choices=STATUS_CHOICES, default='AMBER')
     last_change_at = models.DateTimeField('최종변경일시', default=timezone.now)
     last_reason = models.CharField('최종사유', max_length=400, blank=True)
+    # 상위(호스트/도메인/망구분/상위 엔드포인트) 장애로 체크를 생략한 경우 (다음 실제 체크 시 해제)
+    suppressed_by = models.CharField('체크 생략 사유', max_length=200, null=True, blank=True)
+    suppressed_at = models.DateTimeField('체크 생략 일시', null=True, blank=True)
     updated_at = models.DateTimeField('갱신일시', auto_now=True)
     
     class Meta:
@@ -215,3 +324,478 @@ class Notification(models.Model):
     
     def __str__(self):
         return f"{self.title} -> {self.sent_to} ({self.status})"
+
+
+class CheckDailyStat(models.Model):
+    """
+    일별/망구분별 체크 집계 카운터 (체크 기록 화면 통계용)
+
+    usp_record_check가 체크를 기록할 때 함께 갱신합니다.
+    망구분 단위 행이므로 망구분 롤업 갱신과 같은 범위에서만 경합합니다.
+    """
+    
+    stat_date = models.DateField('집계일')
+    network_group = models.ForeignKey(
+        NetworkGroup,
+        on_delete=models.CASCADE,
+        verbose_name='망구분',
+        related_name='check_daily_stats'
+    )
+    total_count = models.BigIntegerField('전체 건수', default=0)
+    success_count = models.BigIntegerField('성공 건수', default=0)
+    error_count = models.BigIntegerField('오류 건수', default=0)
+    latency_sum = models.BigIntegerField('성공 응답시간 합계(ms)', default=0)
+    latency_count = models.BigIntegerField('성공 응답시간 건수', default=0)
+    
+    class Meta:
+        db_table = 'check_daily_stats'
+        verbose_name = '일별 체크 집계'
+        verbose_name_plural = '일별 체크 집계'
+        unique_together = ['stat_date', 'network_group']
+    
+    def __str__(self):
+        return f"{self.stat_date} {self.network_group_id}: {self.total_count}"
+    
+    @classmethod
+    def rebuild(cls, network_group_ids=None):
+        """checks 테이블에서 집계를 다시 계산 (초기 적재, 대량 입력 후 사용)"""
+        from datetime import timezone as dt_timezone
+        from django.db import transaction
+        from django.db.models import Count, Q, Sum
+        from django.db.models.functions import TruncDate
+        
+        success = Q(checks__status_code__gte=200, checks__status_code__lt=300, checks__error__isnull=True)
+        success_latency = success & Q(checks__latency_ms__isnull=False)
+        
+        endpoints = Endpoint.objects.all()
+        if network_group_ids is not None:
+            endpoints = endpoints.filter(domain__network_group_id__in=network_group_ids)
+        rows = (
+            endpoints
+            .filter(checks__isnull=False)
+            # DB에 저장된 시각 그대로 날짜를 자름 (usp_record_check의 CAST(@checked_at AS DATE), 시간별 집계와 같은 기준)
+            .annotate(stat_date=TruncDate('checks__checked_at', tzinfo=dt_timezone.utc))
+            .values('stat_date', 'domain__network_group_id')
+            .annotate(
+                total_count=Count('checks'),
+                success_count=Count('checks', filter=success),
+                latency_sum=Sum('checks__latency_ms', filter=success_latency),
+                latency_count=Count('checks', filter=success_latency),
+            )
+            .order_by()
+        )
+        stats = [
+            cls(
+                stat_date=row['stat_date'],
+                network_group_id=row['domain__network_group_id'],
+                total_count=row['total_count'],
+                success_count=row['success_count'],
+                error_count=row['total_count'] - row['success_count'],
+                latency_sum=row['latency_sum'] or 0,
+                latency_count=row['latency_count'],
+            )
+            for row in rows
+        ]
+        
+        with transaction.atomic():
+            existing = cls.objects.all()
+            if network_group_ids is not None:
+                existing = existing.filter(network_group_id__in=network_group_ids)
+            existing.delete()
+            cls.objects.bulk_create(stats, batch_size=1000)
+        return len(stats)
+
+
+class CheckHourlyStat(models.Model):
+    """
+    시간별/엔드포인트별 체크 집계 (장기간 응답시간 차트용)
+
+    usp_record_check가 체크를 기록할 때 함께 갱신합니다.
+    bucket_start는 checks.checked_at과 같은 기준의 정시 시각입니다.
+    """
+    
+    endpoint = models.ForeignKey(
+        Endpoint,
+        on_delete=models.CASCADE,
+        verbose_name='엔드포인트',
+        related_name='hourly_stats'
+    )
+    bucket_start = models.DateTimeField('집계 시작 시각')
+    total_count = models.IntegerField('전체 건수', default=0)
+    error_count = models.IntegerField('오류 건수', default=0)
+    latency_min = models.IntegerField('최소 응답시간(ms)', null=True)
+    latency_max = models.IntegerField('최대 응답시간(ms)', null=True)
+    latency_sum = models.BigIntegerField('응답시간 합계(ms)', default=0)
+    latency_count = models.IntegerField('응답시간 건수', default=0)
+    
+    class Meta:
+        db_table = 'check_hourly_stats'
+        verbose_name = '시간별 체크 집계'
+        verbose_name_plural = '시간별 체크 집계'
+        unique_together = ['endpoint', 'bucket_start']
+        indexes = [
+            # 가용률 리포트 기간 합산 (bucket_start 범위)
+            models.Index(fields=['bucket_start'], name='IX_check_hourly_stats_bucket'),
+        ]
+    
+    def __str__(self):
+        return f"{self.endpoint_id} {self.bucket_start}: {self.total_count}"
+    
+    @classmethod
+    def rebuild(cls, network_group_ids=None):
+        """checks 테이블에서 집계를 다시 계산 (초기 적재, 대량 입력 후 사용)"""
+        from datetime import timezone as dt_timezone
+        from django.db import transaction
+        from django.db.models import Count, Max, Min, Q, Sum
+        from django.db.models.functions import TruncHour
+        
+        success = Q(status_code__gte=200, status_code__lt=300, error__isnull=True)
+        
+        checks = Check.objects.all()
+        if network_group_ids is not None:
+            checks = checks.filter(endpoint__domain__network_group_id__in=network_group_ids)
+        rows = (
+            checks
+            # DB에 저장된 시각 그대로 정시 단위로 자름 (usp_record_check와 같은 기준)
+            .annotate(bucket_start=TruncHour('checked_at', tzinfo=dt_timezone.utc))
+            .values('endpoint_id', 'bucket_start')
+            .annotate(
+                total_count=Count('id'),
+                success_count=Count('id', filter=success),
+                latency_min=Min('latency_ms'),
+                latency_max=Max('latency_ms'),
+                latency_sum=Sum('latency_ms'),
+                latency_count=Count('latency_ms'),
+            )
+            .order_by()
+        )
+        
+        with transaction.atomic():
+            existing = cls.objects.all()
+            if network_group_ids is not None:
+                existing = existing.filter(endpoint__domain__network_group_id__in=network_group_ids)
+            existing.delete()
+            
+            batch = []
+            created = 0
+            for row in rows.iterator(chunk_size=5000):
+                batch.append(cls(
+                    endpoint_id=row['endpoint_id'],
+                    bucket_start=row['bucket_start'],
+                    total_count=row['total_count'],
+                    error_count=row['total_count'] - row['success_count'],
+                    latency_min=row['latency_min'],
+                    latency_max=row['latency_max'],
+                    latency_sum=row['latency_sum'] or 0,
+                    latency_count=row['latency_count'],
+                ))
+                if len(batch) >= 1000:
+                    cls.objects.bulk_create(batch)
+                    created += len(batch)
+                    batch = []
+            cls.objects.bulk_create(batch)
+        return created + len(batch)
+
+
+class CheckHourlyLatency(models.Model):
+    """
+    시간별/엔드포인트별 응답시간 히스토그램 (가용률 리포트 백분위용)
+
+    usp_record_check가 체크를 기록할 때 응답시간 구간의 건수를 1 늘립니다.
+    구간은 0 = 1ms 미만, 1~95 = 1ms~120초 로그 간격이며 마지막 구간은 그 이상을 포함합니다.
+    """
+    
+    BIN_COUNT = 96
+    BIN_MAX_MS = 120000
+    
+    endpoint = models.ForeignKey(
+        Endpoint,
+        on_delete=models.CASCADE,
+        verbose_name='엔드포인트',
+        related_name='hourly_latency'
+    )
+    bucket_start = models.DateTimeField('집계 시작 시각')
+    latency_bin = models.PositiveSmallIntegerField('응답시간 구간')
+    check_count = models.IntegerField('건수', default=0)
+    
+    class Meta:
+        db_table = 'check_hourly_latency'
+        verbose_name = '시간별 응답시간 히스토그램'
+        verbose_name_plural = '시간별 응답시간 히스토그램'
+        unique_together = ['endpoint', 'bucket_start', 'latency_bin']
+        indexes = [
+            models.Index(fields=['bucket_start'], name='IX_check_hourly_latency_bucket'),
+        ]
+    
+    def __str__(self):
+        return f"{self.endpoint_id} {self.bucket_start} [{self.latency_bin}]: {self.check_count}"
+    
+    @classmethod
+    def bin_expression(cls, field='latency_ms'):
+        """응답시간 → 구간 번호 (usp_record_check의 @latency_bin과 같은 계산)"""
+        import math
+        from django.db.models import Case, FloatField, IntegerField, Value, When
+        from django.db.models.functions import Cast, Floor, Ln
+        
+        ratio = math.log(cls.BIN_MAX_MS) / (cls.BIN_COUNT - 1)
+        return Case(
+            When(**{f'{field}__lt': 1}, then=Value(0)),
+            When(**{f'{field}__gte': cls.BIN_MAX_MS}, then=Value(cls.BIN_COUNT - 1)),
+            default=Cast(Floor(Ln(Cast(field, FloatField())) / Value(ratio)), IntegerField()) + 1,
+            output_field=IntegerField(),
+        )
+    
+    @classmethod
+    def rebuild(cls, network_group_ids=None):
+        """checks 테이블에서 히스토그램을 다시 계산 (초기 적재, 대량 입력 후 사용)"""
+        from datetime import timezone as dt_timezone
+        from django.db import transaction
+        from django.db.models import Count
+        from django.db.models.functions import TruncHour
+        
+        checks = Check.objects.filter(latency_ms__isnull=False)
+        if network_group_ids is not None:
+            checks = checks.filter(endpoint__domain__network_group_id__in=network_group_ids)
+        rows = (
+            checks
+            # 시간별 집계와 같은 정시 구간
+            .annotate(bucket_start=TruncHour('checked_at', tzinfo=dt_timezone.utc), latency_bin=cls.bin_expression())
+            .values('endpoint_id', 'bucket_start', 'latency_bin')
+            .annotate(check_count=Count('id'))
+            .order_by()
+        )
+        
+        with transaction.atomic():
+            existing = cls.objects.all()
+            if network_group_ids is not None:
+                existing = existing.filter(endpoint__domain__network_group_id__in=network_group_ids)
+            existing.delete()
+            
+            batch = []
+            created = 0
+            for row in rows.iterator(chunk_size=5000):
+                batch.append(cls(**row))
+                if len(batch) >= 1000:
+                    cls.objects.bulk_create(batch)
+                    created += len(batch)
+                    batch = []
+            cls.objects.bulk_create(batch)
+        return created + len(batch)
+
+
+class Incident(models.Model):
+    """
+    장애 구간 (엔드포인트 상태가 장애/신호없음으로 바뀐 시점부터 다시 바뀐 시점까지)
+
+    usp_record_check가 체크를 기록할 때 구간을 열고 닫으므로,
+    장애 이력과 MTTR을 체크 기록 전체를 읽지 않고 조회할 수 있습니다.
+    엔드포인트당 열린 구간(ended_at 없음)은 최대 1개입니다.
+    """
+    
+    STATUS_CHOICES = [
+        ('AMBER', '신호없음'),
+        ('RED', '장애'),
+    ]
+    
+    endpoint = models.ForeignKey(
+        Endpoint,
+        on_delete=models.CASCADE,
+        verbose_name='엔드포인트',
+        related_name='incidents'
+    )
+    status = models.CharField('상태', max_length=6, choices=STATUS_CHOICES)
+    started_at = models.DateTimeField('시작일시')
+    ended_at = models.DateTimeField('종료일시', null=True, blank=True)
+    duration_sec = models.IntegerField('지속시간(초)', null=True, blank=True)
+    first_error = models.TextField('최초 오류', blank=True)
+    last_error = models.TextField('최근 오류', blank=True)
+    check_count = models.IntegerField('체크 건수', default=1)
+    last_checked_at = models.DateTimeField('최근 체크일시')
+    
+    class Meta:
+        db_table = 'incidents'
+        verbose_name = '장애 구간'
+        verbose_name_plural = '장애 구간'
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['endpoint', '-started_at'], name='IX_incidents_endpoint'),
+            # 장애 이력 키셋 페이지네이션 (started_at, id)
+            models.Index(fields=['-started_at', '-id'], name='IX_incidents_started_at_id'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['endpoint'], condition=models.Q(ended_at__isnull=True), name='UQ_incidents_open'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.endpoint_id} {self.status} ({self.started_at} ~ {self.ended_at or ''})"
+    
+    @property
+    def is_open(self):
+        """진행 중 여부"""
+        return self.ended_at is None
+    
+    @property
+    def duration_display(self):
+        """지속시간 표시 (진행 중이면 현재까지)"""
+        from .incidents import format_duration
+        if self.ended_at is None:
+            return format_duration((timezone.now() - self.started_at).total_seconds())
+        return format_duration(self.duration_sec)
+    
+    @classmethod
+    def rebuild(cls, network_group_ids=None):
+        """checks 테이블에서 장애 구간을 다시 계산 (초기 적재, 대량 입력 후 사용)"""
+        from django.db import transaction
+        from .incidents import replay_checks
+        
+        checks = Check.objects.all()
+        if network_group_ids is not None:
+            checks = checks.filter(endpoint__domain__network_group_id__in=network_group_ids)
+        rows = (
+            checks
+            .order_by('endpoint_id', 'checked_at', 'id')
+            .values_list('endpoint_id', 'status_code', 'error', 'checked_at')
+            .iterator(chunk_size=5000)
+        )
+        
+        with transaction.atomic():
+            existing = cls.objects.all()
+            if network_group_ids is not None:
+                existing = existing.filter(endpoint__domain__network_group_id__in=network_group_ids)
+            existing.delete()
+            
+            batch = []
+            created = 0
+            for incident in replay_checks(rows):
+                batch.append(cls(**incident))
+                if len(batch) >= 1000:
+                    cls.objects.bulk_create(batch)
+                    created += len(batch)
+                    batch = []
+            cls.objects.bulk_create(batch)
+        return created + len(batch)
+
+
+class ProbeAgent(models.Model):
+    """
+    원격 폴러 에이전트 (DB에 직접 연결할 수 없는 망 안의 콘솔)
+
+    에이전트는 체크 결과를 수집 API(/monitoring/api/ingest/)로 보내고 응답으로 담당 엔드포인트를 받습니다.
+    토큰은 발급 시 한 번만 보여 주고 SHA-256 해시만 저장합니다.
+    """
+    
+    name = models.CharField('에이전트명', max_length=100, unique=True)
+    network_group = models.ForeignKey(
+        NetworkGroup,
+        on_delete=models.CASCADE,
+        verbose_name='담당 망구분',
+        related_name='probe_agents'
+    )
+    token_hash = models.CharField('토큰 해시', max_length=64, unique=True, editable=False)
+    is_active = models.BooleanField('활성 상태', default=True)
+    note = models.TextField('비고', blank=True)
+    last_seen_at = models.DateTimeField('최근 수집일시', null=True, blank=True)
+    last_address = models.GenericIPAddressField('최근 접속 주소', null=True, blank=True)
+    created_at = models.DateTimeField('생성일시', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+    
+    class Meta:
+        db_table = 'probe_agents'
+        verbose_name = '원격 에이전트'
+        verbose_name_plural = '원격 에이전트'
+        ordering = ['name']
+    
+    def __str__(self):
+        return f"{self.name} ({self.network_group})"
+    
+    @staticmethod
+    def hash_token(token):
+        """토큰 해시 (SHA-256 16진수)"""
+        import hashlib
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+    
+    def issue_token(self):
+        """새 토큰 발급 (기존 토큰은 즉시 무효), 반환값: 평문 토큰 (저장 전에 호출)"""
+        import secrets
+        token = secrets.token_urlsafe(32)
+        self.token_hash = self.hash_token(token)
+        return token
+    
+    @classmethod
+    def authenticate(cls, authorization):
+        """Authorization: Bearer <토큰> 헤더로 활성 에이전트 조회 (실패 시 None)"""
+        scheme, _, token = (authorization or '').partition(' ')
+        if scheme.lower() != 'bearer' or not token.strip():
+            return None
+        return (
+            cls.objects
+            .select_related('network_group')
+            .filter(token_hash=cls.hash_token(token.strip()), is_active=True)
+            .first()
+        )
+
+
+class CheckRequest(models.Model):
+    """
+    즉시 점검 요청 (웹앱이 넣고 콘솔이 usp_claim_check_requests로 가져감)
+
+    콘솔은 예약된 체크보다 먼저 실행하고 기록한 체크 ID를 연결합니다. (하루 지난 요청은 usp_cleanup_old_checks가 삭제)
+    """
+    
+    endpoint = models.ForeignKey(
+        Endpoint,
+        on_delete=models.CASCADE,
+        verbose_name='엔드포인트',
+        related_name='check_requests'
+    )
+    requested_by = models.ForeignKey(
+        'accounts.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name='요청자'
+    )
+    requested_at = models.DateTimeField('요청일시', default=timezone.now)
+    claimed_by = models.CharField('처리 인스턴스', max_length=100, null=True, blank=True)
+    claimed_at = models.DateTimeField('처리 시작일시', null=True, blank=True)
+    completed_at = models.DateTimeField('완료일시', null=True, blank=True)
+    # 체크 기록은 보관기간이 지나면 삭제되므로 FK 제약 없이 ID만 연결 (Model.check와 겹치지 않는 이름)
+    check_result = models.ForeignKey(
+        Check,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_column='check_id',
+        null=True,
+        blank=True,
+        verbose_name='체크 결과',
+        related_name='+'
+    )
+    
+    class Meta:
+        db_table = 'check_requests'
+        verbose_name = '즉시 점검 요청'
+        verbose_name_plural = '즉시 점검 요청'
+        ordering = ['-requested_at']
+    
+    def __str__(self):
+        return f"{self.endpoint_id} ({self.requested_at})"
+    
+    @classmethod
+    def enqueue(cls, endpoint_id, user=None):
+        """즉시 점검 요청 추가 (아직 완료되지 않은 요청이 있으면 그 요청 재사용)"""
+        pending = cls.objects.filter(endpoint_id=endpoint_id, completed_at__isnull=True).order_by('id').first()
+        return pending or cls.objects.create(endpoint_id=endpoint_id, requested_by=user)
+    
+    @classmethod
+    def enqueue_many(cls, endpoint_ids, user=None):
+        """여러 엔드포인트 즉시 점검 요청 (완료되지 않은 요청이 있는 엔드포인트는 건너뜀), 반환값: 추가한 요청 수"""
+        pending = set(
+            cls.objects.filter(completed_at__isnull=True).values_list('endpoint_id', flat=True)
+        )
+        created = cls.objects.bulk_create([
+            cls(endpoint_id=endpoint_id, requested_by=user)
+            for endpoint_id in endpoint_ids if endpoint_id not in pending
+        ], batch_size=1000)
+        return len(created)
@@ -0,0 +1,331 @@
+"""
+가용률(SLA) 리포트 엔진
+월 단위로 시간별 집계(check_hourly_stats)와 장애 구간(incidents)을 읽어 엔드포인트별 배열(NumPy)로 계산하고 캐시합니다.
+체크 기록(checks)은 읽지 않으므로 엔드포인트 수가 많아도 월 리포트는 집계 쿼리 몇 번으로 만들어집니다.
+연간 리포트는 캐시된 월별 결과를 합쳐 만들므로 지난 달은 다시 계산하지 않습니다.
+
+- 가동률: 체크가 있었던 시간(시간별 집계가 있는 정시 구간) 중 장애 구간이 아닌 시간의 비율
+- 장애 구간: incidents (usp_record_check가 상태가 바뀔 때 열고 닫는 구간), 월 경계에 걸친 구간은 한 건으로 셈
+- MTTR: 장애 시간 합계 / 장애 건수, MTBF: 정상 시간 합계 / 장애 건수
+- 응답시간 백분위: 시간별 응답시간 히스토그램(check_hourly_latency)을 합친 로그 간격 구간의 기하 중앙값으로 근사
+"""
+
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, Q, Sum
+from django.utils import timezone
+
+from common.dbtime import from_stored, stored_now, stored_start_of_day
+from .models import CheckHourlyLatency, CheckHourlyStat, Endpoint, Incident
+
+# 응답시간 히스토그램 구간 경계 (ms, 로그 간격): [0, 1), [1, r), [r, r²), ... 마지막 구간은 그 이상 포함
+LATENCY_BINS = np.concatenate([
+    [0.0], np.geomspace(1, CheckHourlyLatency.BIN_MAX_MS, CheckHourlyLatency.BIN_COUNT)
+])
+PERCENTILES = (50, 95, 99)
+
+BUCKET_SECONDS = 3600
+
+LEVELS = ('network', 'domain', 'endpoint')
+
+
+def month_range(year, month):
+    """월의 [시작, 끝) (DB 저장 기준: KST 시각 + UTC tzinfo)"""
+    start = stored_start_of_day(date(year, month, 1))
+    if month == 12:
+        end = stored_start_of_day(date(year + 1, 1, 1))
+    else:
+        end = stored_start_of_day(date(year, month + 1, 1))
+    return start, end
+
+
+def period_months(period):
+    """'YYYY-MM' 또는 'YYYY' 기간의 (연, 월) 목록"""
+    if len(period) == 4:
+        year = int(period)
+        return [(year, month) for month in range(1, 13)]
+    year, month = period.split('-')
+    if not 1 <= int(month) <= 12:
+        raise ValueError(period)
+    return [(int(year), int(month))]
+
+
+def monthly_stats(year, month):
+    """
+    월별 엔드포인트 통계 (캐시 사용)
+
+    지난 달은 결과가 바뀌지 않으므로 오래 캐시하고, 이번 달은 짧게 캐시합니다.
+    """
+    start, end = month_range(year, month)
+    now = stored_now()
+    if start >= now:
+        return None
+
+    key = f'sla_report:v4:{year:04d}-{month:02d}'
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_stats(start, min(end, now))
+        timeout = settings.SLA_REPORT_CACHE_SECONDS if end > now else settings.SLA_REPORT_PAST_CACHE_SECONDS
+        cache.set(key, stats, timeout)
+    return stats
+
+
+def compute_stats(start, end):
+    """[start, end) 구간의 엔드포인트별 통계를 배열로 계산 (시간별 집계 + 장애 구간)"""
+    endpoint_ids = np.array(list(Endpoint.objects.order_by('id').values_list('id', flat=True)), dtype=np.int64)
+    n = len(endpoint_ids)
+    start_ts, end_ts = start.timestamp(), end.timestamp()
+    stats = {
+        'start': start_ts,
+        'end': end_ts,
+        'endpoint_ids': endpoint_ids,
+        'checks': np.zeros(n, dtype=np.int64),
+        'errors': np.zeros(n, dtype=np.int64),
+        'covered': np.zeros(n, dtype=np.float64),
+        'downtime': np.zeros(n, dtype=np.float64),
+        'incidents': np.zeros(n, dtype=np.int64),
+        'histogram': np.zeros((n, len(LATENCY_BINS) - 1), dtype=np.int64),
+    }
+
+    hourly = CheckHourlyStat.objects.filter(bucket_start__gte=start, bucket_start__lt=end)
+
+    # 체크/오류 건수와 체크가 있었던 시간 (마지막 정시 구간은 end까지만)
+    totals = list(
+        hourly.values('endpoint_id')
+        .annotate(checks=Sum('total_count'), errors=Sum('error_count'), buckets=Count('id'), last=Max('bucket_start'))
+        .order_by()
+        .values_list('endpoint_id', 'checks', 'errors', 'buckets', 'last')
+    )
+    if totals:
+        index = _positions(endpoint_ids, [row[0] for row in totals])
+        known = index >= 0
+        overrun = np.array([max(row[4].timestamp() + BUCKET_SECONDS - end_ts, 0) for row in totals])
+        stats['checks'][index[known]] = np.array([row[1] for row in totals], dtype=np.int64)[known]
+        stats['errors'][index[known]] = np.array([row[2] for row in totals], dtype=np.int64)[known]
+        stats['covered'][index[known]] = (np.array([row[3] for row in totals]) * BUCKET_SECONDS - overrun)[known]
+
+    # 응답시간 히스토그램: 시간별 구간 건수를 DB에서 (엔드포인트, 구간)별로 합산
+    bins = list(
+        CheckHourlyLatency.objects
+        .filter(bucket_start__gte=start, bucket_start__lt=end)
+        .values('endpoint_id', 'latency_bin')
+        .annotate(weight=Sum('check_count'))
+        .order_by()
+        .values_list('endpoint_id', 'latency_bin', 'weight')
+    )
+    if bins:
+        index = _positions(endpoint_ids, [row[0] for row in bins])
+        known = index >= 0
+        np.add.at(
+            stats['histogram'],
+            (index[known], np.array([row[1] for row in bins], dtype=np.int64)[known]),
+            np.array([row[2] for row in bins], dtype=np.int64)[known],
+        )
+
+    # 구간과 겹치는 장애 구간 (열린 구간은 end까지), 장애 시간은 구간 안쪽만
+    incidents = list(
+        Incident.objects
+        .filter(started_at__lt=end)
+        .filter(Q(ended_at__isnull=True) | Q(ended_at__gt=start))
+        .order_by('id')
+        .values_list('id', 'endpoint_id', 'started_at', 'ended_at')
+    )
+    index = _positions(endpoint_ids, [row[1] for row in incidents])
+    known = index >= 0
+    stats['interval_id'] = np.array([row[0] for row in incidents], dtype=np.int64)[known]
+    stats['interval_endpoint'] = np.array([row[1] for row in incidents], dtype=np.int64)[known]
+    stats['interval_start'] = np.array([row[2].timestamp() for row in incidents], dtype=np.float64)[known]
+    stats['interval_end'] = np.array(
+        [end_ts if row[3] is None else row[3].timestamp() for row in incidents], dtype=np.float64
+    )[known]
+    clipped = (
+        np.minimum(stats['interval_end'], end_ts) - np.maximum(stats['interval_start'], start_ts)
+    ).clip(min=0)
+    np.add.at(stats['downtime'], index[known], clipped)
+    np.add.at(stats['incidents'], index[known], 1)
+    # 체크가 없던 시간(콘솔 중지 등)까지 열려 있던 구간은 측정 시간을 넘지 않도록
+    stats['downtime'] = np.minimum(stats['downtime'], stats['covered'])
+    return stats
+
+
+def _positions(endpoint_ids, ids):
+    """엔드포인트 ID → 배열 위치 (삭제된 엔드포인트는 -1)"""
+    ids = np.asarray(ids, dtype=np.int64)
+    if not len(endpoint_ids):
+        return np.full(len(ids), -1)
+    index = np.minimum(np.searchsorted(endpoint_ids, ids), len(endpoint_ids) - 1)
+    return np.where(endpoint_ids[index] == ids, index, -1)
+
+
+def merge_stats(parts):
+    """
+    월별 통계 합치기 (엔드포인트 ID 기준으로 정렬해 합산)
+
+    월 경계에 걸친 장애 구간은 여러 달에 들어 있으므로 구간 ID로 하나로 이어 붙인 뒤 건수를 셉니다.
+    (장애 시간은 월별로 구간 안쪽만 더했으므로 그대로 합산)
+    """
+    parts = [part for part in parts if part is not None]
+    if not parts:
+        return None
+    if len(parts) == 1:
+        return parts[0]
+
+    endpoint_ids = np.unique(np.concatenate([part['endpoint_ids'] for part in parts]))
+    n = len(endpoint_ids)
+    merged = {
+        'start': min(part['start'] for part in parts),
+        'end': max(part['end'] for part in parts),
+        'endpoint_ids': endpoint_ids,
+        'checks': np.zeros(n, dtype=np.int64),
+        'errors': np.zeros(n, dtype=np.int64),
+        'covered': np.zeros(n, dtype=np.float64),
+        'downtime': np.zeros(n, dtype=np.float64),
+        'histogram': np.zeros((n, len(LATENCY_BINS) - 1), dtype=np.int64),
+    }
+    for part in parts:
+        index = np.searchsorted(endpoint_ids, part['endpoint_ids'])
+        for name in ('checks', 'errors', 'covered', 'downtime', 'histogram'):
+            merged[name][index] += part[name]
+
+    ids = np.concatenate([part['interval_id'] for part in parts])
+    ends = np.concatenate([part['interval_end'] for part in parts])
+    # 같은 구간은 종료 시각이 가장 늦은 것(뒤쪽 달) 하나만 남김
+    order = np.lexsort((-ends, ids))
+    first = order[np.concatenate([[True], np.diff(ids[order]) != 0])] if len(ids) else order
+    merged['interval_id'] = ids[first]
+    merged['interval_end'] = ends[first]
+    for name in ('interval_endpoint', 'interval_start'):
+        merged[name] = np.concatenate([part[name] for part in parts])[first]
+    merged['incidents'] = np.bincount(
+        np.searchsorted(endpoint_ids, merged['interval_endpoint']), minlength=n
+    ).astype(np.int64)
+    return merged
+
+
+def build_report(period, level='network', network_group_id=None, max_intervals=100):
+    """
+    기간/집계 단위별 리포트 행 목록과 장애 구간 목록 생성
+
+    반환값: (rows, intervals) - 장애 구간은 긴 순서로 max_intervals개
+    """
+    if level not in LEVELS:
+        raise ValueError(level)
+    stats = merge_stats([monthly_stats(year, month) for year, month in period_months(period)])
+    if stats is None:
+        return [], []
+
+    endpoints = {
+        row[0]: row for row in Endpoint.objects.values_list(
+            'id', 'url', 'domain_id', 'domain__domain', 'domain__site_name',
+            'domain__network_group_id', 'domain__network_group__name'
+        )
+    }
+    endpoint_ids = stats['endpoint_ids']
+    known = np.array([int(i) in endpoints for i in endpoint_ids], dtype=bool)
+    if network_group_id:
+        known &= np.array(
+            [int(i) in endpoints and endpoints[int(i)][5] == network_group_id for i in endpoint_ids], dtype=bool
+        )
+
+    # 엔드포인트 → 집계 대상(망구분/도메인/엔드포인트) 매핑
+    if level == 'endpoint':
+        keys = {int(i): int(i) for i in endpoint_ids[known]}
+        labels = {int(i): {'name': endpoints[int(i)][1], 'parent': endpoints[int(i)][3]} for i in endpoint_ids[known]}
+    elif level == 'domain':
+        keys = {int(i): endpoints[int(i)][2] for i in endpoint_ids[known]}
+        labels = {
+            endpoints[int(i)][2]: {'name': endpoints[int(i)][3], 'parent': endpoints[int(i)][6]}
+            for i in endpoint_ids[known]
+        }
+    else:
+        keys = {int(i): endpoints[int(i)][5] for i in endpoint_ids[known]}
+        labels = {endpoints[int(i)][5]: {'name': endpoints[int(i)][6], 'parent': ''} for i in endpoint_ids[known]}
+
+    entity_ids = sorted(labels)
+    entity_index = {entity: index for index, entity in enumerate(entity_ids)}
+    group = np.array([entity_index[keys[int(i)]] for i in endpoint_ids[known]], dtype=np.int64)
+    m = len(entity_ids)
+
+    def total(name):
+        return np.bincount(group, weights=stats[name][known], minlength=m)
+
+    checks, errors = total('checks'), total('errors')
+    covered, downtime, incidents = total('covered'), total('downtime'), total('incidents')
+    endpoint_count = np.bincount(group, minlength=m)
+    histogram = np.zeros((m, stats['histogram'].shape[1]), dtype=np.uint64)
+    np.add.at(histogram, group, stats['histogram'][known])
+    percentiles = _histogram_percentiles(histogram)
+
+    uptime = np.divide(covered - downtime, covered, out=np.full(m, np.nan), where=covered > 0) * 100
+    mttr = np.divide(downtime, incidents, out=np.full(m, np.nan), where=incidents > 0)
+    mtbf = np.divide(covered - downtime, incidents, out=np.full(m, np.nan), where=incidents > 0)
+
+    target = settings.SLA_TARGET_PERCENT
+    rows = []
+    for index, entity in enumerate(entity_ids):
+        rows.append({
+            'id': entity,
+            'name': labels[entity]['name'],
+            'parent': labels[entity]['parent'],
+            'endpoints': int(endpoint_count[index]),
+            'checks': int(checks[index]),
+            'errors': int(errors[index]),
+            'uptime': None if np.isnan(uptime[index]) else round(float(uptime[index]), 3),
+            'downtime_sec': int(downtime[index]),
+            'incidents': int(incidents[index]),
+            'mttr_sec': None if np.isnan(mttr[index]) else int(mttr[index]),
+            'mtbf_sec': None if np.isnan(mtbf[index]) else int(mtbf[index]),
+            'p50': percentiles[index][0],
+            'p95': percentiles[index][1],
+            'p99': percentiles[index][2],
+            'breached': bool(not np.isnan(uptime[index]) and uptime[index] < target),
+        })
+
+    interval_mask = np.isin(stats['interval_endpoint'], endpoint_ids[known])
+    order = np.argsort(stats['interval_start'][interval_mask] - stats['interval_end'][interval_mask])[:max_intervals]
+    intervals = []
+    for endpoint_id, start, end in zip(
+        stats['interval_endpoint'][interval_mask][order],
+        stats['interval_start'][interval_mask][order],
+        stats['interval_end'][interval_mask][order],
+    ):
+        endpoint = endpoints[int(endpoint_id)]
+        intervals.append({
+            'endpoint_id': int(endpoint_id),
+            'url': endpoint[1],
+            'domain': endpoint[3],
+            'network_group': endpoint[6],
+            'start': _to_local(start),
+            'end': _to_local(end),
+            'duration_sec': int(end - start),
+        })
+    return rows, intervals
+
+
+def _histogram_percentiles(histogram):
+    """히스토그램 행별 백분위 응답시간 (구간의 기하 중앙값)"""
+    centers = np.sqrt(np.maximum(LATENCY_BINS[:-1], 0.5) * LATENCY_BINS[1:])
+    cumulative = np.cumsum(histogram, axis=1)
+    totals = cumulative[:, -1]
+    result = []
+    for row, count in zip(cumulative, totals):
+        if count == 0:
+            result.append([None] * len(PERCENTILES))
+            continue
+        ranks = np.ceil(np.array(PERCENTILES) / 100 * count)
+        result.append([int(round(centers[i])) for i in np.searchsorted(row, ranks)])
+    return result
+
+
+def _to_local(epoch):
+    return from_stored(datetime.fromtimestamp(epoch, dt_timezone.utc))
+
+
+def default_period():
+    """기본 리포트 기간 (지난 달)"""
+    first = timezone.localdate().replace(day=1)
+    previous = first - timedelta(days=1)
+    return f'{previous.year:04d}-{previous.month:02d}'
@@ -1,3 +1,553 @@
-from django.test import TestCase
+import gzip
+import json
+import unittest
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from common.dbtime import to_stored
+from common.pagination import KeysetPaginator
+from common.testing import QueryBudgetMixin
+from .config_import import ConfigImportError, apply_plan, build_plan, read_rows
+from .incidents import replay_checks
+from .ingest import IngestError, read_batch
+from .models import (
+    NetworkGroup, Domain, Endpoint, Check, CheckDailyStat, CheckHourlyLatency, CheckHourlyStat, ConfigRevision,
+    CheckRequest, HeaderSet, Incident, ProbeAgent,
+)
+from .reports import build_report, compute_stats, merge_stats, month_range, monthly_stats
+
+
+def create_admin():
+    return get_user_model().objects.create_superuser('admin', 'admin@jnu.ac.kr', '010-0000-0000', 'pw')
+
+
+def create_endpoints(groups=1, domains=1, endpoints=1, prefix='TEST'):
+    """망구분 groups개 × 도메인 domains개 × 엔드포인트 endpoints개 생성, 반환값: 엔드포인트 목록"""
+    created = []
+    for g in range(groups):
+        group = NetworkGroup.objects.create(name=f'{prefix}-{g}')
+        for d in range(domains):
+            domain = Domain.objects.create(
+                network_group=group, domain=f'd{g}-{d}.{prefix.lower()}.jnu.ac.kr', site_name=f'사이트 {g}-{d}',
+                owner_name='담당자'
+            )
+            for e in range(endpoints):
+                created.append(Endpoint.objects.create(domain=domain, url=f'https://{domain.domain}/health/{e}'))
+    return created
+
+
+class AdminClientMixin:
+    """관리자로 로그인한 self.client"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_admin()
+
+    def setUp(self):
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+        self.client.force_login(self.user, backend='django.contrib.auth.backends.ModelBackend')
+
+
+class MonitoringQueryBudgetTests(AdminClientMixin, QueryBudgetMixin, TestCase):
+    """관리 화면 쿼리 수가 VIEW_QUERY_BUDGETS 이내인지 (목록은 행 수와 관계없이 일정해야 함)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.endpoints = create_endpoints(groups=3, domains=3, endpoints=3)
+        for endpoint in cls.endpoints:
+            Check.objects.create(endpoint=endpoint, status_code=200, latency_ms=30)
+
+    @unittest.expectedFailure  # 망구분별 N+1, VIEW_QUERY_BUDGETS 참고
+    def test_network_group_list(self):
+        self.assertEqual(self.assertViewQueryBudget('monitoring:network_group_list').status_code, 200)
+
+    @unittest.expectedFailure  # 도메인별 N+1
+    def test_domain_list(self):
+        self.assertEqual(self.assertViewQueryBudget('monitoring:domain_list').status_code, 200)
+
+    def test_endpoint_list(self):
+        self.assertEqual(self.assertViewQueryBudget('monitoring:endpoint_list').status_code, 200)
+
+    def test_check_history(self):
+        self.assertEqual(self.assertViewQueryBudget('monitoring:check_history').status_code, 200)
+
+    def test_incident_list(self):
+        self.assertEqual(self.assertViewQueryBudget('monitoring:incident_list').status_code, 200)
+
+
+class StatRebuildTests(TestCase):
+    """집계 재계산이 usp_record_check와 같은 날짜/시간 경계를 쓰는지"""
+
+    def test_daily_and_hourly_use_stored_time(self):
+        endpoint = create_endpoints()[0]
+        # DB에는 한국 시간이 시간대 없이 저장됨 (Django는 UTC로 읽음): 10/19 23:30, 10/20 00:10
+        for hour, minute in ((23, 30), (24, 10)):
+            checked_at = datetime(2026, 10, 19, tzinfo=dt_timezone.utc) + timedelta(hours=hour, minutes=minute)
+            Check.objects.create(endpoint=endpoint, status_code=200, latency_ms=10, checked_at=checked_at)
+
+        CheckDailyStat.rebuild()
+        CheckHourlyStat.rebuild()
+
+        daily = dict(CheckDailyStat.objects.values_list('stat_date', 'total_count'))
+        self.assertEqual(daily, {date(2026, 10, 19): 1, date(2026, 10, 20): 1})
+        hourly_dates = sorted(bucket.date() for bucket in CheckHourlyStat.objects.values_list('bucket_start', flat=True))
+        self.assertEqual(hourly_dates, sorted(daily))
+
+    def test_latency_bins_match_procedure(self):
+        endpoint = create_endpoints()[0]
+        for latency_ms in (0, 1, 100, 119999, 120000, 500000):
+            Check.objects.create(endpoint=endpoint, status_code=200, latency_ms=latency_ms,
+                                 checked_at=stored_time(2026, 10, 19, 10))
+        CheckHourlyLatency.rebuild()
+        bins = dict(CheckHourlyLatency.objects.values_list('latency_bin', 'check_count'))
+        # usp_record_check: 1ms 미만 0, 120초 이상 95, 그 사이는 FLOOR(LOG(ms) / (LOG(120000) / 95)) + 1
+        self.assertEqual(bins, {0: 1, 1: 1, 38: 1, 95: 3})
+
+
+class NetworkGroupCloneTests(TestCase):
+    """NetworkGroup.clone (usp_endpoint_clone_from_group과 같은 컬럼 복사)"""
+
+    def test_clone_copies_domains_and_endpoints(self):
+        endpoint = create_endpoints(domains=2, endpoints=2)[0]
+        source = endpoint.domain.network_group
+        Domain.objects.filter(id=endpoint.domain_id).update(owner_contact='a@jnu.ac.kr', is_active=False)
+
+        clone, domain_count, endpoint_count = source.clone('TEST-copy')
+
+        self.assertEqual((domain_count, endpoint_count), (2, 4))
+        copied = clone.domains.get(domain=endpoint.domain.domain)
+        self.assertEqual((copied.owner_contact, copied.is_active), ('a@jnu.ac.kr', False))
+        self.assertEqual(
+            sorted(Endpoint.objects.filter(domain__network_group=clone).values_list('url', flat=True)),
+            sorted(Endpoint.objects.filter(domain__network_group=source).values_list('url', flat=True)),
+        )
+
+
+def local_time(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+def stored_time(*args):
+    """DB 저장 값: 한국 시간을 시간대 없이 저장 (Django는 UTC로 읽음)"""
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class SlaReportTests(TestCase):
+    """시간별 집계 + 장애 구간 기반 SLA 리포트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.endpoint = create_endpoints()[0]
+        # 2025-09-30 20:00 ~ 2025-10-01 04:00 (9시간) 매시 60건, 장애 구간 09-30 22:00 ~ 10-01 02:00
+        for hour in range(9):
+            CheckHourlyStat.objects.create(
+                endpoint=cls.endpoint, bucket_start=stored_time(2025, 9, 30, 20) + timedelta(hours=hour),
+                total_count=60, error_count=60 if 2 <= hour < 6 else 0,
+                latency_sum=60 * 100, latency_count=60,
+            )
+        Incident.objects.create(
+            endpoint=cls.endpoint, status='RED', started_at=stored_time(2025, 9, 30, 22),
+            ended_at=stored_time(2025, 10, 1, 2), duration_sec=4 * 3600, check_count=240,
+            last_checked_at=stored_time(2025, 10, 1, 1, 59),
+        )
+
+    def setUp(self):
+        # 월별 결과 캐시는 테스트마다 비움
+        cache.clear()
+
+    def test_month_clips_downtime_to_month(self):
+        september = compute_stats(*month_range(2025, 9))
+        october = compute_stats(*month_range(2025, 10))
+        self.assertEqual(september['covered'][0], 4 * 3600)
+        self.assertEqual(september['downtime'][0], 2 * 3600)
+        self.assertEqual(october['covered'][0], 5 * 3600)
+        self.assertEqual(october['downtime'][0], 2 * 3600)
+        self.assertEqual((september['checks'][0], october['checks'][0]), (240, 300))
+
+    def test_incident_across_month_boundary_counted_once(self):
+        merged = merge_stats([compute_stats(*month_range(2025, month)) for month in (9, 10)])
+        self.assertEqual(merged['incidents'][0], 1)
+        self.assertEqual(merged['downtime'][0], 4 * 3600)
+
+        rows, intervals = build_report('2025', level='endpoint')
+        self.assertEqual(rows[0]['incidents'], 1)
+        self.assertEqual(rows[0]['mttr_sec'], 4 * 3600)
+        self.assertEqual(rows[0]['uptime'], round(5 / 9 * 100, 3))
+        self.assertEqual(len(intervals), 1)
+        self.assertEqual(intervals[0]['duration_sec'], 4 * 3600)
+
+    def test_current_month_counts_open_incident(self):
+        endpoint = create_endpoints(prefix='OPEN')[0]
+        now = to_stored(timezone.now())
+        bucket = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+        for hour in range(3):
+            CheckHourlyStat.objects.create(
+                endpoint=endpoint, bucket_start=bucket + timedelta(hours=hour), total_count=60, error_count=60,
+            )
+        Incident.objects.create(
+            endpoint=endpoint, status='RED', started_at=bucket, check_count=180, last_checked_at=now,
+        )
+        stats = monthly_stats(now.year, now.month)
+        position = list(stats['endpoint_ids']).index(endpoint.id)
+        # 열린 장애 구간은 (저장 기준) 현재 시각까지
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        self.assertAlmostEqual(stats['downtime'][position], (now - max(bucket, month_start)).total_seconds(), delta=5)
+
+    def test_latency_percentiles_keep_tail(self):
+        # 10/01 01시: 100ms 94건, 2초 6건 (시간 평균은 약 214ms)
+        checked_at = stored_time(2025, 10, 1, 1)
+        for index, latency_ms in enumerate([100] * 94 + [2000] * 6):
+            Check.objects.create(endpoint=self.endpoint, status_code=200, latency_ms=latency_ms,
+                                 checked_at=checked_at + timedelta(seconds=index))
+        CheckHourlyLatency.rebuild()
+        rows, _ = build_report('2025-10', level='endpoint')
+        self.assertTrue(90 <= rows[0]['p50'] <= 110)
+        self.assertTrue(1800 <= rows[0]['p95'] <= 2200)
+        self.assertEqual(rows[0]['p95'], rows[0]['p99'])
+
+
+class IncidentListFilterTests(AdminClientMixin, TestCase):
+    """장애 이력 필터 파라미터 검증"""
+
+    def test_invalid_ids_are_ignored(self):
+        endpoint = create_endpoints()[0]
+        Incident.objects.create(
+            endpoint=endpoint, status='RED', started_at=timezone.now(), check_count=1,
+            last_checked_at=timezone.now()
+        )
+        response = self.client.get(reverse('monitoring:incident_list'), {'endpoint': 'abc', 'network_group': '1x'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['page_obj']), 1)
+
+    def test_endpoint_filter(self):
+        first, second = create_endpoints(endpoints=2)
+        Incident.objects.create(
+            endpoint=first, status='RED', started_at=timezone.now(), check_count=1,
+            last_checked_at=timezone.now()
+        )
+        response = self.client.get(reverse('monitoring:incident_list'), {'endpoint': str(second.id)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['page_obj']), 0)
+        self.assertEqual(response.context['selected_endpoint'], second.id)
+
+    def incident(self, endpoint, started_at, **extra):
+        return Incident.objects.create(
+            endpoint=endpoint, status='RED', started_at=started_at, check_count=1, last_checked_at=started_at, **extra
+        )
+
+    def test_date_filter_uses_kst_day(self):
+        endpoint = create_endpoints()[0]
+        # 10/20 00:10 (KST)에 시작한 장애
+        self.incident(endpoint, stored_time(2026, 10, 20, 0, 10))
+        response = self.client.get(reverse('monitoring:incident_list'), {'date_from': '2026-10-20'})
+        self.assertEqual(len(response.context['page_obj']), 1)
+        response = self.client.get(reverse('monitoring:incident_list'), {'date_to': '2026-10-19'})
+        self.assertEqual(len(response.context['page_obj']), 0)
+
+    def test_stats_window_in_stored_time(self):
+        endpoint = create_endpoints()[0]
+        started_at = to_stored(timezone.now()) - timedelta(days=30, hours=3)
+        self.incident(endpoint, started_at, ended_at=started_at + timedelta(minutes=5), duration_sec=300)
+        self.incident(endpoint, to_stored(timezone.now()) - timedelta(hours=2))
+        response = self.client.get(reverse('monitoring:incident_list'))
+        self.assertEqual(len(response.context['page_obj']), 2)
+        self.assertEqual((response.context['stats']['total'], response.context['stats']['open']), (1, 1))
+
+
+class FakeBulkRecorder:
+    """usp_record_checks_bulk 대체 (trace_id가 이미 기록된 결과는 건너뜀)"""
+
+    def __init__(self):
+        self.trace_ids = set()
+
+    def __call__(self, sp_name, params=None):
+        if sp_name == 'usp_get_poll_targets':
+            return []
+        results = json.loads(params['results'])
+        duplicates = sum(1 for row in results if row['trace_id'] in self.trace_ids)
+        self.trace_ids.update(row['trace_id'] for row in results)
+        return [{'recorded_count': len(results) - duplicates, 'skipped_count': 0, 'duplicate_count': duplicates}]
+
+
+class AgentIngestTests(TestCase):
+    """원격 에이전트 수집 API (배치 재전송 시 중복 기록 방지)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.endpoint = create_endpoints()[0]
+        cls.agent = ProbeAgent(name='agent', network_group=cls.endpoint.domain.network_group)
+        cls.token = cls.agent.issue_token()
+        cls.agent.save()
+
+    def post(self, rows):
+        body = gzip.compress('\n'.join(json.dumps(row) for row in rows).encode('utf-8'))
+        return self.client.post(
+            reverse('monitoring:agent_ingest'), body, content_type='application/x-ndjson',
+            HTTP_AUTHORIZATION=f'Bearer {self.token}', HTTP_CONTENT_ENCODING='gzip', HTTP_HOST='localhost',
+        )
+
+    def check_row(self, **extra):
+        row = {
+            'endpoint_id': self.endpoint.id, 'status_code': 200, 'latency_ms': 30, 'headers': None, 'error': None,
+            'checked_at': '2026-10-19T10:00:00', 'trace_id': str(uuid.uuid4()),
+        }
+        row.update(extra)
+        return row
+
+    def test_read_batch_normalizes_trace_id(self):
+        trace_id = uuid.uuid4()
+        body = json.dumps(self.check_row(trace_id=str(trace_id).upper()))
+        checks, suppressions = read_batch(gzip.compress(body.encode('utf-8')), 'gzip')
+        self.assertEqual(checks[0]['trace_id'], str(trace_id))
+        self.assertEqual(suppressions, [])
+
+    def test_read_batch_rejects_bad_trace_id(self):
+        with self.assertRaises(IngestError):
+            read_batch(json.dumps(self.check_row(trace_id='abc')).encode('utf-8'))
+
+    def test_retried_batch_is_not_recorded_twice(self):
+        rows = [self.check_row(), self.check_row(status_code=500)]
+        with mock.patch('monitoring.ingest.DatabaseMiddleware.execute_sp', FakeBulkRecorder()):
+            first = self.post(rows).json()
+            retry = self.post(rows).json()
+        self.assertEqual((first['recorded'], first['duplicates']), (2, 0))
+        self.assertEqual((retry['recorded'], retry['duplicates']), (0, 2))
+
+    def test_rejects_unknown_token(self):
+        self.token = 'wrong'
+        self.assertEqual(self.post([self.check_row()]).status_code, 401)
+
+
+class KeysetPaginationTests(TestCase):
+    """(checked_at, id) 키셋 페이지 경계"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.endpoint = create_endpoints()[0]
+        base = local_time(2026, 10, 19, 10)
+        # 같은 시각 2건은 id로 순서 결정
+        for minutes in (0, 1, 2, 2, 3, 4, 5):
+            Check.objects.create(endpoint=cls.endpoint, status_code=200, latency_ms=10,
+                                 checked_at=base + timedelta(minutes=minutes))
+        cls.ordered = list(Check.objects.order_by('-checked_at', '-id').values_list('id', flat=True))
+
+    def ids(self, page):
+        return [check.id for check in page]
+
+    def test_walk_forward_and_back(self):
+        paginator = KeysetPaginator(Check.objects.all(), 3)
+        first = paginator.page()
+        second = paginator.page(before=first.next_cursor)
+        third = paginator.page(before=second.next_cursor)
+        self.assertEqual(self.ids(first) + self.ids(second) + self.ids(third), self.ordered)
+        self.assertEqual((first.has_previous, first.has_next), (False, True))
+        self.assertEqual((third.has_previous, third.has_next), (True, False))
+        self.assertIsNone(third.next_cursor)
+
+        back = paginator.page(after=third.previous_cursor)
+        self.assertEqual(self.ids(back), self.ids(second))
+        self.assertTrue(back.has_previous)
+        top = paginator.page(after=back.previous_cursor)
+        self.assertEqual(self.ids(top), self.ids(first))
+        self.assertFalse(top.has_previous)
+        self.assertIsNone(top.previous_cursor)
+
+    def test_exact_page_has_no_next(self):
+        page = KeysetPaginator(Check.objects.all(), len(self.ordered)).page()
+        self.assertEqual(len(page), len(self.ordered))
+        self.assertFalse(page.has_next)
+
+    def test_invalid_cursor_returns_first_page(self):
+        paginator = KeysetPaginator(Check.objects.all(), 3)
+        for cursor in ('abc', '123', '1_x', '9' * 30 + '_1'):
+            page = paginator.page(before=cursor)
+            self.assertEqual(self.ids(page), self.ordered[:3])
+            self.assertFalse(page.has_previous)
+
+    def test_filter_applies_with_seek(self):
+        paginator = KeysetPaginator(Check.objects.filter(endpoint__url='none'), 3)
+        page = paginator.page()
+        self.assertEqual((len(page), page.next_cursor, page.previous_cursor), (0, None, None))
+
+
+class ConfigImportTests(TestCase):
+    """설정 가져오기 (같은 파일을 다시 가져오면 변경 없음)"""
+
+    CSV = (
+        'network_group,domain,site_name,owner_name,url,poll_interval_sec,is_enabled\n'
+        'IMPORT,a.jnu.ac.kr,사이트 A,담당자,https://a.jnu.ac.kr/health,60,true\n'
+        'IMPORT,a.jnu.ac.kr,사이트 A,담당자,https://a.jnu.ac.kr/login,300,false\n'
+        'IMPORT,b.jnu.ac.kr,사이트 B,담당자,https://b.jnu.ac.kr/,,\n'
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_admin()
+
+    def import_csv(self, text):
+        return apply_plan(build_plan(read_rows(text.encode('utf-8'), 'endpoints.csv')), self.user, 'endpoints.csv')
+
+    def test_reimport_is_noop(self):
+        self.assertIsNotNone(self.import_csv(self.CSV))
+        self.assertEqual(Endpoint.objects.filter(domain__network_group__name='IMPORT').count(), 3)
+        revisions = ConfigRevision.objects.count()
+
+        plan = build_plan(read_rows(self.CSV.encode('utf-8'), 'endpoints.csv'))
+        self.assertFalse(plan.has_changes)
+        self.assertEqual(plan.summary()['unchanged'], 1 + 2 + 3)
+        self.assertIsNone(apply_plan(plan, self.user))
+        self.assertEqual(ConfigRevision.objects.count(), revisions)
+
+    def test_changed_cell_updates_only_that_row(self):
+        self.import_csv(self.CSV)
+        plan = build_plan(read_rows(self.CSV.replace('login,300,false', 'login,600,false').encode('utf-8')))
+        self.assertEqual(plan.summary()['endpoints_updated'], 1)
+        apply_plan(plan, self.user)
+        self.assertEqual(Endpoint.objects.get(url='https://a.jnu.ac.kr/login').poll_interval_sec, 600)
+        # 빈 셀은 기존 값 유지
+        self.assertEqual(Endpoint.objects.get(url='https://b.jnu.ac.kr/').poll_interval_sec, 300)
+
+    def test_invalid_rows_are_all_reported(self):
+        text = self.CSV + 'IMPORT,a.jnu.ac.kr,,,https://a.jnu.ac.kr/health,10,maybe\n'
+        with self.assertRaises(ConfigImportError) as raised:
+            build_plan(read_rows(text.encode('utf-8')))
+        self.assertEqual(len(raised.exception.errors), 2)
+        self.assertFalse(NetworkGroup.objects.filter(name='IMPORT').exists())
+
+
+class IncidentReplayTests(TestCase):
+    """체크 기록에서 장애 구간 재계산 (usp_record_check와 같은 열기/닫기)"""
+
+    def test_replay_transitions(self):
+        base = datetime(2026, 10, 19, 10)
+        at = [base + timedelta(minutes=minute) for minute in range(7)]
+        rows = [
+            (1, 200, None, at[0]),
+            (1, 500, None, at[1]),
+            (1, 503, 'Service Unavailable', at[2]),
+            (1, None, '연결 시간 초과', at[3]),
+            (1, 200, None, at[4]),
+            (2, 500, None, at[5]),
+        ]
+        incidents = list(replay_checks(rows))
+        self.assertEqual(
+            [(i['endpoint_id'], i['status'], i['started_at'], i['ended_at'], i['check_count']) for i in incidents],
+            [(1, 'RED', at[1], at[3], 2), (1, 'AMBER', at[3], at[4], 1), (2, 'RED', at[5], None, 1)],
+        )
+        self.assertEqual(incidents[0]['duration_sec'], 120)
+        self.assertEqual((incidents[0]['first_error'], incidents[0]['last_error']), ('HTTP 500', 'Service Unavailable'))
+        self.assertEqual(incidents[1]['first_error'], '연결 시간 초과')
+        self.assertIsNone(incidents[2]['duration_sec'])
+
+    def test_rebuild_is_repeatable(self):
+        endpoint = create_endpoints()[0]
+        base = local_time(2026, 10, 19, 10)
+        for minute, status_code in enumerate((200, 500, 500, 200, None)):
+            Check.objects.create(endpoint=endpoint, status_code=status_code, checked_at=base + timedelta(minutes=minute))
+        self.assertEqual(Incident.rebuild(), 2)
+        self.assertEqual(Incident.rebuild(), 2)
+        self.assertEqual(
+            list(Incident.objects.order_by('started_at').values_list('status', 'check_count', 'ended_at')),
+            [('RED', 2, base + timedelta(minutes=3)), ('AMBER', 1, None)],
+        )
+
+
+class HeaderSetTests(TestCase):
+    """응답 헤더 조합 정규화/저장 (콘솔 normalize_headers와 같은 문자열)"""
+
+    def test_normalize_matches_console_format(self):
+        self.assertEqual(
+            HeaderSet.normalize({'Server': 'nginx', 'Content-Type': ' text/html;  charset=utf-8 '}),
+            '{"content-type":"text/html; charset=utf-8","server":"nginx"}',
+        )
+        self.assertIsNone(HeaderSet.normalize({}))
+
+    def test_store_shares_one_row(self):
+        headers = HeaderSet.normalize({'Server': 'nginx'})
+        first = HeaderSet.store(headers)
+        second = HeaderSet.store(HeaderSet.normalize({'SERVER': 'nginx'}))
+        self.assertEqual(bytes(first), bytes(second))
+        self.assertEqual(len(bytes(first)), 32)
+        self.assertEqual(HeaderSet.objects.count(), 1)
+        self.assertIsNone(HeaderSet.store(None))
+
+
+class CheckExportFilterTests(AdminClientMixin, TestCase):
+    """내보내기 일시 필터/출력이 저장 기준(KST) 시각을 쓰는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.endpoint = create_endpoints()[0]
+        for hour, minute in ((23, 30), (24, 10)):
+            Check.objects.create(endpoint=cls.endpoint, status_code=200, latency_ms=10,
+                                 checked_at=stored_time(2026, 10, 19) + timedelta(hours=hour, minutes=minute))
+
+    def export(self, **params):
+        response = self.client.get(reverse('monitoring:check_export'), {'format': 'ndjson', **params})
+        self.assertEqual(response.status_code, 200)
+        rows = b''.join(response.streaming_content).decode().splitlines()
+        return [json.loads(row)['checked_at'] for row in rows]
+
+    def test_date_filter_uses_kst_day(self):
+        self.assertEqual(self.export(date_from='2026-10-20'), ['2026-10-20T00:10:00+09:00'])
+        self.assertEqual(self.export(date_to='2026-10-19'), ['2026-10-19T23:30:00+09:00'])
+
+    def test_datetime_filter(self):
+        self.assertEqual(self.export(**{'from': '2026-10-20T00:00'}), ['2026-10-20T00:10:00+09:00'])
+        # 시간대가 있으면 KST로 바꾸어 비교
+        self.assertEqual(self.export(**{'to': '2026-10-19T15:00:00+00:00'}), ['2026-10-19T23:30:00+09:00'])
+
+
+class CheckHistoryFilterTests(AdminClientMixin, TestCase):
+    """체크 기록 화면 일자 필터가 KST 일자 경계를 쓰는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.endpoint = create_endpoints()[0]
+        cls.ids = [
+            Check.objects.create(endpoint=cls.endpoint, status_code=200, latency_ms=10,
+                                 checked_at=stored_time(2026, 10, 19) + timedelta(hours=hour, minutes=minute)).id
+            for hour, minute in ((0, 5), (23, 30), (24, 10))
+        ]
+
+    def page_ids(self, **params):
+        response = self.client.get(reverse('monitoring:check_history'), params)
+        self.assertEqual(response.status_code, 200)
+        return sorted(check.id for check in response.context['page_obj'])
+
+    def test_single_day(self):
+        self.assertEqual(self.page_ids(date_from='2026-10-19', date_to='2026-10-19'), self.ids[:2])
+        self.assertEqual(self.page_ids(date_from='2026-10-20'), self.ids[2:])
+
+
+class CheckRequestStatusTests(AdminClientMixin, TestCase):
+    """즉시 점검 요청 상태 조회는 기다리지 않고 현재 상태를 반환"""
+
+    def test_status_without_waiting(self):
+        endpoint = create_endpoints()[0]
+        data = self.client.post(reverse('monitoring:endpoint_check', args=[endpoint.id])).json()
+        self.assertTrue(data['success'])
+        with mock.patch('time.sleep') as sleep:
+            pending = self.client.get(data['status_url']).json()
+        sleep.assert_not_called()
+        self.assertEqual((pending['done'], pending['claimed']), (False, False))
+
+        check = Check.objects.create(endpoint=endpoint, status_code=200, latency_ms=30,
+                                     checked_at=stored_time(2026, 10, 19, 10))
+        CheckRequest.objects.filter(id=data['request_id']).update(
+            claimed_at=timezone.now(), completed_at=timezone.now(), check_result=check
+        )
+        done = self.client.get(data['status_url']).json()
+        self.assertTrue(done['done'])
+        self.assertEqual(done['check']['checked_at'], '2026-10-19T10:00:00+09:00')
@@ -23,6 +23,7 @@ urlpatterns = [
     path('endpoints/<int:endpoint_id>/edit/', views.endpoint_edit_view, name='endpoint_edit'),
     path('endpoints/<int:endpoint_id>/delete/', views.endpoint_delete_view, name='endpoint_delete'),
     path('endpoints/<int:endpoint_id>/detail/', views.endpoint_detail_view, name='endpoint_detail'),
+    path('endpoints/<int:endpoint_id>/check/', views.endpoint_check_view, name='endpoint_check'),
     
     # 일괄 설정
     path('bulk-settings/', views.bulk_settings_view, name='bulk_settings'),
@@ -32,8 +33,14 @@ urlpatterns = [
     
     # 설정 및 기록
     path('settings/', views.settings_view, name='settings'),
+    path('settings/import/', views.config_import_view, name='config_import'),
     path('check-history/', views.check_history_view, name='check_history'),
+    path('check-history/export/', views.check_export_view, name='check_export'),
+    path('incidents/', views.incident_list_view, name='incident_list'),
+    path('reports/', views.sla_report_view, name='sla_report'),
     
     # API
     path('api/endpoints/<int:endpoint_id>/chart-data/', views.endpoint_chart_data_view, name='endpoint_chart_data'),
+    path('api/ingest/', views.agent_ingest_view, name='agent_ingest'),
+    path('api/check-requests/<int:request_id>/', views.check_request_status_view, name='check_request_status'),
 ]
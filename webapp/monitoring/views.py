@@ -1,19 +1,34 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
+from django.conf import settings
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
+from django.views.decorators.csrf import csrf_exempt
 from django.core.paginator import Paginator
 from django.db import transaction
 from django.utils import timezone
-from django.http import JsonResponse, HttpResponse
-from django.db.models import Q, Count, Avg, Max
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from django.db.models import Q, Count, Avg, Max, Sum, OuterRef, Subquery, TextField
+from django.db.models.functions import Coalesce
 from datetime import datetime, timedelta
+import csv
 import json
-from .models import NetworkGroup, Domain, Endpoint, Check, ConfigRevision
+import time
+from django.core.serializers.json import DjangoJSONEncoder
+from common.dbtime import from_stored, stored_now, stored_start_of_day, to_stored
+from common.pagination import KeysetPaginator
+from .models import (
+    NetworkGroup, Domain, Endpoint, Check, ConfigRevision, CheckDailyStat, Incident, ProbeAgent, CheckRequest,
+    HeaderSet
+)
 from .forms import (
     NetworkGroupForm, DomainForm, EndpointForm, 
-    BulkSettingsForm, CloneNetworkGroupForm
+    BulkSettingsForm, CloneNetworkGroupForm, ConfigImportForm
 )
+from .config_import import ConfigImportError, read_rows, build_plan, apply_plan, MAX_REPORTED_ERRORS
+from .incidents import format_duration
+from .ingest import IngestError, read_batch, record_batch, current_revision, agent_assignment
 
 
 def is_admin(user):
@@ -517,9 +532,11 @@ def settings_view(request):
             messages.success(request, f'{deleted_count}개의 오래된 체크 기록이 삭제되었습니다.')
             
         elif action == 'refresh_all_checks':
-            # 모든 엔드포인트의 다음 체크 시간을 현재 시간으로 설정 (즉시 체크)
-            # 이는 실제로는 저장프로시저나 별도 로직으로 처리해야 함
-            messages.success(request, '모든 엔드포인트의 체크가 예약되었습니다.')
+            # 활성 엔드포인트 전체 즉시 점검 요청 (콘솔이 요청 큐에서 가져가 실행, 설정 변경이 아니므로 리비전 없음)
+            endpoint_ids = Endpoint.objects.filter(is_enabled=True).values_list('id', flat=True)
+            created = CheckRequest.enqueue_many(endpoint_ids, request.user)
+            messages.success(request, f'엔드포인트 {created}개의 즉시 점검이 요청되었습니다.')
+            return redirect('monitoring:settings')
             
         elif action == 'export_config':
             # 설정 백업 (JSON 형태로)
@@ -531,7 +548,7 @@ def settings_view(request):
             }
             
             response = HttpResponse(
-                json.dumps(config_data, indent=2, ensure_ascii=False),
+                json.dumps(config_data, indent=2, ensure_ascii=False, cls=DjangoJSONEncoder),
                 content_type='application/json; charset=utf-8'
             )
             response['Content-Disposition'] = f'attachment; filename="svcmon_config_{timezone.now().strftime("%Y%m%d_%H%M%S")}.json"'
@@ -560,7 +577,7 @@ def settings_view(request):
     }
     
     # 최근 설정 변경 이력
-    recent_revisions = ConfigRevision.objects.order_by('-created_at')[:10]
+    recent_revisions = ConfigRevision.objects.order_by('-changed_at')[:10]
     
     context = {
         'stats': stats,
@@ -570,81 +587,390 @@ def settings_view(request):
 
 
 @login_required
-def check_history_view(request):
-    """체크 기록 뷰"""
-    from django.db.models import Avg, Count, Q
-    from datetime import datetime, timedelta
+@user_passes_test(is_admin)
+def config_import_view(request):
+    """
+    설정 일괄 가져오기 뷰
+    
+    모든 행을 먼저 검증한 뒤 기존 설정과 비교해 추가/변경분만 한 트랜잭션에서 저장하고
+    설정 변경 이력은 한 번만 기록합니다 (콘솔 프로그램 재적용 1회).
+    """
+    summary = None
+    errors = []
+    if request.method == 'POST':
+        form = ConfigImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            upload = form.cleaned_data['file']
+            try:
+                plan = build_plan(read_rows(upload.read(), upload.name))
+            except ConfigImportError as e:
+                errors = e.errors[:MAX_REPORTED_ERRORS]
+                if len(e.errors) > MAX_REPORTED_ERRORS:
+                    errors.append(f'외 {len(e.errors) - MAX_REPORTED_ERRORS}건의 오류가 더 있습니다.')
+            else:
+                summary = plan.summary()
+                if not form.cleaned_data['dry_run']:
+                    if apply_plan(plan, request.user, source=upload.name):
+                        messages.success(request, f'설정을 가져왔습니다: {plan.describe()}')
+                    else:
+                        messages.info(request, '변경된 설정이 없습니다.')
+                    return redirect('monitoring:config_import')
+    else:
+        form = ConfigImportForm()
     
-    checks = Check.objects.all().order_by('-checked_at')
+    context = {
+        'form': form,
+        'summary': summary,
+        'errors': errors,
+    }
+    return render(request, 'monitoring/config_import.html', context)
+
+
+INCIDENT_STATS_DAYS = 30
+
+
+@login_required
+def incident_list_view(request):
+    """
+    장애 이력 뷰 (장애 구간 테이블, 키셋 페이지네이션)
     
-    # 필터링
-    endpoint_id = request.GET.get('endpoint')
-    if endpoint_id:
-        checks = checks.filter(endpoint_id=endpoint_id)
+    MTTR 등 통계는 기간 필터가 없으면 최근 30일 동안 시작된 장애 구간으로 계산합니다.
+    """
+    from urllib.parse import urlencode
     
+    incidents = Incident.objects.select_related('endpoint__domain__network_group')
+    endpoint_id = _parse_id(request.GET.get('endpoint'))
+    if endpoint_id:
+        incidents = incidents.filter(endpoint_id=endpoint_id)
+    network_group_id = _parse_id(request.GET.get('network_group'))
+    if network_group_id:
+        incidents = incidents.filter(endpoint__domain__network_group_id=network_group_id)
     status = request.GET.get('status')
-    if status == 'success':
-        # 성공: 상태코드가 200-299이고 에러가 없는 경우
-        checks = checks.filter(
-            status_code__gte=200, 
-            status_code__lt=300,
-            error__isnull=True
-        )
-    elif status == 'error':
-        # 실패: 상태코드가 200-299가 아니거나 에러가 있는 경우
-        checks = checks.filter(
-            Q(status_code__lt=200) | 
-            Q(status_code__gte=300) | 
-            Q(error__isnull=False)
-        )
+    if status in ('RED', 'AMBER'):
+        incidents = incidents.filter(status=status)
+    state = request.GET.get('state')
+    if state == 'open':
+        incidents = incidents.filter(ended_at__isnull=True)
+    elif state == 'closed':
+        incidents = incidents.filter(ended_at__isnull=False)
+    
+    date_from = _parse_date(request.GET.get('date_from'))
+    date_to = _parse_date(request.GET.get('date_to'))
+    if date_from:
+        incidents = incidents.filter(started_at__gte=_start_of_day(date_from))
+    if date_to:
+        incidents = incidents.filter(started_at__lt=_start_of_day(date_to + timedelta(days=1)))
+    
+    # 통계 (종료된 구간의 지속시간 평균 = MTTR)
+    stats_incidents = incidents
+    if not date_from and not date_to:
+        stats_incidents = incidents.filter(started_at__gte=stored_now() - timedelta(days=INCIDENT_STATS_DAYS))
+    stats = stats_incidents.aggregate(
+        total=Count('id'),
+        red=Count('id', filter=Q(status='RED')),
+        open=Count('id', filter=Q(ended_at__isnull=True)),
+        mttr=Avg('duration_sec'),
+        longest=Max('duration_sec'),
+    )
     
-    # 통계 계산
-    total_checks = Check.objects.count()
-    success_checks = Check.objects.filter(
-        status_code__gte=200, 
-        status_code__lt=300,
-        error__isnull=True
-    ).count()
-    success_rate = (success_checks / total_checks * 100) if total_checks > 0 else 0
+    paginator = KeysetPaginator(incidents, 20, field='started_at')
+    page_obj = paginator.page(before=request.GET.get('before'), after=request.GET.get('after'))
     
-    # 평균 응답시간 (성공한 체크만)
-    avg_response_time = Check.objects.filter(
-        status_code__gte=200, 
-        status_code__lt=300,
-        error__isnull=True,
-        latency_ms__isnull=False
-    ).aggregate(Avg('latency_ms'))['latency_ms__avg'] or 0
+    filter_query = urlencode({
+        key: request.GET[key]
+        for key in ('endpoint', 'network_group', 'status', 'state', 'date_from', 'date_to')
+        if request.GET.get(key)
+    })
+    
+    context = {
+        'page_obj': page_obj,
+        'endpoints': Endpoint.objects.only('id', 'url').order_by('url'),
+        'network_groups': NetworkGroup.objects.order_by('name'),
+        'selected_endpoint': endpoint_id,
+        'selected_network_group': network_group_id,
+        'selected_status': status,
+        'selected_state': state,
+        'selected_date_from': date_from.isoformat() if date_from else '',
+        'selected_date_to': date_to.isoformat() if date_to else '',
+        'filter_query': filter_query,
+        'stats': stats,
+        'stats_days': None if date_from or date_to else INCIDENT_STATS_DAYS,
+        'mttr_display': format_duration(stats['mttr']),
+        'longest_display': format_duration(stats['longest']),
+    }
+    return render(request, 'monitoring/incident_list.html', context)
+
+
+@login_required
+def sla_report_view(request):
+    """
+    가용률(SLA) 리포트 뷰 (HTML/CSV)
     
-    # 오늘 오류 수
-    today = timezone.now().date()
-    today_errors = Check.objects.filter(
-        Q(status_code__lt=200) | 
-        Q(status_code__gte=300) | 
-        Q(error__isnull=False),
-        checked_at__date=today
-    ).count()
+    period는 YYYY-MM(월) 또는 YYYY(연), level은 network/domain/endpoint입니다.
+    월별 결과는 캐시되고 연간 리포트는 월별 결과를 합쳐 계산합니다.
+    """
+    from .reports import LEVELS, build_report, default_period, period_months
     
-    # 페이지네이션
-    paginator = Paginator(checks, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    period = request.GET.get('period') or default_period()
+    level = request.GET.get('level', 'network')
+    network_group_id = request.GET.get('network_group')
+    try:
+        period_months(period)
+        network_group_id = int(network_group_id) if network_group_id else None
+    except ValueError:
+        return HttpResponse('period는 YYYY-MM 또는 YYYY 형식이어야 합니다.', status=400)
+    if level not in LEVELS:
+        return HttpResponse('level은 network, domain, endpoint 중 하나여야 합니다.', status=400)
+    
+    rows, intervals = build_report(period, level=level, network_group_id=network_group_id)
+    
+    if request.GET.get('format') == 'csv':
+        response = HttpResponse(content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="sla_{level}_{period}.csv"'
+        response.write('\ufeff')
+        writer = csv.writer(response)
+        writer.writerow([
+            'name', 'parent', 'endpoints', 'checks', 'errors', 'uptime_percent', 'downtime_sec',
+            'incidents', 'mttr_sec', 'mtbf_sec', 'p50_ms', 'p95_ms', 'p99_ms',
+        ])
+        for row in rows:
+            writer.writerow([
+                row['name'], row['parent'], row['endpoints'], row['checks'], row['errors'], row['uptime'],
+                row['downtime_sec'], row['incidents'], row['mttr_sec'], row['mtbf_sec'],
+                row['p50'], row['p95'], row['p99'],
+            ])
+        return response
+    
+    for row in rows:
+        row['downtime_display'] = format_duration(row['downtime_sec'])
+        row['mttr_display'] = format_duration(row['mttr_sec'])
+        row['mtbf_display'] = format_duration(row['mtbf_sec'])
+    for interval in intervals:
+        interval['duration_display'] = format_duration(interval['duration_sec'])
+    
+    context = {
+        'rows': rows,
+        'intervals': intervals,
+        'period': period,
+        'level': level,
+        'selected_network_group': network_group_id,
+        'network_groups': NetworkGroup.objects.order_by('name'),
+        'sla_target': settings.SLA_TARGET_PERCENT,
+        'breached_count': sum(1 for row in rows if row['breached']),
+    }
+    return render(request, 'monitoring/sla_report.html', context)
+
+
+@login_required
+def check_history_view(request):
+    """체크 기록 뷰 (키셋 페이지네이션, 통계는 일별 집계 카운터 사용)"""
+    from urllib.parse import urlencode
+    
+    # 필터링 (seek 조건과 함께 인덱스에서 처리)
+    checks = _filter_checks(Check.objects.select_related('endpoint__domain'), request.GET)
+    endpoint_id = request.GET.get('endpoint')
+    status = request.GET.get('status')
+    date_from = _parse_date(request.GET.get('date_from'))
+    date_to = _parse_date(request.GET.get('date_to'))
+    
+    # 통계 (체크 테이블 대신 일별 집계 카운터 합산)
+    totals = CheckDailyStat.objects.aggregate(
+        total=Sum('total_count'),
+        success=Sum('success_count'),
+        latency_sum=Sum('latency_sum'),
+        latency_count=Sum('latency_count'),
+        today_errors=Sum('error_count', filter=Q(stat_date=timezone.localdate())),
+    )
+    total_checks = totals['total'] or 0
+    success_rate = (totals['success'] / total_checks * 100) if total_checks else 0
+    avg_response_time = (totals['latency_sum'] / totals['latency_count']) if totals['latency_count'] else 0
+    
+    # 키셋 페이지네이션 (checked_at, id)
+    paginator = KeysetPaginator(checks, 20, field='checked_at')
+    page_obj = paginator.page(before=request.GET.get('before'), after=request.GET.get('after'))
+    
+    # 페이지 이동 링크에 유지할 필터
+    filter_query = urlencode({
+        key: request.GET[key]
+        for key in ('endpoint', 'domain', 'network_group', 'status', 'date_from', 'date_to', 'from', 'to')
+        if request.GET.get(key)
+    })
     
     # 엔드포인트 목록 (필터용)
-    endpoints = Endpoint.objects.all().order_by('url')
+    endpoints = Endpoint.objects.only('id', 'url').order_by('url')
     
     context = {
         'page_obj': page_obj,
         'endpoints': endpoints,
         'selected_endpoint': endpoint_id,
         'selected_status': status,
+        'selected_date_from': date_from.isoformat() if date_from else '',
+        'selected_date_to': date_to.isoformat() if date_to else '',
+        'filter_query': filter_query,
         'total_checks': total_checks,
         'success_rate': round(success_rate, 1),
         'avg_response_time': round(avg_response_time) if avg_response_time else 0,
-        'today_errors': today_errors,
+        'today_errors': totals['today_errors'] or 0,
     }
     return render(request, 'monitoring/check_history.html', context)
 
 
+CHECK_EXPORT_CHUNK_SIZE = 2000
+CHECK_EXPORT_COLUMNS = [
+    'id', 'checked_at', 'network_group', 'domain', 'site_name', 'endpoint_id', 'url',
+    'status_code', 'latency_ms', 'error',
+]
+
+
+@login_required
+def check_export_view(request):
+    """
+    체크 기록 스트리밍 내보내기 (CSV/NDJSON)
+    
+    체크 기록 화면과 같은 필터(endpoint, status, date_from, date_to)에 더해
+    domain, network_group, from/to(ISO 일시)를 지원합니다.
+    서버 측 커서로 일정 크기씩 읽어 바로 전송하므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in ('csv', 'ndjson'):
+        return HttpResponse('format은 csv 또는 ndjson이어야 합니다.', status=400)
+    
+    include_headers = request.GET.get('include_headers') == '1'
+    fields = [
+        'id', 'checked_at', 'endpoint__domain__network_group__name', 'endpoint__domain__domain',
+        'endpoint__domain__site_name', 'endpoint_id', 'endpoint__url', 'status_code', 'latency_ms', 'error',
+    ]
+    checks = Check.objects.all()
+    if include_headers:
+        # header_sets의 헤더 조합 (이전 버전 기록은 checks.headers)
+        checks = checks.annotate(header_text=Coalesce(
+            Subquery(HeaderSet.objects.filter(header_hash=OuterRef('header_hash')).values('headers')[:1]),
+            'headers',
+            output_field=TextField()
+        ))
+        fields.append('header_text')
+    
+    rows = (
+        _filter_checks(checks, request.GET)
+        .order_by('checked_at', 'id')
+        .values_list(*fields)
+        .iterator(chunk_size=CHECK_EXPORT_CHUNK_SIZE)
+    )
+    
+    filename = f"checks_{timezone.localtime():%Y%m%d_%H%M%S}.{export_format}"
+    if export_format == 'csv':
+        response = StreamingHttpResponse(_csv_rows(rows, include_headers), content_type='text/csv; charset=utf-8')
+    else:
+        response = StreamingHttpResponse(_ndjson_rows(rows, include_headers), content_type='application/x-ndjson')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼"""
+    
+    def write(self, value):
+        return value
+
+
+def _csv_rows(rows, include_headers):
+    writer = csv.writer(_Echo())
+    columns = CHECK_EXPORT_COLUMNS + (['headers'] if include_headers else [])
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    yield '\ufeff' + writer.writerow(columns)
+    for row in rows:
+        row = list(row)
+        row[1] = from_stored(row[1]).isoformat()
+        yield writer.writerow(row)
+
+
+def _ndjson_rows(rows, include_headers):
+    columns = CHECK_EXPORT_COLUMNS + (['headers'] if include_headers else [])
+    for row in rows:
+        record = dict(zip(columns, row))
+        record['checked_at'] = from_stored(record['checked_at']).isoformat()
+        yield json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def _filter_checks(checks, params):
+    """체크 기록 화면/내보내기 공통 필터"""
+    endpoint_id = params.get('endpoint')
+    if endpoint_id:
+        checks = checks.filter(endpoint_id=endpoint_id)
+    domain_id = params.get('domain')
+    if domain_id:
+        checks = checks.filter(endpoint__domain_id=domain_id)
+    network_group_id = params.get('network_group')
+    if network_group_id:
+        checks = checks.filter(endpoint__domain__network_group_id=network_group_id)
+    
+    status = params.get('status')
+    if status == 'success':
+        # 성공: 상태코드가 200-299이고 에러가 없는 경우
+        checks = checks.filter(
+            status_code__gte=200, 
+            status_code__lt=300,
+            error__isnull=True
+        )
+    elif status == 'error':
+        # 실패: 상태코드가 200-299가 아니거나 에러가 있는 경우
+        checks = checks.filter(
+            Q(status_code__lt=200) | 
+            Q(status_code__gte=300) | 
+            Q(error__isnull=False)
+        )
+    
+    date_from = _parse_date(params.get('date_from'))
+    if date_from:
+        checks = checks.filter(checked_at__gte=_start_of_day(date_from))
+    date_to = _parse_date(params.get('date_to'))
+    if date_to:
+        checks = checks.filter(checked_at__lt=_start_of_day(date_to + timedelta(days=1)))
+    
+    # 일시 범위 (ISO 8601, 시간대가 없으면 현지 시간)
+    time_from = _parse_datetime(params.get('from'))
+    if time_from:
+        checks = checks.filter(checked_at__gte=time_from)
+    time_to = _parse_datetime(params.get('to'))
+    if time_to:
+        checks = checks.filter(checked_at__lt=time_to)
+    return checks
+
+
+def _parse_datetime(value):
+    """ISO 8601 일시 문자열을 저장 기준 일시로 변환 (잘못된 값은 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return to_stored(parsed)
+
+
+def _parse_id(value):
+    """ID 문자열을 int로 변환 (잘못된 값은 None)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_date(value):
+    """YYYY-MM-DD 문자열을 date로 변환 (잘못된 값은 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def _start_of_day(day):
+    """저장 기준 해당 일자 0시 (DB에는 KST 시각이 그대로 저장됨)"""
+    return stored_start_of_day(day)
+
+
 @login_required
 def endpoint_chart_data_view(request, endpoint_id):
     """엔드포인트 차트 데이터 API"""
@@ -662,6 +988,97 @@ def endpoint_chart_data_view(request, endpoint_id):
     return JsonResponse(data)
 
 
+# 즉시 점검 결과 조회 간격 (초, 클라이언트 권장값)
+CHECK_STATUS_POLL_SEC = 1
+
+
+@login_required
+@require_http_methods(["POST"])
+def endpoint_check_view(request, endpoint_id):
+    """
+    엔드포인트 즉시 점검 요청 API
+
+    실행 중인 콘솔이 1초 안에 요청을 가져가 예약된 체크보다 먼저 실행합니다.
+    결과는 check_request_status_view를 poll_sec 간격으로 조회해 확인합니다.
+    """
+    endpoint = get_object_or_404(Endpoint, id=endpoint_id)
+    if not endpoint.is_enabled:
+        return JsonResponse({'success': False, 'error': '비활성화된 엔드포인트입니다.'}, status=400)
+    
+    check_request = CheckRequest.enqueue(endpoint.id, request.user)
+    return JsonResponse({
+        'success': True,
+        'request_id': check_request.id,
+        'status_url': reverse('monitoring:check_request_status', args=[check_request.id]),
+        'poll_sec': CHECK_STATUS_POLL_SEC,
+    })
+
+
+@login_required
+def check_request_status_view(request, request_id):
+    """
+    즉시 점검 요청 상태 API
+
+    기다리지 않고 현재 상태를 바로 반환합니다 (웹 워커를 붙잡지 않도록 대기는 클라이언트가 반복 조회).
+    콘솔이 체크를 기록했으면 done: true와 결과를, 가져갔지만 아직 기록 전이면 claimed: true를 반환합니다.
+    """
+    check_request = get_object_or_404(CheckRequest.objects.select_related('check_result'), id=request_id)
+    
+    data = {
+        'request_id': check_request.id,
+        'endpoint_id': check_request.endpoint_id,
+        'done': check_request.completed_at is not None,
+        'claimed': check_request.claimed_at is not None,
+    }
+    check = check_request.check_result
+    if check is not None:
+        data['check'] = {
+            'id': check.id,
+            'status_code': check.status_code,
+            'latency_ms': check.latency_ms,
+            'error': check.error,
+            'checked_at': from_stored(check.checked_at),
+        }
+    return JsonResponse(data, encoder=DjangoJSONEncoder)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def agent_ingest_view(request):
+    """
+    원격 에이전트 체크 결과 수집 API (Authorization: Bearer <토큰>, 본문: NDJSON, gzip 압축 가능)
+
+    ?revision=<에이전트가 아는 설정 리비전>이 현재 리비전과 같으면 담당 엔드포인트 목록은 생략합니다.
+    """
+    agent = ProbeAgent.authenticate(request.headers.get('Authorization'))
+    if agent is None:
+        return JsonResponse({'error': '에이전트 인증에 실패했습니다.'}, status=401)
+    
+    try:
+        checks, suppressions = read_batch(request.body, request.headers.get('Content-Encoding'))
+    except IngestError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    recorded, skipped, duplicates = record_batch(agent, checks, suppressions)
+    ProbeAgent.objects.filter(id=agent.id).update(
+        last_seen_at=timezone.now(), last_address=request.META.get('REMOTE_ADDR')
+    )
+    
+    revision = current_revision()
+    data = {
+        'agent': agent.name,
+        'network_group_id': agent.network_group_id,
+        'network_group_name': agent.network_group.name,
+        'recorded': recorded,
+        'skipped': skipped,
+        'duplicates': duplicates,
+        'config_revision': revision,
+    }
+    if request.GET.get('revision') != str(revision):
+        data['endpoints'] = agent_assignment(agent)
+    return JsonResponse(data, encoder=DjangoJSONEncoder)
+
+
 # ============================
 # 누락된 뷰들 추가
 # ============================
@@ -730,50 +1147,29 @@ def clone_network_group_view(request):
     if request.method == 'POST':
         form = CloneNetworkGroupForm(request.POST)
         if form.is_valid():
-            source_id = form.cleaned_data['source_network_group']
+            source_network_group = form.cleaned_data['source_network_group']
             new_name = form.cleaned_data['new_name']
-            copy_domains = form.cleaned_data['copy_domains']
-            copy_endpoints = form.cleaned_data['copy_endpoints']
-            
-            source_network_group = get_object_or_404(NetworkGroup, id=source_id)
             
             with transaction.atomic():
-                # 새 망구분 생성
-                new_network_group = NetworkGroup.objects.create(
-                    name=new_name,
-                    note=f'{source_network_group.note} (복제본)'
+                # 도메인/엔드포인트 일괄 복제
+                new_network_group, domain_count, endpoint_count = source_network_group.clone(
+                    new_name,
+                    copy_domains=form.cleaned_data['copy_domains'],
+                    copy_endpoints=form.cleaned_data['copy_endpoints'],
                 )
                 
-                if copy_domains:
-                    # 도메인 복제
-                    for domain in source_network_group.domains.all():
-                        new_domain = Domain.objects.create(
-                            network_group=new_network_group,
-                            domain=domain.domain,
-                            site_name=domain.site_name,
-                            owner_name=domain.owner_name,
-                            note=domain.note
-                        )
-                        
-                        if copy_endpoints:
-                            # 엔드포인트 복제
-                            for endpoint in domain.endpoints.all():
-                                Endpoint.objects.create(
-                                    domain=new_domain,
-                                    url=endpoint.url,
-                                    poll_interval_sec=endpoint.poll_interval_sec,
-                                    is_enabled=endpoint.is_enabled,
-                                    note=endpoint.note
-                                )
-                
                 # 설정 변경 이력 추가
                 ConfigRevision.objects.create(
-                    reason=f'망구분 복제: {source_network_group.name} → {new_name}',
+                    reason=f'망구분 복제: {source_network_group.name} → {new_name} '
+                           f'(도메인 {domain_count}개, 엔드포인트 {endpoint_count}개)',
                     changed_by=request.user
                 )
-                
-                messages.success(request, f'망구분 "{new_name}"이 생성되었습니다.')
-                return redirect('monitoring:network_group_list')
+            
+            messages.success(
+                request,
+                f'망구분 "{new_name}"이 생성되었습니다. (도메인 {domain_count}개, 엔드포인트 {endpoint_count}개)'
+            )
+            return redirect('monitoring:network_group_list')
     else:
         form = CloneNetworkGroupForm()
     
@@ -51,10 +51,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'common.middleware.QueryMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'common.middleware.StatusPageWhiteNoiseMiddleware',
+    'common.middleware.PollingSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -325,7 +326,75 @@ LOGOUT_REDIRECT_URL = '/'
 
 # Session Configuration
 SESSION_COOKIE_AGE = 86400  # 24 hours
-SESSION_SAVE_EVERY_REQUEST = True
+
+# 폴링 API 경로는 세션이 변경된 경우에만 저장 (common.middleware.PollingSessionMiddleware)
+SESSION_SKIP_SAVE_PATH_PREFIXES = [
+    '/api/',
+    '/monitoring/api/',
+]
+
+# 요청 메트릭 수집 (common.middleware.QueryMetricsMiddleware, /metrics/)
+REQUEST_METRICS_ENABLED = os.getenv('REQUEST_METRICS_ENABLED', 'True').lower() == 'true'
+
+# 뷰별 최대 쿼리 수 예산 (초과 시 경고 로그, common.testing에서 검증)
+# 뷰가 지켜야 할 목표값: 화면/API 쿼리 수는 망구분·도메인·엔드포인트 수와 관계없이 일정해야 함
+# 측정값(망구분 3개, 도메인 30개, 엔드포인트 300개 기준 benchmark_views)이 예산을 넘는 뷰는 주석에 표시하고
+# 테스트에서 알려진 실패(expectedFailure)로 둠. 예산을 측정값에 맞춰 올리지 말고 뷰를 고칠 것
+VIEW_QUERY_BUDGETS = {
+    # 대시보드
+    'dashboard:home': 20,  # 측정 315 (망구분/도메인별 N+1)
+    'dashboard:network_detail': 20,  # 127 (도메인별 N+1)
+    'dashboard:domain_detail': 20,  # 28 (엔드포인트별 N+1)
+    'dashboard:endpoint_chart': 15,  # 12
+    'dashboard:dashboard_api': 20,  # 308
+    'dashboard:network_status_api': 15,  # 102
+    'dashboard:all_networks_status_api': 20,  # 307
+    'dashboard:network_detail_api': 20,  # 122
+    'dashboard:domain_detail_api': 15,  # 22
+    'dashboard:endpoint_chart_api': 15,
+    'dashboard:endpoint_series_api': 5,  # 2
+    # 모니터링 관리
+    'monitoring:network_group_list': 15,  # 45 (망구분별 N+1)
+    'monitoring:network_group_create': 10,  # 5
+    'monitoring:network_group_edit': 10,  # 6
+    'monitoring:network_group_delete': 10,
+    'monitoring:clone_network_group': 20,
+    'monitoring:domain_list': 15,  # 28 (도메인별 N+1)
+    'monitoring:domain_create': 10,  # 6
+    'monitoring:domain_edit': 10,  # 7
+    'monitoring:domain_delete': 10,
+    'monitoring:endpoint_list': 12,  # 9
+    'monitoring:endpoint_create': 10,  # 6
+    'monitoring:endpoint_edit': 10,  # 7
+    'monitoring:endpoint_delete': 10,
+    'monitoring:endpoint_detail': 12,  # 10
+    'monitoring:endpoint_check': 10,  # 5
+    'monitoring:bulk_settings': 10,
+    'monitoring:status': 20,  # 421 (망구분/도메인별 N+1)
+    'monitoring:settings': 15,  # 13
+    'monitoring:config_import': 10,  # 5
+    'monitoring:check_history': 15,  # 8
+    'monitoring:check_export': 10,  # 6
+    'monitoring:check_request_status': 5,  # 3
+    'monitoring:endpoint_chart_data': 10,  # 4
+    'monitoring:incident_list': 12,  # 9
+    'monitoring:sla_report': 12,  # 11
+}
+
+# 공개 상태 페이지 스냅샷 (dashboard.status_page, /static/status/)
+# 스냅샷은 별도 프로세스(python manage.py write_status_page --loop)로 생성하는 것이 기본.
+# STATUS_PAGE_ENABLED=True는 웹 프로세스 안에서 스레드로 생성 (프로세스가 하나인 배포에서만 사용)
+STATUS_PAGE_ENABLED = os.getenv('STATUS_PAGE_ENABLED', 'False').lower() == 'true'
+STATUS_PAGE_INTERVAL_SECONDS = int(os.getenv('STATUS_PAGE_INTERVAL_SECONDS', '30'))
+STATUS_PAGE_SUBDIR = 'status'
+
+# 가용률 리포트 (monitoring.reports)
+SLA_TARGET_PERCENT = float(os.getenv('SLA_TARGET_PERCENT', '99.9'))
+SLA_REPORT_CACHE_SECONDS = int(os.getenv('SLA_REPORT_CACHE_SECONDS', '300'))  # 이번 달
+SLA_REPORT_PAST_CACHE_SECONDS = int(os.getenv('SLA_REPORT_PAST_CACHE_SECONDS', str(60 * 60 * 24 * 30)))  # 지난 달
+
+# 인증 백엔드 사용자 캐시 유지 시간 (초, 0이면 캐시 사용 안 함)
+AUTH_USER_CACHE_SECONDS = int(os.getenv('AUTH_USER_CACHE_SECONDS', '30'))
 
 # Logging Configuration
 LOGGING = {
@@ -18,12 +18,16 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.generic import RedirectView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('dashboard.urls')),
     path('accounts/', include('accounts.urls')),
     path('monitoring/', include('monitoring.urls')),
+    path('metrics/', include('common.urls')),
+    # 공개 상태 페이지 (dashboard.status_page가 생성한 정적 파일)
+    path('status/', RedirectView.as_view(url=f'{settings.STATIC_URL}{settings.STATUS_PAGE_SUBDIR}/')),
 ]
 
 # 개발 환경에서 정적 파일 서빙